@@ -0,0 +1,34 @@
+"""add_hot_path_indexes
+
+Revision ID: 5d8f2b7c9e41
+Revises: a3035d06cc1e
+Create Date: 2026-10-17 10:12:41.503218
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5d8f2b7c9e41'
+down_revision = 'a3035d06cc1e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Payments are read per expense (ordered by installment) and per period
+    op.create_index('idx_payments_expense_installment', 'payments', ['expense_id', 'no_installment'])
+    op.create_index('idx_payments_payment_date', 'payments', ['payment_date'])
+
+    # Expenses are read per account, usually filtered by type and status
+    op.create_index('idx_expenses_account_type_status', 'expenses', ['account_id', 'expense_type', 'status'])
+
+    # Accounts are read per owner and type
+    op.create_index('idx_accounts_owner_type', 'accounts', ['owner_id', 'type'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_accounts_owner_type', table_name='accounts')
+    op.drop_index('idx_expenses_account_type_status', table_name='expenses')
+    op.drop_index('idx_payments_payment_date', table_name='payments')
+    op.drop_index('idx_payments_expense_installment', table_name='payments')
@@ -0,0 +1,38 @@
+"""payments_amount_numeric
+
+Revision ID: 8e4a1f0c6b27
+Revises: 5d8f2b7c9e41
+Create Date: 2026-10-17 15:40:12.118904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4a1f0c6b27'
+down_revision = '5d8f2b7c9e41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Same exact type as expenses.amount; existing floats are rounded to cents
+    op.alter_column(
+        'payments',
+        'amount',
+        existing_type=sa.Float(precision=2),
+        type_=sa.Numeric(precision=20, scale=2),
+        existing_nullable=False,
+        postgresql_using='round(amount::numeric, 2)',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'payments',
+        'amount',
+        existing_type=sa.Numeric(precision=20, scale=2),
+        type_=sa.Float(precision=2),
+        existing_nullable=False,
+    )
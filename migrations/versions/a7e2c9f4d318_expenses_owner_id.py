@@ -0,0 +1,39 @@
+"""expenses_owner_id
+
+Revision ID: a7e2c9f4d318
+Revises: f3c8a1d6b245
+Create Date: 2026-10-18 09:14:52.301847
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7e2c9f4d318'
+down_revision = 'f3c8a1d6b245'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Owner of the expense's account, copied onto the expense so the default (all accounts)
+    # listing seeks (owner_id, created_at, id) on one index instead of joining accounts and sorting
+    op.add_column('expenses', sa.Column('owner_id', UUID(as_uuid=True), nullable=True))
+    accounts = sa.table('accounts', sa.column('id'), sa.column('owner_id'))
+    expenses = sa.table('expenses', sa.column('account_id'), sa.column('owner_id'))
+    op.execute(
+        expenses.update().values(
+            owner_id=sa.select(accounts.c.owner_id).where(accounts.c.id == expenses.c.account_id).scalar_subquery()
+        )
+    )
+    op.alter_column('expenses', 'owner_id', nullable=False)
+    op.create_foreign_key('expenses_owner_id_fkey', 'expenses', 'users', ['owner_id'], ['id'])
+    op.create_index('idx_expenses_owner_created_id', 'expenses', ['owner_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_expenses_owner_created_id', table_name='expenses')
+    op.drop_constraint('expenses_owner_id_fkey', 'expenses', type_='foreignkey')
+    op.drop_column('expenses', 'owner_id')
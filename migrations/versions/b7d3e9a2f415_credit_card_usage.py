@@ -0,0 +1,68 @@
+"""credit_card_usage
+
+Revision ID: b7d3e9a2f415
+Revises: 8e4a1f0c6b27
+Create Date: 2026-10-17 17:05:33.482610
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d3e9a2f415'
+down_revision = '8e4a1f0c6b27'
+branch_labels = None
+depends_on = None
+
+# Pending amount of an expense (alias e), as Purchase/Subscription.pending_amount compute it
+PENDING_AMOUNT = """
+    CASE WHEN e.expense_type = 'purchase'
+        THEN e.amount - COALESCE((
+            SELECT SUM(p.amount) FROM payments p
+            WHERE p.expense_id = e.id AND p.status IN ('paid', 'canceled')
+        ), 0)
+        ELSE COALESCE((
+            SELECT SUM(p.amount) FROM payments p
+            WHERE p.expense_id = e.id AND p.status NOT IN ('paid', 'canceled')
+        ), 0)
+    END
+"""
+
+BACKFILL = f"""
+UPDATE credit_cards SET
+    used_limit = COALESCE((
+        SELECT SUM({PENDING_AMOUNT}) FROM expenses e
+        WHERE e.account_id = credit_cards.account_id
+    ), 0),
+    used_financing_limit = COALESCE((
+        SELECT SUM({PENDING_AMOUNT}) FROM expenses e
+        WHERE e.account_id = credit_cards.account_id AND e.expense_type = 'purchase' AND e.installments <> 1
+    ), 0),
+    expenses_count = (
+        SELECT COUNT(*) FROM expenses e WHERE e.account_id = credit_cards.account_id
+    ),
+    purchases_count = (
+        SELECT COUNT(*) FROM expenses e WHERE e.account_id = credit_cards.account_id AND e.expense_type = 'purchase'
+    ),
+    subscriptions_count = (
+        SELECT COUNT(*) FROM expenses e WHERE e.account_id = credit_cards.account_id AND e.expense_type = 'subscription'
+    )
+"""
+
+
+def upgrade() -> None:
+    op.add_column('credit_cards', sa.Column('used_limit', sa.Numeric(precision=20, scale=2), server_default='0', nullable=False))
+    op.add_column('credit_cards', sa.Column('used_financing_limit', sa.Numeric(precision=20, scale=2), server_default='0', nullable=False))
+    op.add_column('credit_cards', sa.Column('expenses_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('credit_cards', sa.Column('purchases_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('credit_cards', sa.Column('subscriptions_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    op.drop_column('credit_cards', 'subscriptions_count')
+    op.drop_column('credit_cards', 'purchases_count')
+    op.drop_column('credit_cards', 'expenses_count')
+    op.drop_column('credit_cards', 'used_financing_limit')
+    op.drop_column('credit_cards', 'used_limit')
@@ -0,0 +1,88 @@
+"""period_summaries
+
+Revision ID: c4f81a6d2e93
+Revises: b7d3e9a2f415
+Create Date: 2026-10-17 18:22:07.934105
+
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4f81a6d2e93'
+down_revision = 'b7d3e9a2f415'
+branch_labels = None
+depends_on = None
+
+
+def _backfill() -> None:
+    accounts = sa.table('accounts', sa.column('id'), sa.column('owner_id'))
+    expenses = sa.table('expenses', sa.column('id'), sa.column('account_id'))
+    payments = sa.table(
+        'payments', sa.column('id'), sa.column('expense_id'), sa.column('amount'),
+        sa.column('status'), sa.column('payment_date'),
+    )
+    period_summaries = sa.table(
+        'period_summaries', sa.column('id'), sa.column('owner_id'), sa.column('account_id'),
+        sa.column('year'), sa.column('month'), sa.column('total_amount'), sa.column('total_confirmed_amount'),
+        sa.column('total_paid_amount'), sa.column('total_pending_amount'), sa.column('total_payments'),
+    )
+
+    def total(statuses: list[str]):
+        return sa.func.coalesce(sa.func.sum(sa.case((payments.c.status.in_(statuses), payments.c.amount), else_=0)), 0)
+
+    year = sa.extract('year', payments.c.payment_date)
+    month = sa.extract('month', payments.c.payment_date)
+    rows = op.get_bind().execute(
+        sa.select(
+            accounts.c.owner_id,
+            expenses.c.account_id,
+            year.label('year'),
+            month.label('month'),
+            sa.func.sum(payments.c.amount).label('total_amount'),
+            total(['confirmed', 'paid']).label('total_confirmed_amount'),
+            total(['paid']).label('total_paid_amount'),
+            total(['unconfirmed']).label('total_pending_amount'),
+            sa.func.count(payments.c.id).label('total_payments'),
+        )
+        .select_from(payments)
+        .join(expenses, expenses.c.id == payments.c.expense_id)
+        .join(accounts, accounts.c.id == expenses.c.account_id)
+        .group_by(accounts.c.owner_id, expenses.c.account_id, year, month)
+    ).all()
+    if rows:
+        op.bulk_insert(period_summaries, [
+            {**row._asdict(), 'id': uuid.uuid4(), 'year': int(row.year), 'month': int(row.month)}
+            for row in rows
+        ])
+
+
+def upgrade() -> None:
+    op.create_table(
+        'period_summaries',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('owner_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('account_id', UUID(as_uuid=True), sa.ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('year', sa.Integer(), nullable=False),
+        sa.Column('month', sa.Integer(), nullable=False),
+        sa.Column('total_amount', sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.Column('total_confirmed_amount', sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.Column('total_paid_amount', sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.Column('total_pending_amount', sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.Column('total_payments', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now(), onupdate=sa.func.now()),
+        sa.UniqueConstraint('owner_id', 'account_id', 'year', 'month', name='uq_period_summaries_owner_account_period'),
+    )
+    # Owner's months in a range (dashboard charts) are a single range scan
+    op.create_index('idx_period_summaries_owner_period', 'period_summaries', ['owner_id', 'year', 'month'])
+    _backfill()
+
+
+def downgrade() -> None:
+    op.drop_index('idx_period_summaries_owner_period', table_name='period_summaries')
+    op.drop_table('period_summaries')
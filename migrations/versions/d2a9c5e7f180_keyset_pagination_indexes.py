@@ -0,0 +1,28 @@
+"""keyset_pagination_indexes
+
+Revision ID: d2a9c5e7f180
+Revises: c4f81a6d2e93
+Create Date: 2026-10-17 19:05:43.218764
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2a9c5e7f180'
+down_revision = 'c4f81a6d2e93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Cursor pages seek on (created_at, id), per owner where the table has one
+    op.create_index('idx_expenses_created_id', 'expenses', ['created_at', 'id'])
+    op.create_index('idx_expense_categories_owner_created_id', 'expense_categories', ['owner_id', 'created_at', 'id'])
+    op.create_index('idx_accounts_owner_created_id', 'accounts', ['owner_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_accounts_owner_created_id', table_name='accounts')
+    op.drop_index('idx_expense_categories_owner_created_id', table_name='expense_categories')
+    op.drop_index('idx_expenses_created_id', table_name='expenses')
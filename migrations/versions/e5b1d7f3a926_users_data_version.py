@@ -0,0 +1,25 @@
+"""users_data_version
+
+Revision ID: e5b1d7f3a926
+Revises: d2a9c5e7f180
+Create Date: 2026-10-17 20:11:36.540218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b1d7f3a926'
+down_revision = 'd2a9c5e7f180'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Bumped by the repositories on every write to the user's data, source of the ETags
+    op.add_column('users', sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'data_version')
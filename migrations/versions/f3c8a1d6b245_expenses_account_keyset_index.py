@@ -0,0 +1,27 @@
+"""expenses_account_keyset_index
+
+Revision ID: f3c8a1d6b245
+Revises: e5b1d7f3a926
+Create Date: 2026-10-17 23:42:18.906315
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c8a1d6b245'
+down_revision = 'e5b1d7f3a926'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Expense cursor pages are filtered through the account (expenses have no owner_id column):
+    # prefix the (created_at, id) seek with account_id instead of scanning every user's expenses
+    op.drop_index('idx_expenses_created_id', table_name='expenses')
+    op.create_index('idx_expenses_account_created_id', 'expenses', ['account_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_expenses_account_created_id', table_name='expenses')
+    op.create_index('idx_expenses_created_id', 'expenses', ['created_at', 'id'])
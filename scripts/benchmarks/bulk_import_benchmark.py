@@ -0,0 +1,111 @@
+"""
+Compare importing N expenses one by one with the bulk create use case.
+
+Creates a user and a credit card, then imports the same synthetic bank statement (80%
+purchases in 1 to 12 installments, 20% subscriptions) twice into fresh databases: with
+one PurchaseCreateUseCase/SubscriptionCreateUseCase call per row (what N sequential
+POST requests do, minus HTTP) and with one ExpenseBulkCreateUseCase call.
+
+Usage:
+    CONN_DB=sqlite:///:memory: JWT_SECRET_KEY=x JWT_REFRESH_SECRET_KEY=y \\
+        python -m scripts.benchmarks.bulk_import_benchmark --rows 1000
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.application.dtos import BulkCreateExpensesDTO, CreatePurchaseDTO, CreateSubscriptionDTO
+from src.application.use_cases.expense import ExpenseBulkCreateUseCase, PurchaseCreateUseCase, SubscriptionCreateUseCase
+from src.domain.account import CreditCardFactory
+from src.domain.expense import ExpenseCategoryFactory
+from src.domain.shared import Amount
+from src.infrastructure.database.models import BaseModel, CreditCardModel, ExpenseCategoryModel, ExpenseModel
+from src.infrastructure.repositories import CreditCardRepositorySQL, ExpenseCategoryRepositorySQL, ExpenseRepositorySQL
+
+
+def build_statement(rows: int, account_id, category_id) -> BulkCreateExpensesDTO:
+    rnd = random.Random(42)
+    purchases, subscriptions = [], []
+    for i in range(rows):
+        acquired_at = date(2024, 1, 1) + timedelta(days=i % 365)
+        common = {
+            'account_id': account_id,
+            'title': f'Statement row {i}',
+            'cc_name': f'MERCHANT*{i}',
+            'acquired_at': acquired_at,
+            'amount': round(rnd.uniform(5, 2000), 2),
+            'first_payment_date': acquired_at + timedelta(days=30),
+            'category_id': category_id,
+        }
+        if rnd.random() < 0.8:
+            purchases.append(CreatePurchaseDTO(**common, installments=rnd.randint(1, 12)))
+        else:
+            subscriptions.append(CreateSubscriptionDTO(**common, installments=1, status='active'))
+    return BulkCreateExpensesDTO(purchases=purchases, subscriptions=subscriptions)
+
+
+def build_database(url: str) -> tuple[sessionmaker, ExpenseRepositorySQL, list]:
+    engine = create_engine(url)
+    BaseModel.metadata.drop_all(bind=engine)
+    BaseModel.metadata.create_all(bind=engine)
+    statements: list = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(1))
+    session_factory = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+    return session_factory, ExpenseRepositorySQL(model=ExpenseModel, session_factory=session_factory), statements
+
+
+def create_card(session_factory: sessionmaker):
+    card = CreditCardFactory.create(
+        id=uuid4(), owner_id=uuid4(), alias='Card', limit=Amount(10_000_000), is_enabled=True,
+        main_credit_card_id=None, next_closing_date=date.today(), next_expiring_date=date.today(),
+        financing_limit=Amount(10_000_000), expenses=[],
+    )
+    return CreditCardRepositorySQL(model=CreditCardModel, session_factory=session_factory).create(card)
+
+
+def create_category(session_factory: sessionmaker, owner_id):
+    category = ExpenseCategoryFactory.create(id=uuid4(), owner_id=owner_id, name='Imported', description='', is_income=False)
+    return ExpenseCategoryRepositorySQL(model=ExpenseCategoryModel, session_factory=session_factory).create(category)
+
+
+def import_one_by_one(repository: ExpenseRepositorySQL, data: BulkCreateExpensesDTO, owner_id) -> None:
+    for purchase in data.purchases:
+        PurchaseCreateUseCase(repository).execute(purchase)
+    for subscription in data.subscriptions:
+        SubscriptionCreateUseCase(repository).execute(subscription)
+
+
+def import_bulk(repository: ExpenseRepositorySQL, data: BulkCreateExpensesDTO, owner_id) -> None:
+    category_repository = ExpenseCategoryRepositorySQL(model=ExpenseCategoryModel, session_factory=repository.session_factory)
+    result = ExpenseBulkCreateUseCase(repository, category_repository).execute(data, owner_id)
+    assert not result.errors
+
+
+def main(rows: int, url: str) -> None:
+    results = {}
+    for name, importer in {'one by one': import_one_by_one, 'bulk': import_bulk}.items():
+        session_factory, repository, statements = build_database(url)
+        card = create_card(session_factory)
+        category = create_category(session_factory, card.owner_id)
+        data = build_statement(rows, card.id, category.id)
+        statements.clear()
+        start = time.perf_counter()
+        importer(repository, data, card.owner_id)
+        elapsed = time.perf_counter() - start
+        assert repository.count_by_filter({'owner_id': card.owner_id}) == rows
+        results[name] = elapsed
+        print(f'{name:<12} {elapsed * 1000:>10.0f} ms  {len(statements):>6} statements')
+    print(f'speedup: {results["one by one"] / results["bulk"]:.1f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--url', default='sqlite://', help='database to import into (tables are dropped and recreated)')
+    args = parser.parse_args()
+    main(args.rows, args.url)
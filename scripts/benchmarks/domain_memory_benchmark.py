@@ -0,0 +1,131 @@
+"""
+Measure the memory held by a synthetic user's payments with tracemalloc.
+
+Builds N Payment entities (each with its Amount) plus one PeriodPayment per payment,
+the way a card listing plus a period projection does, and compares it with the same
+data held by plain __dict__-backed objects (the layout before __slots__).
+
+Usage:
+    CONN_DB=sqlite:///:memory: JWT_SECRET_KEY=x JWT_REFRESH_SECRET_KEY=y \\
+        python -m scripts.benchmarks.domain_memory_benchmark --payments 10000
+"""
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from datetime import date, timedelta
+from uuid import uuid4
+
+from src.domain.account.enums import AccountType
+from src.domain.expense import Payment, PeriodPayment
+from src.domain.expense.enums import PaymentStatus, ExpenseStatus, ExpenseType
+from src.domain.shared import Amount
+
+
+# Same constructors without __slots__: the layout before this change (per-instance __dict__)
+class DictAmount:
+    __init__ = Amount.__init__
+
+
+class DictPeriodPayment:
+    __init__ = PeriodPayment.__init__
+
+
+class DictPayment:
+    def __init__(self, id, expense_id, amount, no_installment, status, payment_date, is_last_payment) -> None:
+        self.id = id
+        self.expense_id = expense_id
+        self.amount = amount
+        self.no_installment = no_installment
+        self.status = status
+        self.payment_date = payment_date
+        self.is_last_payment = is_last_payment
+
+
+def build_payment_data(count: int) -> list[dict]:
+    expense_id, account_id = uuid4(), uuid4()
+    start = date(2025, 1, 10)
+    return [
+        {
+            'id': uuid4(),
+            'expense_id': expense_id,
+            'account_id': account_id,
+            'amount': 100.0 + i % 97,
+            'no_installment': i % 12 + 1,
+            'payment_date': start + timedelta(days=i % 365),
+        }
+        for i in range(count)
+    ]
+
+
+def build_objects(data: list[dict], payment_cls: type, period_payment_cls: type, amount_cls: type) -> list:
+    objects = []
+    for row in data:
+        payment = payment_cls(
+            id=row['id'],
+            expense_id=row['expense_id'],
+            amount=amount_cls(row['amount']),
+            no_installment=row['no_installment'],
+            status=PaymentStatus.UNCONFIRMED,
+            payment_date=row['payment_date'],
+            is_last_payment=False,
+        )
+        objects.append(payment)
+        objects.append(period_payment_cls(
+            payment_id=row['id'],
+            amount=amount_cls(row['amount']),
+            status=PaymentStatus.UNCONFIRMED,
+            payment_date=row['payment_date'],
+            no_installment=row['no_installment'],
+            is_last_payment=False,
+            expense_id=row['expense_id'],
+            expense_title='Synthetic purchase',
+            expense_type=ExpenseType.PURCHASE,
+            expense_cc_name='SYNTH',
+            expense_acquired_at=date(2025, 1, 1),
+            expense_installments=12,
+            expense_status=ExpenseStatus.ACTIVE,
+            expense_category_name=None,
+            account_id=row['account_id'],
+            account_alias='Card',
+            account_is_enabled=True,
+            account_type=AccountType.CREDIT_CARD,
+        ))
+    return objects
+
+
+def build_slotted(data: list[dict]) -> list:
+    return build_objects(data, Payment, PeriodPayment, Amount)
+
+
+def build_dict_backed(data: list[dict]) -> list:
+    return build_objects(data, DictPayment, DictPeriodPayment, DictAmount)
+
+
+def measure(builder: Callable[[list[dict]], list], data: list[dict]) -> int:
+    """Bytes still allocated by the objects builder() returns (input data excluded)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = builder(data)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def main(payments: int) -> None:
+    data = build_payment_data(payments)
+    dict_backed = measure(build_dict_backed, data)
+    slotted = measure(build_slotted, data)
+    print(f'payments: {payments}')
+    print(f'__dict__ objects  {dict_backed / 1024:>10.1f} KiB  ({dict_backed / payments:.0f} B/payment)')
+    print(f'__slots__ objects {slotted / 1024:>10.1f} KiB  ({slotted / payments:.0f} B/payment)')
+    print(f'reduction: {1 - slotted / dict_backed:.1%}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--payments', type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.payments)
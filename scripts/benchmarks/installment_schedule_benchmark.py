@@ -0,0 +1,99 @@
+"""
+Time the payment schedule of N purchases in M installments each.
+
+Compares Purchase.calculate_payments (one installment_schedule pass, Payment built
+directly) with the former per-installment loop: an Amount, a PaymentFactory.create and
+an add_months_to_date chained from the previous due date for every installment. Both
+build the same Payment entities, uuid4() ids included.
+
+Usage:
+    CONN_DB=sqlite:///:memory: JWT_SECRET_KEY=x JWT_REFRESH_SECRET_KEY=y \\
+        python -m scripts.benchmarks.installment_schedule_benchmark --purchases 1000 --installments 48
+"""
+import argparse
+import random
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+from uuid import uuid4
+
+from src.domain.expense import PaymentFactory, Purchase
+from src.domain.expense.enums import PaymentStatus
+from src.domain.shared import Amount, date_helpers
+
+
+def legacy_calculate_payments(purchase: Purchase) -> None:
+    'Purchase.calculate_payments before the schedule helper.'
+    precision = purchase.amount.precision
+    remaining_units = purchase.amount.units
+    remaining_installments = purchase.installments
+    payment_date: date = purchase.first_payment_date or purchase.acquired_at
+    for no in range(1, purchase.installments + 1):
+        installment_amount = Amount.from_units(round(remaining_units / remaining_installments), precision)
+        payment = PaymentFactory.create(
+            id=uuid4(),
+            expense_id=purchase.id,
+            amount=installment_amount,
+            no_installment=no,
+            status=PaymentStatus.UNCONFIRMED,
+            payment_date=payment_date,
+            is_last_payment=(no == purchase.installments)
+        )
+        purchase.payments.append(payment)
+        remaining_units -= installment_amount.units
+        remaining_installments -= 1
+        payment_date = date_helpers.add_months_to_date(payment_date, 1) if purchase.installments > 1 else payment_date
+
+
+def build_purchases(count: int, installments: int) -> list[Purchase]:
+    rng = random.Random(0)
+    purchases = []
+    for _ in range(count):
+        first_payment_date = date(2024, 1, 1) + timedelta(days=rng.randint(0, 365))
+        purchase = Purchase(
+            id=uuid4(),
+            account_id=uuid4(),
+            title='Purchase',
+            cc_name='Purchase',
+            acquired_at=first_payment_date,
+            amount=Amount.from_units(rng.randint(1_000, 5_000_000)),
+            installments=1,
+            first_payment_date=first_payment_date,
+            category_id=uuid4(),
+            payments=[],
+        )
+        purchase.installments = installments
+        purchases.append(purchase)
+    return purchases
+
+
+def measure(calculate: Callable[[Purchase], None], purchases: list[Purchase], repeat: int) -> float:
+    """Best wall time in ms of computing the payments of every purchase."""
+    best = float('inf')
+    for _ in range(repeat):
+        for purchase in purchases:
+            purchase.payments = []
+        start = time.perf_counter()
+        for purchase in purchases:
+            calculate(purchase)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(purchases: int, installments: int, repeat: int) -> None:
+    data = build_purchases(purchases, installments)
+    legacy = measure(legacy_calculate_payments, data, repeat)
+    schedule = measure(Purchase.calculate_payments, data, repeat)
+    print(f'purchases: {purchases} x {installments} installments ({purchases * installments} payments)')
+    print(f'per-installment loop  {legacy:>9.1f} ms')
+    print(f'installment_schedule  {schedule:>9.1f} ms')
+    print(f'speedup: {legacy / schedule:.1f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--purchases', type=int, default=1000)
+    parser.add_argument('--installments', type=int, default=48)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    main(args.purchases, args.installments, args.repeat)
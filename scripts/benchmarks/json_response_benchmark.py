@@ -0,0 +1,119 @@
+"""
+Compare the time to answer a period projection with the default and the fast JSON path.
+
+Builds a synthetic 12 month projection of N payments and serves it from two routes:
+the default path (DTOs validated on construction, then response_model's dump, validate
+and serialize round trip, jsonable output and json.dumps) and the fast path (DTOs built
+with model_construct by the period helpers, returned as FastJSONResponse). Requests go
+through httpx's ASGITransport, so only the app is measured; both bodies are compared.
+
+Usage:
+    CONN_DB=sqlite:///:memory: JWT_SECRET_KEY=x JWT_REFRESH_SECRET_KEY=y \\
+        python -m scripts.benchmarks.json_response_benchmark --payments 2000
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import date
+from uuid import uuid4
+
+import httpx
+from fastapi import FastAPI, Response
+
+from src.application.dtos import PeriodPaymentDTO, PeriodResponseDTO
+from src.application.use_cases.period.helpers import parse_period
+from src.domain.account.enums import AccountType
+from src.domain.expense import Period, PeriodPayment
+from src.domain.expense.enums import ExpenseStatus, ExpenseType, PaymentStatus
+from src.domain.shared import Amount, Month, Year
+from src.entrypoints.responses import FastJSONResponse, fast_json
+
+
+def build_projection(payments: int, months: int) -> list[Period]:
+    account_id = uuid4()
+    expense_ids = [uuid4() for _ in range(-(-payments // months))]
+    periods = []
+    for index in range(months):
+        year, month = divmod(index, 12)
+        count = payments // months + (index < payments % months)
+        period_payments = [
+            PeriodPayment(
+                payment_id=uuid4(),
+                amount=Amount(100 + i % 97 + 0.25),
+                status=[PaymentStatus.UNCONFIRMED, PaymentStatus.CONFIRMED, PaymentStatus.PAID][i % 3],
+                payment_date=date(2025 + year, month + 1, 10),
+                no_installment=index + 1,
+                is_last_payment=index == months - 1,
+                expense_id=expense_ids[i],
+                expense_title=f'Synthetic purchase {i}',
+                expense_type=ExpenseType.PURCHASE,
+                expense_cc_name='SYNTH',
+                expense_acquired_at=date(2024, 12, 1),
+                expense_installments=months,
+                expense_status=ExpenseStatus.ACTIVE,
+                expense_category_name=None,
+                account_id=account_id,
+                account_alias='Card',
+                account_is_enabled=True,
+                account_type=AccountType.CREDIT_CARD,
+            )
+            for i in range(count)
+        ]
+        periods.append(Period(id=uuid4(), month=Month(month + 1), year=Year(2025 + year), payments=period_payments))
+    return periods
+
+
+def parse_period_validated(period: Period) -> PeriodResponseDTO:
+    """The former helpers: same fields, DTOs validated on construction."""
+    constructed = parse_period(period)
+    payments = [PeriodPaymentDTO(**dict(payment)) for payment in constructed.payments]
+    return PeriodResponseDTO(**{**dict(constructed), 'payments': payments})
+
+
+def build_app(periods: list[Period]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/default', response_model=list[PeriodResponseDTO])
+    async def default() -> list[PeriodResponseDTO]:
+        return [parse_period_validated(period) for period in periods]
+
+    @app.get('/fast', response_model=list[PeriodResponseDTO], response_class=FastJSONResponse)
+    async def fast(response: Response) -> FastJSONResponse:
+        return fast_json([parse_period(period) for period in periods], response)
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, requests: int) -> tuple[float, bytes]:
+    """Return milliseconds per request and the last body."""
+    response = await client.get(path)  # warm up
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(path)
+        assert response.status_code == 200
+    elapsed = time.perf_counter() - start
+    return elapsed / requests * 1000, response.content
+
+
+async def main(payments: int, months: int, requests: int) -> None:
+    periods = build_projection(payments, months)
+    transport = httpx.ASGITransport(app=build_app(periods))
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        default_ms, default_body = await measure(client, '/default', requests)
+        fast_ms, fast_body = await measure(client, '/fast', requests)
+    total = sum(len(period.payments) for period in periods)
+    print(f'payments: {total} in {months} periods, response: {len(fast_body) / 1024:.0f} KiB')
+    print(f'default (validate + jsonable + json.dumps) {default_ms:>8.1f} ms/request')
+    print(f'fast (model_construct + pydantic-core)     {fast_ms:>8.1f} ms/request')
+    print(f'speedup: {default_ms / fast_ms:.1f}x')
+    print(f'same JSON: {json.loads(default_body) == json.loads(fast_body)}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--payments', type=int, default=2000)
+    parser.add_argument('--months', type=int, default=12)
+    parser.add_argument('--requests', type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.payments, args.months, args.requests))
@@ -0,0 +1,100 @@
+"""
+Compare requests per second of an authenticated hello-world route behind JWTMiddleware.
+
+Runs the pure ASGI JWTMiddleware against the previous BaseHTTPMiddleware layout (same
+token handling, wrapped in dispatch/call_next) and no middleware at all. Requests go
+through httpx's ASGITransport, so only the app and middleware stack is measured.
+
+Usage:
+    CONN_DB=sqlite:///:memory: JWT_SECRET_KEY=x JWT_REFRESH_SECRET_KEY=y \\
+        python -m scripts.benchmarks.jwt_middleware_benchmark --requests 5000
+"""
+import argparse
+import asyncio
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp
+
+from src.application.helpers.security import decode_jwt_cached, encode_jwt
+from src.config import settings
+from src.entrypoints.middlewares.jwt_middleware import JWTMiddleware
+
+
+class BaseHTTPJWTMiddleware(BaseHTTPMiddleware):
+    """The former BaseHTTPMiddleware layout, reusing the ASGI middleware's token logic."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        super().__init__(app)
+        self.jwt_middleware = JWTMiddleware(app)
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        token = request.headers.get('Authorization')
+        if token is None or not token.startswith('Bearer'):
+            return await call_next(request)
+        jwt_payload = decode_jwt_cached(token.split(' ')[1], settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+        response = await call_next(request)
+        response.headers.update(self.jwt_middleware._get_renewal_headers(jwt_payload))
+        return response
+
+
+def build_app(middleware: list[Middleware]) -> FastAPI:
+    app = FastAPI(middleware=middleware)
+
+    @app.get('/hello')
+    async def hello() -> dict:
+        return {'hello': 'world'}
+
+    return app
+
+
+async def measure(app: FastAPI, token: str, requests: int, concurrency: int) -> float:
+    """Return requests per second for `requests` GET /hello calls."""
+    transport = httpx.ASGITransport(app=app)
+    headers = {'Authorization': f'Bearer {token}'}
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        # Warm up (route compilation, JWT cache)
+        await client.get('/hello', headers=headers)
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                response = await client.get('/hello', headers=headers)
+                assert response.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return (requests // concurrency) * concurrency / elapsed
+
+
+async def main(requests: int, concurrency: int) -> None:
+    token = encode_jwt(
+        {'sub': str(uuid4()), 'role': 'free_user', 'email': 'bench@example.com'},
+        settings.JWT_SECRET_KEY,
+        settings.JWT_ALGORITHM,
+        timedelta(minutes=settings.JWT_EXPIRATION_TIME_MINUTES),
+    )
+    scenarios = {
+        'no middleware': build_app([]),
+        'BaseHTTPMiddleware': build_app([Middleware(BaseHTTPJWTMiddleware)]),
+        'pure ASGI': build_app([Middleware(JWTMiddleware)]),
+    }
+    results = {}
+    for name, app in scenarios.items():
+        results[name] = await measure(app, token, requests, concurrency)
+        print(f'{name:<20} {results[name]:>10.0f} req/s')
+    gain = results['pure ASGI'] / results['BaseHTTPMiddleware'] - 1
+    print(f'pure ASGI vs BaseHTTPMiddleware: {gain:+.1%}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,99 @@
+"""
+Time the month lookups a period listing does on a credit card with many payments.
+
+Builds a card with N purchases (installments spread over the next months) and asks
+CreditCard.get_payments for every month of the range, as Period.fill_from_account does
+once per period. Compares it with the former lookup: a linear scan of every expense's
+payments, concatenated with reduce(lambda acc, exp: acc + ...).
+
+Usage:
+    CONN_DB=sqlite:///:memory: JWT_SECRET_KEY=x JWT_REFRESH_SECRET_KEY=y \\
+        python -m scripts.benchmarks.period_lookup_benchmark --purchases 2000 --months 24
+"""
+import argparse
+import random
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+from functools import reduce
+from uuid import uuid4
+
+from src.domain.account import CreditCard, CreditCardFactory
+from src.domain.expense import Payment, Purchase
+from src.domain.shared import Amount, date_helpers
+
+
+def legacy_get_payments(card: CreditCard, month: int, year: int) -> list[Payment]:
+    'CreditCard.get_payments before the per-expense month index.'
+    def expense_payments(expense) -> list[Payment]:
+        payments = []
+        for payment in expense.payments:
+            if payment.payment_date.month == month and payment.payment_date.year == year:
+                payments.append(payment)
+        return payments
+    return reduce(lambda acc, exp: acc + expense_payments(exp), card.expenses, [])
+
+
+def build_card(purchases: int) -> CreditCard:
+    rng = random.Random(0)
+    card = CreditCardFactory.create(
+        id=uuid4(),
+        owner_id=uuid4(),
+        alias='Benchmark Card',
+        limit=Amount(10_000_000),
+        is_enabled=True,
+        main_credit_card_id=None,
+        next_closing_date=date(2025, 1, 1),
+        next_expiring_date=date(2025, 1, 10),
+        financing_limit=Amount(10_000_000),
+        expenses=[],
+    )
+    for _ in range(purchases):
+        first_payment_date = date(2025, 1, 1) + timedelta(days=rng.randint(0, 365))
+        card.expenses.append(Purchase(
+            id=uuid4(),
+            account_id=card.id,
+            title='Purchase',
+            cc_name='PURCHASE',
+            acquired_at=first_payment_date,
+            amount=Amount.from_units(rng.randint(1_000, 500_000)),
+            installments=rng.choice([1, 3, 6, 12, 18]),
+            first_payment_date=first_payment_date,
+            category_id=uuid4(),
+            payments=[],
+        ))
+    return card
+
+
+def measure(get_payments: Callable, card: CreditCard, months: list[date], repeat: int) -> tuple[float, int]:
+    """Best wall time in ms of looking up every month, and the payments found."""
+    best, found = float('inf'), 0
+    for _ in range(repeat):
+        for expense in card.expenses:
+            expense.payments = list(expense.payments)  # drop the month index of the previous run
+        start = time.perf_counter()
+        found = sum(len(get_payments(card, d.month, d.year)) for d in months)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, found
+
+
+def main(purchases: int, months: int, repeat: int) -> None:
+    card = build_card(purchases)
+    periods = list(date_helpers.iter_monthly_dates(date(2025, 1, 1), months))
+    payments = sum(len(expense.payments) for expense in card.expenses)
+    print(f'purchases: {purchases} ({payments} payments), months: {months}')
+    legacy, legacy_found = measure(legacy_get_payments, card, periods, repeat)
+    indexed, indexed_found = measure(CreditCard.get_payments, card, periods, repeat)
+    assert legacy_found == indexed_found
+    print(f'linear scan + reduce  {legacy:>9.1f} ms')
+    print(f'month index           {indexed:>9.1f} ms')
+    print(f'speedup: {legacy / indexed:.1f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--purchases', type=int, default=2000)
+    parser.add_argument('--months', type=int, default=24)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    main(args.purchases, args.months, args.repeat)
@@ -0,0 +1,141 @@
+"""
+Time and memory of projecting N active subscriptions over M months.
+
+Compares the former per-period simulation (a max() over the subscription's payments in
+every period, then a full simulated Payment with its own uuid4(), the way
+Subscription.get_next_payment builds it) with Subscription.iter_simulated_occurrences
+(last payment looked up once, one occurrence computed per month read). Also reports
+what opening the occurrence iterators costs when none of their months is read.
+
+Usage:
+    CONN_DB=sqlite:///:memory: JWT_SECRET_KEY=x JWT_REFRESH_SECRET_KEY=y \\
+        python -m scripts.benchmarks.subscription_projection_benchmark --subscriptions 50 --months 24
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import date
+from uuid import uuid4
+
+from src.domain.expense import Payment, PaymentFactory, Subscription
+from src.domain.expense.enums import PaymentStatus
+from src.domain.shared import Amount, date_helpers
+
+
+def build_subscriptions(count: int, history: int) -> list[Subscription]:
+    subscriptions = []
+    for i in range(count):
+        first_payment_date = date(2023, 1, i % 28 + 1)
+        subscription = Subscription(
+            id=uuid4(),
+            account_id=uuid4(),
+            title=f'Subscription {i}',
+            cc_name='SUB',
+            acquired_at=first_payment_date,
+            amount=Amount(10 + i),
+            first_payment_date=first_payment_date,
+            category_id=uuid4(),
+            payments=[],
+        )
+        subscription.payments = [
+            PaymentFactory.create(
+                id=uuid4(),
+                expense_id=subscription.id,
+                amount=subscription.amount,
+                no_installment=no,
+                status=PaymentStatus.PAID,
+                payment_date=payment_date,
+            )
+            for no, payment_date in enumerate(date_helpers.iter_monthly_dates(first_payment_date, history), start=1)
+        ]
+        subscriptions.append(subscription)
+    return subscriptions
+
+
+def get_months(subscriptions: list[Subscription], months: int) -> list[tuple[int, int]]:
+    'The `months` (month, year) periods right after the latest payment of any subscription.'
+    last = max(payment.payment_date for subscription in subscriptions for payment in subscription.payments)
+    start = date_helpers.add_months_to_date(last.replace(day=1), 1)
+    return [(d.month, d.year) for d in date_helpers.iter_monthly_dates(start, months)]
+
+
+def legacy_projection(subscriptions: list[Subscription], months: list[tuple[int, int]]) -> list[Payment]:
+    'Former simulation: the last payment is searched again and a Payment built for every period.'
+    simulated = []
+    for month, year in months:
+        for subscription in subscriptions:
+            last_payment = max(subscription.payments, key=lambda p: p.payment_date)
+            if (year, month) <= (last_payment.payment_date.year, last_payment.payment_date.month):
+                continue
+            months_diff = (year - last_payment.payment_date.year) * 12 + month - last_payment.payment_date.month
+            simulated.append(PaymentFactory.create(
+                id=uuid4(),
+                expense_id=subscription.id,
+                amount=Amount(subscription.amount.value),
+                no_installment=last_payment.no_installment + months_diff,
+                status=PaymentStatus.SIMULATED,
+                payment_date=date_helpers.clamp_to_month(year, month, subscription.first_payment_date.day),
+                is_last_payment=False,
+            ))
+    return simulated
+
+
+def occurrences_projection(subscriptions: list[Subscription], months: list[tuple[int, int]]) -> list:
+    (first_month, first_year), (last_month, last_year) = months[0], months[-1]
+    return [
+        occurrence
+        for subscription in subscriptions
+        for occurrence in subscription.iter_simulated_occurrences(first_month, first_year, last_month, last_year)
+    ]
+
+
+def unread_occurrences(subscriptions: list[Subscription], months: list[tuple[int, int]]) -> list:
+    (first_month, first_year), (last_month, last_year) = months[0], months[-1]
+    return [
+        subscription.iter_simulated_occurrences(first_month, first_year, last_month, last_year)
+        for subscription in subscriptions
+    ]
+
+
+def measure(project: Callable, subscriptions: list[Subscription], months: list[tuple[int, int]], repeat: int) -> tuple[float, int]:
+    """Best wall time in ms and bytes still held by the result of project()."""
+    best = float('inf')
+    for _ in range(repeat):
+        for subscription in subscriptions:
+            subscription.payments = list(subscription.payments)  # drop the cached last payment
+        start = time.perf_counter()
+        project(subscriptions, months)
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = project(subscriptions, months)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return best * 1000, after - before
+
+
+def main(subscriptions: int, months: int, history: int, repeat: int) -> None:
+    data = build_subscriptions(subscriptions, history)
+    periods = get_months(data, months)
+    print(f'subscriptions: {subscriptions} ({history} payments each), months: {months}')
+    for label, project in [
+        ('per-period Payment', legacy_projection),
+        ('occurrences', occurrences_projection),
+        ('occurrences, unread', unread_occurrences),
+    ]:
+        elapsed, allocated = measure(project, data, periods, repeat)
+        print(f'{label:<20} {elapsed:>8.2f} ms  {allocated / 1024:>8.1f} KiB')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--subscriptions', type=int, default=50)
+    parser.add_argument('--months', type=int, default=24)
+    parser.add_argument('--history', type=int, default=24, help='recorded payments per subscription')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    main(args.subscriptions, args.months, args.history, args.repeat)
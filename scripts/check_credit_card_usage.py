@@ -0,0 +1,46 @@
+"""
+Check the usage stored on each credit card against its expenses and payments.
+
+Recomputes every card's used limits and expense counts from the expense and payment
+rows and lists the cards whose stored figures differ. With --fix, the stored figures of
+those cards are overwritten with the recomputed ones. Exits with status 1 when drift
+was found and not fixed.
+
+Usage:
+    python -m scripts.check_credit_card_usage [--fix]
+"""
+import argparse
+import sys
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.domain.account import CreditCardUsage
+from src.infrastructure.database import db_conn
+from src.infrastructure.repositories.credit_card_usage_sql import find_usage_drift, store_usage
+
+
+def fix_usage_drift(session: Session, drift: dict[UUID, tuple[CreditCardUsage, CreditCardUsage]]) -> None:
+    for account_id, (_, expected_usage) in drift.items():
+        store_usage(session, account_id, expected_usage)
+    session.commit()
+
+
+def main(fix: bool) -> int:
+    with db_conn.SessionLocal() as session:
+        drift = find_usage_drift(session)
+        for account_id, (stored_usage, expected_usage) in drift.items():
+            print(f'{account_id}: stored {stored_usage!r}, expected {expected_usage!r}')
+        print(f'{len(drift)} credit card(s) with drifted usage')
+        if drift and fix:
+            fix_usage_drift(session, drift)
+            print(f'fixed {len(drift)} credit card(s)')
+            return 0
+    return 1 if drift else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fix', action='store_true', help='overwrite drifted figures with the recomputed ones')
+    args = parser.parse_args()
+    sys.exit(main(args.fix))
@@ -0,0 +1,37 @@
+"""
+Check the stored period summaries against the payments.
+
+Recomputes the totals of every (account, month) with payments from the payment rows and
+lists the periods whose stored summary differs, is missing or no longer has payments.
+With --fix, those periods are recomputed and stored again. Exits with status 1 when
+drift was found and not fixed.
+
+Usage:
+    python -m scripts.check_period_summaries [--fix]
+"""
+import argparse
+import sys
+
+from src.infrastructure.database import db_conn
+from src.infrastructure.repositories.period_summary_sql import find_period_summary_drift, refresh_period_summaries
+
+
+def main(fix: bool) -> int:
+    with db_conn.SessionLocal() as session:
+        drift = find_period_summary_drift(session)
+        for (account_id, year, month), (stored, expected) in sorted(drift.items(), key=lambda item: item[0][1:]):
+            print(f'{account_id} {month:02}/{year}: stored {stored}, expected {expected}')
+        print(f'{len(drift)} period summary(ies) drifted')
+        if drift and fix:
+            refresh_period_summaries(session, drift.keys())
+            session.commit()
+            print(f'fixed {len(drift)} period summary(ies)')
+            return 0
+    return 1 if drift else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fix', action='store_true', help='recompute and store the drifted periods')
+    args = parser.parse_args()
+    sys.exit(main(args.fix))
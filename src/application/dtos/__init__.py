@@ -23,9 +23,14 @@ from .expense_dtos import (
     UpdatePurchaseDTO,
     CreateSubscriptionDTO,
     UpdateSubscriptionDTO,
+    BulkCreateExpensesDTO,
+    BulkRowErrorDTO,
+    BulkCreateExpensesResultDTO,
 )
 from .payment_dtos import PaymentResponseDTO, CreatePaymentDTO, UpdatePaymentDTO
 from .period_dtos import PeriodPaymentDTO, PeriodResponseDTO, PeriodSummaryDTO
+from .metrics_dtos import PoolMetricsDTO, PasswordHasherMetricsDTO, CacheMetricsDTO
+from .export_dtos import ExportFormat
 
 
 __all__ = [
@@ -60,6 +65,9 @@ __all__ = [
     'UpdatePurchaseDTO',
     'CreateSubscriptionDTO',
     'UpdateSubscriptionDTO',
+    'BulkCreateExpensesDTO',
+    'BulkRowErrorDTO',
+    'BulkCreateExpensesResultDTO',
     # Payment
     'PaymentResponseDTO',
     'CreatePaymentDTO',
@@ -68,4 +76,10 @@ __all__ = [
     'PeriodPaymentDTO',
     'PeriodResponseDTO',
     'PeriodSummaryDTO',
+    # Metrics
+    'PoolMetricsDTO',
+    'PasswordHasherMetricsDTO',
+    'CacheMetricsDTO',
+    # Export
+    'ExportFormat',
 ]
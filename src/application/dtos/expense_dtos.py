@@ -1,7 +1,7 @@
 from uuid import UUID
 from datetime import date
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from src.domain.expense.enums import ExpenseStatus, ExpenseType
 from .payment_dtos import PaymentResponseDTO as Payment
@@ -72,3 +72,30 @@ class UpdateSubscriptionDTO(BaseModel):
     first_payment_date: date | None = None
     status: ExpenseStatus | None = None
     category_id: UUID | None = None
+
+
+# Rows accepted by one bulk create request (purchases + subscriptions)
+MAX_BULK_ROWS = 1000
+
+
+class BulkCreateExpensesDTO(BaseModel):
+    purchases: list[CreatePurchaseDTO] = Field(default_factory=list)
+    subscriptions: list[CreateSubscriptionDTO] = Field(default_factory=list)
+
+    @model_validator(mode='after')
+    def check_size(self) -> 'BulkCreateExpensesDTO':
+        if len(self.purchases) + len(self.subscriptions) > MAX_BULK_ROWS:
+            raise ValueError(f'At most {MAX_BULK_ROWS} expenses per request')
+        return self
+
+
+class BulkRowErrorDTO(BaseModel):
+    expense_type: ExpenseType = Field(..., description='List the row belongs to')
+    index: int = Field(..., ge=0, description='Position of the row in its list')
+    description: str
+
+
+class BulkCreateExpensesResultDTO(BaseModel):
+    created_count: int = Field(..., ge=0)
+    created_ids: list[UUID] = Field(default_factory=list, description='IDs of the created expenses, purchases first, in request order')
+    errors: list[BulkRowErrorDTO] = Field(default_factory=list, description='Rows that were not created')
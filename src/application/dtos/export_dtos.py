@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+    @property
+    def media_type(self) -> str:
+        return 'application/x-ndjson' if self is ExportFormat.NDJSON else 'text/csv'
@@ -0,0 +1,38 @@
+from pydantic import BaseModel, Field
+
+
+class PoolMetricsDTO(BaseModel):
+    pool_class: str = Field(..., description='SQLAlchemy pool implementation')
+    checkouts: int = Field(..., ge=0, description='Connections handed out since startup')
+    checkout_timeouts: int = Field(..., ge=0, description='Checkouts that gave up after pool_timeout')
+    checkout_wait_total_ms: float = Field(..., ge=0)
+    checkout_wait_avg_ms: float = Field(..., ge=0)
+    checkout_wait_max_ms: float = Field(..., ge=0)
+    connections_opened: int = Field(..., ge=0, description='New DBAPI connections opened')
+    connections_invalidated: int = Field(..., ge=0)
+    # Only reported by QueuePool
+    pool_size: int | None = None
+    checked_out: int | None = Field(None, description='Connections currently in use')
+    checked_in: int | None = Field(None, description='Idle connections in the pool')
+    overflow: int | None = Field(None, description='Connections open beyond pool_size')
+    max_overflow: int | None = None
+    async_pool: 'PoolMetricsDTO | None' = Field(None, description='Pool of the async engine (asyncpg), sized by the same settings')
+
+
+class PasswordHasherMetricsDTO(BaseModel):
+    max_workers: int = Field(..., ge=1, description='bcrypt calls running in parallel')
+    max_queue: int = Field(..., ge=0, description='Waiting calls before rejecting with 503')
+    queued: int = Field(..., ge=0, description='Calls waiting for a free worker (queue depth)')
+    running: int = Field(..., ge=0)
+    completed: int = Field(..., ge=0)
+    rejected: int = Field(..., ge=0, description='Calls rejected because the queue was full')
+
+
+class CacheMetricsDTO(BaseModel):
+    enabled: bool
+    backend: str | None = Field(None, description='Cache implementation (InMemoryCache or RedisCache)')
+    ttl: int | None = Field(None, description='Seconds a cached result is served')
+    hits: int = Field(0, ge=0, description='Reads served from the cache')
+    misses: int = Field(0, ge=0, description='Reads that went to the database')
+    hit_ratio: float = Field(0.0, ge=0, le=1)
+    invalidations: int = Field(0, ge=0, description='Writes that dropped a user\'s cached results')
@@ -5,18 +5,23 @@ T = TypeVar('T')
 
 
 class Pagination(BaseModel):
-    current_page: int = Field(..., ge=1)
-    total_pages: int = Field(..., ge=0)
-    total_items: int = Field(..., ge=0)
+    # Page numbers only apply to offset pagination; cursor pages have next_cursor instead
+    current_page: int | None = Field(None, ge=1)
+    total_pages: int | None = Field(None, ge=0)
+    # None when the total was not counted (cursor pagination without include_total)
+    total_items: int | None = Field(None, ge=0)
     per_page: int = Field(..., ge=1)
+    next_cursor: str | None = Field(None, description='Opaque cursor of the next page, None on the last one')
 
     @property
     def has_next_page(self) -> bool:
+        if self.current_page is None or self.total_pages is None:
+            return self.next_cursor is not None
         return self.current_page < self.total_pages
 
     @property
     def has_previous_page(self) -> bool:
-        return self.current_page > 1
+        return self.current_page is not None and self.current_page > 1
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
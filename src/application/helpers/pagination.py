@@ -0,0 +1,33 @@
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from src.application.dtos import Pagination
+from src.application.ports import CursorKey
+
+
+def encode_cursor(key: CursorKey) -> str:
+    """Opaque cursor for a (created_at, id) keyset position."""
+    created_at, id = key
+    return base64.urlsafe_b64encode(f'{created_at.isoformat()}|{id}'.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    """Inverse of encode_cursor. Raises ValueError for cursors it did not produce."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        created_at, id = raw.split('|')
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError('Invalid pagination cursor')
+
+
+def get_cursor_pagination(limit: int, next_key: CursorKey | None, total_items: int | None = None) -> Pagination:
+    """Pagination details of a cursor page (page numbers don't apply)."""
+    return Pagination(
+        total_pages=None if total_items is None else -(-total_items // limit),
+        total_items=total_items,
+        per_page=limit,
+        next_cursor=encode_cursor(next_key) if next_key is not None else None,
+    )
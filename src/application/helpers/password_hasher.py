@@ -0,0 +1,87 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from src.common.exceptions import PasswordHasherBusyError
+from src.config import settings
+from . import security
+
+
+class PasswordHasher:
+    """
+    Run bcrypt hash/verify on a dedicated, bounded thread pool.
+
+    bcrypt releases the GIL, so max_workers threads hash in parallel while the event loop
+    and the request threadpool stay free. At most max_queue calls wait for a worker;
+    beyond that PasswordHasherBusyError is raised instead of piling up requests.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 64) -> None:
+        self.max_workers: int = max_workers
+        self.max_queue: int = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hasher')
+        self._lock = threading.Lock()
+        self._queued: int = 0
+        self._running: int = 0
+        self._completed: int = 0
+        self._rejected: int = 0
+
+    async def hash(self, plain_password: str) -> str:
+        return await self._submit(security.hash_password, plain_password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(security.verify_password, plain_password, hashed_password)
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker."""
+        return self._queued
+
+    def get_metrics(self) -> dict:
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'queued': self._queued,
+                'running': self._running,
+                'completed': self._completed,
+                'rejected': self._rejected,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._queued >= self.max_queue:
+                self._rejected += 1
+                raise PasswordHasherBusyError()
+            self._queued += 1
+        future = self._executor.submit(self._run, fn, *args)
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    def _on_done(self, future: Future) -> None:
+        # A call cancelled before a worker picked it up never reaches _run
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    max_queue=settings.PASSWORD_HASHER_MAX_QUEUE,
+)
@@ -0,0 +1,187 @@
+import hashlib
+import inspect
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+from uuid import UUID, uuid4
+
+from src.application.ports import AsyncUnitOfWork, Cache, UnitOfWork
+
+T = TypeVar('T')
+
+
+class ResultCache:
+    """
+    Read results cached per user on a Cache port.
+
+    Every entry of a user is tagged with the user, so a write by that user drops all of
+    them at once. Inside a unit of work the entries are dropped after its commit.
+
+    A read racing the write may still compute the previous result (it read before the
+    commit) and store it after the drop. Each invalidation therefore also replaces the
+    user's generation, read before computing: a result stored while the generation
+    changed is dropped again instead of being served until its ttl.
+    """
+
+    def __init__(
+        self,
+        cache: Cache,
+        ttl: int = 300,
+        current_unit_of_work: Callable[[], UnitOfWork | AsyncUnitOfWork | None] = lambda: None,
+    ) -> None:
+        self.cache = cache
+        self.ttl: int = ttl
+        self._current_unit_of_work = current_unit_of_work
+        self._lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._invalidations: int = 0
+
+    @staticmethod
+    def user_tag(user_id: UUID) -> str:
+        return f'user:{user_id}'
+
+    @staticmethod
+    def user_key(user_id: UUID, name: str, *args: Any) -> str:
+        digest = hashlib.sha1(repr(args).encode()).hexdigest()
+        return f'user:{user_id}:{name}:{digest}'
+
+    @staticmethod
+    def generation_key(user_id: UUID) -> str:
+        # Not tagged with the user: dropping the user's entries must not reset it
+        return f'user:{user_id}:generation'
+
+    def get_or_compute(self, user_id: UUID, key: str, compute: Callable[[], T]) -> T:
+        value = self._get(key)
+        if value is None:
+            generation = self.cache.get(self.generation_key(user_id))
+            value = compute()
+            self.cache.set(key, value, self.ttl, tags=[self.user_tag(user_id)])
+            # Invalidated since the compute began: the value may predate the write
+            if self.cache.get(self.generation_key(user_id)) != generation:
+                self.cache.invalidate_tag(self.user_tag(user_id))
+        return value
+
+    async def aget_or_compute(self, user_id: UUID, key: str, compute: Callable[[], Awaitable[T]]) -> T:
+        'get_or_compute for async code, through the async methods of the cache (no blocking I/O on the event loop).'
+        value = self._count(await self.cache.aget(key))
+        if value is None:
+            generation = await self.cache.aget(self.generation_key(user_id))
+            value = await compute()
+            await self.cache.aset(key, value, self.ttl, tags=[self.user_tag(user_id)])
+            if await self.cache.aget(self.generation_key(user_id)) != generation:
+                await self.cache.ainvalidate_tag(self.user_tag(user_id))
+        return value
+
+    def invalidate(self, user_id: UUID) -> None:
+        'Drop every cached result of the user.'
+        # New generation first: a racing read that stores after the drop sees it and drops again
+        self.cache.set(self.generation_key(user_id), uuid4().hex, self.ttl)
+        self.cache.invalidate_tag(self.user_tag(user_id))
+        with self._lock:
+            self._invalidations += 1
+
+    def invalidate_after_commit(self, user_id: UUID) -> None:
+        'Drop every cached result of the user once the active unit of work commits (now without one).'
+        unit_of_work = self._current_unit_of_work()
+        if unit_of_work is None:
+            self.invalidate(user_id)
+        else:
+            unit_of_work.after_commit(lambda: self.invalidate(user_id))
+
+    async def ainvalidate(self, user_id: UUID) -> None:
+        'invalidate for async code, through the async methods of the cache.'
+        await self.cache.aset(self.generation_key(user_id), uuid4().hex, self.ttl)
+        await self.cache.ainvalidate_tag(self.user_tag(user_id))
+        with self._lock:
+            self._invalidations += 1
+
+    async def ainvalidate_after_commit(self, user_id: UUID) -> None:
+        'invalidate_after_commit for async code; the async unit of work awaits the invalidation after its commit.'
+        unit_of_work = self._current_unit_of_work()
+        if unit_of_work is None:
+            await self.ainvalidate(user_id)
+        else:
+            unit_of_work.after_commit(lambda: self.ainvalidate(user_id))
+
+    def get_metrics(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'backend': type(self.cache).__name__,
+                'ttl': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': self._hits / lookups if lookups else 0.0,
+                'invalidations': self._invalidations,
+            }
+
+    def _get(self, key: str) -> Any | None:
+        return self._count(self.cache.get(key))
+
+    def _count(self, value: Any | None) -> Any | None:
+        'Count a lookup as a hit or a miss.'
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+
+class CachedUseCase:
+    """Read use case whose execute results are served from the user's cache entries."""
+
+    def __init__(self, use_case: Any, result_cache: ResultCache, user_id: UUID) -> None:
+        self.use_case = use_case
+        self.result_cache = result_cache
+        self.user_id = user_id
+
+    def execute(self, *args: Any) -> Any:
+        key = ResultCache.user_key(self.user_id, type(self.use_case).__name__, *args)
+        return self.result_cache.get_or_compute(self.user_id, key, lambda: self.use_case.execute(*args))
+
+
+class AsyncCachedUseCase(CachedUseCase):
+    async def execute(self, *args: Any) -> Any:
+        key = ResultCache.user_key(self.user_id, type(self.use_case).__name__, *args)
+        return await self.result_cache.aget_or_compute(self.user_id, key, lambda: self.use_case.execute(*args))
+
+
+class InvalidatingUseCase:
+    """Write use case that drops the user's cached results once execute succeeds and is committed."""
+
+    def __init__(self, use_case: Any, result_cache: ResultCache, user_id: UUID) -> None:
+        self.use_case = use_case
+        self.result_cache = result_cache
+        self.user_id = user_id
+
+    def execute(self, *args: Any) -> Any:
+        result = self.use_case.execute(*args)
+        self.result_cache.invalidate_after_commit(self.user_id)
+        return result
+
+
+class AsyncInvalidatingUseCase(InvalidatingUseCase):
+    async def execute(self, *args: Any) -> Any:
+        result = await self.use_case.execute(*args)
+        await self.result_cache.ainvalidate_after_commit(self.user_id)
+        return result
+
+
+def cached(use_case: Any, result_cache: ResultCache | None, user_id: UUID | None) -> Any:
+    """Wrap a read use case with the cache; returned as is without a cache or user."""
+    if result_cache is None or user_id is None:
+        return use_case
+    if inspect.iscoroutinefunction(use_case.execute):
+        return AsyncCachedUseCase(use_case, result_cache, user_id)
+    return CachedUseCase(use_case, result_cache, user_id)
+
+
+def invalidating(use_case: Any, result_cache: ResultCache | None, user_id: UUID | None) -> Any:
+    """Wrap a write use case so it invalidates the user's cache; returned as is without a cache or user."""
+    if result_cache is None or user_id is None:
+        return use_case
+    if inspect.iscoroutinefunction(use_case.execute):
+        return AsyncInvalidatingUseCase(use_case, result_cache, user_id)
+    return InvalidatingUseCase(use_case, result_cache, user_id)
@@ -5,9 +5,13 @@ import jwt
 import secrets
 
 from src.common.exceptions import JWTExpiredError, JWTInvalidError, JWTInvalidSignatureError
+from src.common.ttl_cache import TTLCache
 from src.config import settings
 from src.domain.auth import User
 
+# Verified JWT payloads keyed by token digest, evicted at the token's exp
+jwt_cache = TTLCache(max_size=settings.JWT_CACHE_SIZE)
+
 
 def hash_password(plain_password: str) -> str:
     salt = bcrypt.gensalt(rounds=10)
@@ -40,6 +44,21 @@ def decode_jwt(token: str, secret: str, algorithm: str) -> dict:
         raise JWTInvalidError()
 
 
+def decode_jwt_cached(token: str, secret: str, algorithm: str) -> dict:
+    """decode_jwt that skips signature verification for tokens already verified
+
+    Only valid tokens with an exp claim are cached, until that exp. A copy of the
+    payload is returned so callers can modify it.
+    """
+    key = (hash_token(token), hash_token(secret), algorithm)
+    payload = jwt_cache.get(key)
+    if payload is None:
+        payload = decode_jwt(token, secret, algorithm)
+        if 'exp' in payload:
+            jwt_cache.set(key, payload, expires_at=payload['exp'])
+    return dict(payload)
+
+
 def create_access_token(user: User) -> str:
     expires = timedelta(minutes=settings.JWT_EXPIRATION_TIME_MINUTES)
     payload = {
@@ -1,18 +1,38 @@
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, CursorKey
+from .async_base_repository import AsyncBaseRepository
 from .user_repository import UserRepository
+from .async_user_repository import AsyncUserRepository
 from .credit_card_repository import CreditCardRepository
+from .async_credit_card_repository import AsyncCreditCardRepository
 from .expense_repository import ExpenseRepository
+from .async_expense_repository import AsyncExpenseRepository
 from .expense_category_repository import ExpenseCategoryRepository
+from .async_expense_category_repository import AsyncExpenseCategoryRepository
 from .payment_repository import PaymentRepository
+from .async_payment_repository import AsyncPaymentRepository
 from .refresh_token_repository import RefreshTokenRepository
+from .async_refresh_token_repository import AsyncRefreshTokenRepository
+from .unit_of_work import UnitOfWork, AsyncUnitOfWork
+from .cache import Cache
 
 
 __all__ = [
     'BaseRepository',
+    'CursorKey',
+    'AsyncBaseRepository',
     'UserRepository',
+    'AsyncUserRepository',
     'CreditCardRepository',
+    'AsyncCreditCardRepository',
     'ExpenseRepository',
+    'AsyncExpenseRepository',
     'PaymentRepository',
+    'AsyncPaymentRepository',
     'ExpenseCategoryRepository',
+    'AsyncExpenseCategoryRepository',
     'RefreshTokenRepository',
+    'AsyncRefreshTokenRepository',
+    'UnitOfWork',
+    'AsyncUnitOfWork',
+    'Cache',
 ]
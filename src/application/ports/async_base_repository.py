@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+
+from src.domain.shared import EntityBase
+from .base_repository import CursorKey
+
+from typing import Generic, TypeVar
+
+T = TypeVar('T', bound=EntityBase)
+
+
+class AsyncBaseRepository(Generic[T], ABC):
+    @abstractmethod
+    async def create(self, entity: T) -> T:
+        pass
+
+    @abstractmethod
+    async def count_by_filter(self, filter: dict) -> int:
+        pass
+
+    @abstractmethod
+    async def get_many_by_filter(self, filter: dict, limit: int, offset: int) -> list[T]:
+        pass
+
+    @abstractmethod
+    async def get_page_by_filter(self, filter: dict, limit: int, offset: int) -> tuple[list[T], int]:
+        """Get the same page as get_many_by_filter together with count_by_filter's total, in one query."""
+        pass
+
+    @abstractmethod
+    async def get_many_by_cursor(self, filter: dict, limit: int, after: CursorKey | None = None) -> tuple[list[T], CursorKey | None]:
+        """Get up to limit entities ordered by (created_at, id) after the given position, and the position to continue from (None on the last page)."""
+        pass
+
+    @abstractmethod
+    async def get_by_filter(self, filter: dict) -> T | None:
+        pass
+
+    @abstractmethod
+    async def update(self, entity: T) -> T:
+        pass
+
+    @abstractmethod
+    async def delete_by_filter(self, filter: dict) -> None:
+        pass
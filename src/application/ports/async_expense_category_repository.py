@@ -0,0 +1,13 @@
+from abc import abstractmethod
+from collections.abc import Iterable
+from uuid import UUID
+
+from src.domain.expense import ExpenseCategory
+from .async_base_repository import AsyncBaseRepository
+
+
+class AsyncExpenseCategoryRepository(AsyncBaseRepository[ExpenseCategory]):
+    @abstractmethod
+    async def get_owned_ids(self, owner_id: UUID, category_ids: Iterable[UUID]) -> set[UUID]:
+        """Return the given category ids that exist and belong to the owner"""
+        pass
@@ -0,0 +1,27 @@
+from abc import abstractmethod
+from collections.abc import AsyncIterator, Iterable
+from typing import TypeVar
+from uuid import UUID
+
+from src.domain.expense import Expense, PeriodPayment
+from .async_base_repository import AsyncBaseRepository
+
+
+T = TypeVar('T', bound=Expense)
+
+
+class AsyncExpenseRepository(AsyncBaseRepository[T]):
+    @abstractmethod
+    async def create_many(self, entities: list[T]) -> None:
+        """Create several expenses with their payments in one transaction"""
+        pass
+
+    @abstractmethod
+    async def get_owned_account_ids(self, owner_id: UUID, account_ids: Iterable[UUID]) -> set[UUID]:
+        """Return the given account ids that exist and belong to the owner"""
+        pass
+
+    @abstractmethod
+    def iter_payment_history(self, owner_id: UUID, batch_size: int = 1000) -> AsyncIterator[PeriodPayment]:
+        """Iterate asynchronously over every payment of the owner's expenses, with expense and account data, fetching batch_size rows at a time"""
+        pass
@@ -0,0 +1,6 @@
+from src.domain.expense import Payment
+from .async_base_repository import AsyncBaseRepository
+
+
+class AsyncPaymentRepository(AsyncBaseRepository[Payment]):
+    pass
@@ -0,0 +1,37 @@
+"""Async Refresh Token Repository Port"""
+from abc import abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from src.application.ports.async_base_repository import AsyncBaseRepository
+from src.domain.auth import RefreshToken
+
+
+class AsyncRefreshTokenRepository(AsyncBaseRepository[RefreshToken]):
+    """Async counterpart of RefreshTokenRepository"""
+
+    @abstractmethod
+    async def find_by_token_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        """Find a refresh token by its hash"""
+        pass
+
+    @abstractmethod
+    async def find_active_by_user(self, user_id: UUID) -> list[RefreshToken]:
+        """Find all active (non-revoked, non-expired) refresh tokens for a user"""
+        pass
+
+    @abstractmethod
+    async def revoke_all_by_user(self, user_id: UUID) -> int:
+        """Revoke all refresh tokens for a user
+
+        Returns the number of tokens revoked
+        """
+        pass
+
+    @abstractmethod
+    async def delete_expired(self) -> int:
+        """Delete all expired refresh tokens (cleanup operation)
+
+        Returns the number of tokens deleted
+        """
+        pass
@@ -0,0 +1,12 @@
+from abc import abstractmethod
+from uuid import UUID
+
+from src.domain.auth import User
+from .async_base_repository import AsyncBaseRepository
+
+
+class AsyncUserRepository(AsyncBaseRepository[User]):
+    @abstractmethod
+    async def get_data_version(self, user_id: UUID) -> int:
+        """Get the user's data version, increased by every write to their cards, expenses, payments and categories"""
+        pass
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
 
 from src.domain.shared import EntityBase
 
@@ -6,6 +8,9 @@ from typing import Generic, TypeVar
 
 T = TypeVar('T', bound=EntityBase)
 
+# Keyset pagination position: (created_at, id) of the last row of a page
+CursorKey = tuple[datetime, UUID]
+
 
 class BaseRepository(Generic[T], ABC):
     @abstractmethod
@@ -20,6 +25,16 @@ class BaseRepository(Generic[T], ABC):
     def get_many_by_filter(self, filter: dict, limit: int, offset: int) -> list[T]:
         pass
 
+    @abstractmethod
+    def get_page_by_filter(self, filter: dict, limit: int, offset: int) -> tuple[list[T], int]:
+        """Get the same page as get_many_by_filter together with count_by_filter's total, in one query."""
+        pass
+
+    @abstractmethod
+    def get_many_by_cursor(self, filter: dict, limit: int, after: CursorKey | None = None) -> tuple[list[T], CursorKey | None]:
+        """Get up to limit entities ordered by (created_at, id) after the given position, and the position to continue from (None on the last page)."""
+        pass
+
     @abstractmethod
     def get_by_filter(self, filter: dict) -> T | None:
         pass
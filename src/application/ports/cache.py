@@ -0,0 +1,45 @@
+"""Cache Port"""
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Any
+
+
+class Cache(ABC):
+    """Port for a key/value cache of computed read results
+
+    Entries expire after their ttl and can be grouped under tags (e.g. one per user)
+    to drop them all at once. Values must be picklable, as out-of-process
+    implementations serialize them.
+
+    The async variants are used from async code (e.g. async path operations). By default
+    they run the sync methods in a worker thread so the event loop is not blocked;
+    implementations with a native async client override them.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or None when missing or expired"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        """Cache value for ttl seconds, listed under the given tags"""
+        pass
+
+    @abstractmethod
+    def invalidate_tag(self, tag: str) -> None:
+        """Drop every entry listed under the tag"""
+        pass
+
+    async def aget(self, key: str) -> Any | None:
+        """Async get"""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        """Async set"""
+        await asyncio.to_thread(self.set, key, value, ttl, tags)
+
+    async def ainvalidate_tag(self, tag: str) -> None:
+        """Async invalidate_tag"""
+        await asyncio.to_thread(self.invalidate_tag, tag)
@@ -1,6 +1,23 @@
+from abc import abstractmethod
+from uuid import UUID
+
 from src.domain.account import CreditCard
+from src.domain.expense import PeriodPayment, PeriodSummary
 from .base_repository import BaseRepository
 
 
 class CreditCardRepository(BaseRepository[CreditCard]):
-    pass
+    @abstractmethod
+    def get_period_payments(self, owner_id: UUID, month: int, year: int) -> list[PeriodPayment]:
+        """Get the payments of every owner's credit card for a period, including simulated subscription payments"""
+        pass
+
+    @abstractmethod
+    def get_category_names(self, owner_id: UUID) -> dict[UUID, str]:
+        """Get the names of the owner's expense categories by id"""
+        pass
+
+    @abstractmethod
+    def get_period_summaries(self, owner_id: UUID, month: int, year: int, months: int) -> list[PeriodSummary]:
+        """Get the totals of the owner's credit card payments for `months` periods starting at month/year"""
+        pass
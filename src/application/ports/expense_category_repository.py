@@ -1,6 +1,13 @@
+from abc import abstractmethod
+from collections.abc import Iterable
+from uuid import UUID
+
 from src.domain.expense import ExpenseCategory
 from .base_repository import BaseRepository
 
 
 class ExpenseCategoryRepository(BaseRepository[ExpenseCategory]):
-    pass
+    @abstractmethod
+    def get_owned_ids(self, owner_id: UUID, category_ids: Iterable[UUID]) -> set[UUID]:
+        """Return the given category ids that exist and belong to the owner"""
+        pass
@@ -1,6 +1,9 @@
+from abc import abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import TypeVar
+from uuid import UUID
 
-from src.domain.expense import Expense
+from src.domain.expense import Expense, PeriodPayment
 from .base_repository import BaseRepository
 
 
@@ -8,4 +11,17 @@ T = TypeVar('T', bound=Expense)
 
 
 class ExpenseRepository(BaseRepository[T]):
-    pass
+    @abstractmethod
+    def create_many(self, entities: list[T]) -> None:
+        """Create several expenses with their payments in one transaction"""
+        pass
+
+    @abstractmethod
+    def get_owned_account_ids(self, owner_id: UUID, account_ids: Iterable[UUID]) -> set[UUID]:
+        """Return the given account ids that exist and belong to the owner"""
+        pass
+
+    @abstractmethod
+    def iter_payment_history(self, owner_id: UUID, batch_size: int = 1000) -> Iterator[PeriodPayment]:
+        """Iterate over every payment of the owner's expenses, with expense and account data, fetching batch_size rows at a time"""
+        pass
@@ -0,0 +1,110 @@
+"""Unit of Work Port"""
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from types import TracebackType
+from typing import Optional
+
+
+class UnitOfWork(ABC):
+    """Port for a Unit of Work
+
+    Groups every repository call made while it is active in a single transaction.
+    Leaving the block commits on success and rolls back on error. Work that must only
+    happen once the data is committed (e.g. dropping cached reads) is queued with
+    after_commit.
+    """
+
+    def __enter__(self) -> 'UnitOfWork':
+        self.begin()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.end()
+
+    @abstractmethod
+    def begin(self) -> None:
+        """Make this unit of work the active one"""
+        pass
+
+    @abstractmethod
+    def end(self) -> None:
+        """Release the resources and stop being the active unit of work"""
+        pass
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Commit the work done so far"""
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard the work done so far"""
+        pass
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run callback once the work is committed (dropped if it is rolled back)"""
+        pass
+
+
+class AsyncUnitOfWork(ABC):
+    """Port for a Unit of Work of async repositories
+
+    Same contract as UnitOfWork, used with `async with`: committing, rolling back and
+    releasing the resources are awaited. after_commit callbacks may be coroutine
+    functions, whose result is awaited.
+    """
+
+    async def __aenter__(self) -> 'AsyncUnitOfWork':
+        self.begin()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.end()
+
+    @abstractmethod
+    def begin(self) -> None:
+        """Make this unit of work the active one"""
+        pass
+
+    @abstractmethod
+    async def end(self) -> None:
+        """Release the resources and stop being the active unit of work"""
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit the work done so far"""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Discard the work done so far"""
+        pass
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], Awaitable[None] | None]) -> None:
+        """Run callback once the work is committed (dropped if it is rolled back)"""
+        pass
@@ -1,6 +1,12 @@
+from abc import abstractmethod
+from uuid import UUID
+
 from src.domain.auth import User
 from .base_repository import BaseRepository
 
 
 class UserRepository(BaseRepository[User]):
-    pass
+    @abstractmethod
+    def get_data_version(self, user_id: UUID) -> int:
+        """Get the user's data version, increased by every write to their cards, expenses, payments and categories"""
+        pass
@@ -1,17 +1,17 @@
 from uuid import uuid4
 
 from ...dtos import CreateCreditCardDTO, CreditCardResponseDTO
-from ...ports import CreditCardRepository
+from ...ports import AsyncCreditCardRepository
 from src.domain.account import CreditCardFactory
 from src.domain.shared import Amount
 from .helpers import parse_credit_card
 
 
 class CreditCardCreateUseCase:
-    def __init__(self, credit_card_repository: CreditCardRepository):
+    def __init__(self, credit_card_repository: AsyncCreditCardRepository):
         self.credit_card_repository = credit_card_repository
 
-    def execute(self, credit_card_data: CreateCreditCardDTO) -> CreditCardResponseDTO:
+    async def execute(self, credit_card_data: CreateCreditCardDTO) -> CreditCardResponseDTO:
         credit_card = CreditCardFactory.create(
             id=uuid4(),
             owner_id=credit_card_data.owner_id,
@@ -24,5 +24,5 @@ class CreditCardCreateUseCase:
             financing_limit=Amount(credit_card_data.financing_limit),
             expenses=[],
         )
-        new_credit_card = self.credit_card_repository.create(credit_card)
+        new_credit_card = await self.credit_card_repository.create(credit_card)
         return parse_credit_card(new_credit_card)
@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from ...ports import CreditCardRepository
+from ...ports import AsyncCreditCardRepository
 
 
 class CreditCardDeleteUseCase:
-    def __init__(self, credit_card_repository: CreditCardRepository):
+    def __init__(self, credit_card_repository: AsyncCreditCardRepository):
         self.credit_card_repository = credit_card_repository
 
-    def execute(self, credit_card_id: UUID) -> None:
-        self.credit_card_repository.delete_by_filter({'id': credit_card_id})
+    async def execute(self, credit_card_id: UUID) -> None:
+        await self.credit_card_repository.delete_by_filter({'id': credit_card_id})
@@ -1,15 +1,15 @@
 from ...dtos import CreditCardResponseDTO, PaginatedResponse, Pagination
-from ...ports import CreditCardRepository
+from ...helpers.pagination import decode_cursor, get_cursor_pagination
+from ...ports import AsyncCreditCardRepository
 from .helpers import parse_credit_card
 
 
 class CreditCardGetPaginatedUseCase:
-    def __init__(self, credit_card_repository: CreditCardRepository):
+    def __init__(self, credit_card_repository: AsyncCreditCardRepository):
         self.credit_card_repository = credit_card_repository
 
-    def execute(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[CreditCardResponseDTO]:
-        credit_cards = self.credit_card_repository.get_many_by_filter(filter, limit, offset)
-        total = self.credit_card_repository.count_by_filter(filter)
+    async def execute(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[CreditCardResponseDTO]:
+        credit_cards, total = await self.credit_card_repository.get_page_by_filter(filter, limit, offset)
         credit_cards_dto = [parse_credit_card(credit_card) for credit_card in credit_cards]
         pagination = Pagination(
             current_page=offset // limit + 1,
@@ -21,3 +21,12 @@ class CreditCardGetPaginatedUseCase:
             items=credit_cards_dto,
             pagination=pagination,
         )
+
+    async def execute_by_cursor(self, filter: dict, limit: int, cursor: str | None = None, include_total: bool = False) -> PaginatedResponse[CreditCardResponseDTO]:
+        after = decode_cursor(cursor) if cursor else None
+        credit_cards, next_key = await self.credit_card_repository.get_many_by_cursor(filter, limit, after)
+        total = await self.credit_card_repository.count_by_filter(filter) if include_total else None
+        return PaginatedResponse[CreditCardResponseDTO](
+            items=[parse_credit_card(credit_card) for credit_card in credit_cards],
+            pagination=get_cursor_pagination(limit, next_key, total),
+        )
@@ -1,19 +1,20 @@
 from uuid import UUID
 
 from ...dtos import CreditCardResponseDTO, UpdateCreditCardDTO
-from ...ports import CreditCardRepository
+from ...ports import AsyncCreditCardRepository
 from src.domain.account import CreditCard
 from .helpers import parse_credit_card
 
 
 class CreditCardUpdateUseCase:
-    def __init__(self, credit_card_repository: CreditCardRepository):
+    def __init__(self, credit_card_repository: AsyncCreditCardRepository):
         self.credit_card_repository = credit_card_repository
 
-    def execute(self, credit_card_id: UUID, credit_card_data: UpdateCreditCardDTO) -> CreditCardResponseDTO:
-        credit_card = self.credit_card_repository.get_by_filter({'id': credit_card_id})
+    async def execute(self, credit_card_id: UUID, credit_card_data: UpdateCreditCardDTO) -> CreditCardResponseDTO:
+        # Expenses are not needed to update card data; the repository reloads them on update
+        credit_card = await self.credit_card_repository.get_by_filter({'id': credit_card_id, 'include_expenses': False})
         if credit_card is None:
             raise ValueError('Credit card not found')
         credit_card.update_from_dict(credit_card_data.model_dump(exclude_unset=True))
-        updated_credit_card = self.credit_card_repository.update(credit_card)
+        updated_credit_card = await self.credit_card_repository.update(credit_card)
         return parse_credit_card(updated_credit_card)
@@ -1,16 +1,16 @@
 """Logout from all devices Use Case"""
 from uuid import UUID
 
-from src.application.ports import RefreshTokenRepository
+from src.application.ports import AsyncRefreshTokenRepository
 
 
 class LogoutAllDevicesUseCase:
     """Use case to revoke all refresh tokens for a user (logout from all devices)"""
     
-    def __init__(self, refresh_token_repository: RefreshTokenRepository):
+    def __init__(self, refresh_token_repository: AsyncRefreshTokenRepository):
         self.refresh_token_repository = refresh_token_repository
     
-    def execute(self, user_id: UUID) -> int:
+    async def execute(self, user_id: UUID) -> int:
         """Revoke all refresh tokens for a user
         
         Args:
@@ -19,4 +19,4 @@ class LogoutAllDevicesUseCase:
         Returns:
             Number of tokens revoked
         """
-        return self.refresh_token_repository.revoke_all_by_user(user_id)
+        return await self.refresh_token_repository.revoke_all_by_user(user_id)
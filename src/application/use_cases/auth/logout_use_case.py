@@ -1,16 +1,16 @@
 """Logout Use Case - Revoke a specific refresh token"""
 from src.application.helpers import security
-from src.application.ports import RefreshTokenRepository
+from src.application.ports import AsyncRefreshTokenRepository
 from src.common.exceptions import UnauthorizedError
 
 
 class LogoutUseCase:
     """Use case to revoke a specific refresh token (logout from one device)"""
     
-    def __init__(self, refresh_token_repository: RefreshTokenRepository):
+    def __init__(self, refresh_token_repository: AsyncRefreshTokenRepository):
         self.refresh_token_repository = refresh_token_repository
     
-    def execute(self, refresh_token_str: str) -> None:
+    async def execute(self, refresh_token_str: str) -> None:
         """Revoke a specific refresh token
         
         Args:
@@ -23,7 +23,7 @@ class LogoutUseCase:
         token_hash = security.hash_token(refresh_token_str)
         
         # Find the refresh token in database
-        refresh_token = self.refresh_token_repository.find_by_token_hash(token_hash)
+        refresh_token = await self.refresh_token_repository.find_by_token_hash(token_hash)
         
         if not refresh_token:
             raise UnauthorizedError('Invalid refresh token')
@@ -32,4 +32,4 @@ class LogoutUseCase:
         refresh_token.revoke()
         
         # Save the updated token
-        self.refresh_token_repository.update(refresh_token)
+        await self.refresh_token_repository.update(refresh_token)
@@ -4,7 +4,7 @@ from typing import Optional
 
 from src.application.dtos import RefreshTokenRequestDTO, RefreshTokenResponseDTO
 from src.application.helpers import security
-from src.application.ports import UserRepository, RefreshTokenRepository
+from src.application.ports import AsyncUserRepository, AsyncRefreshTokenRepository
 from src.common.exceptions import UnauthorizedError
 
 logger = logging.getLogger(__name__)
@@ -15,13 +15,13 @@ class RefreshAccessTokenUseCase:
     
     def __init__(
         self,
-        user_repository: UserRepository,
-        refresh_token_repository: RefreshTokenRepository
+        user_repository: AsyncUserRepository,
+        refresh_token_repository: AsyncRefreshTokenRepository
     ):
         self.user_repository = user_repository
         self.refresh_token_repository = refresh_token_repository
     
-    def execute(
+    async def execute(
         self,
         request: RefreshTokenRequestDTO,
         ip_address: Optional[str] = None
@@ -45,7 +45,7 @@ class RefreshAccessTokenUseCase:
         logger.debug(f"Token hash: {token_hash[:16]}...")
         
         # Find the refresh token in database
-        refresh_token = self.refresh_token_repository.find_by_token_hash(token_hash)
+        refresh_token = await self.refresh_token_repository.find_by_token_hash(token_hash)
         
         if not refresh_token:
             logger.warning("Refresh token not found in database")
@@ -59,7 +59,7 @@ class RefreshAccessTokenUseCase:
             raise UnauthorizedError('[TOKEN_EXPIRED] Refresh token is expired or revoked')
         
         # Get the user
-        user = self.user_repository.get_by_filter({'id': refresh_token.user_id})
+        user = await self.user_repository.get_by_filter({'id': refresh_token.user_id})
         if not user:
             logger.error(f"User {refresh_token.user_id} not found")
             raise UnauthorizedError('[USER_NOT_FOUND] User not found')
@@ -3,7 +3,8 @@ from typing import Optional
 
 from src.application.dtos import LoginUserDTO, LoggedInUserDTO
 from src.application.helpers import security
-from src.application.ports import UserRepository, RefreshTokenRepository
+from src.application.helpers.password_hasher import PasswordHasher, password_hasher as default_password_hasher
+from src.application.ports import AsyncUserRepository, AsyncRefreshTokenRepository
 from src.config import settings
 from src.domain.auth import RefreshToken
 
@@ -11,21 +12,23 @@ from src.domain.auth import RefreshToken
 class UserLoginUseCase:
     def __init__(
         self, 
-        user_repository: UserRepository,
-        refresh_token_repository: RefreshTokenRepository
+        user_repository: AsyncUserRepository,
+        refresh_token_repository: AsyncRefreshTokenRepository,
+        password_hasher: PasswordHasher | None = None,
     ):
         self.user_repository = user_repository
         self.refresh_token_repository = refresh_token_repository
+        self.password_hasher = password_hasher or default_password_hasher
 
-    def execute(
+    async def execute(
         self, 
         user_data: LoginUserDTO, 
         ip_address: Optional[str] = None
     ) -> LoggedInUserDTO:
         # Authenticate user
         filter = {'username': user_data.username}
-        user = self.user_repository.get_by_filter(filter)
-        if not user or not security.verify_password(user_data.password, user.encrypted_password):
+        user = await self.user_repository.get_by_filter(filter)
+        if not user or not await self.password_hasher.verify(user_data.password, user.encrypted_password):
             raise ValueError('Invalid username or password')
         
         # Create access token
@@ -48,7 +51,7 @@ class UserLoginUseCase:
         )
         
         # Save refresh token to database
-        self.refresh_token_repository.create(refresh_token_entity)
+        await self.refresh_token_repository.create(refresh_token_entity)
         
         return LoggedInUserDTO(
             id=user.id,
@@ -3,17 +3,20 @@ from uuid import uuid4
 from src.domain.auth import UserFactory
 from ...dtos import RegisterUserDTO, LoggedInUserDTO
 from ...helpers import security
-from ...ports import UserRepository
+from ...helpers.password_hasher import PasswordHasher, password_hasher as default_password_hasher
+from ...ports import AsyncUserRepository
 
 
 class UserRegisterUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: AsyncUserRepository, password_hasher: PasswordHasher | None = None):
         self.user_repository = user_repository
+        self.password_hasher = password_hasher or default_password_hasher
 
-    def execute(self, user_data: RegisterUserDTO) -> LoggedInUserDTO:
-        user_dict = self.__get_user_dict(user_data)
+    async def execute(self, user_data: RegisterUserDTO) -> LoggedInUserDTO:
+        encrypted_password = await self.password_hasher.hash(user_data.password)
+        user_dict = self.__get_user_dict(user_data, encrypted_password)
         user = UserFactory.create(**user_dict)
-        user = self.user_repository.create(user)
+        user = await self.user_repository.create(user)
         access_token = security.create_access_token(user)
         return LoggedInUserDTO(
             id=user.id,
@@ -23,12 +26,12 @@ class UserRegisterUseCase:
             access_token=access_token
         )
 
-    def __get_user_dict(self, user_data: RegisterUserDTO) -> dict:
+    def __get_user_dict(self, user_data: RegisterUserDTO, encrypted_password: str) -> dict:
         return {
             'id': uuid4(),
             'username': user_data.username,
             'email': user_data.email,
-            'encrypted_password': security.hash_password(user_data.password),
+            'encrypted_password': encrypted_password,
             'role': user_data.role.value,
             'profile': self.__get_profile_dict(user_data)
         }
@@ -1,15 +1,15 @@
 from ...dtos import LoginUserDTO, LoggedInUserDTO
 from ...helpers import security
-from ...ports import UserRepository
+from ...ports import AsyncUserRepository
 
 
 class UserRenewTokenUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: AsyncUserRepository):
         self.user_repository = user_repository
 
-    def execute(self, user_data: LoggedInUserDTO) -> LoggedInUserDTO:
+    async def execute(self, user_data: LoggedInUserDTO) -> LoggedInUserDTO:
         filter = {'id': user_data.id}
-        user = self.user_repository.get_by_filter(filter)
+        user = await self.user_repository.get_by_filter(filter)
         if not user:
             raise ValueError('User not found')
         access_token = security.create_access_token(user)
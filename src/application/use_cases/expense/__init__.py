@@ -3,6 +3,7 @@ from .expense_category_get_paginated_use_case import ExpenseCategoryGetPaginated
 from .expense_category_update_use_case import ExpenseCategoryUpdateUseCase
 from .expense_category_delete_use_case import ExpenseCategoryDeleteUseCase
 from .expense_get_paginated_use_case import ExpenseGetPaginatedUseCase
+from .expense_bulk_create_use_case import ExpenseBulkCreateUseCase
 from .purchase_create_use_case import PurchaseCreateUseCase
 from .purchase_update_use_case import PurchaseUpdateUseCase
 from .purchase_delete_use_case import PurchaseDeleteUseCase
@@ -14,6 +15,7 @@ from .subscription_get_one_use_case import SubscriptionGetOneUseCase
 from .payment_create_use_case import PaymentCreateUseCase
 from .payment_update_use_case import PaymentUpdateUseCase
 from .payment_delete_use_case import PaymentDeleteUseCase
+from .payment_export_use_case import PaymentExportUseCase
 
 __all__ = [
     # Expense Category Use Cases
@@ -23,6 +25,7 @@ __all__ = [
     'ExpenseCategoryDeleteUseCase',
     # Expense Use Cases
     'ExpenseGetPaginatedUseCase',
+    'ExpenseBulkCreateUseCase',
     # Purchase Use Cases
     'PurchaseCreateUseCase',
     'PurchaseUpdateUseCase',
@@ -37,4 +40,5 @@ __all__ = [
     'PaymentCreateUseCase',
     'PaymentUpdateUseCase',
     'PaymentDeleteUseCase',
+    'PaymentExportUseCase',
 ]
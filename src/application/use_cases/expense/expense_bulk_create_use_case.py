@@ -0,0 +1,88 @@
+from uuid import UUID, uuid4
+
+from src.domain.expense import Expense, PurchaseFactory, SubscriptionFactory
+from src.domain.expense.enums import ExpenseType
+from src.domain.shared import Amount
+from ...dtos import (
+    BulkCreateExpensesDTO,
+    BulkCreateExpensesResultDTO,
+    BulkRowErrorDTO,
+    CreatePurchaseDTO,
+    CreateSubscriptionDTO,
+)
+from ...ports import AsyncExpenseCategoryRepository, AsyncExpenseRepository
+
+
+class ExpenseBulkCreateUseCase:
+    """
+    Create a batch of purchases and subscriptions.
+
+    The accounts and categories the rows refer to are checked against the owner's with
+    one query each, then each row goes through its factory, which validates it and
+    computes its payments in memory. Rejected rows are reported back; the valid ones are
+    written together with AsyncExpenseRepository.create_many.
+    """
+
+    def __init__(
+        self,
+        expense_repository: AsyncExpenseRepository[Expense],
+        expense_category_repository: AsyncExpenseCategoryRepository,
+    ):
+        self.expense_repository = expense_repository
+        self.expense_category_repository = expense_category_repository
+
+    async def execute(self, data: BulkCreateExpensesDTO, owner_id: UUID) -> BulkCreateExpensesResultDTO:
+        expenses: list[Expense] = []
+        errors: list[BulkRowErrorDTO] = []
+        rows = [
+            *((ExpenseType.PURCHASE, index, row) for index, row in enumerate(data.purchases)),
+            *((ExpenseType.SUBSCRIPTION, index, row) for index, row in enumerate(data.subscriptions)),
+        ]
+        # Unknown or foreign references would fail the whole INSERT, so they are row errors
+        account_ids = await self.expense_repository.get_owned_account_ids(owner_id, {row.account_id for _, _, row in rows})
+        category_ids = await self.expense_category_repository.get_owned_ids(
+            owner_id, {row.category_id for _, _, row in rows if row.category_id is not None}
+        )
+        for expense_type, index, row in rows:
+            try:
+                if row.account_id not in account_ids:
+                    raise ValueError(f'Account with ID {row.account_id} not found')
+                if row.category_id is not None and row.category_id not in category_ids:
+                    raise ValueError(f'Category with ID {row.category_id} not found')
+                expenses.append(self._build_expense(row))
+            except ValueError as ex:
+                errors.append(BulkRowErrorDTO(expense_type=expense_type, index=index, description=str(ex)))
+
+        await self.expense_repository.create_many(expenses)
+        return BulkCreateExpensesResultDTO(
+            created_count=len(expenses),
+            created_ids=[expense.id for expense in expenses],
+            errors=errors,
+        )
+
+    def _build_expense(self, row: CreatePurchaseDTO | CreateSubscriptionDTO) -> Expense:
+        # Same construction as PurchaseCreateUseCase and SubscriptionCreateUseCase
+        if isinstance(row, CreatePurchaseDTO):
+            return PurchaseFactory.create(
+                id=uuid4(),
+                account_id=row.account_id,
+                title=row.title,
+                cc_name=row.cc_name,
+                acquired_at=row.acquired_at,
+                amount=Amount(row.amount),
+                installments=row.installments,
+                first_payment_date=row.first_payment_date,
+                category_id=row.category_id,
+                payments=[],
+            )
+        return SubscriptionFactory.create(
+            id=uuid4(),
+            account_id=row.account_id,
+            title=row.title,
+            cc_name=row.cc_name,
+            acquired_at=row.acquired_at,
+            amount=Amount(row.amount),
+            first_payment_date=row.first_payment_date,
+            category_id=row.category_id,
+            payments=[],
+        )
@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from ...ports import ExpenseCategoryRepository
+from ...ports import AsyncExpenseCategoryRepository
 
 
 class ExpenseCategoryDeleteUseCase:
-    def __init__(self, expense_category_repository: ExpenseCategoryRepository):
+    def __init__(self, expense_category_repository: AsyncExpenseCategoryRepository):
         self.expense_category_repository = expense_category_repository
 
-    def execute(self, category_id: UUID):
-        self.expense_category_repository.delete_by_filter({'id': category_id})
+    async def execute(self, category_id: UUID):
+        await self.expense_category_repository.delete_by_filter({'id': category_id})
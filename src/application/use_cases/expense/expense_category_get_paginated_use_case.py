@@ -1,16 +1,17 @@
-from ...ports import ExpenseCategoryRepository
+from ...helpers.pagination import decode_cursor, get_cursor_pagination
+from ...ports import AsyncExpenseCategoryRepository
 from ...dtos import ExpenseCategoryResponseDTO, PaginatedResponse, Pagination
 from .helpers import parse_expense_category
 
 
 class ExpenseCategoryGetPaginatedUseCase:
-    def __init__(self, expense_category_repository: ExpenseCategoryRepository):
+    def __init__(self, expense_category_repository: AsyncExpenseCategoryRepository):
         self.expense_category_repository = expense_category_repository
 
-    def execute(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[ExpenseCategoryResponseDTO]:
-        categories = self.expense_category_repository.get_many_by_filter(
+    async def execute(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[ExpenseCategoryResponseDTO]:
+        categories = await self.expense_category_repository.get_many_by_filter(
             filter, limit, offset)
-        total = self.expense_category_repository.count_by_filter(filter)
+        total = await self.expense_category_repository.count_by_filter(filter)
         return PaginatedResponse[ExpenseCategoryResponseDTO](
             items=[parse_expense_category(cat) for cat in categories],
             pagination=Pagination(
@@ -20,3 +21,12 @@ class ExpenseCategoryGetPaginatedUseCase:
                 current_page=offset // limit + 1,
             )
         )
+
+    async def execute_by_cursor(self, filter: dict, limit: int, cursor: str | None = None, include_total: bool = False) -> PaginatedResponse[ExpenseCategoryResponseDTO]:
+        after = decode_cursor(cursor) if cursor else None
+        categories, next_key = await self.expense_category_repository.get_many_by_cursor(filter, limit, after)
+        total = await self.expense_category_repository.count_by_filter(filter) if include_total else None
+        return PaginatedResponse[ExpenseCategoryResponseDTO](
+            items=[parse_expense_category(cat) for cat in categories],
+            pagination=get_cursor_pagination(limit, next_key, total),
+        )
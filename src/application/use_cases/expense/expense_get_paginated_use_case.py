@@ -1,16 +1,16 @@
 from src.domain.expense import Expense
 from ...dtos import ExpenseResponseDTO, PaginatedResponse, Pagination
-from ...ports import ExpenseRepository
+from ...helpers.pagination import decode_cursor, get_cursor_pagination
+from ...ports import AsyncExpenseRepository
 from .helpers import parse_expense
 
 
 class ExpenseGetPaginatedUseCase:
-    def __init__(self, expense_repository: ExpenseRepository[Expense]):
+    def __init__(self, expense_repository: AsyncExpenseRepository[Expense]):
         self.expense_repository = expense_repository
 
-    def execute(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[ExpenseResponseDTO]:
-        total_items = self.expense_repository.count_by_filter(filter)
-        items = self.expense_repository.get_many_by_filter(filter, limit, offset)
+    async def execute(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[ExpenseResponseDTO]:
+        items, total_items = await self.expense_repository.get_page_by_filter(filter, limit, offset)
         return PaginatedResponse[ExpenseResponseDTO](
             items=[parse_expense(expense) for expense in items],
             pagination=Pagination(
@@ -20,3 +20,12 @@ class ExpenseGetPaginatedUseCase:
                 per_page=limit,
             )
         )
+
+    async def execute_by_cursor(self, filter: dict, limit: int, cursor: str | None = None, include_total: bool = False) -> PaginatedResponse[ExpenseResponseDTO]:
+        after = decode_cursor(cursor) if cursor else None
+        items, next_key = await self.expense_repository.get_many_by_cursor(filter, limit, after)
+        total_items = await self.expense_repository.count_by_filter(filter) if include_total else None
+        return PaginatedResponse[ExpenseResponseDTO](
+            items=[parse_expense(expense) for expense in items],
+            pagination=get_cursor_pagination(limit, next_key, total_items),
+        )
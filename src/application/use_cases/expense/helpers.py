@@ -1,3 +1,9 @@
+"""
+Helper functions for expense use cases.
+
+The DTOs are built from domain entities, whose values already have the DTO field types,
+so they are created with model_construct: no validation pass over every payment.
+"""
 
 from src.domain.expense import Payment, Expense, ExpenseCategory
 from ...dtos import ExpenseResponseDTO, PaymentResponseDTO, ExpenseCategoryResponseDTO
@@ -13,7 +19,7 @@ def parse_expense_category(category: ExpenseCategory) -> ExpenseCategoryResponse
     Returns:
         ExpenseCategoryResponseDTO
     """
-    return ExpenseCategoryResponseDTO(
+    return ExpenseCategoryResponseDTO.model_construct(
         id=category.id,
         owner_id=category.owner_id,
         name=category.name,
@@ -23,7 +29,7 @@ def parse_expense_category(category: ExpenseCategory) -> ExpenseCategoryResponse
 
 
 def parse_expense(expense: Expense) -> ExpenseResponseDTO:
-    return ExpenseResponseDTO(
+    return ExpenseResponseDTO.model_construct(
         id=expense.id,
         account_id=expense.account_id,
         title=expense.title,
@@ -46,7 +52,7 @@ def parse_expense(expense: Expense) -> ExpenseResponseDTO:
 
 
 def parse_payment(payment: Payment) -> PaymentResponseDTO:
-    return PaymentResponseDTO(
+    return PaymentResponseDTO.model_construct(
         id=payment.id,
         expense_id=payment.expense_id,
         amount=payment.amount.value,
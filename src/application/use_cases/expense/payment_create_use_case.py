@@ -4,21 +4,21 @@ from src.domain.expense import Payment, Subscription
 from src.domain.expense.enums import PaymentStatus
 from src.domain.shared import Amount
 from ...dtos import CreatePaymentDTO, PaymentResponseDTO
-from ...ports import PaymentRepository, ExpenseRepository
+from ...ports import AsyncPaymentRepository, AsyncExpenseRepository
 from .helpers import parse_payment
 
 
 class PaymentCreateUseCase:
-    def __init__(self, payment_repository: PaymentRepository, expense_repository: ExpenseRepository | None = None):
+    def __init__(self, payment_repository: AsyncPaymentRepository, expense_repository: AsyncExpenseRepository | None = None):
         self.payment_repository = payment_repository
         self.expense_repository = expense_repository
 
-    def execute(self, payment_data: CreatePaymentDTO) -> PaymentResponseDTO:
+    async def execute(self, payment_data: CreatePaymentDTO) -> PaymentResponseDTO:
         # Validate that the expense exists
         if not self.expense_repository:
-            raise ValueError('ExpenseRepository is required for creating payments')
+            raise ValueError('AsyncExpenseRepository is required for creating payments')
         
-        expense = self.expense_repository.get_by_filter({'id': payment_data.expense_id})
+        expense = await self.expense_repository.get_by_filter({'id': payment_data.expense_id})
         if not expense:
             raise ValueError(f'Expense with ID {payment_data.expense_id} not found')
         
@@ -38,11 +38,11 @@ class PaymentCreateUseCase:
         if isinstance(expense, Subscription):
             expense.add_new_payment(payment)
             # Save the entire subscription with reordered payments
-            self.expense_repository.update(expense)
+            await self.expense_repository.update(expense)
             # Get the payment from the updated subscription
             updated_payment = next((p for p in expense.payments if p.id == payment.id), payment)
             return parse_payment(updated_payment)
         else:
             # For other expense types, create directly
-            self.payment_repository.create(payment)
+            await self.payment_repository.create(payment)
             return parse_payment(payment)
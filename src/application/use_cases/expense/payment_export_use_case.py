@@ -0,0 +1,59 @@
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator
+from uuid import UUID
+
+from src.domain.expense import Expense, PeriodPayment
+from ...dtos import ExportFormat, PeriodPaymentDTO
+from ...ports import AsyncExpenseRepository
+from ..period.helpers import parse_period_payment
+
+# Columns of the CSV export, in PeriodPaymentDTO field order (the NDJSON objects' keys)
+EXPORT_COLUMNS = list(PeriodPaymentDTO.model_fields)
+
+
+class PaymentExportUseCase:
+    """
+    Export the full payment history of a user as NDJSON or CSV text chunks.
+
+    The chunks are produced lazily, as an async iterator, from the repository's streamed
+    rows, `chunk_size` payments each, so the whole history is never held in memory.
+    """
+
+    def __init__(self, expense_repository: AsyncExpenseRepository[Expense], chunk_size: int = 500):
+        self.expense_repository = expense_repository
+        self.chunk_size = chunk_size
+
+    def execute(self, owner_id: UUID, format: ExportFormat) -> AsyncIterator[str]:
+        format = ExportFormat(format)
+        payments = self.expense_repository.iter_payment_history(owner_id, batch_size=self.chunk_size * 2)
+        if format is ExportFormat.CSV:
+            return self._to_csv(payments)
+        return self._to_ndjson(payments)
+
+    async def _chunks(self, payments: AsyncIterable[PeriodPayment]) -> AsyncIterator[list[PeriodPaymentDTO]]:
+        chunk: list[PeriodPaymentDTO] = []
+        async for payment in payments:
+            chunk.append(parse_period_payment(payment))
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    async def _to_ndjson(self, payments: AsyncIterable[PeriodPayment]) -> AsyncIterator[str]:
+        async for chunk in self._chunks(payments):
+            yield ''.join(f'{dto.model_dump_json()}\n' for dto in chunk)
+
+    async def _to_csv(self, payments: AsyncIterable[PeriodPayment]) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, lineterminator='\n')
+        writer.writeheader()
+        async for chunk in self._chunks(payments):
+            writer.writerows(dto.model_dump(mode='json') for dto in chunk)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        # Header only, for users without payments
+        if buffer.tell():
+            yield buffer.getvalue()
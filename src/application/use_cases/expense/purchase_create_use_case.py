@@ -3,15 +3,15 @@ from uuid import uuid4
 from src.domain.expense import PurchaseFactory, Purchase
 from src.domain.shared import Amount
 from ...dtos import CreatePurchaseDTO, ExpenseResponseDTO
-from ...ports import ExpenseRepository
+from ...ports import AsyncExpenseRepository
 from .helpers import parse_expense
 
 
 class PurchaseCreateUseCase:
-    def __init__(self, expense_repository: ExpenseRepository[Purchase]):
+    def __init__(self, expense_repository: AsyncExpenseRepository[Purchase]):
         self.expense_repository = expense_repository
 
-    def execute(self, purchase_data: CreatePurchaseDTO) -> ExpenseResponseDTO:
+    async def execute(self, purchase_data: CreatePurchaseDTO) -> ExpenseResponseDTO:
         purchase = PurchaseFactory.create(
             id=uuid4(),
             account_id=purchase_data.account_id,
@@ -24,5 +24,5 @@ class PurchaseCreateUseCase:
             category_id=purchase_data.category_id,
             payments=[],
         )
-        self.expense_repository.create(purchase)
+        await self.expense_repository.create(purchase)
         return parse_expense(purchase)
@@ -1,12 +1,12 @@
 from uuid import UUID
 
 from src.domain.expense import Purchase
-from ...ports import ExpenseRepository
+from ...ports import AsyncExpenseRepository
 
 
 class PurchaseDeleteUseCase:
-    def __init__(self, expense_repository: ExpenseRepository[Purchase]):
+    def __init__(self, expense_repository: AsyncExpenseRepository[Purchase]):
         self.expense_repository = expense_repository
 
-    def execute(self, purchase_id: UUID) -> None:
-        self.expense_repository.delete_by_filter({'id': purchase_id})
+    async def execute(self, purchase_id: UUID) -> None:
+        await self.expense_repository.delete_by_filter({'id': purchase_id})
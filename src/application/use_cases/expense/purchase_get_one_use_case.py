@@ -2,16 +2,16 @@ from uuid import UUID
 
 from src.domain.expense import Purchase
 from ...dtos import ExpenseResponseDTO
-from ...ports import ExpenseRepository
+from ...ports import AsyncExpenseRepository
 from .helpers import parse_expense
 
 
 class PurchaseGetOneUseCase:
-    def __init__(self, expense_repository: ExpenseRepository[Purchase]):
+    def __init__(self, expense_repository: AsyncExpenseRepository[Purchase]):
         self.expense_repository = expense_repository
 
-    def execute(self, purchase_id: UUID) -> ExpenseResponseDTO:
-        purchase = self.expense_repository.get_by_filter({'id': purchase_id})
+    async def execute(self, purchase_id: UUID) -> ExpenseResponseDTO:
+        purchase = await self.expense_repository.get_by_filter({'id': purchase_id})
         if not purchase:
             raise ValueError('Purchase not found')
         return parse_expense(purchase)
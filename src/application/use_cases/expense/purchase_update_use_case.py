@@ -2,19 +2,19 @@ from uuid import UUID
 
 from src.domain.expense import Purchase
 from ...dtos import UpdatePurchaseDTO, ExpenseResponseDTO
-from ...ports import ExpenseRepository
+from ...ports import AsyncExpenseRepository
 from .helpers import parse_expense
 
 
 class PurchaseUpdateUseCase:
-    def __init__(self, expense_repository: ExpenseRepository[Purchase]):
+    def __init__(self, expense_repository: AsyncExpenseRepository[Purchase]):
         self.expense_repository = expense_repository
 
-    def execute(self, purchase_id: UUID, purchase_data: UpdatePurchaseDTO) -> ExpenseResponseDTO:
-        purchase = self.expense_repository.get_by_filter({'id': purchase_id})
+    async def execute(self, purchase_id: UUID, purchase_data: UpdatePurchaseDTO) -> ExpenseResponseDTO:
+        purchase = await self.expense_repository.get_by_filter({'id': purchase_id})
         if not purchase:
             raise ValueError('Purchase not found')
         for field, value in purchase_data.model_dump(exclude_unset=True).items():
             setattr(purchase, field, value)
-        updated_purchase = self.expense_repository.update(purchase)
+        updated_purchase = await self.expense_repository.update(purchase)
         return parse_expense(updated_purchase)
@@ -3,15 +3,15 @@ from uuid import uuid4
 from src.domain.expense import SubscriptionFactory, Subscription
 from src.domain.shared import Amount
 from ...dtos import CreateSubscriptionDTO, ExpenseResponseDTO
-from ...ports import ExpenseRepository
+from ...ports import AsyncExpenseRepository
 from .helpers import parse_expense
 
 
 class SubscriptionCreateUseCase:
-    def __init__(self, expense_repository: ExpenseRepository[Subscription]):
+    def __init__(self, expense_repository: AsyncExpenseRepository[Subscription]):
         self.expense_repository = expense_repository
 
-    def execute(self, subscription_data: CreateSubscriptionDTO) -> ExpenseResponseDTO:
+    async def execute(self, subscription_data: CreateSubscriptionDTO) -> ExpenseResponseDTO:
         subscription = SubscriptionFactory.create(
             id=uuid4(),
             account_id=subscription_data.account_id,
@@ -23,5 +23,5 @@ class SubscriptionCreateUseCase:
             category_id=subscription_data.category_id,
             payments=[],
         )
-        self.expense_repository.create(subscription)
+        await self.expense_repository.create(subscription)
         return parse_expense(subscription)
@@ -1,12 +1,12 @@
 from uuid import UUID
 
 from src.domain.expense import Subscription
-from ...ports import ExpenseRepository
+from ...ports import AsyncExpenseRepository
 
 
 class SubscriptionDeleteUseCase:
-    def __init__(self, expense_repository: ExpenseRepository[Subscription]):
+    def __init__(self, expense_repository: AsyncExpenseRepository[Subscription]):
         self.expense_repository = expense_repository
 
-    def execute(self, subscription_id: UUID) -> None:
-        self.expense_repository.delete_by_filter({'id': subscription_id})
+    async def execute(self, subscription_id: UUID) -> None:
+        await self.expense_repository.delete_by_filter({'id': subscription_id})
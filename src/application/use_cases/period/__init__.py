@@ -1,7 +1,9 @@
 from .get_one import PeriodGetOneUseCase
 from .get_range import PeriodGetRangeUseCase
+from .get_summaries import PeriodGetSummariesUseCase
 
 __all__ = [
     'PeriodGetOneUseCase',
     'PeriodGetRangeUseCase',
+    'PeriodGetSummariesUseCase',
 ]
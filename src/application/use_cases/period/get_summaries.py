@@ -0,0 +1,37 @@
+from uuid import UUID, uuid4
+
+from src.application.dtos import PeriodSummaryDTO
+from src.application.ports import AsyncCreditCardRepository
+from src.domain.shared import Month, Year
+from .helpers import parse_period_summary
+
+
+class PeriodGetSummariesUseCase:
+    """Get the totals of a range of periods (for dashboard charts), without their payments."""
+    
+    def __init__(
+        self,
+        credit_card_repository: AsyncCreditCardRepository,
+    ):
+        self.credit_card_repository = credit_card_repository
+    
+    async def execute(self, user_id: UUID, month: int, year: int, months: int = 12) -> list[PeriodSummaryDTO]:
+        """
+        Get period summaries from the materialized period totals.
+        
+        Args:
+            user_id: Owner user ID
+            month: First period month (1-12)
+            year: First period year
+            months: Number of consecutive periods (default: 12)
+            
+        Returns:
+            List of PeriodSummaryDTO, one per period in order (empty periods included)
+        """
+        summaries = await self.credit_card_repository.get_period_summaries(
+            owner_id=user_id,
+            month=Month(month),
+            year=Year(year),
+            months=months,
+        )
+        return [parse_period_summary(summary, uuid4()) for summary in summaries]
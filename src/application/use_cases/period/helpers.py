@@ -0,0 +1,97 @@
+"""
+Helper functions for period use cases.
+
+The DTOs are built from domain objects, whose values already have the DTO field types,
+so they are created with model_construct: no validation pass over every payment.
+"""
+from uuid import UUID
+
+from src.domain.expense import Period, PeriodPayment, PeriodSummary
+from src.application.dtos import PeriodResponseDTO, PeriodPaymentDTO, PeriodSummaryDTO
+
+
+def parse_period_payment(period_payment: PeriodPayment) -> PeriodPaymentDTO:
+    """
+    Convert a PeriodPayment value object to PeriodPaymentDTO.
+    
+    Args:
+        period_payment: PeriodPayment value object
+        
+    Returns:
+        PeriodPaymentDTO with payment, expense and account data
+    """
+    pp = period_payment
+    return PeriodPaymentDTO.model_construct(
+        # Payment data
+        payment_id=pp.payment_id,
+        amount=pp.amount.value,
+        status=pp.status,
+        payment_date=pp.payment_date,
+        no_installment=pp.no_installment,
+        is_last_payment=pp.is_last_payment,
+        
+        # Expense data
+        expense_id=pp.expense_id,
+        expense_title=pp.expense_title,
+        expense_type=pp.expense_type,
+        expense_cc_name=pp.expense_cc_name,
+        expense_acquired_at=pp.expense_acquired_at,
+        expense_installments=pp.expense_installments,
+        expense_status=pp.expense_status,
+        expense_category_name=pp.expense_category_name,
+        
+        # Account data
+        account_id=pp.account_id,
+        account_alias=pp.account_alias,
+        account_is_enabled=pp.account_is_enabled,
+        account_type=pp.account_type,
+    )
+
+
+def parse_period(period: Period) -> PeriodResponseDTO:
+    """
+    Convert a Period domain entity to PeriodResponseDTO.
+    
+    Args:
+        period: Period domain entity
+        
+    Returns:
+        PeriodResponseDTO with all computed values and enriched payments
+    """
+    return PeriodResponseDTO.model_construct(
+        id=period.id,
+        period_str=period.period_str,
+        month=int(period.month),
+        year=int(period.year),
+        total_amount=period.total_amount.value,
+        total_confirmed_amount=period.total_confirmed_amount.value,
+        total_paid_amount=period.total_paid_amount.value,
+        total_pending_amount=period.total_pending_amount.value,
+        total_payments=period.total_payments,
+        pending_payments_count=len(period.pending_payments),
+        completed_payments_count=len(period.completed_payments),
+        payments=[parse_period_payment(pp) for pp in period.payments],
+    )
+
+
+def parse_period_summary(summary: PeriodSummary, id: UUID) -> PeriodSummaryDTO:
+    """
+    Convert a PeriodSummary value object to PeriodSummaryDTO.
+    
+    Args:
+        summary: PeriodSummary value object
+        id: Period ID (summaries are not entities, so the caller provides it)
+        
+    Returns:
+        PeriodSummaryDTO with the period totals
+    """
+    return PeriodSummaryDTO.model_construct(
+        id=id,
+        period_str=summary.period_str,
+        month=int(summary.month),
+        year=int(summary.year),
+        total_amount=summary.total_amount.value,
+        total_confirmed_amount=summary.total_confirmed_amount.value,
+        total_paid_amount=summary.total_paid_amount.value,
+        total_payments=summary.total_payments,
+    )
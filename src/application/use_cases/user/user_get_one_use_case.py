@@ -7,7 +7,7 @@ their profile and preferences data.
 import logging
 from uuid import UUID
 
-from src.application.ports.user_repository import UserRepository
+from src.application.ports import AsyncUserRepository
 from src.application.dtos import UserResponseDTO, ProfileResponseDTO, PreferencesResponseDTO
 from src.domain.auth import User
 
@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 class UserGetOneUseCase:
     """Use case for retrieving a user by their ID."""
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: AsyncUserRepository):
         """
         Initialize the use case.
 
@@ -26,7 +26,7 @@ class UserGetOneUseCase:
         """
         self.user_repository = user_repository
 
-    def execute(self, user_id: UUID) -> UserResponseDTO:
+    async def execute(self, user_id: UUID) -> UserResponseDTO:
         """
         Retrieve a user by ID.
 
@@ -39,7 +39,7 @@ class UserGetOneUseCase:
         Raises:
             ValueError: If user is not found
         """
-        user: User | None = self.user_repository.get_by_filter({'id': user_id})
+        user: User | None = await self.user_repository.get_by_filter({'id': user_id})
         
         if not user:
             raise ValueError(f'User with id {user_id} not found')
@@ -8,9 +8,9 @@ import logging
 from uuid import UUID
 from datetime import date
 
-from src.application.ports.user_repository import UserRepository
+from src.application.ports import AsyncUserRepository
 from src.application.dtos import UpdateUserDTO, UserResponseDTO, ProfileResponseDTO, PreferencesResponseDTO
-from src.application.helpers.security import hash_password
+from src.application.helpers.password_hasher import PasswordHasher, password_hasher as default_password_hasher
 from src.domain.auth import User
 
 logger = logging.getLogger(__name__)
@@ -19,16 +19,18 @@ logger = logging.getLogger(__name__)
 class UserUpdateUseCase:
     """Use case for updating user information."""
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: AsyncUserRepository, password_hasher: PasswordHasher | None = None):
         """
         Initialize the use case.
 
         Args:
             user_repository: Repository for user data access
+            password_hasher: Hashes new passwords off the event loop
         """
         self.user_repository = user_repository
+        self.password_hasher = password_hasher or default_password_hasher
 
-    def execute(self, user_id: UUID, update_data: UpdateUserDTO) -> UserResponseDTO:
+    async def execute(self, user_id: UUID, update_data: UpdateUserDTO) -> UserResponseDTO:
         """
         Update a user's information.
 
@@ -43,7 +45,7 @@ class UserUpdateUseCase:
             ValueError: If user is not found or validation fails
         """
         # Fetch existing user
-        user: User | None = self.user_repository.get_by_filter({'id': user_id})
+        user: User | None = await self.user_repository.get_by_filter({'id': user_id})
         
         if not user:
             raise ValueError(f'User with id {user_id} not found')
@@ -56,7 +58,7 @@ class UserUpdateUseCase:
             user.email = update_data.email
 
         if update_data.password is not None:
-            user.encrypted_password = hash_password(update_data.password)
+            user.encrypted_password = await self.password_hasher.hash(update_data.password)
 
         # Update profile fields if provided
         if update_data.profile:
@@ -78,7 +80,7 @@ class UserUpdateUseCase:
                     user.profile.preferences.monthly_spending_limit = update_data.profile.preferences.monthly_spending_limit
 
         # Save updated user
-        updated_user = self.user_repository.update(user)
+        updated_user = await self.user_repository.update(user)
 
         # Build response DTOs
         preferences_dto = None
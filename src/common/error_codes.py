@@ -5,3 +5,5 @@ JWT_INVALID = 'TOKEN_INVALID'
 # Repo
 REPO_ERROR = 'REPO_ERROR'
 REPO_NOT_FOUND = 'REPO_NOT_FOUND'
+# Security
+PASSWORD_HASHER_BUSY = 'PASSWORD_HASHER_BUSY'
@@ -1,5 +1,6 @@
 from .jwt_exceptions import JWTExpiredError, JWTInvalidSignatureError, JWTInvalidError, UnauthorizedError
 from .repo_exceptions import RepositoryError, RepoNotFoundError
+from .security_exceptions import PasswordHasherBusyError
 
 
 __all__ = [
@@ -11,4 +12,6 @@ __all__ = [
     # Repo Exceptions
     'RepositoryError',
     'RepoNotFoundError',
+    # Security Exceptions
+    'PasswordHasherBusyError',
 ]
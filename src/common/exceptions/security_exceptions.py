@@ -0,0 +1,15 @@
+from .base_exception import BaseException
+from ..error_codes import PASSWORD_HASHER_BUSY
+
+
+class PasswordHasherBusyError(BaseException):
+    """
+    Exception raised when the password hashing queue is full.
+
+    Attributes:
+        message (str): Human-readable error message.
+        code (str): Error code representing the saturated password hasher.
+    """
+
+    def __init__(self, message: str = 'Too many concurrent password checks, try again later', code: str = PASSWORD_HASHER_BUSY):
+        super().__init__(message=message, code=code)
@@ -0,0 +1,73 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    Bounded LRU cache where every entry also expires at its own timestamp.
+
+    Expiry uses wall-clock epoch seconds so it can be fed straight from a JWT `exp`.
+    Thread-safe: sync routes run in the threadpool while middlewares run on the loop.
+    on_evict, when given, is called (outside the lock) with the key of every entry
+    dropped because it expired or was the least recently used; not for pop/clear.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        clock: Callable[[], float] = time.time,
+        on_evict: Callable[[Hashable], None] | None = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        self.max_size: int = max_size
+        self._clock = clock
+        self._on_evict = on_evict
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at > self._clock():
+                self._data.move_to_end(key)
+                return value
+            del self._data[key]
+        self._evicted([key])
+        return default
+
+    def set(self, key: Hashable, value: Any, expires_at: float) -> None:
+        evicted = []
+        with self._lock:
+            if expires_at <= self._clock():
+                if self._data.pop(key, None) is not None:
+                    evicted.append(key)
+            else:
+                self._data[key] = (expires_at, value)
+                self._data.move_to_end(key)
+                while len(self._data) > self.max_size:
+                    evicted.append(self._data.popitem(last=False)[0])
+        self._evicted(evicted)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def _evicted(self, keys: list[Hashable]) -> None:
+        if self._on_evict is not None:
+            for key in keys:
+                self._on_evict(key)
+
+    def __len__(self) -> int:
+        return len(self._data)
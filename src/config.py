@@ -7,6 +7,13 @@ class Settings(BaseSettings):
     CONN_DB: str  # ! Required
     DEV: bool = False
 
+    # DB pool (ignored by SQLite, which uses its own pools)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds waiting for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds, -1 disables
+    DB_POOL_PRE_PING: bool = True
+
     # Config
     DEBUG: bool = False
 
@@ -17,6 +24,19 @@ class Settings(BaseSettings):
     JWT_MAX_RENEWALS: int = 3  # Maximum auto-renewals before requiring refresh
     JWT_REFRESH_SECRET_KEY: str  # ! Required - Different secret for refresh tokens
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 30  # 30 days
+    JWT_CACHE_SIZE: int = 1024  # Verified access tokens kept until their exp
+
+    # Password hashing (bcrypt runs on its own bounded pool)
+    PASSWORD_HASHER_WORKERS: int = 2
+    PASSWORD_HASHER_MAX_QUEUE: int = 64  # Waiting hash/verify calls before rejecting with 503
+
+    # Cache of read results (periods, card listing), dropped per user on writes
+    # Unset: enabled only with CACHE_URL. The in-process cache is per worker (a write only
+    # invalidates the worker that handled it), so enable it without CACHE_URL only with a single worker
+    CACHE_ENABLED: bool | None = None
+    CACHE_URL: str | None = None  # redis://host:6379/0 shares it across workers; in-process when unset
+    CACHE_TTL_SECONDS: int = 300
+    CACHE_MAX_SIZE: int = 4096  # In-process entries
 
     model_config = SettingsConfigDict(env_file='.env', env_file_encoding='utf-8')
 
@@ -1,11 +1,13 @@
 from .account import Account
 from .credit_card import CreditCard
 from .credit_card_factory import CreditCardFactory
+from .credit_card_usage import CreditCardUsage
 from .enums import AccountType
 
 __all__ = [
     'Account',
     'CreditCard',
     'CreditCardFactory',
+    'CreditCardUsage',
     'AccountType',
 ]
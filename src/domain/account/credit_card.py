@@ -1,10 +1,10 @@
-from functools import reduce
 from uuid import UUID
 from datetime import date
 from typing import TYPE_CHECKING
 
 from ..shared import Amount, Month, Year
 from .account import Account
+from .credit_card_usage import CreditCardUsage
 from .enums import AccountType
 
 
@@ -27,6 +27,7 @@ class CreditCard(Account):
         next_expiring_date: date,
         financing_limit: Amount,
         expenses: list['Expense'],
+        usage: CreditCardUsage | None = None,
     ):
         super().__init__(id, owner_id, alias, limit, is_enabled)
         self.main_credit_card_id = main_credit_card_id
@@ -34,33 +35,40 @@ class CreditCard(Account):
         self.next_expiring_date = next_expiring_date
         self.financing_limit = financing_limit
         self.expenses = expenses
+        # Persisted usage, given when the card is loaded without its expenses
+        self.stored_usage = usage
 
     @property
     def account_type(self) -> AccountType:
         """Return CREDIT_CARD as the account type."""
         return AccountType.CREDIT_CARD
 
+    @property
+    def usage(self) -> CreditCardUsage:
+        """Return the stored usage, or compute it from the expenses when there is none."""
+        if self.stored_usage is not None:
+            return self.stored_usage
+        return CreditCardUsage.from_expenses(self.expenses)
+
     @property
     def total_expenses_count(self) -> int:
         """Return the total number of expenses associated with this credit card."""
-        return len(self.expenses)
+        return self.usage.expenses_count
 
     @property
     def total_purchases_count(self) -> int:
         """Return the total number of purchase expenses associated with this credit card."""
-        from ..expense import ExpenseType
-        return len([exp for exp in self.expenses if exp.expense_type == ExpenseType.PURCHASE])
+        return self.usage.purchases_count
 
     @property
     def total_subscriptions_count(self) -> int:
-        from ..expense import ExpenseType
         """Return the total number of subscription expenses associated with this credit card."""
-        return len([exp for exp in self.expenses if exp.expense_type == ExpenseType.SUBSCRIPTION])
+        return self.usage.subscriptions_count
 
     @property
     def used_limit(self) -> Amount:
         """Calculate and return the used limit of the credit card."""
-        return sum((exp.pending_amount for exp in self.expenses), Amount(0))
+        return self.usage.used_limit
 
     @property
     def available_limit(self) -> Amount:
@@ -70,7 +78,7 @@ class CreditCard(Account):
     @property
     def used_financing_limit(self) -> Amount:
         """Calculate and return the used financing limit of the credit card."""
-        return sum((exp.pending_financing_amount for exp in self.expenses), Amount(0))
+        return self.usage.used_financing_limit
 
     @property
     def available_financing_limit(self) -> Amount:
@@ -110,4 +118,8 @@ class CreditCard(Account):
         if (month is None and year is not None) or (month is not None and year is None):
             raise ValueError('Both month and year must be provided together or both must be None')
 
-        return reduce(lambda acc, exp: acc + exp.get_payments(month, year), self.expenses, [])
+        payments: list['Payment'] = []
+        for expense in self.expenses:
+            # Each expense answers from its own (year, month) index, so this is linear in the results
+            payments.extend(expense.get_payments(month, year))
+        return payments
@@ -9,6 +9,7 @@ class CreditCardFactory(EntityFactoryBase):
     @staticmethod
     def create(**kwargs):
         from .credit_card import CreditCard
+        from .credit_card_usage import CreditCardUsage
         from ..expense import Expense
 
         id: UUID | None = kwargs.get('id')
@@ -21,6 +22,7 @@ class CreditCardFactory(EntityFactoryBase):
         next_expiring_date: date | None = kwargs.get('next_expiring_date')
         financing_limit: Amount | None = kwargs.get('financing_limit')
         expenses: list | None = kwargs.get('expenses')
+        usage: CreditCardUsage | None = kwargs.get('usage')
 
         # Validations
         if id is None or not isinstance(id, UUID):
@@ -46,6 +48,8 @@ class CreditCardFactory(EntityFactoryBase):
         not_is_expense = next((e for e in expenses if not isinstance(e, Expense)), None)
         if not_is_expense:
             raise ValueError(f'all items in expenses must be instances of Expense, got {type(not_is_expense)}')
+        if not isinstance(usage, (CreditCardUsage, type(None))):
+            raise ValueError(f'usage must be an instance of CreditCardUsage, got {type(usage)}')
         
         return CreditCard(
             id=id,
@@ -58,4 +62,5 @@ class CreditCardFactory(EntityFactoryBase):
             next_expiring_date=next_expiring_date,
             financing_limit=financing_limit,
             expenses=expenses,
+            usage=usage,
         )
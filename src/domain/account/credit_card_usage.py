@@ -0,0 +1,88 @@
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from ..shared import Amount
+
+if TYPE_CHECKING:
+    from ..expense import Expense
+
+
+class CreditCardUsage:
+    '''
+    What the expenses of a credit card take from its limits, and how many there are.
+
+    Usages add up: the usage of a card is the sum of the usage of each of its expenses,
+    so it can be kept up to date by adding the difference an expense change makes.
+    '''
+
+    __slots__ = ('used_limit', 'used_financing_limit', 'expenses_count', 'purchases_count', 'subscriptions_count')
+
+    def __init__(
+        self,
+        used_limit: Amount,
+        used_financing_limit: Amount,
+        expenses_count: int = 0,
+        purchases_count: int = 0,
+        subscriptions_count: int = 0,
+    ):
+        self.used_limit = used_limit
+        self.used_financing_limit = used_financing_limit
+        self.expenses_count = expenses_count
+        self.purchases_count = purchases_count
+        self.subscriptions_count = subscriptions_count
+
+    @classmethod
+    def empty(cls) -> 'CreditCardUsage':
+        return cls(Amount(0), Amount(0))
+
+    @classmethod
+    def from_expense(cls, expense: 'Expense') -> 'CreditCardUsage':
+        'Usage taken by a single expense.'
+        from ..expense import ExpenseType
+        return cls(
+            used_limit=expense.pending_amount,
+            used_financing_limit=expense.pending_financing_amount,
+            expenses_count=1,
+            purchases_count=int(expense.expense_type == ExpenseType.PURCHASE),
+            subscriptions_count=int(expense.expense_type == ExpenseType.SUBSCRIPTION),
+        )
+
+    @classmethod
+    def from_expenses(cls, expenses: Iterable['Expense']) -> 'CreditCardUsage':
+        'Usage taken by several expenses, computed in a single pass.'
+        return sum((cls.from_expense(expense) for expense in expenses), cls.empty())
+
+    @property
+    def is_empty(self) -> bool:
+        return self == CreditCardUsage.empty()
+
+    def __add__(self, other: 'CreditCardUsage') -> 'CreditCardUsage':
+        if not isinstance(other, CreditCardUsage):
+            return NotImplemented
+        return CreditCardUsage(
+            used_limit=self.used_limit + other.used_limit,
+            used_financing_limit=self.used_financing_limit + other.used_financing_limit,
+            expenses_count=self.expenses_count + other.expenses_count,
+            purchases_count=self.purchases_count + other.purchases_count,
+            subscriptions_count=self.subscriptions_count + other.subscriptions_count,
+        )
+
+    def __sub__(self, other: 'CreditCardUsage') -> 'CreditCardUsage':
+        if not isinstance(other, CreditCardUsage):
+            return NotImplemented
+        return CreditCardUsage(
+            used_limit=self.used_limit - other.used_limit,
+            used_financing_limit=self.used_financing_limit - other.used_financing_limit,
+            expenses_count=self.expenses_count - other.expenses_count,
+            purchases_count=self.purchases_count - other.purchases_count,
+            subscriptions_count=self.subscriptions_count - other.subscriptions_count,
+        )
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, CreditCardUsage):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(value, field) for field in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{field}={getattr(self, field)!r}' for field in self.__slots__)
+        return f'CreditCardUsage({fields})'
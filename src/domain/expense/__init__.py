@@ -7,10 +7,13 @@ from .period_factory import PeriodFactory
 from .period import Period
 from .period_payment import PeriodPayment
 from .period_payment_factory import PeriodPaymentFactory
+from .period_projection import PeriodProjection
+from .period_summary import PeriodSummary
 from .purchase_factory import PurchaseFactory
 from .purchase import Purchase
 from .subscription_factory import SubscriptionFactory
 from .subscription import Subscription
+from .subscription_occurrence import SubscriptionOccurrence
 from .enums import ExpenseType, ExpenseStatus, PaymentStatus
 
 __all__ = [
@@ -23,10 +26,13 @@ __all__ = [
     'PeriodFactory',
     'PeriodPayment',
     'PeriodPaymentFactory',
+    'PeriodProjection',
+    'PeriodSummary',
     'PurchaseFactory',
     'Purchase',
     'SubscriptionFactory',
     'Subscription',
+    'SubscriptionOccurrence',
     'ExpenseType',
     'ExpenseStatus',
     'PaymentStatus',
@@ -38,6 +38,8 @@ class Expense(EntityBase, ABC):
         self.status = status
         self.category_id = category_id
         self.payments = payments if payments is not None else []
+        # (payments list, its length, (year, month) -> payments) of the last get_payments lookup
+        self._payments_index: tuple[list[Payment], int, dict[tuple[int, int], list[Payment]]] | None = None
 
     @property
     def is_one_time_payment(self) -> bool:
@@ -73,8 +75,21 @@ class Expense(EntityBase, ABC):
         'Get all payments for this expense in a given month and year.'
         if (month is None and year is not None) or (month is not None and year is None):
             raise ValueError('Both month and year must be provided together or both must be None')
-        payments = []
-        for payment in self.payments:
-            if (month is None or payment.payment_date.month == month) and (year is None or payment.payment_date.year == year):
-                payments.append(payment)
-        return payments
+        if month is None:
+            return list(self.payments)
+        return list(self.__get_payments_index().get((year, month), ()))
+
+    def __get_payments_index(self) -> dict[tuple[int, int], list['Payment']]:
+        'Payments grouped by (year, month) of their date, built once until the payments change.'
+        payments = self.payments
+        cache = self._payments_index
+        if cache is None or cache[0] is not payments or cache[1] != len(payments):
+            index: dict[tuple[int, int], list[Payment]] = {}
+            for payment in payments:
+                index.setdefault((payment.payment_date.year, payment.payment_date.month), []).append(payment)
+            cache = self._payments_index = (payments, len(payments), index)
+        return cache[2]
+
+    def _payments_changed(self) -> None:
+        'Drop what is derived from the payments (called by the methods that change them).'
+        self._payments_index = None
@@ -7,6 +7,8 @@ from .enums import PaymentStatus
 
 
 class Payment(EntityBase):
+    # Thousands of payments are loaded per user, so no per-instance __dict__
+    __slots__ = ('expense_id', 'amount', 'no_installment', 'status', 'payment_date', 'is_last_payment')
 
     def __init__(
             self,
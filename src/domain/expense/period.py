@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from uuid import UUID
 
 from ..shared import EntityBase, Amount, Month, Year
@@ -27,31 +28,27 @@ class Period(EntityBase):
     @property
     def total_amount(self) -> Amount:
         'Calculate the total amount of all payments in this period.'
-        total = sum(payment.amount.value for payment in self.payments)
-        return Amount(total)
+        return Amount.sum(payment.amount for payment in self.payments)
 
     @property
     def total_paid_amount(self) -> Amount:
         'Calculate the total amount of all paid payments in this period.'
-        total = sum(payment.amount.value for payment in self.payments if payment.status == PaymentStatus.PAID)
-        return Amount(total)
+        return Amount.sum(payment.amount for payment in self.payments if payment.status == PaymentStatus.PAID)
     
     @property
     def total_confirmed_amount(self) -> Amount:
         'Calculate the total amount of all confirmed/paid payments in this period.'
         confirmed_statuses = {PaymentStatus.CONFIRMED, PaymentStatus.PAID}
-        total = sum(
-            payment.amount.value 
-            for payment in self.payments 
+        return Amount.sum(
+            payment.amount
+            for payment in self.payments
             if payment.status in confirmed_statuses
         )
-        return Amount(total)
 
     @property
     def total_pending_amount(self) -> Amount:
         'Calculate the total amount of all unconfirmed payments in this period.'
-        total = sum(payment.amount.value for payment in self.payments if payment.status == PaymentStatus.UNCONFIRMED)
-        return Amount(total)
+        return Amount.sum(payment.amount for payment in self.payments if payment.status == PaymentStatus.UNCONFIRMED)
 
     @property
     def pending_payments(self) -> list[PeriodPayment]:
@@ -85,7 +82,7 @@ class Period(EntityBase):
         if not existing_payment:
             self.payments.append(payment)
 
-    def fill_from_account(self, account: Account, expenses: list | None = None):
+    def fill_from_account(self, account: Account, expenses: list | None = None, category_names: Mapping[UUID, str] | None = None):
         """
         Fill the period with payments from the given account.
         
@@ -95,11 +92,10 @@ class Period(EntityBase):
         Args:
             account: Account entity (e.g., CreditCard)
             expenses: Optional list of expenses. If None and account has expenses attribute, uses it.
+            category_names: Optional category names by id, to label the payments.
         """
         from .period_payment_factory import PeriodPaymentFactory
-        from .enums import ExpenseType, ExpenseStatus, PaymentStatus
-        from datetime import date
-        from uuid import uuid4
+        from .enums import ExpenseType
         
         # Try to get expenses from account if not provided
         if expenses is None:
@@ -107,6 +103,7 @@ class Period(EntityBase):
         
         # Ensure expenses is a list at this point
         expenses_list = expenses if expenses is not None else []
+        category_names = category_names or {}
         
         # Create a mapping of expense_id -> expense for quick lookup
         expense_map = {exp.id: exp for exp in expenses_list}
@@ -122,15 +119,12 @@ class Period(EntityBase):
             # Track which expenses have real payments in this period
             real_payments_expense_ids.add(expense.id)
             
-            # Get category name if exists
-            category_name = None  # TODO: fetch from category repository if needed
-            
             # Create PeriodPayment
             period_payment = PeriodPaymentFactory.create_from_entities(
                 payment=payment,
                 expense=expense,
                 account=account,
-                category_name=category_name,
+                category_name=category_names.get(expense.category_id),
             )
             
             try:
@@ -148,63 +142,18 @@ class Period(EntityBase):
             if expense.id in real_payments_expense_ids:
                 continue
             
-            # Skip if subscription is not active
-            if expense.status not in {ExpenseStatus.ACTIVE, ExpenseStatus.PENDING}:
-                continue
-            
-            # Check if this subscription should have a payment in this period
-            # A subscription should have a simulated payment if:
-            # 1. It has at least one payment (it has started)
-            # 2. The last payment is in a period before this one
-            if not expense.payments:
-                continue
-            
-            # Get the last payment date
-            last_payment = max(expense.payments, key=lambda p: p.payment_date)
-            last_payment_date = last_payment.payment_date
-            
-            # Calculate if this period comes after the last payment
-            period_date = date(self.year, self.month, 1)
-            last_payment_period_date = date(
-                last_payment_date.year, 
-                last_payment_date.month, 
-                1
-            )
-            
-            # If this period is after the last payment period, create simulated payment
-            if period_date > last_payment_period_date:
-                # Calculate the payment date for this period (same day as first payment)
-                payment_day = expense.first_payment_date.day
-                # Adjust day if it exceeds the month's days
-                from calendar import monthrange
-                max_day = monthrange(self.year, self.month)[1]
-                payment_day = min(payment_day, max_day)
-                
-                simulated_payment_date = date(self.year, self.month, payment_day)
-                
-                # Calculate installment number (subscriptions continue indefinitely)
-                months_diff = (self.year - last_payment_date.year) * 12 + (self.month - last_payment_date.month)
-                simulated_installment = last_payment.no_installment + months_diff
-                
-                # Create simulated PeriodPayment
-                from .payment import Payment
-                simulated_payment = Payment(
-                    id=uuid4(),  # Temporary ID (not persisted)
-                    expense_id=expense.id,
-                    amount=expense.amount,
-                    no_installment=simulated_installment,
-                    status=PaymentStatus.SIMULATED,
-                    payment_date=simulated_payment_date,
-                    is_last_payment=False,  # Subscriptions don't have a last payment
-                )
-                
-                category_name = None  # TODO: fetch from category repository if needed
-                
-                simulated_period_payment = PeriodPaymentFactory.create_from_entities(
-                    payment=simulated_payment,
+            # Simulated charge of this period, if it comes after the last payment's period
+            occurrence = next(expense.iter_simulated_occurrences(self.month, self.year, self.month, self.year), None)
+            if occurrence is not None:
+                anchor = PeriodPaymentFactory.create_from_entities(
+                    payment=expense.last_payment,
                     expense=expense,
                     account=account,
-                    category_name=category_name,
+                    category_name=category_names.get(expense.category_id),
+                )
+                simulated_period_payment = PeriodPaymentFactory.create_from_occurrence(
+                    anchor=anchor,
+                    occurrence=occurrence,
                 )
                 
                 try:
@@ -13,7 +13,14 @@ class PeriodPayment:
     This is a composite value object that aggregates data from Payment, Expense, and Account
     for efficient period-based queries and displays.
     """
-    
+
+    __slots__ = (
+        'payment_id', 'amount', 'status', 'payment_date', 'no_installment', 'is_last_payment',
+        'expense_id', 'expense_title', 'expense_type', 'expense_cc_name', 'expense_acquired_at',
+        'expense_installments', 'expense_status', 'expense_category_name',
+        'account_id', 'account_alias', 'account_is_enabled', 'account_type',
+    )
+
     def __init__(
         self,
         # Payment data
@@ -1,10 +1,11 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from ..shared import Amount
+from ..shared import Amount, date_helpers
 from ..account import Account
 from .payment import Payment
 from .expense import Expense
 from .period_payment import PeriodPayment
+from .subscription_occurrence import SubscriptionOccurrence
 
 
 class PeriodPaymentFactory:
@@ -55,6 +56,77 @@ class PeriodPaymentFactory:
             account_type=account.account_type,
         )
     
+    @staticmethod
+    def create_simulated(
+        anchor: PeriodPayment,
+        amount: Amount,
+        payment_day: int,
+        month: int,
+        year: int,
+    ) -> PeriodPayment:
+        """
+        Create a simulated PeriodPayment for a subscription in a later period.
+        
+        Args:
+            anchor: Last real payment of the subscription (as PeriodPayment)
+            amount: Current subscription amount
+            payment_day: Day of month the subscription is charged (clamped to month end)
+            month: Target period month
+            year: Target period year
+            
+        Returns:
+            PeriodPayment with SIMULATED status and a temporary (not persisted) ID
+        """
+        months_diff = (year - anchor.payment_date.year) * 12 + (month - anchor.payment_date.month)
+        return PeriodPaymentFactory.create_from_occurrence(
+            anchor=anchor,
+            occurrence=SubscriptionOccurrence(
+                payment_date=date_helpers.clamp_to_month(year, month, payment_day),
+                no_installment=anchor.no_installment + months_diff,
+                amount=amount,
+            ),
+        )
+
+    @staticmethod
+    def create_from_occurrence(anchor: PeriodPayment, occurrence: SubscriptionOccurrence) -> PeriodPayment:
+        """
+        Create a simulated PeriodPayment from a subscription occurrence.
+        
+        Args:
+            anchor: Last real payment of the subscription (as PeriodPayment)
+            occurrence: Occurrence yielded by Subscription.iter_simulated_occurrences
+            
+        Returns:
+            PeriodPayment with SIMULATED status and a temporary (not persisted) ID
+        """
+        from .enums import PaymentStatus
+
+        return PeriodPayment(
+            # Payment data
+            payment_id=uuid4(),  # Temporary ID (not persisted)
+            amount=occurrence.amount,
+            status=PaymentStatus.SIMULATED,
+            payment_date=occurrence.payment_date,
+            no_installment=occurrence.no_installment,
+            is_last_payment=False,  # Subscriptions don't have a last payment
+            
+            # Expense data
+            expense_id=anchor.expense_id,
+            expense_title=anchor.expense_title,
+            expense_type=anchor.expense_type,
+            expense_cc_name=anchor.expense_cc_name,
+            expense_acquired_at=anchor.expense_acquired_at,
+            expense_installments=anchor.expense_installments,
+            expense_status=anchor.expense_status,
+            expense_category_name=anchor.expense_category_name,
+            
+            # Account data
+            account_id=anchor.account_id,
+            account_alias=anchor.account_alias,
+            account_is_enabled=anchor.account_is_enabled,
+            account_type=anchor.account_type,
+        )
+
     @staticmethod
     def create(**kwargs) -> PeriodPayment:
         """
@@ -0,0 +1,96 @@
+from collections.abc import Mapping
+from uuid import UUID, uuid4
+
+from ..shared import Month, Year
+from ..account import Account
+from .enums import ExpenseType
+from .period import Period
+from .period_factory import PeriodFactory
+from .period_payment import PeriodPayment
+from .period_payment_factory import PeriodPaymentFactory
+
+
+class PeriodProjection:
+    """
+    Build several periods from the same accounts in a single pass.
+
+    Instead of filling every period from every account (months x payments), each
+    account's payments are walked once and dropped into buckets keyed by (year, month).
+    Active subscriptions then add one simulated payment to every requested period
+    after their last real payment (Subscription.iter_simulated_occurrences), the same
+    way Period.fill_from_account does.
+    """
+
+    def __init__(self, months: list[tuple[Month, Year]]):
+        """
+        Args:
+            months: Ordered list of (month, year) pairs to project
+        """
+        self._buckets: dict[tuple[int, int], list[PeriodPayment]] = {
+            (int(year), int(month)): [] for month, year in months
+        }
+
+    def add_account(self, account: Account, expenses: list | None = None, category_names: Mapping[UUID, str] | None = None) -> None:
+        """
+        Sort the payments of an account into the projected periods.
+
+        Args:
+            account: Account entity (e.g., CreditCard)
+            expenses: Optional list of expenses. If None and account has expenses attribute, uses it.
+            category_names: Optional category names by id, to label the payments.
+        """
+        if expenses is None:
+            expenses = getattr(account, 'expenses', [])
+        expenses_list = expenses if expenses is not None else []
+        category_names = category_names or {}
+
+        buckets = self._buckets
+        subscriptions = []
+
+        # 1. Real payments, one pass over every payment of the account
+        for expense in expenses_list:
+            for payment in expense.payments:
+                bucket = buckets.get((payment.payment_date.year, payment.payment_date.month))
+                if bucket is not None:
+                    bucket.append(PeriodPaymentFactory.create_from_entities(
+                        payment=payment,
+                        expense=expense,
+                        account=account,
+                        category_name=category_names.get(expense.category_id),
+                    ))
+            if expense.expense_type == ExpenseType.SUBSCRIPTION:
+                subscriptions.append(expense)
+
+        if not buckets or not subscriptions:
+            return
+
+        # 2. Simulated payments for periods after the last real subscription payment
+        (first_year, first_month), (last_year, last_month) = min(buckets), max(buckets)
+        for expense in subscriptions:
+            anchor = None
+            for occurrence in expense.iter_simulated_occurrences(first_month, first_year, last_month, last_year):
+                bucket = buckets.get((occurrence.payment_date.year, occurrence.payment_date.month))
+                if bucket is None:
+                    continue
+                if anchor is None:
+                    anchor = PeriodPaymentFactory.create_from_entities(
+                        payment=expense.last_payment,
+                        expense=expense,
+                        account=account,
+                        category_name=category_names.get(expense.category_id),
+                    )
+                bucket.append(PeriodPaymentFactory.create_from_occurrence(anchor=anchor, occurrence=occurrence))
+
+    def get_periods(self) -> list[Period]:
+        """Return the projected periods in the order they were requested."""
+        periods = []
+        for (year, month), payments in self._buckets.items():
+            period = PeriodFactory.create(
+                id=uuid4(),
+                month=Month(month),
+                year=Year(year),
+                payments=[],
+            )
+            period.payments.extend(payments)
+            periods.append(period)
+        return periods
@@ -0,0 +1,42 @@
+from ..shared import Amount, Month, Year
+
+
+class PeriodSummary:
+    """
+    Totals of the recorded payments of a period, without the payments themselves.
+
+    Simulated subscription payments are not recorded, so they are not part of a summary.
+    """
+
+    __slots__ = (
+        'month', 'year', 'total_amount', 'total_confirmed_amount', 'total_paid_amount',
+        'total_pending_amount', 'total_payments',
+    )
+
+    def __init__(
+        self,
+        month: Month,
+        year: Year,
+        total_amount: Amount,
+        total_confirmed_amount: Amount,
+        total_paid_amount: Amount,
+        total_pending_amount: Amount,
+        total_payments: int,
+    ):
+        self.month = month
+        self.year = year
+        self.total_amount = total_amount
+        self.total_confirmed_amount = total_confirmed_amount
+        self.total_paid_amount = total_paid_amount
+        self.total_pending_amount = total_pending_amount
+        self.total_payments = total_payments
+
+    @classmethod
+    def empty(cls, month: Month, year: Year) -> 'PeriodSummary':
+        'Summary of a period without payments.'
+        return cls(month, year, Amount(0), Amount(0), Amount(0), Amount(0), 0)
+
+    @property
+    def period_str(self) -> str:
+        'Return the period in MM/YYYY format.'
+        return f'{self.month:02}/{self.year}'
@@ -1,12 +1,11 @@
 from uuid import UUID, uuid4
 from datetime import date
 
-from ..shared import date_helpers, Amount
+from ..shared import installment_helpers, Amount
 from .exceptions import PaymentNotFoundInExpenseException
 from .enums import ExpenseType, ExpenseStatus, PaymentStatus
 from .expense import Expense
 from .payment import Payment
-from .payment_factory import PaymentFactory
 
 
 class Purchase(Expense):
@@ -45,8 +44,7 @@ class Purchase(Expense):
     @property
     def paid_amount(self) -> Amount:
         'Calculate the total amount paid for the purchase.'
-        total_paid = sum(payment.amount.value for payment in self.payments if payment.is_final_status)
-        return Amount(total_paid)
+        return Amount.sum(payment.amount for payment in self.payments if payment.is_final_status)
 
     @property
     def pending_installments(self) -> int:
@@ -69,31 +67,25 @@ class Purchase(Expense):
     @property
     def pending_amount(self) -> Amount:
         'Calculate the pending amount of the purchase made in one payment.'
-        total_amount = self.amount.value
-        for payment in self.payments:
-            if payment.is_final_status:
-                total_amount -= payment.amount.value
-        return Amount(total_amount)
+        return self.amount - self.paid_amount
 
     def calculate_payments(self) -> None:
-        remaining_amount = self.amount.value
-        remaining_installments = self.installments
-        payment_date: date = self.first_payment_date or self.acquired_at
-        for no in range(1, self.installments + 1):
-            installment_amount = Amount(remaining_amount / remaining_installments)
-            payment = PaymentFactory.create(
+        precision = self.amount.precision
+        first_payment_date: date = self.first_payment_date or self.acquired_at
+        schedule = installment_helpers.installment_schedule(self.amount.units, self.installments, first_payment_date)
+        # Amounts and dates come out of the schedule already valid, so no PaymentFactory checks per installment
+        self.payments.extend(
+            Payment(
                 id=uuid4(),
                 expense_id=self.id,
-                amount=installment_amount,
+                amount=Amount.from_units(units, precision),
                 no_installment=no,
                 status=PaymentStatus.UNCONFIRMED,
                 payment_date=payment_date,
-                is_last_payment=(no == self.installments)
+                is_last_payment=(no == self.installments),
             )
-            self.payments.append(payment)
-            remaining_amount -= installment_amount.value
-            remaining_installments -= 1
-            payment_date = date_helpers.add_months_to_date(payment_date, 1) if self.installments > 1 else payment_date
+            for no, (units, payment_date) in enumerate(schedule, start=1)
+        )
 
     def __update_status(self) -> None:
         'Update the status of the purchase based on current conditions.'
@@ -110,24 +102,27 @@ class Purchase(Expense):
 
         payment_to_update.amount = payment.amount
         payment_to_update.status = payment.status
+        self._payments_changed()
 
         self.__rebalance_open_payments(payment_to_update)
 
     def __rebalance_open_payments(self, anchor_payment: Payment | None = None) -> None:
-        def to_cents(value: float) -> int:
-            return int(round(value * 100))
+        def to_cents(amount: Amount) -> int:
+            if amount.precision == 2:
+                return amount.units
+            return int(round(amount.value * 100))
 
         def assign_amount(payment: Payment, cents: int) -> None:
             precision = getattr(payment.amount, 'precision', 2)
-            payment.amount = Amount(cents / 100, precision)
+            payment.amount = Amount.from_units(cents, 2) if precision == 2 else Amount(cents / 100, precision)
 
         open_payments = [p for p in self.payments if not p.is_final_status]
         if not open_payments:
             self.__update_status()
             return
 
-        total_cents = to_cents(self.amount.value)
-        final_cents = sum(to_cents(payment.amount.value) for payment in self.payments if payment.is_final_status)
+        total_cents = to_cents(self.amount)
+        final_cents = sum(to_cents(payment.amount) for payment in self.payments if payment.is_final_status)
         remaining_cents = total_cents - final_cents
         if remaining_cents < 0:
             raise ValueError('Final payments amount cannot exceed purchase total.')
@@ -136,7 +131,7 @@ class Purchase(Expense):
         payments_to_adjust = open_payments
 
         if active_anchor:
-            anchor_cents = to_cents(active_anchor.amount.value)
+            anchor_cents = to_cents(active_anchor.amount)
             remaining_cents -= anchor_cents
             if remaining_cents < 0:
                 raise ValueError('Updated payment amount exceeds available pending amount for purchase.')
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from uuid import UUID, uuid4
 from datetime import date
 
@@ -7,10 +8,13 @@ from .enums import ExpenseType, ExpenseStatus, PaymentStatus
 from .expense import Expense
 from .payment import Payment
 from .payment_factory import PaymentFactory
+from .subscription_occurrence import SubscriptionOccurrence
 
 
 class Subscription(Expense):
     VALID_STATUS = {ExpenseStatus.ACTIVE, ExpenseStatus.CANCELLED}
+    # Statuses that keep charging in the months after the last recorded payment
+    PROJECTED_STATUS = {ExpenseStatus.ACTIVE, ExpenseStatus.PENDING}
 
     def __init__(
         self,
@@ -27,7 +31,9 @@ class Subscription(Expense):
         # Calculate installments based on the number of payments provided
         # If no payments, it will be set to 1 (one payment will be created automatically)
         installments = len(payments) if payments else 1
-        
+        # (payments list, its length, latest payment) of the last last_payment lookup
+        self.__last_payment_cache: tuple[list[Payment], int, Payment | None] | None = None
+
         super().__init__(
             id,
             account_id,
@@ -50,8 +56,7 @@ class Subscription(Expense):
     @property
     def paid_amount(self) -> Amount:
         'Calculate the total amount paid for the subscription.'
-        total_paid = sum(payment.amount.value for payment in self.payments if payment.status == PaymentStatus.PAID)
-        return Amount(total_paid)
+        return Amount.sum(payment.amount for payment in self.payments if payment.status == PaymentStatus.PAID)
 
     @property
     def pending_installments(self) -> int:
@@ -65,19 +70,57 @@ class Subscription(Expense):
     @property
     def pending_amount(self) -> Amount:
         'Calculate the pending amount of the subscription.'
-        total_pending = sum(payment.amount.value for payment in self.payments if payment.status not in {PaymentStatus.PAID, PaymentStatus.CANCELED})
-        return Amount(total_pending)
+        return Amount.sum(
+            payment.amount for payment in self.payments if payment.status not in {PaymentStatus.PAID, PaymentStatus.CANCELED}
+        )
 
     @property
     def pending_financing_amount(self) -> Amount:
         'A suscription has not financing amounts.'
         return Amount(0)
 
+    @property
+    def last_payment(self) -> Payment | None:
+        'Latest payment by date, looked up once until the payments change.'
+        payments = self.payments
+        cache = self.__last_payment_cache
+        if cache is None or cache[0] is not payments or cache[1] != len(payments):
+            last_payment = max(payments, key=lambda p: p.payment_date, default=None)
+            cache = self.__last_payment_cache = (payments, len(payments), last_payment)
+        return cache[2]
+
+    def iter_simulated_occurrences(
+        self, from_month: int, from_year: int, to_month: int, to_year: int
+    ) -> Iterator[SubscriptionOccurrence]:
+        '''
+        Lazily yield the simulated charge of each month from from_month/from_year to
+        to_month/to_year (both included) that comes after the month of the last payment.
+
+        Every month is computed on its own from the last payment when the iterator reaches
+        it, so months that are never read cost nothing. Yields nothing for subscriptions
+        without payments or that no longer charge.
+        '''
+        last_payment = self.last_payment
+        if last_payment is None or self.status not in self.PROJECTED_STATUS:
+            return
+        last_date = last_payment.payment_date
+        last_index = last_date.year * 12 + last_date.month - 1
+        payment_day = self.first_payment_date.day
+        amount = self.amount
+        for index in range(max(from_year * 12 + from_month - 1, last_index + 1), to_year * 12 + to_month):
+            year, month = divmod(index, 12)
+            yield SubscriptionOccurrence(
+                payment_date=date_helpers.clamp_to_month(year, month + 1, payment_day),
+                no_installment=last_payment.no_installment + index - last_index,
+                amount=amount,
+            )
+
     def add_new_payment(self, payment: Payment) -> None:
         if payment.expense_id != self.id:
             raise ValueError('Payment expense ID does not match subscription ID')
         self.amount = payment.amount
         self.payments.append(payment)
+        self._payments_changed()
         self.__sort_payments_by_date()
         self.__update_amount()
         self.__update_installments()
@@ -86,6 +129,7 @@ class Subscription(Expense):
         for payment in self.payments:
             if payment.id == payment_id:
                 self.payments.remove(payment)
+                self._payments_changed()
                 self.__update_amount()
                 self.__update_installments()
                 return
@@ -95,11 +139,16 @@ class Subscription(Expense):
         for i, payment in enumerate(self.payments):
             if payment.id == payment_id:
                 self.payments[i] = payment_updated
+                self._payments_changed()
                 self.__sort_payments_by_date()
                 self.__update_amount()
                 return
         raise PaymentNotFoundInExpenseException(f'Payment with ID {payment_id} not found in subscription {self.title}.')
 
+    def _payments_changed(self) -> None:
+        super()._payments_changed()
+        self.__last_payment_cache = None
+
     def get_next_payment(self, factor: Amount = Amount(1.0), is_simulated: bool = False) -> Payment:
         if factor.value <= 0:
             raise ValueError('Factor must be greater than zero')
@@ -126,7 +175,7 @@ class Subscription(Expense):
         if not self.payments:
             return
         last_payment = self.payments[-1]
-        if last_payment.amount.value != self.amount.value:
+        if last_payment.amount != self.amount:
             self.amount = last_payment.amount
 
     def __update_installments(self) -> None:
@@ -0,0 +1,12 @@
+from datetime import date
+from typing import NamedTuple
+
+from ..shared import Amount
+
+
+class SubscriptionOccurrence(NamedTuple):
+    """Simulated (not recorded) charge of a subscription in a month after its last payment."""
+
+    payment_date: date
+    no_installment: int
+    amount: Amount
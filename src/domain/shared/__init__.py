@@ -1,6 +1,7 @@
 from .entity_base import EntityBase
 from .entity_factory_base import EntityFactoryBase
 from .helpers import dates as date_helpers
+from .helpers import installments as installment_helpers
 from .value_objects.amount import Amount
 from .value_objects.month import Month
 from .value_objects.year import Year
@@ -11,6 +12,7 @@ __all__ = [
     'EntityFactoryBase',
     # Helpers
     'date_helpers',
+    'installment_helpers',
     # Value Objects
     'Amount',
     'Month',
@@ -4,6 +4,9 @@ from abc import ABC, abstractmethod
 
 
 class EntityBase(ABC):
+    # Subclasses that don't declare __slots__ still get a __dict__
+    __slots__ = ('id',)
+
     def __init__(self, id: UUID):
         self.id = id
 
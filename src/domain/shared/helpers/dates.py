@@ -1,4 +1,6 @@
-from datetime import date, timedelta
+from calendar import monthrange
+from collections.abc import Iterator
+from datetime import date
 
 
 def calc_days_until(date_to: date) -> int:
@@ -13,22 +15,50 @@ def calc_days_until(date_to: date) -> int:
     return delta.days if delta.days >= 0 else 0
 
 
+def clamp_to_month(year: int, month: int, day: int) -> date:
+    '''
+    Build a date in the given month, moving days past its end to the last day.
+
+    :param year: The year of the date.
+    :param month: The month of the date.
+    :param day: The wanted day of the month.
+    :return: The date, e.g. (2023, 2, 31) -> 2023-02-28.
+    '''
+    return date(year, month, min(day, monthrange(year, month)[1]))
+
+
 def add_months_to_date(start_date: date, months: int) -> date:
     '''
     Add a specified number of months to a given date.
 
+    Days past the end of the target month are clamped to its last day (Jan 31 + 1 month is Feb 28/29).
+
     :param start_date: The initial date to which months will be added.
     :param months: The number of months to add.
     :return: The new date after adding the specified number of months.
     '''
     month = start_date.month - 1 + months
-    day = start_date.day
-    year = start_date.year + month // 12
-    try:
-        new_date = date(year, month % 12 + 1, day)
-    except ValueError as ex:
-        new_date = start_date + timedelta(days=30)
-    return new_date
+    return clamp_to_month(start_date.year + month // 12, month % 12 + 1, start_date.day)
+
+
+def iter_monthly_dates(start_date: date, count: int) -> Iterator[date]:
+    '''
+    Yield `count` dates one month apart, starting at start_date.
+
+    Every date is taken from start_date rather than from the previous one, so a day
+    clamped at a short month comes back in longer ones (Jan 31, Feb 28, Mar 31, ...).
+
+    :param start_date: The first date of the series.
+    :param count: The number of dates to yield.
+    :return: An iterator over the dates.
+    '''
+    year, month, day = start_date.year, start_date.month, start_date.day
+    for _ in range(count):
+        yield clamp_to_month(year, month, day)
+        if month == 12:
+            year, month = year + 1, 1
+        else:
+            month += 1
 
 
 def is_leap_year(year: int) -> bool:
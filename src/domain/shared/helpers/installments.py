@@ -0,0 +1,43 @@
+from datetime import date
+
+from .dates import iter_monthly_dates
+
+
+def split_units(total_units: int, parts: int) -> list[int]:
+    '''
+    Split an integer amount of units (e.g. cents) into `parts` installments.
+
+    Each installment is the remaining units divided by the remaining installments,
+    rounded half-even, so the installments always add up to total_units exactly and
+    no two of them differ by more than one unit (10000 / 3 -> [3333, 3334, 3333]).
+
+    :param total_units: The amount to split, in integer units.
+    :param parts: The number of installments (at least 1).
+    :return: The units of each installment, in order.
+    '''
+    if parts < 1:
+        raise ValueError(f'parts must be at least 1, got {parts}')
+    installments = []
+    remaining = total_units
+    for left in range(parts, 0, -1):
+        units, rest = divmod(remaining, left)
+        if 2 * rest > left or (2 * rest == left and units % 2):
+            units += 1
+        installments.append(units)
+        remaining -= units
+    return installments
+
+
+def installment_schedule(total_units: int, installments: int, first_date: date) -> list[tuple[int, date]]:
+    '''
+    Compute the (units, due date) of every installment of an amount in a single pass.
+
+    Due dates are one month apart from first_date, clamped to the end of short months
+    (see dates.iter_monthly_dates).
+
+    :param total_units: The amount to split, in integer units.
+    :param installments: The number of installments (at least 1).
+    :param first_date: The due date of the first installment.
+    :return: One (units, due date) pair per installment, in order.
+    '''
+    return list(zip(split_units(total_units, installments), iter_monthly_dates(first_date, installments)))
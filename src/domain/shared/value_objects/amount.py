@@ -1,12 +1,59 @@
+from collections.abc import Iterable
+from decimal import Decimal, ROUND_HALF_EVEN
+
 
 class Amount:
-    'Represents a decimal value with a fixed precision.'
+    '''
+    Represents a decimal value with a fixed precision.
+
+    Stored as an integer number of units of 10**-precision (cents for the default
+    precision of 2), so additions, subtractions and sums are exact integer operations.
+    '''
+
+    __slots__ = ('units', 'precision')
 
-    def __init__(self, value: float | int, precision: int = 2):
+    def __init__(self, value: float | int | Decimal, precision: int = 2):
         if precision < 0:
             raise ValueError('Precision must be a non-negative integer')
-        self.value = round(float(value), precision)
-        self.precision = precision
+        scale = 10 ** precision
+        if isinstance(value, int):
+            units = value * scale
+        elif isinstance(value, Decimal):
+            units = int((value * scale).to_integral_value(rounding=ROUND_HALF_EVEN))
+        else:
+            units = round(float(value) * scale)
+        self.units: int = units
+        self.precision: int = precision
+
+    @classmethod
+    def from_units(cls, units: int, precision: int = 2) -> 'Amount':
+        'Build an Amount from integer units (cents for precision 2), skipping __init__ conversions.'
+        amount = object.__new__(cls)
+        amount.units = units
+        amount.precision = precision
+        return amount
+
+    @classmethod
+    def sum(cls, amounts: Iterable['Amount'], precision: int = 2) -> 'Amount':
+        'Exact total of several amounts, at the highest precision among them (at least `precision`).'
+        total = 0
+        for amount in amounts:
+            if amount.precision == precision:
+                total += amount.units
+            elif amount.precision < precision:
+                total += amount.units * 10 ** (precision - amount.precision)
+            else:
+                total = total * 10 ** (amount.precision - precision) + amount.units
+                precision = amount.precision
+        return cls.from_units(total, precision)
+
+    @property
+    def value(self) -> float:
+        return self.units / 10 ** self.precision
+
+    def to_decimal(self) -> Decimal:
+        'Exact Decimal value (e.g. for Numeric columns).'
+        return Decimal(self.units).scaleb(-self.precision)
 
     def __str__(self) -> str:
         return f'{self.value:.{self.precision}f}'
@@ -14,19 +61,35 @@ class Amount:
     def __add__(self, other: 'Amount') -> 'Amount':
         if not isinstance(other, Amount):
             raise TypeError('Can only add Decimal to Decimal')
-        return Amount(self.value + other.value, max(self.precision, other.precision))
-    
+        if self.precision == other.precision:
+            return Amount.from_units(self.units + other.units, self.precision)
+        return Amount.sum((self, other), self.precision)
+
+    def __radd__(self, other: object) -> 'Amount':
+        # Lets the builtin sum() start from 0
+        if isinstance(other, int) and other == 0:
+            return self
+        return NotImplemented
+
     def __sub__(self, other: 'Amount') -> 'Amount':
         if not isinstance(other, Amount):
             raise TypeError('Can only subtract Decimal from Decimal')
-        return Amount(self.value - other.value, max(self.precision, other.precision))
+        if self.precision == other.precision:
+            return Amount.from_units(self.units - other.units, self.precision)
+        precision = max(self.precision, other.precision)
+        return Amount.from_units(
+            self.units * 10 ** (precision - self.precision) - other.units * 10 ** (precision - other.precision),
+            precision,
+        )
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, (Amount, float, int)):
             return NotImplemented
         if isinstance(value, Amount):
+            if self.precision == value.precision:
+                return self.units == value.units
             value = value.value
         return self.value == float(value)
-    
+
     def __repr__(self) -> str:
         return f'Amount(value={self.value}, precision={self.precision})'
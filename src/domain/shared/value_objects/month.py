@@ -1,4 +1,6 @@
 class Month(int):
+    __slots__ = ()
+
     def __new__(cls, value: int):
         if value is None or not (1 <= value <= 12):
             raise ValueError('Month must be between 1 and 12')
@@ -1,4 +1,6 @@
 class Year(int):
+    __slots__ = ()
+
     def __new__(cls, value: int):
         if value is None or value < 2000:
             raise ValueError('Year must be a positive integer greater than 2000')
@@ -1,13 +1,17 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .routes import router_api
 from src.entrypoints.middlewares.jwt_middleware import JWTMiddleware
-from src.entrypoints.exceptions import BaseHTTPException
+from src.entrypoints.exceptions import BaseHTTPException, NotModified
+from src.application.helpers.password_hasher import password_hasher
+from src.infrastructure.database import async_db_conn
 
 origins = [
     'https://smw.juanpanasiti.com.ar',
@@ -29,12 +33,22 @@ api_middlewares = [
     Middleware(JWTMiddleware),
 ]
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close the asyncpg pool and the password hashing threads on shutdown
+    await async_db_conn.dispose()
+    password_hasher.shutdown()
+
+
 app = FastAPI(
     title='Save My Wallet API',
     description='API for Save My Wallet application',
     version='3.0.0 beta',
     middleware=api_middlewares,
     routes=router_api.routes,
+    lifespan=lifespan,
 )
 
 
@@ -50,6 +64,12 @@ async def base_http_exception_handler(request: Request, exc: BaseHTTPException):
     )
 
 
+@app.exception_handler(NotModified)
+async def not_modified_handler(request: Request, exc: NotModified):
+    """Answer conditional GETs with an empty 304 (no JSON body allowed)"""
+    return Response(status_code=exc.status_code, headers=exc.headers)
+
+
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle standard HTTP exceptions with error code"""
@@ -20,7 +20,8 @@ from src.application.use_cases.account import (
     CreditCardGetPaginatedUseCase,
     CreditCardDeleteUseCase,
 )
-from src.application.ports import CreditCardRepository
+from src.application.helpers.result_cache import ResultCache, cached, invalidating
+from src.application.ports import AsyncCreditCardRepository
 from src.entrypoints.exceptions import client_exceptions as ce
 from src.entrypoints.exceptions import server_exceptions as se
 from src.common.exceptions import RepoNotFoundError
@@ -37,19 +38,22 @@ class AccountController:
     between the presentation layer and application use cases.
     """
 
-    def __init__(self, credit_card_repository: CreditCardRepository):
+    def __init__(self, credit_card_repository: AsyncCreditCardRepository, result_cache: ResultCache | None = None):
         """Initialize the controller with repository dependencies.
 
         Repository dependency is mandatory and must be provided via DI.
+        The card listing is served from result_cache, which writes invalidate per user.
         """
-        self._credit_card_repository: CreditCardRepository = credit_card_repository
+        self._credit_card_repository: AsyncCreditCardRepository = credit_card_repository
+        self._result_cache: ResultCache | None = result_cache
 
-    def create_credit_card(self, credit_card_data: CreateCreditCardDTO) -> CreditCardResponseDTO:
+    async def create_credit_card(self, credit_card_data: CreateCreditCardDTO, user_id: UUID | None = None) -> CreditCardResponseDTO:
         """
         Create a new credit card.
 
         Args:
             credit_card_data: CreateCreditCardDTO containing credit card information
+            user_id: Owner whose cached read results are dropped
 
         Returns:
             CreditCardResponseDTO with created credit card information
@@ -59,8 +63,8 @@ class AccountController:
         """
         try:
             logger.info(f'Creating credit card with alias: {credit_card_data.alias}')
-            use_case = CreditCardCreateUseCase(self._credit_card_repository)
-            result = use_case.execute(credit_card_data)
+            use_case = invalidating(CreditCardCreateUseCase(self._credit_card_repository), self._result_cache, user_id)
+            result = await use_case.execute(credit_card_data)
             logger.info(f'Credit card created successfully with ID: {result.id}')
             return result
         except ValueError as ex:
@@ -70,7 +74,7 @@ class AccountController:
             logger.error(f'Unexpected error creating credit card: {ex}')
             raise se.InternalServerError()
 
-    def get_credit_card(self, credit_card_id: UUID) -> CreditCardResponseDTO:
+    async def get_credit_card(self, credit_card_id: UUID) -> CreditCardResponseDTO:
         """
         Retrieve a credit card by its ID.
 
@@ -86,7 +90,7 @@ class AccountController:
         try:
             logger.info(f'Retrieving credit card with ID: {credit_card_id}')
             use_case = CreditCardGetOneUseCase(self._credit_card_repository)
-            result = use_case.execute(credit_card_id)
+            result = await use_case.execute(credit_card_id)
             logger.info(f'Credit card retrieved successfully: {credit_card_id}')
             return result
         
@@ -97,13 +101,14 @@ class AccountController:
             logger.error(f'Unexpected error retrieving credit card {credit_card_id}: {ex}')
             raise se.InternalServerError()
 
-    def update_credit_card(self, credit_card_id: UUID, credit_card_data: UpdateCreditCardDTO) -> CreditCardResponseDTO:
+    async def update_credit_card(self, credit_card_id: UUID, credit_card_data: UpdateCreditCardDTO, user_id: UUID | None = None) -> CreditCardResponseDTO:
         """
         Update an existing credit card.
 
         Args:
             credit_card_id: UUID of the credit card to update
             credit_card_data: UpdateCreditCardDTO containing updated information
+            user_id: Owner whose cached read results are dropped
 
         Returns:
             CreditCardResponseDTO with updated credit card information
@@ -113,8 +118,8 @@ class AccountController:
         """
         try:
             logger.info(f'Updating credit card with ID: {credit_card_id}')
-            use_case = CreditCardUpdateUseCase(self._credit_card_repository)
-            result = use_case.execute(credit_card_id, credit_card_data)
+            use_case = invalidating(CreditCardUpdateUseCase(self._credit_card_repository), self._result_cache, user_id)
+            result = await use_case.execute(credit_card_id, credit_card_data)
             logger.info(f'Credit card updated successfully: {credit_card_id}')
             return result
         except ValueError as ex:
@@ -124,20 +129,21 @@ class AccountController:
             logger.error(f'Unexpected error updating credit card {credit_card_id}: {ex}')
             raise se.InternalServerError()
 
-    def delete_credit_card(self, credit_card_id: UUID) -> None:
+    async def delete_credit_card(self, credit_card_id: UUID, user_id: UUID | None = None) -> None:
         """
         Delete a credit card.
 
         Args:
             credit_card_id: UUID of the credit card to delete
+            user_id: Owner whose cached read results are dropped
 
         Raises:
             ValueError: If credit card is not found
         """
         try:
             logger.info(f'Deleting credit card with ID: {credit_card_id}')
-            use_case = CreditCardDeleteUseCase(self._credit_card_repository)
-            use_case.execute(credit_card_id)
+            use_case = invalidating(CreditCardDeleteUseCase(self._credit_card_repository), self._result_cache, user_id)
+            await use_case.execute(credit_card_id)
             logger.info(f'Credit card deleted successfully: {credit_card_id}')
         except ValueError as ex:
             logger.warning(f'Failed to delete credit card {credit_card_id}: {ex}')
@@ -146,7 +152,7 @@ class AccountController:
             logger.error(f'Unexpected error deleting credit card {credit_card_id}: {ex}')
             raise se.InternalServerError()
 
-    def get_paginated_credit_cards(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[CreditCardResponseDTO]:
+    async def get_paginated_credit_cards(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[CreditCardResponseDTO]:
         """
         Retrieve a paginated list of credit cards.
 
@@ -163,8 +169,8 @@ class AccountController:
         """
         try:
             logger.info(f'Retrieving paginated credit cards with limit={limit}, offset={offset}')
-            use_case = CreditCardGetPaginatedUseCase(self._credit_card_repository)
-            result = use_case.execute(filter, limit, offset)
+            use_case = cached(CreditCardGetPaginatedUseCase(self._credit_card_repository), self._result_cache, filter.get('owner_id'))
+            result = await use_case.execute(filter, limit, offset)
             logger.info(f'Retrieved {len(result.items)} credit cards')
             return result
         except ValueError as ex:
@@ -173,3 +179,32 @@ class AccountController:
         except Exception as ex:
             logger.error(f'Unexpected error retrieving paginated credit cards: {ex}')
             raise se.InternalServerError()
+
+    async def get_credit_cards_by_cursor(self, filter: dict, limit: int, cursor: str | None, include_total: bool = False) -> PaginatedResponse[CreditCardResponseDTO]:
+        """
+        Retrieve a page of credit cards with keyset (cursor) pagination.
+
+        Args:
+            filter: Dictionary with filter criteria
+            limit: Maximum number of results to return
+            cursor: next_cursor of the previous page, None for the first page
+            include_total: Whether to also count the matching credit cards
+
+        Returns:
+            PaginatedResponse containing credit cards and the cursor of the next page
+
+        Raises:
+            ValueError: If the cursor or filter parameters are invalid
+        """
+        try:
+            logger.info(f'Retrieving credit cards by cursor with limit={limit}')
+            use_case = CreditCardGetPaginatedUseCase(self._credit_card_repository)
+            result = await use_case.execute_by_cursor(filter, limit, cursor, include_total)
+            logger.info(f'Retrieved {len(result.items)} credit cards')
+            return result
+        except ValueError as ex:
+            logger.warning(f'Invalid pagination parameters: {ex}')
+            raise ce.BadRequest(str(ex), 'PAGINATION_BAD_REQUEST')
+        except Exception as ex:
+            logger.error(f'Unexpected error retrieving credit cards by cursor: {ex}')
+            raise se.InternalServerError()
@@ -13,7 +13,8 @@ from src.application.use_cases.auth import (
     UserRenewTokenUseCase,
     RefreshAccessTokenUseCase,
 )
-from src.application.ports import UserRepository, RefreshTokenRepository
+from src.application.ports import AsyncUserRepository, AsyncRefreshTokenRepository
+from src.common.exceptions import PasswordHasherBusyError
 from src.entrypoints.exceptions import client_exceptions as ce
 from src.entrypoints.exceptions import server_exceptions as se
 
@@ -29,15 +30,15 @@ class AuthController:
     between the presentation layer and application use cases.
     """
 
-    def __init__(self, user_repository: UserRepository, refresh_token_repository: RefreshTokenRepository):
+    def __init__(self, user_repository: AsyncUserRepository, refresh_token_repository: AsyncRefreshTokenRepository):
         """Initialize the controller with repository dependencies.
 
         Repository dependency is mandatory and must be provided via DI.
         """
-        self._user_repository: UserRepository = user_repository
-        self._refresh_token_repository: RefreshTokenRepository = refresh_token_repository
+        self._user_repository: AsyncUserRepository = user_repository
+        self._refresh_token_repository: AsyncRefreshTokenRepository = refresh_token_repository
 
-    def login(self, credentials: LoginUserDTO) -> LoggedInUserDTO:
+    async def login(self, credentials: LoginUserDTO) -> LoggedInUserDTO:
         """
         Authenticate a user with username and password.
 
@@ -53,9 +54,12 @@ class AuthController:
         try:
             logger.info(f'Login attempt for user: {credentials.username}')
             use_case = UserLoginUseCase(self._user_repository, self._refresh_token_repository)
-            result = use_case.execute(credentials)
+            result = await use_case.execute(credentials)
             logger.info(f'User {credentials.username} logged in successfully')
             return result
+        except PasswordHasherBusyError as ex:
+            logger.warning(f'Login rejected for user {credentials.username}: {ex}')
+            raise se.ServiceUnavailable(ex.message, ex.code)
         except ValueError as ex:
             logger.warning(f'Failed login attempt for user {credentials.username}: {ex}')
             raise ce.Unauthorized(str(ex), 'LOGIN_INVALID_CREDENTIALS')
@@ -63,7 +67,7 @@ class AuthController:
             logger.error(f'Unexpected error during login for user {credentials.username}: {ex}')
             raise se.InternalServerError()
 
-    def register(self, user_data: RegisterUserDTO) -> LoggedInUserDTO:
+    async def register(self, user_data: RegisterUserDTO) -> LoggedInUserDTO:
         """
         Register a new user in the system.
 
@@ -79,9 +83,12 @@ class AuthController:
         try:
             logger.info(f'Registration attempt for user: {user_data.username}')
             use_case = UserRegisterUseCase(self._user_repository)
-            result = use_case.execute(user_data)
+            result = await use_case.execute(user_data)
             logger.info(f'User {user_data.username} registered successfully')
             return result
+        except PasswordHasherBusyError as ex:
+            logger.warning(f'Registration rejected for user {user_data.username}: {ex}')
+            raise se.ServiceUnavailable(ex.message, ex.code)
         except ValueError as ex:
             logger.warning(f'Failed registration for user {user_data.username}: {ex}')
             raise ce.BadRequest(str(ex), 'REGISTER_BAD_REQUEST')
@@ -89,7 +96,7 @@ class AuthController:
             logger.error(f'Unexpected error during registration for user {user_data.username}: {ex}')
             raise se.InternalServerError()
 
-    def renew_token(self, current_user: LoggedInUserDTO) -> LoggedInUserDTO:
+    async def renew_token(self, current_user: LoggedInUserDTO) -> LoggedInUserDTO:
         """
         Renew the access token for an authenticated user.
 
@@ -105,7 +112,7 @@ class AuthController:
         try:
             logger.info(f'Token renewal for user ID: {current_user.id}')
             use_case = UserRenewTokenUseCase(self._user_repository)
-            result = use_case.execute(current_user)
+            result = await use_case.execute(current_user)
             logger.info(f'Token renewed successfully for user ID: {current_user.id}')
             return result
         except ValueError as ex:
@@ -116,7 +123,7 @@ class AuthController:
             logger.error(f'Unexpected error during token renewal for user ID {current_user.id}: {ex}')
             raise se.InternalServerError()
 
-    def refresh_access_token(self, refresh_token: str) -> dict:
+    async def refresh_access_token(self, refresh_token: str) -> dict:
         """
         Refresh the access token using a refresh token.
 
@@ -139,7 +146,7 @@ class AuthController:
                 self._user_repository,
                 self._refresh_token_repository
             )
-            result = use_case.execute(request)
+            result = await use_case.execute(request)
             logger.info('Access token refreshed successfully')
             return {
                 'access_token': result.access_token,
@@ -6,6 +6,7 @@ categories, purchases, and subscriptions, delegating business logic to
 the application layer use cases.
 """
 import logging
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from src.application.dtos import (
@@ -21,6 +22,9 @@ from src.application.dtos import (
     CreatePaymentDTO,
     UpdatePaymentDTO,
     PaymentResponseDTO,
+    ExportFormat,
+    BulkCreateExpensesDTO,
+    BulkCreateExpensesResultDTO,
 )
 from src.application.use_cases.expense import (
     ExpenseCategoryCreateUseCase,
@@ -28,6 +32,7 @@ from src.application.use_cases.expense import (
     ExpenseCategoryUpdateUseCase,
     ExpenseCategoryDeleteUseCase,
     ExpenseGetPaginatedUseCase,
+    ExpenseBulkCreateUseCase,
     PurchaseCreateUseCase,
     PurchaseUpdateUseCase,
     PurchaseDeleteUseCase,
@@ -39,8 +44,10 @@ from src.application.use_cases.expense import (
     PaymentCreateUseCase,
     PaymentUpdateUseCase,
     PaymentDeleteUseCase,
+    PaymentExportUseCase,
 )
-from src.application.ports import ExpenseCategoryRepository, ExpenseRepository, PaymentRepository
+from src.application.helpers.result_cache import ResultCache, invalidating
+from src.application.ports import AsyncExpenseCategoryRepository, AsyncExpenseRepository, AsyncPaymentRepository
 from src.entrypoints.exceptions import client_exceptions as ce
 from src.entrypoints.exceptions import server_exceptions as se
 
@@ -58,26 +65,30 @@ class ExpenseController:
 
     def __init__(
         self,
-        expense_category_repository: ExpenseCategoryRepository,
-        expense_repository: ExpenseRepository,
-        payment_repository: PaymentRepository,
+        expense_category_repository: AsyncExpenseCategoryRepository,
+        expense_repository: AsyncExpenseRepository,
+        payment_repository: AsyncPaymentRepository,
+        result_cache: ResultCache | None = None,
     ):
         """Initialize the controller with repository dependencies.
 
         Repository dependencies are mandatory and must be provided via DI.
+        Writes drop the cached read results of the given user from result_cache.
         """
-        self._expense_category_repository: ExpenseCategoryRepository = expense_category_repository
-        self._expense_repository: ExpenseRepository = expense_repository
-        self._payment_repository: PaymentRepository = payment_repository
+        self._expense_category_repository: AsyncExpenseCategoryRepository = expense_category_repository
+        self._expense_repository: AsyncExpenseRepository = expense_repository
+        self._payment_repository: AsyncPaymentRepository = payment_repository
+        self._result_cache: ResultCache | None = result_cache
 
     # Expense Category methods
 
-    def create_expense_category(self, category_data: CreateExpenseCategoryDTO) -> ExpenseCategoryResponseDTO:
+    async def create_expense_category(self, category_data: CreateExpenseCategoryDTO, user_id: UUID | None = None) -> ExpenseCategoryResponseDTO:
         """
         Create a new expense category.
 
         Args:
             category_data: CreateExpenseCategoryDTO containing category information
+            user_id: Owner whose cached read results are dropped
 
         Returns:
             ExpenseCategoryResponseDTO with created category information
@@ -87,8 +98,8 @@ class ExpenseController:
         """
         try:
             logger.info(f'Creating expense category: {category_data.name}')
-            use_case = ExpenseCategoryCreateUseCase(self._expense_category_repository)
-            result = use_case.execute(category_data)
+            use_case = invalidating(ExpenseCategoryCreateUseCase(self._expense_category_repository), self._result_cache, user_id)
+            result = await use_case.execute(category_data)
             logger.info(f'Expense category created successfully with ID: {result.id}')
             return result
         except ValueError as ex:
@@ -98,13 +109,14 @@ class ExpenseController:
             logger.error(f'Unexpected error creating expense category: {ex}')
             raise se.InternalServerError()
 
-    def update_expense_category(self, category_id: UUID, category_data: UpdateExpenseCategoryDTO) -> ExpenseCategoryResponseDTO:
+    async def update_expense_category(self, category_id: UUID, category_data: UpdateExpenseCategoryDTO, user_id: UUID | None = None) -> ExpenseCategoryResponseDTO:
         """
         Update an existing expense category.
 
         Args:
             category_id: UUID of the category to update
             category_data: UpdateExpenseCategoryDTO containing updated information
+            user_id: Owner whose cached read results are dropped
 
         Returns:
             ExpenseCategoryResponseDTO with updated category information
@@ -114,8 +126,8 @@ class ExpenseController:
         """
         try:
             logger.info(f'Updating expense category with ID: {category_id}')
-            use_case = ExpenseCategoryUpdateUseCase(self._expense_category_repository)
-            result = use_case.execute(category_id, category_data)
+            use_case = invalidating(ExpenseCategoryUpdateUseCase(self._expense_category_repository), self._result_cache, user_id)
+            result = await use_case.execute(category_id, category_data)
             logger.info(f'Expense category updated successfully: {category_id}')
             return result
         except ValueError as ex:
@@ -125,20 +137,21 @@ class ExpenseController:
             logger.error(f'Unexpected error updating expense category {category_id}: {ex}')
             raise se.InternalServerError()
 
-    def delete_expense_category(self, category_id: UUID) -> None:
+    async def delete_expense_category(self, category_id: UUID, user_id: UUID | None = None) -> None:
         """
         Delete an expense category.
 
         Args:
             category_id: UUID of the category to delete
+            user_id: Owner whose cached read results are dropped
 
         Raises:
             ValueError: If category is not found
         """
         try:
             logger.info(f'Deleting expense category with ID: {category_id}')
-            use_case = ExpenseCategoryDeleteUseCase(self._expense_category_repository)
-            use_case.execute(category_id)
+            use_case = invalidating(ExpenseCategoryDeleteUseCase(self._expense_category_repository), self._result_cache, user_id)
+            await use_case.execute(category_id)
             logger.info(f'Expense category deleted successfully: {category_id}')
         except ValueError as ex:
             logger.warning(f'Failed to delete expense category {category_id}: {ex}')
@@ -147,7 +160,7 @@ class ExpenseController:
             logger.error(f'Unexpected error deleting expense category {category_id}: {ex}')
             raise se.InternalServerError()
 
-    def get_paginated_expense_categories(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[ExpenseCategoryResponseDTO]:
+    async def get_paginated_expense_categories(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[ExpenseCategoryResponseDTO]:
         """
         Retrieve a paginated list of expense categories.
 
@@ -165,7 +178,7 @@ class ExpenseController:
         try:
             logger.info(f'Retrieving paginated expense categories with limit={limit}, offset={offset}')
             use_case = ExpenseCategoryGetPaginatedUseCase(self._expense_category_repository)
-            result = use_case.execute(filter, limit, offset)
+            result = await use_case.execute(filter, limit, offset)
             logger.info(f'Retrieved {len(result.items)} expense categories')
             return result
         except ValueError as ex:
@@ -175,14 +188,44 @@ class ExpenseController:
             logger.error(f'Unexpected error retrieving paginated expense categories: {ex}')
             raise se.InternalServerError()
 
+    async def get_expense_categories_by_cursor(self, filter: dict, limit: int, cursor: str | None, include_total: bool = False) -> PaginatedResponse[ExpenseCategoryResponseDTO]:
+        """
+        Retrieve a page of expense categories with keyset (cursor) pagination.
+
+        Args:
+            filter: Dictionary with filter criteria
+            limit: Maximum number of results to return
+            cursor: next_cursor of the previous page, None for the first page
+            include_total: Whether to also count the matching expense categories
+
+        Returns:
+            PaginatedResponse containing expense categories and the cursor of the next page
+
+        Raises:
+            ValueError: If the cursor or filter parameters are invalid
+        """
+        try:
+            logger.info(f'Retrieving expense categories by cursor with limit={limit}')
+            use_case = ExpenseCategoryGetPaginatedUseCase(self._expense_category_repository)
+            result = await use_case.execute_by_cursor(filter, limit, cursor, include_total)
+            logger.info(f'Retrieved {len(result.items)} expense categories')
+            return result
+        except ValueError as ex:
+            logger.warning(f'Invalid pagination parameters: {ex}')
+            raise ce.BadRequest(str(ex), 'PAGINATION_BAD_REQUEST')
+        except Exception as ex:
+            logger.error(f'Unexpected error retrieving expense categories by cursor: {ex}')
+            raise se.InternalServerError()
+
     # Purchase methods
 
-    def create_purchase(self, purchase_data: CreatePurchaseDTO) -> ExpenseResponseDTO:
+    async def create_purchase(self, purchase_data: CreatePurchaseDTO, user_id: UUID | None = None) -> ExpenseResponseDTO:
         """
         Create a new purchase.
 
         Args:
             purchase_data: CreatePurchaseDTO containing purchase information
+            user_id: Owner whose cached read results are dropped
 
         Returns:
             ExpenseResponseDTO with created purchase information
@@ -192,8 +235,8 @@ class ExpenseController:
         """
         try:
             logger.info(f'Creating purchase: {purchase_data.title}')
-            use_case = PurchaseCreateUseCase(self._expense_repository)
-            result = use_case.execute(purchase_data)
+            use_case = invalidating(PurchaseCreateUseCase(self._expense_repository), self._result_cache, user_id)
+            result = await use_case.execute(purchase_data)
             logger.info(f'Purchase created successfully with ID: {result.id}')
             return result
         except ValueError as ex:
@@ -203,7 +246,7 @@ class ExpenseController:
             logger.error(f'Unexpected error creating purchase: {ex}')
             raise se.InternalServerError()
 
-    def get_purchase(self, purchase_id: UUID) -> ExpenseResponseDTO:
+    async def get_purchase(self, purchase_id: UUID) -> ExpenseResponseDTO:
         """
         Retrieve a purchase by its ID.
 
@@ -219,7 +262,7 @@ class ExpenseController:
         try:
             logger.info(f'Retrieving purchase with ID: {purchase_id}')
             use_case = PurchaseGetOneUseCase(self._expense_repository)
-            result = use_case.execute(purchase_id)
+            result = await use_case.execute(purchase_id)
             logger.info(f'Purchase retrieved successfully: {purchase_id}')
             return result
         except ValueError as ex:
@@ -229,13 +272,14 @@ class ExpenseController:
             logger.error(f'Unexpected error retrieving purchase {purchase_id}: {ex}')
             raise se.InternalServerError()
 
-    def update_purchase(self, purchase_id: UUID, purchase_data: UpdatePurchaseDTO) -> ExpenseResponseDTO:
+    async def update_purchase(self, purchase_id: UUID, purchase_data: UpdatePurchaseDTO, user_id: UUID | None = None) -> ExpenseResponseDTO:
         """
         Update an existing purchase.
 
         Args:
             purchase_id: UUID of the purchase to update
             purchase_data: UpdatePurchaseDTO containing updated information
+            user_id: Owner whose cached read results are dropped
 
         Returns:
             ExpenseResponseDTO with updated purchase information
@@ -245,8 +289,8 @@ class ExpenseController:
         """
         try:
             logger.info(f'Updating purchase with ID: {purchase_id}')
-            use_case = PurchaseUpdateUseCase(self._expense_repository)
-            result = use_case.execute(purchase_id, purchase_data)
+            use_case = invalidating(PurchaseUpdateUseCase(self._expense_repository), self._result_cache, user_id)
+            result = await use_case.execute(purchase_id, purchase_data)
             logger.info(f'Purchase updated successfully: {purchase_id}')
             return result
         except ValueError as ex:
@@ -256,20 +300,21 @@ class ExpenseController:
             logger.error(f'Unexpected error updating purchase {purchase_id}: {ex}')
             raise se.InternalServerError()
 
-    def delete_purchase(self, purchase_id: UUID) -> None:
+    async def delete_purchase(self, purchase_id: UUID, user_id: UUID | None = None) -> None:
         """
         Delete a purchase.
 
         Args:
             purchase_id: UUID of the purchase to delete
+            user_id: Owner whose cached read results are dropped
 
         Raises:
             ValueError: If purchase is not found
         """
         try:
             logger.info(f'Deleting purchase with ID: {purchase_id}')
-            use_case = PurchaseDeleteUseCase(self._expense_repository)
-            use_case.execute(purchase_id)
+            use_case = invalidating(PurchaseDeleteUseCase(self._expense_repository), self._result_cache, user_id)
+            await use_case.execute(purchase_id)
             logger.info(f'Purchase deleted successfully: {purchase_id}')
         except ValueError as ex:
             logger.warning(f'Failed to delete purchase {purchase_id}: {ex}')
@@ -280,12 +325,13 @@ class ExpenseController:
 
     # Subscription methods
 
-    def create_subscription(self, subscription_data: CreateSubscriptionDTO) -> ExpenseResponseDTO:
+    async def create_subscription(self, subscription_data: CreateSubscriptionDTO, user_id: UUID | None = None) -> ExpenseResponseDTO:
         """
         Create a new subscription.
 
         Args:
             subscription_data: CreateSubscriptionDTO containing subscription information
+            user_id: Owner whose cached read results are dropped
 
         Returns:
             ExpenseResponseDTO with created subscription information
@@ -295,8 +341,8 @@ class ExpenseController:
         """
         try:
             logger.info(f'Creating subscription: {subscription_data.title}')
-            use_case = SubscriptionCreateUseCase(self._expense_repository)
-            result = use_case.execute(subscription_data)
+            use_case = invalidating(SubscriptionCreateUseCase(self._expense_repository), self._result_cache, user_id)
+            result = await use_case.execute(subscription_data)
             logger.info(f'Subscription created successfully with ID: {result.id}')
             return result
         except ValueError as ex:
@@ -306,7 +352,7 @@ class ExpenseController:
             logger.error(f'Unexpected error creating subscription: {ex}')
             raise se.InternalServerError()
 
-    def get_subscription(self, subscription_id: UUID) -> ExpenseResponseDTO:
+    async def get_subscription(self, subscription_id: UUID) -> ExpenseResponseDTO:
         """
         Retrieve a subscription by its ID.
 
@@ -322,7 +368,7 @@ class ExpenseController:
         try:
             logger.info(f'Retrieving subscription with ID: {subscription_id}')
             use_case = SubscriptionGetOneUseCase(self._expense_repository)
-            result = use_case.execute(subscription_id)
+            result = await use_case.execute(subscription_id)
             logger.info(f'Subscription retrieved successfully: {subscription_id}')
             return result
         except ValueError as ex:
@@ -332,13 +378,14 @@ class ExpenseController:
             logger.error(f'Unexpected error retrieving subscription {subscription_id}: {ex}')
             raise se.InternalServerError()
 
-    def update_subscription(self, subscription_id: UUID, subscription_data: UpdateSubscriptionDTO) -> ExpenseResponseDTO:
+    async def update_subscription(self, subscription_id: UUID, subscription_data: UpdateSubscriptionDTO, user_id: UUID | None = None) -> ExpenseResponseDTO:
         """
         Update an existing subscription.
 
         Args:
             subscription_id: UUID of the subscription to update
             subscription_data: UpdateSubscriptionDTO containing updated information
+            user_id: Owner whose cached read results are dropped
 
         Returns:
             ExpenseResponseDTO with updated subscription information
@@ -348,8 +395,8 @@ class ExpenseController:
         """
         try:
             logger.info(f'Updating subscription with ID: {subscription_id}')
-            use_case = SubscriptionUpdateUseCase(self._expense_repository)
-            result = use_case.execute(subscription_id, subscription_data)
+            use_case = invalidating(SubscriptionUpdateUseCase(self._expense_repository), self._result_cache, user_id)
+            result = await use_case.execute(subscription_id, subscription_data)
             logger.info(f'Subscription updated successfully: {subscription_id}')
             return result
         except ValueError as ex:
@@ -359,20 +406,21 @@ class ExpenseController:
             logger.error(f'Unexpected error updating subscription {subscription_id}: {ex}')
             raise se.InternalServerError()
 
-    def delete_subscription(self, subscription_id: UUID) -> None:
+    async def delete_subscription(self, subscription_id: UUID, user_id: UUID | None = None) -> None:
         """
         Delete a subscription.
 
         Args:
             subscription_id: UUID of the subscription to delete
+            user_id: Owner whose cached read results are dropped
 
         Raises:
             ValueError: If subscription is not found
         """
         try:
             logger.info(f'Deleting subscription with ID: {subscription_id}')
-            use_case = SubscriptionDeleteUseCase(self._expense_repository)
-            use_case.execute(subscription_id)
+            use_case = invalidating(SubscriptionDeleteUseCase(self._expense_repository), self._result_cache, user_id)
+            await use_case.execute(subscription_id)
             logger.info(f'Subscription deleted successfully: {subscription_id}')
         except ValueError as ex:
             logger.warning(f'Failed to delete subscription {subscription_id}: {ex}')
@@ -383,7 +431,7 @@ class ExpenseController:
 
     # General expense methods
 
-    def get_paginated_expenses(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[ExpenseResponseDTO]:
+    async def get_paginated_expenses(self, filter: dict, limit: int, offset: int) -> PaginatedResponse[ExpenseResponseDTO]:
         """
         Retrieve a paginated list of expenses (purchases and subscriptions).
 
@@ -401,7 +449,7 @@ class ExpenseController:
         try:
             logger.info(f'Retrieving paginated expenses with limit={limit}, offset={offset}')
             use_case = ExpenseGetPaginatedUseCase(self._expense_repository)
-            result = use_case.execute(filter, limit, offset)
+            result = await use_case.execute(filter, limit, offset)
             logger.info(f'Retrieved {len(result.items)} expenses')
             return result
         except ValueError as ex:
@@ -411,14 +459,100 @@ class ExpenseController:
             logger.error(f'Unexpected error retrieving paginated expenses: {ex}')
             raise se.InternalServerError()
 
+    async def get_expenses_by_cursor(self, filter: dict, limit: int, cursor: str | None, include_total: bool = False) -> PaginatedResponse[ExpenseResponseDTO]:
+        """
+        Retrieve a page of expenses with keyset (cursor) pagination.
+
+        Args:
+            filter: Dictionary with filter criteria
+            limit: Maximum number of results to return
+            cursor: next_cursor of the previous page, None for the first page
+            include_total: Whether to also count the matching expenses
+
+        Returns:
+            PaginatedResponse containing expenses and the cursor of the next page
+
+        Raises:
+            ValueError: If the cursor or filter parameters are invalid
+        """
+        try:
+            logger.info(f'Retrieving expenses by cursor with limit={limit}')
+            use_case = ExpenseGetPaginatedUseCase(self._expense_repository)
+            result = await use_case.execute_by_cursor(filter, limit, cursor, include_total)
+            logger.info(f'Retrieved {len(result.items)} expenses')
+            return result
+        except ValueError as ex:
+            logger.warning(f'Invalid pagination parameters: {ex}')
+            raise ce.BadRequest(str(ex), 'PAGINATION_BAD_REQUEST')
+        except Exception as ex:
+            logger.error(f'Unexpected error retrieving expenses by cursor: {ex}')
+            raise se.InternalServerError()
+
+    async def bulk_create_expenses(self, data: BulkCreateExpensesDTO, user_id: UUID) -> BulkCreateExpensesResultDTO:
+        """
+        Create a batch of purchases and subscriptions in one transaction.
+
+        Args:
+            data: BulkCreateExpensesDTO with the purchases and subscriptions to create
+            user_id: Owner of the referenced accounts and categories, whose cached read results are dropped
+
+        Returns:
+            BulkCreateExpensesResultDTO with the created IDs and the rejected rows
+
+        Raises:
+            ValueError: If the batch is invalid
+        """
+        try:
+            logger.info(f'Creating {len(data.purchases)} purchases and {len(data.subscriptions)} subscriptions')
+            use_case = invalidating(
+                ExpenseBulkCreateUseCase(self._expense_repository, self._expense_category_repository),
+                self._result_cache,
+                user_id,
+            )
+            result = await use_case.execute(data, user_id)
+            logger.info(f'Created {result.created_count} expenses, {len(result.errors)} rows rejected')
+            return result
+        except ValueError as ex:
+            logger.warning(f'Failed to create expenses: {ex}')
+            raise ce.BadRequest(str(ex), 'BULK_CREATE_EXPENSES_BAD_REQUEST')
+        except Exception as ex:
+            logger.error(f'Unexpected error creating expenses: {ex}')
+            raise se.InternalServerError()
+
+    def export_payments(self, owner_id: UUID, format: ExportFormat) -> AsyncIterator[str]:
+        """
+        Export the user's full payment history, streamed as NDJSON or CSV chunks.
+
+        Args:
+            owner_id: ID of the user whose payments are exported
+            format: Output format
+
+        Returns:
+            Async iterator of text chunks, read from the database while it is consumed
+
+        Raises:
+            ValueError: If the format is invalid
+        """
+        try:
+            logger.info(f'Exporting payments of user {owner_id} as {format}')
+            use_case = PaymentExportUseCase(self._expense_repository)
+            return use_case.execute(owner_id, format)
+        except ValueError as ex:
+            logger.warning(f'Invalid export parameters: {ex}')
+            raise ce.BadRequest(str(ex), 'EXPORT_BAD_REQUEST')
+        except Exception as ex:
+            logger.error(f'Unexpected error exporting payments: {ex}')
+            raise se.InternalServerError()
+
     # Payment methods
 
-    def create_payment(self, payment_data: CreatePaymentDTO) -> PaymentResponseDTO:
+    async def create_payment(self, payment_data: CreatePaymentDTO, user_id: UUID | None = None) -> PaymentResponseDTO:
         """
         Create a new payment for a subscription.
 
         Args:
             payment_data: CreatePaymentDTO containing payment information
+            user_id: Owner whose cached read results are dropped
 
         Returns:
             PaymentResponseDTO with created payment information
@@ -428,8 +562,8 @@ class ExpenseController:
         """
         try:
             logger.info(f'Creating payment for expense: {payment_data.expense_id}')
-            use_case = PaymentCreateUseCase(self._payment_repository, self._expense_repository)
-            result = use_case.execute(payment_data)
+            use_case = invalidating(PaymentCreateUseCase(self._payment_repository, self._expense_repository), self._result_cache, user_id)
+            result = await use_case.execute(payment_data)
             logger.info(f'Payment created successfully with ID: {result.id}')
             return result
         except ValueError as ex:
@@ -439,13 +573,14 @@ class ExpenseController:
             logger.error(f'Unexpected error creating payment: {ex}')
             raise se.InternalServerError()
 
-    def update_payment(self, payment_id: UUID, payment_data: UpdatePaymentDTO) -> PaymentResponseDTO:
+    async def update_payment(self, payment_id: UUID, payment_data: UpdatePaymentDTO, user_id: UUID | None = None) -> PaymentResponseDTO:
         """
         Update an existing payment.
 
         Args:
             payment_id: UUID of the payment to update
             payment_data: UpdatePaymentDTO containing updated information
+            user_id: Owner whose cached read results are dropped
 
         Returns:
             PaymentResponseDTO with updated payment information
@@ -455,8 +590,8 @@ class ExpenseController:
         """
         try:
             logger.info(f'Updating payment with ID: {payment_id}')
-            use_case = PaymentUpdateUseCase(self._payment_repository, self._expense_repository)
-            result = use_case.execute(payment_id, payment_data)
+            use_case = invalidating(PaymentUpdateUseCase(self._payment_repository, self._expense_repository), self._result_cache, user_id)
+            result = await use_case.execute(payment_id, payment_data)
             logger.info(f'Payment updated successfully: {payment_id}')
             return result
         except ValueError as ex:
@@ -466,20 +601,21 @@ class ExpenseController:
             logger.error(f'Unexpected error updating payment {payment_id}: {ex}')
             raise se.InternalServerError()
 
-    def delete_payment(self, payment_id: UUID) -> None:
+    async def delete_payment(self, payment_id: UUID, user_id: UUID | None = None) -> None:
         """
         Delete a payment.
 
         Args:
             payment_id: UUID of the payment to delete
+            user_id: Owner whose cached read results are dropped
 
         Raises:
             ValueError: If payment is not found
         """
         try:
             logger.info(f'Deleting payment with ID: {payment_id}')
-            use_case = PaymentDeleteUseCase(self._payment_repository, self._expense_repository)
-            use_case.execute(payment_id)
+            use_case = invalidating(PaymentDeleteUseCase(self._payment_repository, self._expense_repository), self._result_cache, user_id)
+            await use_case.execute(payment_id)
             logger.info(f'Payment deleted successfully: {payment_id}')
         except ValueError as ex:
             logger.warning(f'Failed to delete payment {payment_id}: {ex}')
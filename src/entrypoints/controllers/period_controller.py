@@ -1,33 +1,53 @@
 from uuid import UUID
 
 from src.application.dtos import PeriodResponseDTO, PeriodSummaryDTO
-from src.application.use_cases.period import PeriodGetOneUseCase, PeriodGetRangeUseCase
-from src.application.ports import CreditCardRepository
+from src.application.helpers.result_cache import ResultCache, cached
+from src.application.use_cases.period import PeriodGetOneUseCase, PeriodGetRangeUseCase, PeriodGetSummariesUseCase
+from src.application.ports import AsyncCreditCardRepository
 
 
 class PeriodController:
-    """Controller for period operations."""
+    """Controller for period operations.
+
+    Results are served from result_cache per user; the expense, payment and card
+    writes drop them.
+    """
     
     def __init__(
         self,
-        credit_card_repository: CreditCardRepository,
+        credit_card_repository: AsyncCreditCardRepository,
+        result_cache: ResultCache | None = None,
     ):
         self._credit_card_repository = credit_card_repository
+        self._result_cache = result_cache
     
-    def get_period(self, user_id: UUID, month: int, year: int) -> PeriodResponseDTO:
+    async def get_period(self, user_id: UUID, month: int, year: int) -> PeriodResponseDTO:
         """Get a specific period with enriched payments."""
-        use_case = PeriodGetOneUseCase(
+        use_case = cached(PeriodGetOneUseCase(
             self._credit_card_repository,
-        )
-        return use_case.execute(user_id, month, year)
+        ), self._result_cache, user_id)
+        return await use_case.execute(user_id, month, year)
     
-    def get_periods_projection(
+    async def get_periods_projection(
         self, 
         user_id: UUID, 
         months_ahead: int
     ) -> list[PeriodResponseDTO]:
         """Get future period projection with complete payments."""
-        use_case = PeriodGetRangeUseCase(
+        use_case = cached(PeriodGetRangeUseCase(
+            self._credit_card_repository,
+        ), self._result_cache, user_id)
+        return await use_case.execute(user_id, months_ahead)
+    
+    async def get_period_summaries(
+        self,
+        user_id: UUID,
+        month: int,
+        year: int,
+        months: int,
+    ) -> list[PeriodSummaryDTO]:
+        """Get the totals of consecutive periods, without their payments."""
+        use_case = cached(PeriodGetSummariesUseCase(
             self._credit_card_repository,
-        )
-        return use_case.execute(user_id, months_ahead)
+        ), self._result_cache, user_id)
+        return await use_case.execute(user_id, month, year, months)
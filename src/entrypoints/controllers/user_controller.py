@@ -9,7 +9,7 @@ from uuid import UUID
 
 from src.application.dtos import UpdateUserDTO, UserResponseDTO
 from src.application.use_cases.user import UserGetOneUseCase, UserUpdateUseCase
-from src.application.ports.user_repository import UserRepository
+from src.application.ports import AsyncUserRepository
 from src.entrypoints.exceptions import client_exceptions as ce
 from src.entrypoints.exceptions import server_exceptions as se
 
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 class UserController:
     """Controller for user operations."""
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: AsyncUserRepository):
         """
         Initialize the controller.
 
@@ -28,7 +28,7 @@ class UserController:
         """
         self.user_repository = user_repository
 
-    def get_user(self, user_id: UUID) -> UserResponseDTO:
+    async def get_user(self, user_id: UUID) -> UserResponseDTO:
         """
         Get a user by ID.
 
@@ -44,7 +44,7 @@ class UserController:
         """
         try:
             use_case = UserGetOneUseCase(self.user_repository)
-            return use_case.execute(user_id)
+            return await use_case.execute(user_id)
         except ValueError as e:
             logger.warning(f'User not found: {e}')
             raise ce.NotFound(str(e))
@@ -52,7 +52,7 @@ class UserController:
             logger.error(f'Error getting user: {e}', exc_info=True)
             raise se.InternalServerError('An error occurred while retrieving the user')
 
-    def update_user(self, user_id: UUID, update_data: UpdateUserDTO) -> UserResponseDTO:
+    async def update_user(self, user_id: UUID, update_data: UpdateUserDTO) -> UserResponseDTO:
         """
         Update a user's information.
 
@@ -70,7 +70,7 @@ class UserController:
         """
         try:
             use_case = UserUpdateUseCase(self.user_repository)
-            return use_case.execute(user_id, update_data)
+            return await use_case.execute(user_id, update_data)
         except ValueError as e:
             logger.warning(f'Error updating user: {e}')
             if 'not found' in str(e).lower():
@@ -1,9 +1,9 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 
 from src.domain.auth import Role
-from src.application.helpers.security import decode_jwt
+from src.application.helpers.security import decode_jwt_cached
 from src.application.dtos import DecodedJWT
 from src.entrypoints.exceptions import Forbidden, Unauthorized
 from src.config import settings
@@ -13,17 +13,21 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl='/api/v3/auth/oauth')
 
 
 def has_permission(allowed_roles: list[Role] = []):
-    async def get_token_payload(authorization=Depends(oauth2_scheme)) -> DecodedJWT:
+    async def get_token_payload(request: Request, authorization=Depends(oauth2_scheme)) -> DecodedJWT:
         try:
-            payload = decode_jwt(
-                token=authorization,
-                secret=settings.JWT_SECRET_KEY,
-                algorithm=settings.JWT_ALGORITHM,
-            )
+            # Reuse the token already verified by JWTMiddleware
+            decoded: DecodedJWT | None = getattr(request.state, 'decoded_jwt', None)
+            if decoded is None or getattr(request.state, 'raw_jwt', None) != authorization:
+                payload = decode_jwt_cached(
+                    token=authorization,
+                    secret=settings.JWT_SECRET_KEY,
+                    algorithm=settings.JWT_ALGORITHM,
+                )
+                decoded = DecodedJWT(**payload)
 
-            if len(allowed_roles) > 0 and payload['role'] not in [role.value for role in allowed_roles]:
+            if len(allowed_roles) > 0 and decoded.role not in allowed_roles:
                 raise Forbidden('You have no access to this resource.', 'USER_FORBIDDEN')
-            return DecodedJWT(**payload)
+            return decoded
         except (JWTExpiredError, JWTInvalidSignatureError, JWTInvalidError) as e:
             raise Unauthorized(str(e), e.code)
         except InvalidTokenError as e:
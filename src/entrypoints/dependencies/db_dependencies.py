@@ -0,0 +1,25 @@
+from collections.abc import AsyncIterator
+
+from src.application.ports import AsyncUnitOfWork
+from src.infrastructure.database import async_db_conn, AsyncSQLAlchemyUnitOfWork
+
+
+async def unit_of_work() -> AsyncIterator[AsyncUnitOfWork]:
+    """
+    Bind one unit of work (one AsyncSession and transaction) to the request.
+
+    Async repositories built with async_db_conn.SessionLocal reuse its session while
+    the path operation runs. It commits after the path operation returns, or rolls
+    back if it raises. Use it with Depends(unit_of_work, scope='function') so the
+    commit happens before the response is sent.
+    """
+    uow = AsyncSQLAlchemyUnitOfWork(session_factory=async_db_conn.SessionLocal)
+    uow.begin()
+    try:
+        yield uow
+        await uow.commit()
+    except BaseException:
+        await uow.rollback()
+        raise
+    finally:
+        await uow.end()
@@ -0,0 +1,61 @@
+import hashlib
+from datetime import date
+
+from fastapi import Depends, Request, Response
+
+from src.application.dtos import DecodedJWT
+from src.application.ports import AsyncUserRepository
+from src.domain.auth.enums.role import ALL_ROLES
+from src.entrypoints.dependencies.auth_dependencies import has_permission
+from src.entrypoints.exceptions import NotModified
+from src.infrastructure.database import async_db_conn
+from src.infrastructure.database.models import UserModel
+from src.infrastructure.repositories import AsyncUserRepositorySQL
+
+
+def build_etag(user_id, data_version: int, request: Request) -> str:
+    """
+    Weak ETag of a GET of the user's data at the given data version.
+
+    Includes today's date: periods, projections and default summary ranges change with it.
+    """
+    key = f'{user_id}:{data_version}:{date.today().isoformat()}:{request.url.path}?{request.url.query}'
+    return f'W/"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of the ETag against an If-None-Match header (list of ETags or *)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    opaque = etag.removeprefix('W/')
+    return any(tag.strip().removeprefix('W/') == opaque for tag in if_none_match.split(','))
+
+
+def conditional_get(user_repository: AsyncUserRepository):
+    """
+    Dependency answering GETs of the user's data with 304 when If-None-Match holds the
+    current ETag, before the path operation (and its use case) runs. Otherwise the ETag
+    is set on the response.
+
+    The ETag comes from the user's data version, which the repositories bump on every
+    write to their cards, expenses, payments and categories. It is read with an AsyncSession,
+    on the event loop: a 304 never takes a worker thread.
+    """
+    async def check_etag(
+        request: Request,
+        response: Response,
+        token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
+    ) -> None:
+        data_version = await user_repository.get_data_version(token.user_id)
+        etag = build_etag(token.user_id, data_version, request)
+        if etag_matches(request.headers.get('if-none-match'), etag):
+            raise NotModified(etag)
+        response.headers['ETag'] = etag
+        # Per user data: never in shared caches, always revalidated
+        response.headers['Cache-Control'] = 'private, no-cache'
+    return check_etag
+
+
+if_none_match = conditional_get(AsyncUserRepositorySQL(model=UserModel, session_factory=async_db_conn.SessionLocal))
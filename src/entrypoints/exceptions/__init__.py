@@ -1,11 +1,14 @@
 from .base_http_exception import BaseHTTPException
 from .client_exceptions import BadRequest, Forbidden, NotFound, Unauthorized
+from .redirection_exceptions import NotModified
 from .server_exceptions import InternalServerError, NotImplemented, ServiceUnavailable
 
 
 __all__ = [
     # Base HTTP Exception
     'BaseHTTPException',
+    # Redirection Exceptions
+    'NotModified',
     # Client Exceptions
     'BadRequest',
     'Forbidden',
@@ -0,0 +1,12 @@
+from fastapi import HTTPException
+
+
+class NotModified(HTTPException):
+    """
+    Answer a conditional GET whose If-None-Match matches the current ETag: 304 without a
+    body, carrying the ETag again. Handled apart from the JSON error responses.
+    """
+    status_code = 304
+
+    def __init__(self, etag: str) -> None:
+        super().__init__(status_code=self.status_code, headers={'ETag': etag})
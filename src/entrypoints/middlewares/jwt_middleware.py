@@ -2,15 +2,25 @@ import json
 import time
 from datetime import timedelta
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from pydantic import ValidationError
 
 from src.config import settings
-from src.application.helpers.security import decode_jwt, encode_jwt
+from src.application.dtos import DecodedJWT
+from src.application.helpers.security import decode_jwt_cached, encode_jwt
 from src.common.exceptions import JWTExpiredError, JWTInvalidSignatureError, JWTInvalidError
 
 
-class JWTMiddleware(BaseHTTPMiddleware):
+class JWTMiddleware:
+    """
+    Validate the bearer token and auto-renew it when less than half its lifetime is left.
+
+    Pure ASGI middleware: response messages are passed through untouched (only the
+    renewal headers are added to http.response.start), so streaming responses work and
+    there is no extra task or memory stream per request as with BaseHTTPMiddleware.
+    """
+
     # Routes that don't require JWT validation
     EXCLUDED_PATHS = [
         '/docs',
@@ -21,79 +31,103 @@ class JWTMiddleware(BaseHTTPMiddleware):
         '/api/v3/auth/refresh',  # Refresh uses opaque tokens, not JWTs
         '/api/v3/auth/oauth',
     ]
-    
-    def __init__(self, app) -> None:
-        super().__init__(app)
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
         # Skip JWT validation for excluded paths
-        if any(request.url.path.startswith(path) for path in self.EXCLUDED_PATHS):
-            response = await call_next(request)
-            return response
-        
-        token = request.headers.get('Authorization')
-        
+        if any(scope['path'].startswith(path) for path in self.EXCLUDED_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        token = Headers(scope=scope).get('Authorization')
+
         # If no token or not Bearer format, just continue
         if token is None or not token.startswith('Bearer'):
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
+            return
 
         try:
-            jwt_payload = decode_jwt(token.split(' ')[1], settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
-            exp_timestamp = jwt_payload["exp"]
-
-            current_timestamp = int(time.time())
-            time_left = (exp_timestamp - current_timestamp) // 60
-            
-            # Process the request first
-            response = await call_next(request)
-            
-            # Check if token needs renewal (less than 50% of lifetime remaining)
-            if time_left < (settings.JWT_EXPIRATION_TIME_MINUTES * 0.5):
-                # Get current renewal count (default to 0 if not present)
-                renewal_count = jwt_payload.get('renewal_count', 0)
-                
-                # Check if we've reached the max renewals limit
-                if renewal_count >= settings.JWT_MAX_RENEWALS:
-                    # Signal frontend that refresh token is required
-                    response.headers['X-Require-Refresh'] = 'true'
-                else:
-                    # Renew the token and increment renewal count
-                    del jwt_payload['exp']
-                    jwt_payload['renewal_count'] = renewal_count + 1
-                    
-                    expires_delta = timedelta(minutes=settings.JWT_EXPIRATION_TIME_MINUTES)
-                    new_token = encode_jwt(
-                        jwt_payload, 
-                        settings.JWT_SECRET_KEY, 
-                        settings.JWT_ALGORITHM, 
-                        expires_delta
-                    )
-                    response.headers['renewed-token'] = new_token
-            
-            return response
-                    
+            raw_token = token.split(' ')[1]
+            jwt_payload = decode_jwt_cached(raw_token, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+            renewal_headers = self._get_renewal_headers(jwt_payload)
         except (JWTExpiredError, JWTInvalidSignatureError, JWTInvalidError) as ex:
             # Return consistent error format with code
-            return Response(
-                content=json.dumps({
-                    'detail': {
-                        'description': str(ex),
-                        'code': ex.code
-                    }
-                }),
-                status_code=401,
-                media_type='application/json'
-            )
-        except Exception as ex:
+            await self._send_error(send, 401, str(ex), ex.code)
+            return
+        except Exception:
             # For unexpected errors, return consistent format
-            return Response(
-                content=json.dumps({
-                    'detail': {
-                        'description': 'Error processing token',
-                        'code': 'TOKEN_PROCESSING_ERROR'
-                    }
-                }),
-                status_code=500,
-                media_type='application/json'
-            )
\ No newline at end of file
+            await self._send_error(send, 500, 'Error processing token', 'TOKEN_PROCESSING_ERROR')
+            return
+
+        # Share the verified token with has_permission so it isn't decoded again
+        try:
+            state = scope.setdefault('state', {})
+            state['decoded_jwt'] = DecodedJWT(**jwt_payload)
+            state['raw_jwt'] = raw_token
+        except ValidationError:
+            pass
+
+        if not renewal_headers:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_renewal(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                headers = MutableHeaders(scope=message)
+                for key, value in renewal_headers.items():
+                    headers[key] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_renewal)
+
+    def _get_renewal_headers(self, jwt_payload: dict) -> dict[str, str]:
+        time_left = (jwt_payload['exp'] - int(time.time())) // 60
+
+        # Check if token needs renewal (less than 50% of lifetime remaining)
+        if time_left >= (settings.JWT_EXPIRATION_TIME_MINUTES * 0.5):
+            return {}
+
+        # Get current renewal count (default to 0 if not present)
+        renewal_count = jwt_payload.get('renewal_count', 0)
+
+        # Check if we've reached the max renewals limit
+        if renewal_count >= settings.JWT_MAX_RENEWALS:
+            # Signal frontend that refresh token is required
+            return {'X-Require-Refresh': 'true'}
+
+        # Renew the token and increment renewal count
+        renewed_payload = {key: value for key, value in jwt_payload.items() if key != 'exp'}
+        renewed_payload['renewal_count'] = renewal_count + 1
+
+        expires_delta = timedelta(minutes=settings.JWT_EXPIRATION_TIME_MINUTES)
+        new_token = encode_jwt(
+            renewed_payload,
+            settings.JWT_SECRET_KEY,
+            settings.JWT_ALGORITHM,
+            expires_delta
+        )
+        return {'renewed-token': new_token}
+
+    @staticmethod
+    async def _send_error(send: Send, status_code: int, description: str, code: str) -> None:
+        body = json.dumps({
+            'detail': {
+                'description': description,
+                'code': code
+            }
+        }).encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': status_code,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode('latin-1')),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})
@@ -0,0 +1,7 @@
+from .fast_json_response import FastJSONResponse, fast_json
+
+
+__all__ = [
+    'FastJSONResponse',
+    'fast_json',
+]
@@ -0,0 +1,30 @@
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendering pydantic models (or lists of them) straight to bytes with
+    pydantic-core's serializer, instead of jsonable_encoder + json.dumps.
+
+    Return it from the path operation (see fast_json) so FastAPI skips the response_model
+    round trip (model_dump, validate again, serialize): only use it for DTOs built from
+    trusted domain objects. The response_model is still used for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def fast_json(content: Any, response: Response | None = None) -> FastJSONResponse:
+    """
+    Wrap content in a FastJSONResponse, carrying the headers the dependencies set on the
+    injected `response` (e.g. the ETag), which FastAPI drops when a Response is returned.
+    """
+    fast_response = FastJSONResponse(content)
+    if response is not None:
+        fast_response.headers.raw.extend(response.headers.raw)
+    return fast_response
@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from src.entrypoints.dependencies.db_dependencies import unit_of_work
 from .auth_routes import router as auth_router
 from .account_routes import router as account_router
 from .user_routes import router as user_router
@@ -9,15 +11,20 @@ from .expense_routes import (
     expense_router,
 )
 from .period_routes import router as period_router
+from .metrics_routes import router as metrics_router
 
 
 router_v3 = APIRouter(prefix='/v3')
+# One AsyncSession and transaction per request (auth keeps its own short transactions,
+# the period reads don't need one)
+uow_dependencies = [Depends(unit_of_work, scope='function')]
 
 router_v3.include_router(auth_router, tags=['auth'])
-router_v3.include_router(account_router, tags=['account'])
-router_v3.include_router(user_router, tags=['users'])
-router_v3.include_router(category_router, tags=['expense-categories'])
-router_v3.include_router(purchase_router, tags=['purchases'])
-router_v3.include_router(subscription_router, tags=['subscriptions'])
-router_v3.include_router(expense_router, tags=['expenses'])
+router_v3.include_router(account_router, tags=['account'], dependencies=uow_dependencies)
+router_v3.include_router(user_router, tags=['users'], dependencies=uow_dependencies)
+router_v3.include_router(category_router, tags=['expense-categories'], dependencies=uow_dependencies)
+router_v3.include_router(purchase_router, tags=['purchases'], dependencies=uow_dependencies)
+router_v3.include_router(subscription_router, tags=['subscriptions'], dependencies=uow_dependencies)
+router_v3.include_router(expense_router, tags=['expenses'], dependencies=uow_dependencies)
 router_v3.include_router(period_router, tags=['periods'])
+router_v3.include_router(metrics_router, tags=['metrics'])
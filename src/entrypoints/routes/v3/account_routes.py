@@ -1,3 +1,4 @@
+from typing import Literal, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query
 
@@ -11,62 +12,71 @@ from src.application.dtos import (
 from src.domain.auth.enums.role import ALL_ROLES
 from src.entrypoints.controllers import AccountController
 from src.entrypoints.dependencies.auth_dependencies import has_permission
-from src.infrastructure.repositories import CreditCardRepositorySQL
+from src.entrypoints.dependencies.etag_dependencies import if_none_match
+from src.infrastructure.repositories import AsyncCreditCardRepositorySQL
 from src.infrastructure.database.models import CreditCardModel
-from src.infrastructure.database import db_conn
+from src.infrastructure.database import async_db_conn
+from src.infrastructure.cache import result_cache
 
 router = APIRouter(prefix='/credit-cards')
 controller = AccountController(
-    credit_card_repository=CreditCardRepositorySQL(
+    credit_card_repository=AsyncCreditCardRepositorySQL(
         model=CreditCardModel,
-        session_factory=db_conn.SessionLocal,
-    )
+        session_factory=async_db_conn.SessionLocal,
+    ),
+    result_cache=result_cache,
 )
 
 
 @router.post('', response_model=CreditCardResponseDTO, status_code=201)
-def create_credit_card(
+async def create_credit_card(
     data: CreateCreditCardDTO,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> CreditCardResponseDTO:
     """Create a new credit card."""
-    return controller.create_credit_card(data)
+    return await controller.create_credit_card(data, user_id=token.user_id)
 
 
-@router.get('/{credit_card_id}', response_model=CreditCardResponseDTO)
-def get_credit_card(
+@router.get('/{credit_card_id}', response_model=CreditCardResponseDTO, dependencies=[Depends(if_none_match)])
+async def get_credit_card(
     credit_card_id: UUID,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> CreditCardResponseDTO:
     """Get a credit card by ID."""
-    return controller.get_credit_card(credit_card_id)
+    return await controller.get_credit_card(credit_card_id)
 
 
 @router.put('/{credit_card_id}', response_model=CreditCardResponseDTO)
-def update_credit_card(
+async def update_credit_card(
     credit_card_id: UUID,
     data: UpdateCreditCardDTO,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> CreditCardResponseDTO:
     """Update a credit card."""
-    return controller.update_credit_card(credit_card_id, data)
+    return await controller.update_credit_card(credit_card_id, data, user_id=token.user_id)
 
 
 @router.delete('/{credit_card_id}', status_code=204)
-def delete_credit_card(
+async def delete_credit_card(
     credit_card_id: UUID,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> None:
     """Delete a credit card."""
-    controller.delete_credit_card(credit_card_id)
+    await controller.delete_credit_card(credit_card_id, user_id=token.user_id)
 
 
-@router.get('', response_model=PaginatedResponse[CreditCardResponseDTO])
-def get_paginated_credit_cards(
+@router.get('', response_model=PaginatedResponse[CreditCardResponseDTO], dependencies=[Depends(if_none_match)])
+async def get_paginated_credit_cards(
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    include_expenses: bool = Query(False, description='Set to true to compute usage figures from the expenses instead of the stored ones'),
+    pagination: Literal['offset', 'cursor'] = Query('offset', description="'cursor' pages by next_cursor instead of offset"),
+    cursor: Optional[str] = Query(None, description='next_cursor of the previous page (implies cursor pagination)'),
+    include_total: bool = Query(False, description='Also count total_items in cursor pagination'),
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> PaginatedResponse[CreditCardResponseDTO]:
     """Get a paginated list of credit cards."""
-    filter_dict = {'owner_id': token.user_id}
-    return controller.get_paginated_credit_cards(filter_dict, limit, offset)
+    filter_dict = {'owner_id': token.user_id, 'include_expenses': include_expenses}
+    if pagination == 'cursor' or cursor:
+        return await controller.get_credit_cards_by_cursor(filter_dict, limit, cursor, include_total)
+    return await controller.get_paginated_credit_cards(filter_dict, limit, offset)
@@ -5,39 +5,39 @@ from src.application.dtos import LoginUserDTO, RegisterUserDTO, LoggedInUserDTO,
 from src.domain.auth.enums.role import ALL_ROLES
 from src.entrypoints.controllers import AuthController
 from src.entrypoints.dependencies.auth_dependencies import has_permission
-from src.infrastructure.repositories import UserRepositorySQL
-from src.infrastructure.repositories.refresh_token_repository_sql import RefreshTokenRepositorySQL
+from src.infrastructure.repositories import AsyncUserRepositorySQL
+from src.infrastructure.repositories.async_refresh_token_repository_sql import AsyncRefreshTokenRepositorySQL
 from src.infrastructure.database.models import UserModel
-from src.infrastructure.database import db_conn
+from src.infrastructure.database import async_db_conn
 
 router = APIRouter(prefix='/auth')
 controller = AuthController(
-    user_repository=UserRepositorySQL(
+    user_repository=AsyncUserRepositorySQL(
         model=UserModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
-    refresh_token_repository=RefreshTokenRepositorySQL(
-        session_factory=db_conn.SessionLocal
+    refresh_token_repository=AsyncRefreshTokenRepositorySQL(
+        session_factory=async_db_conn.SessionLocal
     )
 )
 
 @router.post('/oauth')
-def login_oauth(credentials: OAuth2PasswordRequestForm = Depends()) -> LoggedInUserDTO:
+async def login_oauth(credentials: OAuth2PasswordRequestForm = Depends()) -> LoggedInUserDTO:
     data = LoginUserDTO(username=credentials.username, password=credentials.password)
-    return controller.login(data)
+    return await controller.login(data)
 
 @router.post('/login')
-def login(data: LoginUserDTO) -> LoggedInUserDTO:
-    return controller.login(data)
+async def login(data: LoginUserDTO) -> LoggedInUserDTO:
+    return await controller.login(data)
 
 
 @router.post('/register')
-def register(data: RegisterUserDTO) -> LoggedInUserDTO:
-    return controller.register(data)
+async def register(data: RegisterUserDTO) -> LoggedInUserDTO:
+    return await controller.register(data)
 
 
 @router.post('/refresh')
-def refresh_access_token(authorization: str = Header(...)) -> dict:
+async def refresh_access_token(authorization: str = Header(...)) -> dict:
     """
     Refresh access token using refresh token.
     
@@ -59,11 +59,11 @@ def refresh_access_token(authorization: str = Header(...)) -> dict:
     
     refresh_token = authorization.replace('Bearer ', '', 1)
     logger.info(f"Extracted token length: {len(refresh_token)}")
-    return controller.refresh_access_token(refresh_token)
+    return await controller.refresh_access_token(refresh_token)
 
 
 @router.post('/renew-token')
-def renew_token(token: DecodedJWT = Depends(has_permission(ALL_ROLES))) -> LoggedInUserDTO:
+async def renew_token(token: DecodedJWT = Depends(has_permission(ALL_ROLES))) -> LoggedInUserDTO:
     """Renew authentication token for logged-in user."""
     logged_in_user = LoggedInUserDTO(
         id=token.user_id,
@@ -71,4 +71,4 @@ def renew_token(token: DecodedJWT = Depends(has_permission(ALL_ROLES))) -> Logge
         email=token.email,
         role=token.role,
     )
-    return controller.renew_token(logged_in_user)
+    return await controller.renew_token(logged_in_user)
@@ -1,6 +1,7 @@
 from uuid import UUID
-from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 
 from src.application.dtos import (
     CreateExpenseCategoryDTO,
@@ -16,225 +17,283 @@ from src.application.dtos import (
     CreatePaymentDTO,
     UpdatePaymentDTO,
     PaymentResponseDTO,
+    ExportFormat,
+    BulkCreateExpensesDTO,
+    BulkCreateExpensesResultDTO,
 )
 from src.domain.auth.enums.role import ALL_ROLES
 from src.domain.expense.enums import ExpenseType
 from src.entrypoints.controllers import ExpenseController
 from src.entrypoints.dependencies.auth_dependencies import has_permission
+from src.entrypoints.dependencies.etag_dependencies import if_none_match
+from src.entrypoints.responses import FastJSONResponse, fast_json
 from src.infrastructure.repositories import (
-    ExpenseCategoryRepositorySQL,
-    ExpenseRepositorySQL,
-    PaymentRepositorySQL,
+    AsyncExpenseCategoryRepositorySQL,
+    AsyncExpenseRepositorySQL,
+    AsyncPaymentRepositorySQL,
 )
 from src.infrastructure.database.models import (
     ExpenseCategoryModel,
     ExpenseModel,
     PaymentModel,
 )
-from src.infrastructure.database import db_conn
+from src.infrastructure.database import async_db_conn
+from src.infrastructure.cache import result_cache
 
 # Expense Category Router
 category_router = APIRouter(prefix='/expense-categories')
 category_controller = ExpenseController(
-    expense_category_repository=ExpenseCategoryRepositorySQL(
+    expense_category_repository=AsyncExpenseCategoryRepositorySQL(
         model=ExpenseCategoryModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
-    expense_repository=ExpenseRepositorySQL(
+    expense_repository=AsyncExpenseRepositorySQL(
         model=ExpenseModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
-    payment_repository=PaymentRepositorySQL(
+    payment_repository=AsyncPaymentRepositorySQL(
         model=PaymentModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
+    result_cache=result_cache,
 )
 
 
 @category_router.post('', response_model=ExpenseCategoryResponseDTO, status_code=201)
-def create_expense_category(
+async def create_expense_category(
     data: CreateExpenseCategoryDTO,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> ExpenseCategoryResponseDTO:
     """Create a new expense category."""
-    return category_controller.create_expense_category(data)
+    return await category_controller.create_expense_category(data, user_id=token.user_id)
 
 
 @category_router.put('/{category_id}', response_model=ExpenseCategoryResponseDTO)
-def update_expense_category(
+async def update_expense_category(
     category_id: UUID,
     data: UpdateExpenseCategoryDTO,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> ExpenseCategoryResponseDTO:
     """Update an expense category."""
-    return category_controller.update_expense_category(category_id, data)
+    return await category_controller.update_expense_category(category_id, data, user_id=token.user_id)
 
 
 @category_router.delete('/{category_id}', status_code=204)
-def delete_expense_category(
+async def delete_expense_category(
     category_id: UUID,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> None:
     """Delete an expense category."""
-    category_controller.delete_expense_category(category_id)
+    await category_controller.delete_expense_category(category_id, user_id=token.user_id)
 
 
-@category_router.get('', response_model=PaginatedResponse[ExpenseCategoryResponseDTO])
-def get_paginated_expense_categories(
+@category_router.get('', response_model=PaginatedResponse[ExpenseCategoryResponseDTO], response_class=FastJSONResponse, dependencies=[Depends(if_none_match)])
+async def get_paginated_expense_categories(
+    response: Response,
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    pagination: Literal['offset', 'cursor'] = Query('offset', description="'cursor' pages by next_cursor instead of offset"),
+    cursor: Optional[str] = Query(None, description='next_cursor of the previous page (implies cursor pagination)'),
+    include_total: bool = Query(False, description='Also count total_items in cursor pagination'),
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
-) -> PaginatedResponse[ExpenseCategoryResponseDTO]:
+) -> FastJSONResponse:
     """Get a paginated list of expense categories."""
     filter_dict = {'owner_id': token.user_id}
-    return category_controller.get_paginated_expense_categories(filter_dict, limit, offset)
+    if pagination == 'cursor' or cursor:
+        return fast_json(await category_controller.get_expense_categories_by_cursor(filter_dict, limit, cursor, include_total), response)
+    return fast_json(await category_controller.get_paginated_expense_categories(filter_dict, limit, offset), response)
 
 
 # Purchase Router
 purchase_router = APIRouter(prefix='/purchases')
 purchase_controller = ExpenseController(
-    expense_category_repository=ExpenseCategoryRepositorySQL(
+    expense_category_repository=AsyncExpenseCategoryRepositorySQL(
         model=ExpenseCategoryModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
-    expense_repository=ExpenseRepositorySQL(
+    expense_repository=AsyncExpenseRepositorySQL(
         model=ExpenseModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
-    payment_repository=PaymentRepositorySQL(
+    payment_repository=AsyncPaymentRepositorySQL(
         model=PaymentModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
+    result_cache=result_cache,
 )
 
 
 @purchase_router.post('', response_model=ExpenseResponseDTO, status_code=201)
-def create_purchase(
+async def create_purchase(
     data: CreatePurchaseDTO,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> ExpenseResponseDTO:
     """Create a new purchase."""
-    return purchase_controller.create_purchase(data)
+    return await purchase_controller.create_purchase(data, user_id=token.user_id)
 
 
-@purchase_router.get('/{purchase_id}', response_model=ExpenseResponseDTO)
-def get_purchase(
+@purchase_router.get('/{purchase_id}', response_model=ExpenseResponseDTO, dependencies=[Depends(if_none_match)])
+async def get_purchase(
     purchase_id: UUID,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> ExpenseResponseDTO:
     """Get a purchase by ID."""
-    return purchase_controller.get_purchase(purchase_id)
+    return await purchase_controller.get_purchase(purchase_id)
 
 
 @purchase_router.put('/{purchase_id}', response_model=ExpenseResponseDTO)
-def update_purchase(
+async def update_purchase(
     purchase_id: UUID,
     data: UpdatePurchaseDTO,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> ExpenseResponseDTO:
     """Update a purchase."""
-    return purchase_controller.update_purchase(purchase_id, data)
+    return await purchase_controller.update_purchase(purchase_id, data, user_id=token.user_id)
 
 
 @purchase_router.delete('/{purchase_id}', status_code=204)
-def delete_purchase(
+async def delete_purchase(
     purchase_id: UUID,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> None:
     """Delete a purchase."""
-    purchase_controller.delete_purchase(purchase_id)
+    await purchase_controller.delete_purchase(purchase_id, user_id=token.user_id)
 
 
 # Subscription Router
 subscription_router = APIRouter(prefix='/subscriptions')
 subscription_controller = ExpenseController(
-    expense_category_repository=ExpenseCategoryRepositorySQL(
+    expense_category_repository=AsyncExpenseCategoryRepositorySQL(
         model=ExpenseCategoryModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
-    expense_repository=ExpenseRepositorySQL(
+    expense_repository=AsyncExpenseRepositorySQL(
         model=ExpenseModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
-    payment_repository=PaymentRepositorySQL(
+    payment_repository=AsyncPaymentRepositorySQL(
         model=PaymentModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
+    result_cache=result_cache,
 )
 
 
 @subscription_router.post('', response_model=ExpenseResponseDTO, status_code=201)
-def create_subscription(
+async def create_subscription(
     data: CreateSubscriptionDTO,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> ExpenseResponseDTO:
     """Create a new subscription."""
-    return subscription_controller.create_subscription(data)
+    return await subscription_controller.create_subscription(data, user_id=token.user_id)
 
 
-@subscription_router.get('/{subscription_id}', response_model=ExpenseResponseDTO)
-def get_subscription(
+@subscription_router.get('/{subscription_id}', response_model=ExpenseResponseDTO, dependencies=[Depends(if_none_match)])
+async def get_subscription(
     subscription_id: UUID,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> ExpenseResponseDTO:
     """Get a subscription by ID."""
-    return subscription_controller.get_subscription(subscription_id)
+    return await subscription_controller.get_subscription(subscription_id)
 
 
 @subscription_router.put('/{subscription_id}', response_model=ExpenseResponseDTO)
-def update_subscription(
+async def update_subscription(
     subscription_id: UUID,
     data: UpdateSubscriptionDTO,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> ExpenseResponseDTO:
     """Update a subscription."""
-    return subscription_controller.update_subscription(subscription_id, data)
+    return await subscription_controller.update_subscription(subscription_id, data, user_id=token.user_id)
 
 
 @subscription_router.delete('/{subscription_id}', status_code=204)
-def delete_subscription(
+async def delete_subscription(
     subscription_id: UUID,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> None:
     """Delete a subscription."""
-    subscription_controller.delete_subscription(subscription_id)
+    await subscription_controller.delete_subscription(subscription_id, user_id=token.user_id)
 
 
 # General Expenses Router
 expense_router = APIRouter(prefix='/expenses')
 expense_controller = ExpenseController(
-    expense_category_repository=ExpenseCategoryRepositorySQL(
+    expense_category_repository=AsyncExpenseCategoryRepositorySQL(
         model=ExpenseCategoryModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
-    expense_repository=ExpenseRepositorySQL(
+    expense_repository=AsyncExpenseRepositorySQL(
         model=ExpenseModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
-    payment_repository=PaymentRepositorySQL(
+    payment_repository=AsyncPaymentRepositorySQL(
         model=PaymentModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
+    result_cache=result_cache,
 )
 
 
-@expense_router.get('', response_model=PaginatedResponse[ExpenseResponseDTO])
-def get_paginated_expenses(
+@expense_router.get('', response_model=PaginatedResponse[ExpenseResponseDTO], response_class=FastJSONResponse, dependencies=[Depends(if_none_match)])
+async def get_paginated_expenses(
+    response: Response,
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
     type: Optional[ExpenseType] = Query(None, description="Filter by expense type: 'purchase' or 'subscription'"),
+    account_id: Optional[UUID] = Query(None, description='Filter by account (credit card)'),
+    pagination: Literal['offset', 'cursor'] = Query('offset', description="'cursor' pages by next_cursor instead of offset"),
+    cursor: Optional[str] = Query(None, description='next_cursor of the previous page (implies cursor pagination)'),
+    include_total: bool = Query(False, description='Also count total_items in cursor pagination'),
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
-) -> PaginatedResponse[ExpenseResponseDTO]:
+) -> FastJSONResponse:
     """Get a paginated list of expenses (purchases and subscriptions)."""
     filter_dict = {'owner_id': token.user_id}
     if type:
         filter_dict['expense_type'] = type.value
-    return expense_controller.get_paginated_expenses(filter_dict, limit, offset)
+    if account_id:
+        filter_dict['account_id'] = account_id
+    if pagination == 'cursor' or cursor:
+        return fast_json(await expense_controller.get_expenses_by_cursor(filter_dict, limit, cursor, include_total), response)
+    return fast_json(await expense_controller.get_paginated_expenses(filter_dict, limit, offset), response)
+
+
+@expense_router.post('/bulk', response_model=BulkCreateExpensesResultDTO)
+async def bulk_create_expenses(
+    data: BulkCreateExpensesDTO,
+    token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
+) -> BulkCreateExpensesResultDTO:
+    """
+    Create up to 1000 purchases and subscriptions at once (e.g. imported from a bank statement).
+
+    Valid rows are created in one transaction; rows rejected by validation are listed in
+    `errors` by their position in `purchases` or `subscriptions`.
+    """
+    return await expense_controller.bulk_create_expenses(data, user_id=token.user_id)
+
+
+@expense_router.get('/payments/export', response_class=StreamingResponse)
+async def export_payments(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="'ndjson' (one payment per line) or 'csv'"),
+    token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
+) -> StreamingResponse:
+    """
+    Export the full payment history (payments with their expense, category and account).
+
+    Streamed while it is read from the database, in constant memory, instead of paging
+    through /expenses.
+    """
+    chunks = expense_controller.export_payments(token.user_id, format)
+    return StreamingResponse(
+        chunks,
+        media_type=format.media_type,
+        headers={'Content-Disposition': f'attachment; filename="payments.{format.value}"'},
+    )
 
 
 # Payment endpoints for subscriptions
 @subscription_router.post('/{subscription_id}/payments', response_model=PaymentResponseDTO, status_code=201)
-def create_payment_for_subscription(
+async def create_payment_for_subscription(
     subscription_id: UUID,
     data: CreatePaymentDTO,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
@@ -244,25 +303,25 @@ def create_payment_for_subscription(
     if data.expense_id != subscription_id:
         from src.entrypoints.exceptions.client_exceptions import BadRequest
         raise BadRequest('expense_id in payment data must match subscription_id', 'EXPENSE_ID_MISMATCH')
-    return subscription_controller.create_payment(data)
+    return await subscription_controller.create_payment(data, user_id=token.user_id)
 
 
 @subscription_router.delete('/{subscription_id}/payments/{payment_id}', status_code=204)
-def delete_payment_from_subscription(
+async def delete_payment_from_subscription(
     subscription_id: UUID,
     payment_id: UUID,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> None:
     """Delete a payment from a subscription."""
-    subscription_controller.delete_payment(payment_id)
+    await subscription_controller.delete_payment(payment_id, user_id=token.user_id)
 
 
 # Payment endpoint for general expenses (both purchases and subscriptions)
 @expense_router.put('/payments/{payment_id}', response_model=PaymentResponseDTO)
-def update_payment(
+async def update_payment(
     payment_id: UUID,
     data: UpdatePaymentDTO,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
 ) -> PaymentResponseDTO:
     """Update a payment (for both purchases and subscriptions)."""
-    return expense_controller.update_payment(payment_id, data)
+    return await expense_controller.update_payment(payment_id, data, user_id=token.user_id)
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends
+
+from src.application.dtos import DecodedJWT, PoolMetricsDTO, PasswordHasherMetricsDTO, CacheMetricsDTO
+from src.application.helpers.password_hasher import password_hasher
+from src.domain.auth.enums.role import ADMIN_ROLES
+from src.entrypoints.dependencies.auth_dependencies import has_permission
+from src.infrastructure.cache import result_cache
+from src.infrastructure.database import db_conn, async_db_conn
+
+router = APIRouter(prefix='/metrics')
+
+
+@router.get('/db-pool', response_model=PoolMetricsDTO)
+def get_db_pool_metrics(
+    token: DecodedJWT = Depends(has_permission(ADMIN_ROLES)),
+) -> PoolMetricsDTO:
+    """
+    Get connection pool metrics.
+
+    Checkout wait times, timeouts and how many connections are in use or in overflow.
+    Use it to size uvicorn workers against PostgreSQL max_connections: each worker
+    opens up to pool_size + max_overflow connections in both the sync and the async pool.
+    """
+    return PoolMetricsDTO(**db_conn.get_pool_status(), async_pool=PoolMetricsDTO(**async_db_conn.get_pool_status()))
+
+
+@router.get('/password-hasher', response_model=PasswordHasherMetricsDTO)
+def get_password_hasher_metrics(
+    token: DecodedJWT = Depends(has_permission(ADMIN_ROLES)),
+) -> PasswordHasherMetricsDTO:
+    """
+    Get password hashing pool metrics.
+
+    Queue depth, running and rejected bcrypt calls of the login/register hashing pool.
+    """
+    return PasswordHasherMetricsDTO(**password_hasher.get_metrics())
+
+
+@router.get('/cache', response_model=CacheMetricsDTO)
+def get_cache_metrics(
+    token: DecodedJWT = Depends(has_permission(ADMIN_ROLES)),
+) -> CacheMetricsDTO:
+    """
+    Get read result cache metrics.
+
+    Hits and misses of the cached period and card listing reads, and how many writes
+    invalidated a user's results. Counters are per worker process.
+    """
+    if result_cache is None:
+        return CacheMetricsDTO(enabled=False)
+    return CacheMetricsDTO(enabled=True, **result_cache.get_metrics())
@@ -1,6 +1,6 @@
 from datetime import date
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query, Path
+from fastapi import APIRouter, Depends, Query, Path, Response
 
 from src.application.dtos import (
     PeriodResponseDTO,
@@ -10,25 +10,30 @@ from src.application.dtos import (
 from src.domain.auth.enums.role import ALL_ROLES
 from src.entrypoints.controllers import PeriodController
 from src.entrypoints.dependencies.auth_dependencies import has_permission
-from src.infrastructure.repositories import CreditCardRepositorySQL
+from src.entrypoints.dependencies.etag_dependencies import if_none_match
+from src.entrypoints.responses import FastJSONResponse, fast_json
+from src.infrastructure.repositories import AsyncCreditCardRepositorySQL
 from src.infrastructure.database.models import CreditCardModel
-from src.infrastructure.database import db_conn
+from src.infrastructure.database import async_db_conn
+from src.infrastructure.cache import result_cache
 
 
 router = APIRouter(prefix='/periods', tags=['periods'])
 
 controller = PeriodController(
-    credit_card_repository=CreditCardRepositorySQL(
+    credit_card_repository=AsyncCreditCardRepositorySQL(
         model=CreditCardModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     ),
+    result_cache=result_cache,
 )
 
 
-@router.get('/current', response_model=PeriodResponseDTO)
-def get_current_period(
+@router.get('/current', response_model=PeriodResponseDTO, response_class=FastJSONResponse, dependencies=[Depends(if_none_match)])
+async def get_current_period(
+    response: Response,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
-) -> PeriodResponseDTO:
+) -> FastJSONResponse:
     """
     Get the current period (current month).
     
@@ -36,14 +41,15 @@ def get_current_period(
         PeriodResponseDTO with all payments for the current month
     """
     today = date.today()
-    return controller.get_period(token.user_id, today.month, today.year)
+    return fast_json(await controller.get_period(token.user_id, today.month, today.year), response)
 
 
-@router.get('/projection', response_model=list[PeriodResponseDTO])
-def get_periods_projection(
+@router.get('/projection', response_model=list[PeriodResponseDTO], response_class=FastJSONResponse, dependencies=[Depends(if_none_match)])
+async def get_periods_projection(
+    response: Response,
     months_ahead: int = Query(12, ge=1, le=24, description="Months to project ahead"),
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
-) -> list[PeriodResponseDTO]:
+) -> FastJSONResponse:
     """
     Get future period projection with complete payments for charts.
     
@@ -59,15 +65,48 @@ def get_periods_projection(
     Returns:
         List of PeriodResponseDTO with enriched payments for each period
     """
-    return controller.get_periods_projection(token.user_id, months_ahead)
+    return fast_json(await controller.get_periods_projection(token.user_id, months_ahead), response)
 
 
-@router.get('/{month}/{year}', response_model=PeriodResponseDTO)
-def get_period(
+@router.get('/summaries', response_model=list[PeriodSummaryDTO], response_class=FastJSONResponse, dependencies=[Depends(if_none_match)])
+async def get_period_summaries(
+    response: Response,
+    month: int | None = Query(None, ge=1, le=12, description="First period month (default: current month)"),
+    year: int | None = Query(None, ge=2020, description="First period year (default: current year)"),
+    months: int = Query(12, ge=1, le=60, description="Number of consecutive periods"),
+    token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
+) -> FastJSONResponse:
+    """
+    Get the totals of consecutive periods for dashboard charts.
+    
+    Served from the materialized period summaries, so it does not read the payments.
+    Totals only cover recorded payments: simulated subscription payments are not included.
+    
+    Args:
+        month: First period month (1-12, default: current month)
+        year: First period year (>= 2020, default: current year)
+        months: Number of periods (1-60, default: 12)
+        
+    Returns:
+        List of PeriodSummaryDTO, one per period (periods without payments have zero totals)
+    """
+    today = date.today()
+    summaries = await controller.get_period_summaries(
+        token.user_id,
+        month or today.month,
+        year or today.year,
+        months,
+    )
+    return fast_json(summaries, response)
+
+
+@router.get('/{month}/{year}', response_model=PeriodResponseDTO, response_class=FastJSONResponse, dependencies=[Depends(if_none_match)])
+async def get_period(
+    response: Response,
     month: int = Path(..., ge=1, le=12, description="Month (1-12)"),
     year: int = Path(..., ge=2020, description="Year"),
     token: DecodedJWT = Depends(has_permission(ALL_ROLES)),
-) -> PeriodResponseDTO:
+) -> FastJSONResponse:
     """
     Get a specific period with all enriched payments.
     
@@ -90,4 +129,4 @@ def get_period(
     Returns:
         PeriodResponseDTO with enriched payments and calculated amounts
     """
-    return controller.get_period(token.user_id, month, year)
+    return fast_json(await controller.get_period(token.user_id, month, year), response)
@@ -10,21 +10,21 @@ from src.application.dtos import UpdateUserDTO, UserResponseDTO, DecodedJWT
 from src.domain.auth.enums.role import ALL_ROLES
 from src.entrypoints.controllers import UserController
 from src.entrypoints.dependencies.auth_dependencies import has_permission
-from src.infrastructure.repositories import UserRepositorySQL
+from src.infrastructure.repositories import AsyncUserRepositorySQL
 from src.infrastructure.database.models import UserModel
-from src.infrastructure.database import db_conn
+from src.infrastructure.database import async_db_conn
 
 router = APIRouter(prefix='/users', tags=['users'])
 controller = UserController(
-    user_repository=UserRepositorySQL(
+    user_repository=AsyncUserRepositorySQL(
         model=UserModel,
-        session_factory=db_conn.SessionLocal,
+        session_factory=async_db_conn.SessionLocal,
     )
 )
 
 
 @router.get('/me')
-def get_current_user(
+async def get_current_user(
     token: DecodedJWT = Depends(has_permission(ALL_ROLES))
 ) -> UserResponseDTO:
     """
@@ -33,11 +33,11 @@ def get_current_user(
     Returns the authenticated user's data including profile and preferences.
     Uses the user ID from the JWT token.
     """
-    return controller.get_user(token.user_id)
+    return await controller.get_user(token.user_id)
 
 
 @router.get('/{user_id}')
-def get_user(
+async def get_user(
     user_id: UUID,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES))
 ) -> UserResponseDTO:
@@ -49,11 +49,11 @@ def get_user(
     """
     # TODO: Add authorization check to ensure user can only access their own data
     # For now, any authenticated user can access any user's data
-    return controller.get_user(user_id)
+    return await controller.get_user(user_id)
 
 
 @router.put('/{user_id}')
-def update_user(
+async def update_user(
     user_id: UUID,
     update_data: UpdateUserDTO,
     token: DecodedJWT = Depends(has_permission(ALL_ROLES))
@@ -66,4 +66,4 @@ def update_user(
     """
     # TODO: Add authorization check to ensure user can only update their own data
     # For now, any authenticated user can update any user's data
-    return controller.update_user(user_id, update_data)
+    return await controller.update_user(user_id, update_data)
@@ -0,0 +1,30 @@
+from src.config import settings
+from src.application.helpers.result_cache import ResultCache
+from src.application.ports import Cache
+from src.infrastructure.database import AsyncSQLAlchemyUnitOfWork
+from .memory_cache import InMemoryCache
+from .redis_cache import RedisCache
+
+
+def create_cache(url: str | None, max_size: int) -> Cache:
+    """RedisCache when a URL is configured, InMemoryCache otherwise."""
+    if url:
+        return RedisCache(url)
+    return InMemoryCache(max_size=max_size)
+
+
+def is_cache_enabled(enabled: bool | None, url: str | None) -> bool:
+    """CACHE_ENABLED when set; otherwise only with a shared cache (CACHE_URL), as the in-process one is per worker."""
+    return enabled if enabled is not None else bool(url)
+
+
+# Shared by the controllers; None disables caching
+result_cache: ResultCache | None = (
+    ResultCache(
+        create_cache(settings.CACHE_URL, settings.CACHE_MAX_SIZE),
+        ttl=settings.CACHE_TTL_SECONDS,
+        # Writes drop the cached reads after the request's transaction commits
+        current_unit_of_work=AsyncSQLAlchemyUnitOfWork.current,
+    )
+    if is_cache_enabled(settings.CACHE_ENABLED, settings.CACHE_URL) else None
+)
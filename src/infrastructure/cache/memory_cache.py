@@ -0,0 +1,71 @@
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from src.application.ports import Cache
+from src.common.ttl_cache import TTLCache
+
+
+class InMemoryCache(Cache):
+    """
+    Cache kept in the process memory: TTL + LRU bounded to max_size entries.
+
+    Each worker process has its own copy, so invalidations only reach the worker that
+    handled the write: only for single-worker deployments, use RedisCache when running
+    several workers. Keys leave their tags when they expire, are evicted or invalidated,
+    so the tag index stays bounded by max_size.
+    """
+
+    def __init__(self, max_size: int = 4096, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._entries = TTLCache(max_size=max_size, clock=clock, on_evict=self._forget)
+        self._tags: dict[str, set[str]] = {}
+        self._key_tags: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        return self._entries.get(key)
+
+    def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        # Tagged first, so an entry evicted right away is untagged by _forget
+        with self._lock:
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+                self._key_tags.setdefault(key, set()).add(tag)
+        self._entries.set(key, value, self._clock() + ttl)
+
+    def invalidate_tag(self, tag: str) -> None:
+        with self._lock:
+            keys = self._tags.pop(tag, set())
+            for key in keys:
+                self._untag(key)
+        for key in keys:
+            self._entries.pop(key)
+
+    def _forget(self, key: str) -> None:
+        'Remove an expired or evicted entry from its tags.'
+        with self._lock:
+            self._untag(key)
+
+    def _untag(self, key: str) -> None:
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    # No I/O: a lookup only takes a lock, so the async variants don't need a thread
+
+    async def aget(self, key: str) -> Any | None:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        self.set(key, value, ttl, tags)
+
+    async def ainvalidate_tag(self, tag: str) -> None:
+        self.invalidate_tag(tag)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,101 @@
+import logging
+import pickle
+from collections.abc import Iterable
+from typing import Any
+
+from src.application.ports import Cache
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache(Cache):
+    """
+    Cache on a Redis server (or anything speaking its protocol), shared by all workers.
+
+    Values are pickled; tags are Redis sets of the keys listed under them. A failing
+    server degrades to cache misses instead of failing the request. The async methods
+    use a redis.asyncio client, so async path operations don't block the event loop on
+    the round trips.
+    """
+
+    def __init__(self, url: str, prefix: str = 'smw:', client: Any = None, async_client: Any = None) -> None:
+        if client is None:
+            try:
+                import redis
+                import redis.asyncio
+            except ImportError as ex:
+                raise RuntimeError('CACHE_URL requires the redis package (pip install redis)') from ex
+            client = redis.Redis.from_url(url)
+            if async_client is None:
+                async_client = redis.asyncio.Redis.from_url(url)
+        self.client = client
+        # Without one (a sync client given on its own), the async methods run the sync ones in a thread
+        self.async_client = async_client
+        self.prefix: str = prefix
+
+    def get(self, key: str) -> Any | None:
+        try:
+            raw = self.client.get(self.prefix + key)
+        except Exception as ex:
+            logger.warning(f'Cache get failed: {ex}')
+            return None
+        return None if raw is None else pickle.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        try:
+            pipe = self.client.pipeline()
+            pipe.set(self.prefix + key, pickle.dumps(value), ex=ttl)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, self.prefix + key)
+                pipe.expire(tag_key, ttl)
+            pipe.execute()
+        except Exception as ex:
+            logger.warning(f'Cache set failed: {ex}')
+
+    def invalidate_tag(self, tag: str) -> None:
+        tag_key = self._tag_key(tag)
+        try:
+            keys = self.client.smembers(tag_key)
+            self.client.delete(*keys, tag_key)
+        except Exception as ex:
+            # Entries left behind expire after their ttl
+            logger.error(f'Cache invalidation of {tag} failed: {ex}')
+
+    async def aget(self, key: str) -> Any | None:
+        if self.async_client is None:
+            return await super().aget(key)
+        try:
+            raw = await self.async_client.get(self.prefix + key)
+        except Exception as ex:
+            logger.warning(f'Cache get failed: {ex}')
+            return None
+        return None if raw is None else pickle.loads(raw)
+
+    async def aset(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        if self.async_client is None:
+            return await super().aset(key, value, ttl, tags)
+        try:
+            pipe = self.async_client.pipeline()
+            pipe.set(self.prefix + key, pickle.dumps(value), ex=ttl)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, self.prefix + key)
+                pipe.expire(tag_key, ttl)
+            await pipe.execute()
+        except Exception as ex:
+            logger.warning(f'Cache set failed: {ex}')
+
+    async def ainvalidate_tag(self, tag: str) -> None:
+        if self.async_client is None:
+            return await super().ainvalidate_tag(tag)
+        tag_key = self._tag_key(tag)
+        try:
+            keys = await self.async_client.smembers(tag_key)
+            await self.async_client.delete(*keys, tag_key)
+        except Exception as ex:
+            # Entries left behind expire after their ttl
+            logger.error(f'Cache invalidation of {tag} failed: {ex}')
+
+    def _tag_key(self, tag: str) -> str:
+        return f'{self.prefix}tag:{tag}'
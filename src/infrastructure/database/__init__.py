@@ -1,5 +1,23 @@
 from src.config import settings
 from .database_connection import DatabaseConnection
+from .async_database_connection import AsyncDatabaseConnection
+from .unit_of_work import SQLAlchemyUnitOfWork, AsyncSQLAlchemyUnitOfWork
+from .pool_metrics import PoolMetrics, InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool
 
 
-db_conn = DatabaseConnection(settings.CONN_DB)
+db_conn = DatabaseConnection(
+    settings.CONN_DB,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+async_db_conn = AsyncDatabaseConnection(
+    settings.CONN_DB,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
@@ -0,0 +1,93 @@
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from .pool_metrics import PoolMetrics, InstrumentedAsyncAdaptedQueuePool, attach_pool_metrics
+
+
+# Sync driver -> async driver used for the same database
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'postgresql+psycopg2': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+    'sqlite+pysqlite': 'sqlite+aiosqlite',
+}
+
+
+def to_async_url(str_conn: str) -> str:
+    """Translate a sync connection string (e.g. CONN_DB) to its async driver."""
+    url = make_url(str_conn)
+    drivername = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+class AsyncDatabaseConnection:
+    """
+    Async counterpart of DatabaseConnection (asyncpg on PostgreSQL).
+
+    Takes the same pool settings: its connections count against PostgreSQL
+    max_connections on top of the sync pool's.
+    """
+
+    def __init__(
+        self,
+        str_conn: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: int = 30,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+    ) -> None:
+        self.str_conn: str = to_async_url(str_conn)
+        self.pool_size: int = pool_size
+        self.max_overflow: int = max_overflow
+        self.pool_timeout: int = pool_timeout
+        self.pool_recycle: int = pool_recycle
+        self.pool_pre_ping: bool = pool_pre_ping
+        self.pool_metrics: PoolMetrics = PoolMetrics()
+        self._engine: AsyncEngine | None = None
+        self._SessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_async_engine(self.str_conn, echo=False, **self._get_pool_options())
+            if isinstance(self._engine.pool, InstrumentedAsyncAdaptedQueuePool):
+                self._engine.pool.metrics = self.pool_metrics
+            attach_pool_metrics(self._engine.pool, self.pool_metrics)
+        return self._engine
+
+    @property
+    def SessionLocal(self) -> async_sessionmaker[AsyncSession]:
+        if self._SessionLocal is None:
+            self._SessionLocal = async_sessionmaker(bind=self.engine, expire_on_commit=False, class_=AsyncSession)
+        return self._SessionLocal
+
+    async def test_connection(self) -> bool:
+        try:
+            async with self.engine.connect() as conn:
+                await conn.execute(text('SELECT 1'))
+            return True
+        except Exception:
+            return False
+
+    def get_pool_status(self) -> dict:
+        """Pool saturation metrics (checkout waits, in use and overflow connections)."""
+        return self.pool_metrics.snapshot(self.engine.pool)
+
+    async def dispose(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+
+    def _get_pool_options(self) -> dict:
+        # SQLite picks its own pool, which takes none of the sizing options
+        if make_url(self.str_conn).get_backend_name() == 'sqlite':
+            return {}
+        return {
+            'poolclass': InstrumentedAsyncAdaptedQueuePool,
+            'pool_size': self.pool_size,
+            'max_overflow': self.max_overflow,
+            'pool_timeout': self.pool_timeout,
+            'pool_recycle': self.pool_recycle,
+            'pool_pre_ping': self.pool_pre_ping,
+        }
@@ -2,19 +2,38 @@ from collections.abc import Sequence
 
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine, Row
+from sqlalchemy.engine import Engine, Row, make_url
+
+from .pool_metrics import PoolMetrics, InstrumentedQueuePool, attach_pool_metrics
 
 
 class DatabaseConnection:
-    def __init__(self, str_conn: str) -> None:
+    def __init__(
+        self,
+        str_conn: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: int = 30,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+    ) -> None:
         self.str_conn: str = str_conn
+        self.pool_size: int = pool_size
+        self.max_overflow: int = max_overflow
+        self.pool_timeout: int = pool_timeout
+        self.pool_recycle: int = pool_recycle
+        self.pool_pre_ping: bool = pool_pre_ping
+        self.pool_metrics: PoolMetrics = PoolMetrics()
         self._engine: Engine | None = None
         self._SessionLocal: sessionmaker[Session] | None = None
 
     @property
     def engine(self) -> Engine:
         if self._engine is None:
-            self._engine = create_engine(self.str_conn, future=True, echo=False)
+            self._engine = create_engine(self.str_conn, future=True, echo=False, **self._get_pool_options())
+            if isinstance(self._engine.pool, InstrumentedQueuePool):
+                self._engine.pool.metrics = self.pool_metrics
+            attach_pool_metrics(self._engine.pool, self.pool_metrics)
         return self._engine
 
     @property
@@ -38,3 +57,20 @@ class DatabaseConnection:
             return True
         except Exception:
             return False
+
+    def get_pool_status(self) -> dict:
+        """Pool saturation metrics (checkout waits, in use and overflow connections)."""
+        return self.pool_metrics.snapshot(self.engine.pool)
+
+    def _get_pool_options(self) -> dict:
+        # SQLite picks SingletonThreadPool/StaticPool, which take none of the sizing options
+        if make_url(self.str_conn).get_backend_name() == 'sqlite':
+            return {}
+        return {
+            'poolclass': InstrumentedQueuePool,
+            'pool_size': self.pool_size,
+            'max_overflow': self.max_overflow,
+            'pool_timeout': self.pool_timeout,
+            'pool_recycle': self.pool_recycle,
+            'pool_pre_ping': self.pool_pre_ping,
+        }
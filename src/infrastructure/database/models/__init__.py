@@ -8,6 +8,7 @@ from .expense_category_model import ExpenseCategoryModel
 from .expense_model import ExpenseModel
 from .payment_model import PaymentModel
 from .refresh_token_model import RefreshTokenModel
+from .period_summary_model import PeriodSummaryModel
 
 
 __all__ = [
@@ -21,4 +22,5 @@ __all__ = [
     'ExpenseModel',
     'PaymentModel',
     'RefreshTokenModel',
+    'PeriodSummaryModel',
 ]
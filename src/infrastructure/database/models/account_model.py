@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import String, Boolean, ForeignKey, Numeric, UUID
+from sqlalchemy import String, Boolean, ForeignKey, Index, Numeric, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from typing import TYPE_CHECKING
@@ -25,6 +25,13 @@ class AccountModel(BaseModel):
     owner: Mapped['UserModel'] = relationship('UserModel')
     expenses: Mapped[list['ExpenseModel']] = relationship('ExpenseModel', back_populates='account', cascade='all, delete-orphan')
 
+    # Composite indexes for common queries
+    __table_args__ = (
+        Index('idx_accounts_owner_type', 'owner_id', 'type'),
+        # Keyset (cursor) pagination of an owner's accounts
+        Index('idx_accounts_owner_created_id', 'owner_id', 'created_at', 'id'),
+    )
+
     __mapper_args__ = {
         'polymorphic_on': account_type,
         'polymorphic_identity': 'account'
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import DateTime, UUID
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -17,7 +18,13 @@ class BaseModel(DeclarativeBase):
         nullable=False,
     )
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    # SQLite's CURRENT_TIMESTAMP has no fraction: bind datetimes the same way so keyset
+    # comparisons on (created_at, id) match the stored text
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime().with_variant(sqlite.DATETIME(truncate_microseconds=True), 'sqlite'),
+        server_default=func.now(),
+        nullable=False,
+    )
     updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
 
     def to_dict(self, include_relationships: bool = False) -> dict:
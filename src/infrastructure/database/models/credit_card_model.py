@@ -1,7 +1,7 @@
 from datetime import date
 import uuid
 
-from sqlalchemy import ForeignKey, Date, Numeric, UUID
+from sqlalchemy import ForeignKey, Date, Integer, Numeric, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from . import AccountModel
@@ -16,6 +16,13 @@ class CreditCardModel(AccountModel):
     next_expiring_date: Mapped[date] = mapped_column(Date(), nullable=True)
     financing_limit: Mapped[float] = mapped_column(Numeric(precision=20, scale=2), default=0.0, nullable=True)
 
+    # Usage of the card, kept up to date by the expense and payment repositories
+    used_limit: Mapped[float] = mapped_column(Numeric(precision=20, scale=2), default=0, server_default='0', nullable=False)
+    used_financing_limit: Mapped[float] = mapped_column(Numeric(precision=20, scale=2), default=0, server_default='0', nullable=False)
+    expenses_count: Mapped[int] = mapped_column(Integer(), default=0, server_default='0', nullable=False)
+    purchases_count: Mapped[int] = mapped_column(Integer(), default=0, server_default='0', nullable=False)
+    subscriptions_count: Mapped[int] = mapped_column(Integer(), default=0, server_default='0', nullable=False)
+
     # Relationships
     main_credit_card: Mapped['CreditCardModel'] = relationship(
         'CreditCardModel',
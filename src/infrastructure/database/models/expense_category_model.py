@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import String, ForeignKey, UUID
+from sqlalchemy import String, ForeignKey, Index, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -16,3 +16,8 @@ class ExpenseCategoryModel(BaseModel):
 
     # FKs
     owner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('users.id'))
+
+    __table_args__ = (
+        # Keyset (cursor) pagination of an owner's categories
+        Index('idx_expense_categories_owner_created_id', 'owner_id', 'created_at', 'id'),
+    )
@@ -2,10 +2,8 @@ from datetime import date
 from typing import TYPE_CHECKING
 import uuid
 
-from sqlalchemy import String, Date, Integer, ForeignKey, Numeric, UUID
+from sqlalchemy import String, Date, Integer, ForeignKey, Index, Numeric, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.sql import select
 
 from . import BaseModel
 from .payment_model import PaymentModel
@@ -31,6 +29,8 @@ class ExpenseModel(BaseModel):
     # FKs
     account_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('accounts.id'))
     category_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('expense_categories.id'), nullable=True)
+    # Owner of the account, copied here by the repository on insert and on account change
+    owner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
 
     # Relationships
     payments: Mapped[list['PaymentModel']] = relationship(
@@ -38,14 +38,13 @@ class ExpenseModel(BaseModel):
     account: Mapped['AccountModel'] = relationship('AccountModel', back_populates='expenses')
     category: Mapped['ExpenseCategoryModel'] = relationship('ExpenseCategoryModel')
 
-    # Computed fields
-    @hybrid_property
-    def owner_id(self):  # type: ignore[reportRedeclaration]
-        return self.account.owner_id
-
-    @owner_id.expression
-    def owner_id(cls):
-        return select(AccountModel.owner_id).where(AccountModel.id == cls.account_id).scalar_subquery()
+    # Composite indexes for common queries
+    __table_args__ = (
+        Index('idx_expenses_account_type_status', 'account_id', 'expense_type', 'status'),
+        # Keyset (cursor) pagination of the owner's expenses, and of one account's
+        Index('idx_expenses_owner_created_id', 'owner_id', 'created_at', 'id'),
+        Index('idx_expenses_account_created_id', 'account_id', 'created_at', 'id'),
+    )
 
     def __repr__(self) -> str:
         return f'Expense: {self.title}'
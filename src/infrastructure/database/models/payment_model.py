@@ -1,7 +1,7 @@
 from datetime import date
 import uuid
 
-from sqlalchemy import Float, Integer, String, Date, ForeignKey, UUID
+from sqlalchemy import Numeric, Integer, String, Date, ForeignKey, Index, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from . import BaseModel
@@ -12,7 +12,7 @@ class PaymentModel(BaseModel):
     __tablename__ = 'payments'
 
     status: Mapped[str] = mapped_column(String(20), default=PaymentStatus.UNCONFIRMED.value, nullable=False)
-    amount: Mapped[float] = mapped_column(Float(precision=2), default=0.0, nullable=False)
+    amount: Mapped[float] = mapped_column(Numeric(precision=20, scale=2), default=0.0, nullable=False)
     no_installment: Mapped[int] = mapped_column(Integer(), nullable=False)
     payment_date: Mapped[date] = mapped_column(Date(), nullable=True)
     is_last_payment: Mapped[bool] = mapped_column(default=False, nullable=False)
@@ -20,6 +20,12 @@ class PaymentModel(BaseModel):
     # FK
     expense_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('expenses.id'))
 
+    # Composite indexes for common queries
+    __table_args__ = (
+        Index('idx_payments_expense_installment', 'expense_id', 'no_installment'),
+        Index('idx_payments_payment_date', 'payment_date'),
+    )
+
     def __repr__(self) -> str:
         return f'Payment N° {self.no_installment} for expense {self.expense_id}'
 
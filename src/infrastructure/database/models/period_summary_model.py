@@ -0,0 +1,31 @@
+import uuid
+
+from sqlalchemy import ForeignKey, Index, Integer, Numeric, UniqueConstraint, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from . import BaseModel
+
+
+class PeriodSummaryModel(BaseModel):
+    """
+    Totals of the payments of an account in a month, kept current by the expense and
+    payment repositories on write (see period_summary_sql.track_period_summaries).
+    """
+    __tablename__ = 'period_summaries'
+
+    owner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    account_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False)
+    year: Mapped[int] = mapped_column(Integer(), nullable=False)
+    month: Mapped[int] = mapped_column(Integer(), nullable=False)
+
+    total_amount: Mapped[float] = mapped_column(Numeric(precision=20, scale=2), default=0, nullable=False)
+    total_confirmed_amount: Mapped[float] = mapped_column(Numeric(precision=20, scale=2), default=0, nullable=False)
+    total_paid_amount: Mapped[float] = mapped_column(Numeric(precision=20, scale=2), default=0, nullable=False)
+    total_pending_amount: Mapped[float] = mapped_column(Numeric(precision=20, scale=2), default=0, nullable=False)
+    total_payments: Mapped[int] = mapped_column(Integer(), default=0, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('owner_id', 'account_id', 'year', 'month', name='uq_period_summaries_owner_account_period'),
+        # Owner's months in a range (dashboard charts) are a single range scan
+        Index('idx_period_summaries_owner_period', 'owner_id', 'year', 'month'),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import UUID, String
+from sqlalchemy import UUID, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -13,6 +13,8 @@ class UserModel(BaseModel):
     username: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(String(20), nullable=False)
+    # Bumped by every write to the user's cards, expenses, payments and categories (ETags)
+    data_version: Mapped[int] = mapped_column(Integer(), default=0, server_default='0', nullable=False)
 
     # Relationships
     profile: Mapped['ProfileModel'] = relationship('ProfileModel', back_populates='user', uselist=False, cascade='all, delete-orphan')
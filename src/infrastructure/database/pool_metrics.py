@@ -0,0 +1,100 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolMetrics:
+    """Thread-safe counters for a connection pool (checkout waits, timeouts, connections)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts: int = 0
+        self.checkout_timeouts: int = 0
+        self.checkout_wait_total: float = 0.0
+        self.checkout_wait_max: float = 0.0
+        self.connections_opened: int = 0
+        self.connections_invalidated: int = 0
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait_total += wait
+            if wait > self.checkout_wait_max:
+                self.checkout_wait_max = wait
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_invalidate(self) -> None:
+        with self._lock:
+            self.connections_invalidated += 1
+
+    def snapshot(self, pool: Pool) -> dict:
+        """Counters plus the live state of the pool (in use, idle and overflow connections)."""
+        with self._lock:
+            data = {
+                'pool_class': type(pool).__name__,
+                'checkouts': self.checkouts,
+                'checkout_timeouts': self.checkout_timeouts,
+                'checkout_wait_total_ms': round(self.checkout_wait_total * 1000, 3),
+                'checkout_wait_avg_ms': round(self.checkout_wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                'checkout_wait_max_ms': round(self.checkout_wait_max * 1000, 3),
+                'connections_opened': self.connections_opened,
+                'connections_invalidated': self.connections_invalidated,
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                'pool_size': pool.size(),
+                'checked_out': pool.checkedout(),
+                'checked_in': pool.checkedin(),
+                'overflow': max(pool.overflow(), 0),
+                'max_overflow': pool._max_overflow,
+            })
+        return data
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that measures how long each checkout waits for a connection.
+
+    Pool events fire once a connection is already handed out, so the wait (time spent
+    blocked on a saturated pool) is measured around _do_get instead.
+    """
+
+    def __init__(self, *args, metrics: PoolMetrics | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics: PoolMetrics = metrics or PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start)
+        return conn
+
+    def recreate(self) -> 'InstrumentedQueuePool':
+        # Keep counting into the same metrics after engine.dispose()
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics  # type: ignore[attr-defined]
+        return new_pool  # type: ignore[return-value]
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """InstrumentedQueuePool for async engines (create_async_engine rejects non-asyncio pools)."""
+
+
+def attach_pool_metrics(pool: Pool, metrics: PoolMetrics) -> None:
+    """Count new and invalidated DBAPI connections on any pool through pool events."""
+    event.listen(pool, 'connect', lambda dbapi_conn, record: metrics.record_connect())
+    event.listen(pool, 'invalidate', lambda dbapi_conn, record, exception: metrics.record_invalidate())
@@ -0,0 +1,140 @@
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar, Token
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
+
+from src.application.ports import UnitOfWork, AsyncUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+_current_unit_of_work: ContextVar['SQLAlchemyUnitOfWork | None'] = ContextVar('current_unit_of_work', default=None)
+_current_async_unit_of_work: ContextVar['AsyncSQLAlchemyUnitOfWork | None'] = ContextVar('current_async_unit_of_work', default=None)
+
+
+class SQLAlchemyUnitOfWork(UnitOfWork):
+    """
+    Unit of Work backed by a single SQLAlchemy session.
+
+    While active (bound to the current context), repositories built with the same
+    session factory reuse its session and only flush; the unit of work commits once.
+    The session is opened lazily, so requests that don't touch the database don't
+    check out a connection.
+    """
+
+    def __init__(self, session_factory: sessionmaker[Session]) -> None:
+        self.session_factory = session_factory
+        self._session: Session | None = None
+        self._token: Token | None = None
+        self._after_commit: list[Callable[[], None]] = []
+
+    @staticmethod
+    def current() -> 'SQLAlchemyUnitOfWork | None':
+        return _current_unit_of_work.get()
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
+
+    def owns(self, session: Session) -> bool:
+        return self._session is not None and self._session is session
+
+    def begin(self) -> None:
+        self._token = _current_unit_of_work.set(self)
+
+    def end(self) -> None:
+        self._after_commit.clear()
+        try:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+        finally:
+            if self._token is not None:
+                _current_unit_of_work.reset(self._token)
+                self._token = None
+
+    def commit(self) -> None:
+        if self._session is not None:
+            self._session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as ex:
+                # The data is committed already; a failed follow-up must not fail the request
+                logger.error(f'After commit callback failed: {ex}')
+
+    def rollback(self) -> None:
+        self._after_commit.clear()
+        if self._session is not None:
+            self._session.rollback()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self._after_commit.append(callback)
+
+
+class AsyncSQLAlchemyUnitOfWork(AsyncUnitOfWork):
+    """
+    AsyncSession counterpart of SQLAlchemyUnitOfWork.
+
+    While active, async repositories built with the same session factory reuse its
+    session and only flush; the unit of work commits once. The session is opened lazily.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self.session_factory = session_factory
+        self._session: AsyncSession | None = None
+        self._token: Token | None = None
+        self._after_commit: list[Callable[[], Awaitable[None] | None]] = []
+
+    @staticmethod
+    def current() -> 'AsyncSQLAlchemyUnitOfWork | None':
+        return _current_async_unit_of_work.get()
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
+
+    def owns(self, session: AsyncSession) -> bool:
+        return self._session is not None and self._session is session
+
+    def begin(self) -> None:
+        self._token = _current_async_unit_of_work.set(self)
+
+    async def end(self) -> None:
+        self._after_commit.clear()
+        try:
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
+        finally:
+            if self._token is not None:
+                _current_async_unit_of_work.reset(self._token)
+                self._token = None
+
+    async def commit(self) -> None:
+        if self._session is not None:
+            await self._session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as ex:
+                # The data is committed already; a failed follow-up must not fail the request
+                logger.error(f'After commit callback failed: {ex}')
+
+    async def rollback(self) -> None:
+        self._after_commit.clear()
+        if self._session is not None:
+            await self._session.rollback()
+
+    def after_commit(self, callback: Callable[[], Awaitable[None] | None]) -> None:
+        self._after_commit.append(callback)
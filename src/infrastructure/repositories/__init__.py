@@ -1,16 +1,28 @@
 from .base_repository_sql import BaseRepositorySQL
+from .async_base_repository_sql import AsyncBaseRepositorySQL
 from .user_repository_sql import UserRepositorySQL
+from .async_user_repository_sql import AsyncUserRepositorySQL
 from .credit_card_repository_sql import CreditCardRepositorySQL
+from .async_credit_card_repository_sql import AsyncCreditCardRepositorySQL
 from .expense_category_repository_sql import ExpenseCategoryRepositorySQL
+from .async_expense_category_repository_sql import AsyncExpenseCategoryRepositorySQL
 from .expense_repository_sql import ExpenseRepositorySQL
+from .async_expense_repository_sql import AsyncExpenseRepositorySQL
 from .payment_repository_sql import PaymentRepositorySQL
+from .async_payment_repository_sql import AsyncPaymentRepositorySQL
 
 
 __all__ = [
     'BaseRepositorySQL',
+    'AsyncBaseRepositorySQL',
     'UserRepositorySQL',
+    'AsyncUserRepositorySQL',
     'CreditCardRepositorySQL',
+    'AsyncCreditCardRepositorySQL',
     'ExpenseCategoryRepositorySQL',
+    'AsyncExpenseCategoryRepositorySQL',
     'ExpenseRepositorySQL',
+    'AsyncExpenseRepositorySQL',
     'PaymentRepositorySQL',
+    'AsyncPaymentRepositorySQL',
 ]
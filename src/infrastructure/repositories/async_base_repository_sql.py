@@ -0,0 +1,173 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, nullcontext
+from typing import AsyncContextManager
+
+from sqlalchemy import Select, select, delete, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.ports import AsyncBaseRepository, CursorKey
+from ..database import async_db_conn, AsyncSQLAlchemyUnitOfWork
+from ..database.models import BaseModel
+from .base_repository_sql import SQLRepositoryMixin, ModelType, EntityType, apply_cursor, split_cursor_page
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBaseRepositorySQL(SQLRepositoryMixin[ModelType, EntityType], AsyncBaseRepository[EntityType]):
+    """
+    AsyncSession counterpart of BaseRepositorySQL.
+
+    Relationships can't be lazy loaded on an AsyncSession, so everything the entity
+    parser touches must come from _get_load_options (or be noload'ed).
+    """
+
+    def __init__(self, model: type[ModelType], session_factory: async_sessionmaker[AsyncSession] = async_db_conn.SessionLocal) -> None:
+        self.session_factory: async_sessionmaker[AsyncSession] = session_factory
+        self.model: type[ModelType] = model
+
+    async def count_by_filter(self, filter: dict = {}) -> int:
+        try:
+            async with self._session() as session:
+                stmt = select(func.count()).select_from(self.model).filter_by(**self._strip_load_option_fields(filter))
+                return (await session.execute(stmt)).scalar_one()
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+
+    async def create(self, entity: EntityType) -> EntityType:
+        try:
+            async with self._session() as session:
+                new_resource: BaseModel = self._parse_entity_to_model(entity)
+                async with self._track_writes(session, {'id': entity.id}):
+                    session.add(new_resource)
+                await self._commit(session)
+                created = await self._get_one(session, {'id': new_resource.id})
+                return self._parse_model_to_entity(created)  # type: ignore[arg-type]
+        except Exception as ex:
+            logger.critical(f'{self.model} - create - {ex.args}')
+            raise ex
+
+    async def get_many_by_filter(self, filter: dict, limit: int, offset: int) -> list[EntityType]:
+        try:
+            async with self._session() as session:
+                stmt = self._get_filtered_stmt(filter)
+                if filter.get('order_by'):
+                    stmt = stmt.order_by(self._get_order_by_params(filter))
+                stmt = stmt.limit(limit).offset(offset)
+                result_list = (await session.scalars(stmt)).all()
+                return [self._parse_model_to_entity(item) for item in result_list]
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+
+    async def get_page_by_filter(self, filter: dict, limit: int, offset: int) -> tuple[list[EntityType], int]:
+        """Same page as get_many_by_filter with COUNT(*) OVER() as the total, like BaseRepositorySQL.get_page_by_filter."""
+        try:
+            async with self._session() as session:
+                stmt = self._get_filtered_stmt(filter)
+                if filter.get('order_by'):
+                    stmt = stmt.order_by(self._get_order_by_params(filter))
+                stmt = stmt.add_columns(func.count().over().label('total_count')).limit(limit).offset(offset)
+                rows = (await session.execute(stmt)).all()
+            if not rows:
+                # An offset past the last row returns no row to read the total from
+                return [], await self.count_by_filter(filter) if offset else 0
+            return [self._parse_model_to_entity(row[0]) for row in rows], rows[0].total_count
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+
+    async def get_many_by_cursor(self, filter: dict, limit: int, after: CursorKey | None = None) -> tuple[list[EntityType], CursorKey | None]:
+        try:
+            async with self._session() as session:
+                stmt = apply_cursor(self._get_filtered_stmt(filter), self.model, limit, after)
+                rows, next_key = split_cursor_page((await session.scalars(stmt)).all(), limit)
+                return [self._parse_model_to_entity(row) for row in rows], next_key
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+
+    async def get_by_filter(self, filter: dict) -> EntityType | None:
+        try:
+            async with self._session() as session:
+                result = await self._get_one(session, filter)
+                return self._parse_model_to_entity(result) if result else None
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+
+    async def update(self, entity: EntityType) -> EntityType:
+        try:
+            async with self._session() as session:
+                existing_data = await self._get_one(session, {'id': entity.id})
+                if not existing_data:
+                    raise ValueError(f'No record found with id {entity.id}')
+
+                async with self._track_writes(session, {'id': entity.id}):
+                    self._apply_entity_to_model(entity, existing_data)
+
+                await self._commit(session)
+                return self._parse_model_to_entity(existing_data)
+        except IntegrityError as err:
+            logger.error(err.args)
+            logger.error(f'Data with error: {str(entity.to_dict())}')
+            raise err
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+
+    async def delete_by_filter(self, filter: dict) -> None:
+        try:
+            async with self._session() as session:
+                async with self._track_writes(session, filter):
+                    result = await session.execute(delete(self.model).filter_by(**filter))
+                if result.rowcount == 0:  # type: ignore[attr-defined]
+                    raise ValueError(f'No records found matching filter {filter}')
+                await self._commit(session)
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+
+    def _get_filtered_stmt(self, filter: dict) -> Select:
+        stmt = select(self.model).options(*self._get_load_options(filter))
+        search_filter = self._get_filter_params(filter)
+        if search_filter:
+            stmt = stmt.filter_by(**search_filter)
+        return stmt
+
+    async def _get_one(self, session: AsyncSession, filter: dict) -> ModelType | None:
+        stmt = (
+            select(self.model)
+            .options(*self._get_load_options(filter))
+            .filter_by(**self._strip_load_option_fields(filter))
+            .limit(1)
+            .execution_options(populate_existing=True)
+        )
+        return (await session.scalars(stmt)).first()
+
+    def _track_writes(self, session: AsyncSession, filter: dict) -> AsyncContextManager[None]:
+        """
+        Context wrapped around create, update and delete of the rows matching filter, before
+        the commit (see BaseRepositorySQL._track_writes and async_trackers_sql). Nothing by default.
+        """
+        return nullcontext()
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        """Yield the active async unit of work session, or a new session owned by this call."""
+        unit_of_work = AsyncSQLAlchemyUnitOfWork.current()
+        if unit_of_work is not None and unit_of_work.session_factory is self.session_factory:
+            yield unit_of_work.session
+        else:
+            async with self.session_factory() as session:
+                yield session
+
+    async def _commit(self, session: AsyncSession) -> None:
+        """Commit, or only flush when the unit of work owns the transaction."""
+        unit_of_work = AsyncSQLAlchemyUnitOfWork.current()
+        if unit_of_work is not None and unit_of_work.owns(session):
+            await session.flush()
+        else:
+            await session.commit()
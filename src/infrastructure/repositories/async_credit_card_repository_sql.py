@@ -0,0 +1,77 @@
+import logging
+from uuid import UUID
+
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .async_base_repository_sql import AsyncBaseRepositorySQL
+from .async_trackers_sql import track_owned_writes
+from .credit_card_repository_sql import CreditCardSQLMixin
+from src.infrastructure.database.models import CreditCardModel, AccountModel
+from src.application.ports import AsyncCreditCardRepository
+from src.domain.account import CreditCard as CreditCardEntity
+from src.domain.expense import PeriodPayment, PeriodSummary
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCreditCardRepositorySQL(CreditCardSQLMixin, AsyncBaseRepositorySQL[CreditCardModel, CreditCardEntity], AsyncCreditCardRepository):
+    def _track_writes(self, session: AsyncSession, filter: dict):
+        return track_owned_writes(session, CreditCardModel, filter)
+
+    async def get_period_payments(self, owner_id: UUID, month: int, year: int) -> list[PeriodPayment]:
+        """Async version of CreditCardRepositorySQL.get_period_payments (same single SELECT)."""
+        stmt = self._get_period_payments_stmt(owner_id, month, year)
+        try:
+            async with self._session() as session:
+                rows = (await session.execute(stmt)).all()
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+        return self._parse_period_rows(rows, month, year)
+
+    async def get_category_names(self, owner_id: UUID) -> dict[UUID, str]:
+        """Async version of CreditCardRepositorySQL.get_category_names (same single SELECT)."""
+        stmt = self._get_category_names_stmt(owner_id)
+        try:
+            async with self._session() as session:
+                rows = (await session.execute(stmt)).all()
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+        return {row.id: row.name for row in rows}
+
+    async def get_period_summaries(self, owner_id: UUID, month: int, year: int, months: int) -> list[PeriodSummary]:
+        """Async version of CreditCardRepositorySQL.get_period_summaries (same single SELECT)."""
+        stmt = self._get_period_summaries_stmt(owner_id, month, year, months)
+        try:
+            async with self._session() as session:
+                rows = (await session.execute(stmt)).all()
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+        return self._parse_period_summary_rows(rows, month, year, months)
+
+    async def delete_by_filter(self, filter: dict) -> None:
+        """
+        Override delete to properly handle joined table inheritance.
+        
+        Deletes the Account record, which cascades to CreditCard due to FK constraint.
+        """
+        try:
+            async with self._session() as session:
+                account_id = (await session.execute(
+                    select(CreditCardModel.account_id).filter_by(**filter).limit(1)
+                )).scalar_one_or_none()
+                if account_id is None:
+                    raise ValueError(f'No credit card found matching filter {filter}')
+
+                # Delete the Account record (cascades to CreditCard via FK)
+                async with self._track_writes(session, {'id': account_id}):
+                    await session.execute(delete(CreditCardModel.__table__).where(CreditCardModel.account_id == account_id))
+                    await session.execute(delete(AccountModel).where(AccountModel.id == account_id))
+                await self._commit(session)
+                logger.info(f'Successfully deleted credit card and its account with filter {filter}')
+        except Exception as ex:
+            logger.error(f'Error deleting credit card: {ex.args}')
+            raise ex
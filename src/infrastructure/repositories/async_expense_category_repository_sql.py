@@ -0,0 +1,33 @@
+import logging
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .async_base_repository_sql import AsyncBaseRepositorySQL
+from .async_trackers_sql import track_owned_writes
+from .expense_category_repository_sql import ExpenseCategorySQLMixin
+from src.infrastructure.database.models import ExpenseCategoryModel
+from src.domain.expense import ExpenseCategory
+from src.application.ports import AsyncExpenseCategoryRepository
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncExpenseCategoryRepositorySQL(ExpenseCategorySQLMixin, AsyncBaseRepositorySQL[ExpenseCategoryModel, ExpenseCategory], AsyncExpenseCategoryRepository):
+    def _track_writes(self, session: AsyncSession, filter: dict):
+        # Category names are part of the expense and period payloads
+        return track_owned_writes(session, ExpenseCategoryModel, filter)
+
+    async def get_owned_ids(self, owner_id: UUID, category_ids: Iterable[UUID]) -> set[UUID]:
+        """Async version of ExpenseCategoryRepositorySQL.get_owned_ids (same single SELECT)."""
+        category_ids = set(category_ids)
+        if not category_ids:
+            return set()
+        stmt = self._get_owned_ids_stmt(owner_id, category_ids)
+        try:
+            async with self._session() as session:
+                return set(await session.scalars(stmt))
+        except Exception as ex:
+            logger.error(f'Error reading the categories of {owner_id}: {ex.args}')
+            raise ex
@@ -0,0 +1,134 @@
+import logging
+from collections.abc import AsyncIterator, Iterable
+from uuid import UUID
+
+from sqlalchemy import select, insert, delete, func
+
+from .async_base_repository_sql import AsyncBaseRepositorySQL
+from .async_trackers_sql import track_expense_writes
+from .expense_repository_sql import ExpenseSQLMixin
+from src.infrastructure.database.models import ExpenseModel, PaymentModel
+from src.domain.expense import PeriodPayment, Expense as ExpenseEntity
+from src.application.ports import AsyncExpenseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncExpenseRepositorySQL(ExpenseSQLMixin, AsyncBaseRepositorySQL[ExpenseModel, ExpenseEntity], AsyncExpenseRepository):
+    """
+    AsyncSession counterpart of ExpenseRepositorySQL. The payment diff of update runs the
+    shared _sync_payments on the AsyncSession's sync session (AsyncSession.run_sync).
+    """
+
+    async def create(self, entity: ExpenseEntity) -> ExpenseEntity:
+        try:
+            async with self._session() as session:
+                async with track_expense_writes(session, [entity.id]):
+                    session.add(self._parse_entity_to_model(entity))
+                    await session.flush()
+                    session.add_all(self._parse_payments_to_models(entity))
+
+                await self._commit(session)
+                created_expense = await self._get_one(session, {'id': entity.id})
+                return self._parse_model_to_entity(created_expense)
+        except Exception as ex:
+            logger.error(f'Error creating expense: {ex.args}')
+            raise ex
+
+    async def create_many(self, entities: list[ExpenseEntity]) -> None:
+        """Async version of ExpenseRepositorySQL.create_many (one executemany INSERT per table)."""
+        if not entities:
+            return
+        try:
+            async with self._session() as session:
+                owner_ids = dict((await session.execute(self._get_account_owners_stmt(entities))).tuples().all())
+                expense_rows, payment_rows = self._parse_many_to_rows(entities, owner_ids)
+                async with track_expense_writes(session, [entity.id for entity in entities]):
+                    await session.execute(insert(ExpenseModel), expense_rows)
+                    if payment_rows:
+                        await session.execute(insert(PaymentModel), payment_rows)
+                await self._commit(session)
+        except Exception as ex:
+            logger.error(f'Error creating {len(entities)} expenses: {ex.args}')
+            raise ex
+
+    async def get_owned_account_ids(self, owner_id: UUID, account_ids: Iterable[UUID]) -> set[UUID]:
+        """Async version of ExpenseRepositorySQL.get_owned_account_ids (same single SELECT)."""
+        account_ids = set(account_ids)
+        if not account_ids:
+            return set()
+        stmt = self._get_owned_account_ids_stmt(owner_id, account_ids)
+        try:
+            async with self._session() as session:
+                return set(await session.scalars(stmt))
+        except Exception as ex:
+            logger.error(f'Error reading the accounts of {owner_id}: {ex.args}')
+            raise ex
+
+    async def update(self, entity: ExpenseEntity) -> ExpenseEntity:
+        """Update the expense and write only the payments that changed, like ExpenseRepositorySQL.update."""
+        try:
+            async with self._session() as session:
+                async with track_expense_writes(session, [entity.id]):
+                    expense_model = (await session.scalars(select(self.model).filter_by(id=entity.id).limit(1))).first()
+                    if not expense_model:
+                        raise ValueError(f'Expense with id {entity.id} not found')
+
+                    self._apply_entity_to_expense(entity, expense_model)
+
+                    # Flush expense updates before writing payments to avoid autoflush issues
+                    await session.flush()
+                    await session.run_sync(self._sync_payments, entity)
+
+                await self._commit(session)
+
+                # Reload with payments
+                updated_expense = await self._get_one(session, {'id': entity.id})
+                return self._parse_model_to_entity(updated_expense)
+        except Exception as ex:
+            logger.error(f'Error updating expense: {ex.args}')
+            raise ex
+
+    async def count_by_filter(self, filter: dict = {}) -> int:
+        """Count only on the filter fields, like ExpenseRepositorySQL.count_by_filter."""
+        try:
+            async with self._session() as session:
+                stmt = select(func.count()).select_from(self.model).filter_by(**self._get_filter_params(filter))
+                return (await session.execute(stmt)).scalar_one()
+        except Exception as ex:
+            logger.error(f'Error in count_by_filter: {ex.args}')
+            raise ex
+
+    async def iter_payment_history(self, owner_id: UUID, batch_size: int = 1000) -> AsyncIterator[PeriodPayment]:
+        """
+        Async version of ExpenseRepositorySQL.iter_payment_history: the rows are streamed
+        (AsyncSession.stream) batch_size at a time, in constant memory.
+        """
+        stmt = self._get_payment_history_stmt(owner_id, batch_size)
+        try:
+            async with self._session() as session:
+                result = await session.stream(stmt)
+                async for row in result:
+                    yield self._parse_payment_history_row(row)
+        except Exception as ex:
+            logger.error(f'Error in iter_payment_history: {ex.args}')
+            raise ex
+
+    async def delete_by_filter(self, filter: dict) -> None:
+        """Delete the expense and its payments, like ExpenseRepositorySQL.delete_by_filter."""
+        try:
+            async with self._session() as session:
+                expense_id = (await session.execute(
+                    select(self.model.id).filter_by(**filter).limit(1)
+                )).scalar_one_or_none()
+                if expense_id is None:
+                    raise ValueError(f'No expense found matching filter {filter}')
+
+                async with track_expense_writes(session, [expense_id]):
+                    # Delete associated payments first
+                    await session.execute(delete(PaymentModel).where(PaymentModel.expense_id == expense_id))
+                    await session.execute(delete(self.model).where(self.model.id == expense_id))
+                await self._commit(session)
+        except Exception as ex:
+            logger.error(f'Error deleting expense: {ex.args}')
+            raise ex
@@ -0,0 +1,66 @@
+import logging
+
+from sqlalchemy import select, delete
+from sqlalchemy.exc import IntegrityError
+
+from .async_base_repository_sql import AsyncBaseRepositorySQL
+from .async_trackers_sql import track_expense_writes
+from .payment_repository_sql import PaymentSQLMixin
+from src.infrastructure.database.models import PaymentModel
+from src.application.ports import AsyncPaymentRepository
+from src.domain.expense import Payment as PaymentEntity
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPaymentRepositorySQL(PaymentSQLMixin, AsyncBaseRepositorySQL[PaymentModel, PaymentEntity], AsyncPaymentRepository):
+    """
+    Async payments repository. Writes are wrapped in track_expense_writes, the async form of
+    the trackers PaymentRepositorySQL uses.
+    """
+
+    async def create(self, entity: PaymentEntity) -> PaymentEntity:
+        try:
+            async with self._session() as session:
+                async with track_expense_writes(session, [entity.expense_id]):
+                    new_resource = self._parse_entity_to_model(entity)
+                    session.add(new_resource)
+                await self._commit(session)
+                created = await self._get_one(session, {'id': entity.id})
+                return self._parse_model_to_entity(created)  # type: ignore[arg-type]
+        except Exception as ex:
+            logger.critical(f'{self.model} - create - {ex.args}')
+            raise ex
+
+    async def update(self, entity: PaymentEntity) -> PaymentEntity:
+        try:
+            async with self._session() as session:
+                existing_data = await self._get_one(session, {'id': entity.id})
+                if not existing_data:
+                    raise ValueError(f'No record found with id {entity.id}')
+                async with track_expense_writes(session, {existing_data.expense_id, entity.expense_id}):
+                    self._apply_entity_to_model(entity, existing_data)
+                await self._commit(session)
+                return self._parse_model_to_entity(existing_data)
+        except IntegrityError as err:
+            logger.error(err.args)
+            logger.error(f'Data with error: {str(entity.to_dict())}')
+            raise err
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+
+    async def delete_by_filter(self, filter: dict) -> None:
+        try:
+            async with self._session() as session:
+                expense_ids = (await session.scalars(
+                    select(PaymentModel.expense_id).filter_by(**filter).distinct()
+                )).all()
+                async with track_expense_writes(session, expense_ids):
+                    result = await session.execute(delete(PaymentModel).filter_by(**filter))
+                if result.rowcount == 0:  # type: ignore[attr-defined]
+                    raise ValueError(f'No records found matching filter {filter}')
+                await self._commit(session)
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
@@ -0,0 +1,136 @@
+"""Async RefreshToken Repository SQL Implementation"""
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.ports import CursorKey, AsyncRefreshTokenRepository
+from src.domain.auth import RefreshToken
+from src.infrastructure.database.models import RefreshTokenModel
+from src.infrastructure.database import async_db_conn
+from .base_repository_sql import apply_cursor, split_cursor_page
+from .refresh_token_repository_sql import RefreshTokenSQLMixin
+
+
+class AsyncRefreshTokenRepositorySQL(RefreshTokenSQLMixin, AsyncRefreshTokenRepository):
+    """AsyncSession implementation of AsyncRefreshTokenRepository"""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] = async_db_conn.SessionLocal):
+        self.session_factory = session_factory
+
+    async def create(self, entity: RefreshToken) -> RefreshToken:
+        """Create a new refresh token"""
+        async with self.session_factory() as db:
+            model = self._to_model(entity)
+            db.add(model)
+            await db.commit()
+            await db.refresh(model)
+            return self._to_domain(model)
+
+    async def update(self, entity: RefreshToken) -> RefreshToken:
+        """Update a refresh token"""
+        async with self.session_factory() as db:
+            model = (await db.scalars(select(RefreshTokenModel).where(RefreshTokenModel.id == entity.id))).first()
+            if not model:
+                raise ValueError(f"RefreshToken with id {entity.id} not found")
+
+            model.revoked = entity.revoked
+            model.revoked_at = entity.revoked_at
+
+            await db.commit()
+            await db.refresh(model)
+            return self._to_domain(model)
+
+    async def count_by_filter(self, filter: dict) -> int:
+        """Count refresh tokens by filter"""
+        async with self.session_factory() as db:
+            stmt = select(func.count()).select_from(RefreshTokenModel).filter_by(**filter)
+            return (await db.execute(stmt)).scalar_one()
+
+    async def get_many_by_filter(self, filter: dict, limit: int, offset: int) -> list[RefreshToken]:
+        """Get multiple refresh tokens by filter with pagination"""
+        async with self.session_factory() as db:
+            stmt = select(RefreshTokenModel).filter_by(**filter).limit(limit).offset(offset)
+            return [self._to_domain(model) for model in (await db.scalars(stmt)).all()]
+
+    async def get_page_by_filter(self, filter: dict, limit: int, offset: int) -> tuple[list[RefreshToken], int]:
+        """Get a page of refresh tokens by filter and their total in one query"""
+        async with self.session_factory() as db:
+            stmt = (
+                select(RefreshTokenModel, func.count().over().label('total_count'))
+                .filter_by(**filter).limit(limit).offset(offset)
+            )
+            rows = (await db.execute(stmt)).all()
+        if not rows:
+            return [], await self.count_by_filter(filter) if offset else 0
+        return [self._to_domain(row[0]) for row in rows], rows[0].total_count
+
+    async def get_many_by_cursor(self, filter: dict, limit: int, after: Optional[CursorKey] = None) -> tuple[list[RefreshToken], Optional[CursorKey]]:
+        """Get refresh tokens by filter in (created_at, id) order, after the given position"""
+        async with self.session_factory() as db:
+            stmt = apply_cursor(select(RefreshTokenModel).filter_by(**filter), RefreshTokenModel, limit, after)
+            models, next_key = split_cursor_page((await db.scalars(stmt)).all(), limit)
+            return [self._to_domain(model) for model in models], next_key
+
+    async def get_by_filter(self, filter: dict) -> Optional[RefreshToken]:
+        """Get a single refresh token by filter"""
+        async with self.session_factory() as db:
+            model = (await db.scalars(select(RefreshTokenModel).filter_by(**filter).limit(1))).first()
+            return self._to_domain(model) if model else None
+
+    async def delete_by_filter(self, filter: dict) -> None:
+        """Delete refresh tokens by filter"""
+        async with self.session_factory() as db:
+            await db.execute(delete(RefreshTokenModel).filter_by(**filter), execution_options={'synchronize_session': False})
+            await db.commit()
+
+    async def find_by_token_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        """Find a refresh token by its hash"""
+        async with self.session_factory() as db:
+            model = (await db.scalars(
+                select(RefreshTokenModel).where(RefreshTokenModel.token_hash == token_hash).limit(1)
+            )).first()
+            return self._to_domain(model) if model else None
+
+    async def find_active_by_user(self, user_id: UUID) -> list[RefreshToken]:
+        """Find all active refresh tokens for a user"""
+        async with self.session_factory() as db:
+            models = (await db.scalars(select(RefreshTokenModel).where(
+                and_(
+                    RefreshTokenModel.user_id == user_id,
+                    RefreshTokenModel.revoked == False,
+                    RefreshTokenModel.expires_at > datetime.now(timezone.utc)
+                )
+            ))).all()
+            return [self._to_domain(model) for model in models]
+
+    async def revoke_all_by_user(self, user_id: UUID) -> int:
+        """Revoke all refresh tokens for a user"""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(RefreshTokenModel)
+                .where(
+                    and_(
+                        RefreshTokenModel.user_id == user_id,
+                        RefreshTokenModel.revoked == False
+                    )
+                )
+                .values(revoked=True, revoked_at=datetime.now(timezone.utc)),
+                execution_options={'synchronize_session': False},
+            )
+
+            await db.commit()
+            return result.rowcount  # type: ignore[attr-defined]
+
+    async def delete_expired(self) -> int:
+        """Delete all expired refresh tokens"""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                delete(RefreshTokenModel).where(RefreshTokenModel.expires_at < datetime.now(timezone.utc)),
+                execution_options={'synchronize_session': False},
+            )
+
+            await db.commit()
+            return result.rowcount  # type: ignore[attr-defined]
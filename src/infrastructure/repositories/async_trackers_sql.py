@@ -0,0 +1,63 @@
+"""
+Write trackers for the async repositories.
+
+The trackers (track_card_usage, track_period_summaries and the data version ones) read and
+write through a sync Session around the writes they wrap. Here they are entered and exited
+with AsyncSession.run_sync on the AsyncSession's own sync session: their statements run on
+the async driver, in the same transaction as the wrapped writes, without a worker thread.
+"""
+import sys
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import ExitStack, asynccontextmanager
+from typing import ContextManager
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.models import BaseModel
+from .credit_card_usage_sql import track_card_usage
+from .period_summary_sql import track_period_summaries
+from .data_version_sql import track_expenses_data_version, track_owned_data_version
+
+Tracker = Callable[[Session], ContextManager[None]]
+
+
+@asynccontextmanager
+async def run_trackers(session: AsyncSession, *trackers: Tracker) -> AsyncIterator[None]:
+    """Wrap the async writes of the block in the given sync trackers."""
+    stack = ExitStack()
+
+    def enter(sync_session: Session) -> None:
+        for tracker in trackers:
+            stack.enter_context(tracker(sync_session))
+
+    try:
+        await session.run_sync(enter)
+    except BaseException:
+        stack.__exit__(*sys.exc_info())
+        raise
+    try:
+        yield
+    except BaseException:
+        # The trackers only query once the writes succeeded: unwinding them does no I/O
+        if not stack.__exit__(*sys.exc_info()):
+            raise
+    else:
+        await session.run_sync(lambda _: stack.__exit__(None, None, None))
+
+
+def track_expense_writes(session: AsyncSession, expense_ids: Iterable[UUID]):
+    """Card usage, period summaries and owners' data version around writes to the expenses or their payments."""
+    expense_ids = list(expense_ids)
+    return run_trackers(
+        session,
+        lambda sync_session: track_card_usage(sync_session, expense_ids),
+        lambda sync_session: track_period_summaries(sync_session, expense_ids),
+        lambda sync_session: track_expenses_data_version(sync_session, expense_ids),
+    )
+
+
+def track_owned_writes(session: AsyncSession, model: type[BaseModel], filter: dict):
+    """Owners' data version around writes to the rows of an owned model matching filter."""
+    return run_trackers(session, lambda sync_session: track_owned_data_version(sync_session, model, filter))
@@ -0,0 +1,41 @@
+import logging
+from uuid import UUID
+
+from sqlalchemy import select
+
+from .async_base_repository_sql import AsyncBaseRepositorySQL
+from .user_repository_sql import UserSQLMixin
+from src.application.ports import AsyncUserRepository
+from src.infrastructure.database.models import UserModel
+from src.domain.auth import User as UserEntity
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncUserRepositorySQL(UserSQLMixin, AsyncBaseRepositorySQL[UserModel, UserEntity], AsyncUserRepository):
+
+    async def update(self, entity: UserEntity) -> UserEntity:
+        try:
+            async with self._session() as session:
+                existing_resource = await self._get_one(session, {'id': entity.id})
+                if not existing_resource:
+                    raise ValueError(f'User with id {entity.id} does not exist.')
+
+                self._apply_entity_to_user(entity, existing_resource)
+
+                await self._commit(session)
+                # Reloaded with the profile (a new one is not loaded on the instance yet)
+                updated = await self._get_one(session, {'id': entity.id})
+                return self._parse_model_to_entity(updated)  # type: ignore[arg-type]
+        except Exception as ex:
+            logger.critical(f'{self.model} - update - {ex.args} - Updated resource: {entity.to_dict()}')
+            raise ex
+
+    async def get_data_version(self, user_id: UUID) -> int:
+        try:
+            async with self._session() as session:
+                version = await session.scalar(select(UserModel.data_version).where(UserModel.id == user_id))
+                return version or 0
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
@@ -1,17 +1,20 @@
 import logging
 import uuid
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager
 from typing import TypeVar, Generic
-from abc import abstractmethod
+from abc import ABC, abstractmethod
 from datetime import datetime, date
 
 from sqlalchemy.exc import IntegrityError
 # from psycopg2.errors import UniqueViolation
 from sqlalchemy.orm import sessionmaker, Query, Session
-from sqlalchemy import desc, text, Column, Date
+from sqlalchemy import desc, func, literal, text, tuple_, Column, Date, Select
 
-from src.application.ports import BaseRepository
+from src.application.ports import BaseRepository, CursorKey
 from src.domain.shared import EntityBase
-from ..database import db_conn
+from ..database import db_conn, SQLAlchemyUnitOfWork
 from ..database.models import BaseModel
 # from app.exceptions.repo_exceptions import DatabaseError, UniqueFieldException
 
@@ -20,17 +23,110 @@ EntityType = TypeVar('EntityType', bound=EntityBase)
 logger = logging.getLogger(__name__)
 
 
-class BaseRepositorySQL(BaseRepository[EntityType], Generic[ModelType, EntityType]):
+QueryType = TypeVar('QueryType', Query, Select)
+
+
+def apply_cursor(query: QueryType, model: type[ModelType], limit: int, after: CursorKey | None) -> QueryType:
+    """
+    Keyset page: rows after `after` in (created_at, id) order, seeking by row comparison
+    instead of skipping OFFSET rows, so every page costs the same. One extra row is read
+    to know whether there is a next page (see split_cursor_page).
+    """
+    if after is not None:
+        created_at, id = after
+        query = query.filter(
+            tuple_(model.created_at, model.id)
+            > tuple_(literal(created_at, model.created_at.type), literal(id, model.id.type))
+        )
+    return query.order_by(model.created_at, model.id).limit(limit + 1)
+
+
+def split_cursor_page(rows: Sequence[ModelType], limit: int) -> tuple[list[ModelType], CursorKey | None]:
+    """The page out of the rows of an apply_cursor query, and the position of the next page."""
+    next_key = (rows[limit - 1].created_at, rows[limit - 1].id) if len(rows) > limit else None
+    return list(rows[:limit]), next_key
+
+
+def get_cursor_page(query: Query, model: type[ModelType], limit: int, after: CursorKey | None) -> tuple[list[ModelType], CursorKey | None]:
+    """Keyset page of the query (see apply_cursor)."""
+    return split_cursor_page(apply_cursor(query, model, limit, after).all(), limit)
+
+
+class SQLRepositoryMixin(Generic[ModelType, EntityType], ABC):
+    """Query building and parsing helpers shared by the sync and async SQL repositories."""
     VALID_ORDER_BY_FIELDS = ['id', 'created_at', 'updated_at']
+    # Filter keys that select loader options instead of filtering rows
+    LOAD_OPTION_FIELDS: list[str] = []
+
+    def _get_order_by_params(self, params: dict = {}):
+        order_by = params.get('order_by')
+        order_asc = params.get('order_asc')
+
+        if order_by is None:
+            order_by = 'id'
+        if order_asc is None:
+            order_asc = True
+
+        if order_by not in self.VALID_ORDER_BY_FIELDS:
+            raise ValueError(f'Invalid order_by field: {order_by}')
+
+        return text(order_by) if order_asc else desc(text(order_by))
+
+    def _get_load_options(self, params: dict = {}) -> list:
+        """Loader options (e.g. selectinload) to apply to entity queries. None by default."""
+        return []
+
+    def _strip_load_option_fields(self, params: dict = {}) -> dict:
+        return {k: v for k, v in params.items() if k not in self.LOAD_OPTION_FIELDS}
+
+    def _apply_entity_to_model(self, entity: EntityType, existing_data: ModelType) -> None:
+        """Copy the entity's scalar fields onto the model, converting str UUIDs and dates."""
+        for field, value in entity.to_dict().items():
+            if isinstance(value, (list, dict)):
+                continue
+
+            column = self.__get_column(existing_data, field)
+
+            if column is not None:
+                if hasattr(column.type, 'as_uuid') and column.type.as_uuid:  # type: ignore[attr-defined]
+                    if isinstance(value, str):
+                        value = uuid.UUID(value) if value != 'None' else None
+
+                elif isinstance(column.type, Date):
+                    if isinstance(value, str):
+                        value = datetime.strptime(value, '%Y-%m-%d').date()
+
+            setattr(existing_data, field, value)
 
+    def __get_column(self, existing_data: ModelType, field: str) -> Column | None:
+        mapper = type(existing_data).__mapper__
+        for attr in mapper.attrs:
+            if hasattr(attr, 'columns'):
+                if attr.key == field:
+                    return attr.columns[0]
+
+    @abstractmethod
+    def _get_filter_params(self, params: dict = {}) -> dict:
+        pass
+
+    @abstractmethod
+    def _parse_model_to_entity(self, data: ModelType) -> EntityType:
+        pass
+
+    @abstractmethod
+    def _parse_entity_to_model(self, entity: EntityType) -> ModelType:
+        pass
+
+
+class BaseRepositorySQL(SQLRepositoryMixin[ModelType, EntityType], BaseRepository[EntityType]):
     def __init__(self, model: type[ModelType], session_factory: sessionmaker = db_conn.SessionLocal) -> None:
         self.session_factory: sessionmaker[Session] = session_factory
         self.model: type[ModelType] = model
 
     def count_by_filter(self, filter: dict = {}) -> int:
         try:
-            with self.session_factory() as session:
-                count = session.query(self.model).filter_by(**filter).count()
+            with self._session() as session:
+                count = session.query(self.model).filter_by(**self._strip_load_option_fields(filter)).count()
                 return count
         except Exception as ex:
             logger.critical(ex.args)
@@ -38,10 +134,11 @@ class BaseRepositorySQL(BaseRepository[EntityType], Generic[ModelType, EntityTyp
 
     def create(self, entity: EntityType) -> EntityType:
         try:
-            with self.session_factory() as session:
+            with self._session() as session:
                 new_resource: BaseModel = self._parse_entity_to_model(entity)
-                session.add(new_resource)
-                session.commit()
+                with self._track_writes(session, {'id': entity.id}):
+                    session.add(new_resource)
+                self._commit(session)
                 session.refresh(new_resource)
                 return self._parse_model_to_entity(new_resource)
         # except UniqueViolation as uv:
@@ -56,8 +153,11 @@ class BaseRepositorySQL(BaseRepository[EntityType], Generic[ModelType, EntityTyp
 
     def get_many_by_filter(self, filter: dict, limit: int, offset: int) -> list[EntityType]:
         try:
-            with self.session_factory() as session:
+            with self._session() as session:
                 query: Query = session.query(self.model)
+                load_options = self._get_load_options(filter)
+                if load_options:
+                    query = query.options(*load_options)
                 if filter.get('order_by'):
                     query = query.order_by(self._get_order_by_params(filter))
                 search_filter = self._get_filter_params(filter)
@@ -71,11 +171,62 @@ class BaseRepositorySQL(BaseRepository[EntityType], Generic[ModelType, EntityTyp
             logger.critical(ex.args)
             raise ex
 
+    def get_page_by_filter(self, filter: dict, limit: int, offset: int) -> tuple[list[EntityType], int]:
+        try:
+            with self._session() as session:
+                query: Query = session.query(self.model)
+                load_options = self._get_load_options(filter)
+                if load_options:
+                    query = query.options(*load_options)
+                if filter.get('order_by'):
+                    query = query.order_by(self._get_order_by_params(filter))
+                search_filter = self._get_filter_params(filter)
+                if search_filter:
+                    query = query.filter_by(**search_filter)
+                items, total = self._get_counted_page(query, limit, offset)
+            return items, total if total is not None else self.count_by_filter(filter)
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+
+    def _get_counted_page(self, query: Query, limit: int, offset: int) -> tuple[list[EntityType], int | None]:
+        """
+        Page of the query and the total of matching rows in one statement: COUNT(*) OVER()
+        is computed over the whole result before LIMIT/OFFSET and repeated on every row.
+        An offset past the last row returns no row to read it from, so the total is None then.
+        """
+        rows = query.add_columns(func.count().over().label('total_count')).limit(limit).offset(offset).all()
+        if not rows:
+            return [], None if offset else 0
+        return [self._parse_model_to_entity(row[0]) for row in rows], rows[0].total_count
+
+    def get_many_by_cursor(self, filter: dict, limit: int, after: CursorKey | None = None) -> tuple[list[EntityType], CursorKey | None]:
+        try:
+            with self._session() as session:
+                query: Query = session.query(self.model)
+                load_options = self._get_load_options(filter)
+                if load_options:
+                    query = query.options(*load_options)
+                search_filter = self._get_filter_params(filter)
+                if search_filter:
+                    query = query.filter_by(**search_filter)
+                return self._get_cursor_page(query, limit, after)
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+
+    def _get_cursor_page(self, query: Query, limit: int, after: CursorKey | None) -> tuple[list[EntityType], CursorKey | None]:
+        rows, next_key = get_cursor_page(query, self.model, limit, after)
+        return [self._parse_model_to_entity(row) for row in rows], next_key
+
     def get_by_filter(self, filter: dict) -> EntityType | None:
         try:
-            with self.session_factory() as session:
+            with self._session() as session:
                 query: Query = session.query(self.model)
-                query = query.filter_by(**filter)
+                load_options = self._get_load_options(filter)
+                if load_options:
+                    query = query.options(*load_options)
+                query = query.filter_by(**self._strip_load_option_fields(filter))
                 result: ModelType | None = query.first()
                 return self._parse_model_to_entity(result) if result else None
         except Exception as ex:
@@ -84,31 +235,20 @@ class BaseRepositorySQL(BaseRepository[EntityType], Generic[ModelType, EntityTyp
 
     def update(self, entity: EntityType) -> EntityType:
         try:
-            with self.session_factory() as session:
+            with self._session() as session:
                 query: Query = session.query(self.model)
+                load_options = self._get_load_options()
+                if load_options:
+                    query = query.options(*load_options)
                 query = query.filter_by(id=entity.id)
                 existing_data: ModelType | None = query.first()
                 if not existing_data:
                     raise ValueError(f'No record found with id {entity.id}')
 
-                for field, value in entity.to_dict().items():
-                    if isinstance(value, (list, dict)):
-                        continue
-
-                    column = self.__get_column(existing_data, field)
+                with self._track_writes(session, {'id': entity.id}):
+                    self._apply_entity_to_model(entity, existing_data)
 
-                    if column is not None:
-                        if hasattr(column.type, 'as_uuid') and column.type.as_uuid:  # type: ignore[attr-defined]
-                            if isinstance(value, str):
-                                value = uuid.UUID(value) if value != 'None' else None
-
-                        elif isinstance(column.type, Date):
-                            if isinstance(value, str):
-                                value = datetime.strptime(value, '%Y-%m-%d').date()
-
-                    setattr(existing_data, field, value)
-
-                session.commit()
+                self._commit(session)
                 return self._parse_model_to_entity(existing_data)
         except IntegrityError as err:
             logger.error(err.args)
@@ -120,46 +260,40 @@ class BaseRepositorySQL(BaseRepository[EntityType], Generic[ModelType, EntityTyp
 
     def delete_by_filter(self, filter: dict) -> None:
         try:
-            with self.session_factory() as session:
+            with self._session() as session:
                 query: Query = session.query(self.model)
                 query = query.filter_by(**filter)
-                deleted_count: int = query.delete()
+                with self._track_writes(session, filter):
+                    deleted_count: int = query.delete()
                 if deleted_count == 0:
                     raise ValueError(f'No records found matching filter {filter}')
-                session.commit()
+                self._commit(session)
         except Exception as ex:
             logger.critical(ex.args)
             raise ex
 
-    def _get_order_by_params(self, params: dict = {}):
-        order_by = params.get('order_by')
-        order_asc = params.get('order_asc')
-
-        if order_by is None:
-            order_by = 'id'
-        if order_asc is None:
-            order_asc = True
-
-        if order_by not in self.VALID_ORDER_BY_FIELDS:
-            raise ValueError(f'Invalid order_by field: {order_by}')
-
-        return text(order_by) if order_asc else desc(text(order_by))
-
-    def __get_column(self, existing_data: ModelType, field: str) -> Column | None:
-        mapper = type(existing_data).__mapper__
-        for attr in mapper.attrs:
-            if hasattr(attr, 'columns'):
-                if attr.key == field:
-                    return attr.columns[0]
-
-    @abstractmethod
-    def _get_filter_params(self, params: dict = {}) -> dict:
-        pass
+    def _track_writes(self, session: Session, filter: dict) -> ContextManager[None]:
+        """
+        Context wrapped around create, update and delete of the rows matching filter, before
+        the commit. Repositories whose writes must update derived data (e.g. the owner's data
+        version) override it; nothing by default.
+        """
+        return nullcontext()
 
-    @abstractmethod
-    def _parse_model_to_entity(self, data: ModelType) -> EntityType:
-        pass
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """Yield the active unit of work session, or a new session owned by this call."""
+        unit_of_work = SQLAlchemyUnitOfWork.current()
+        if unit_of_work is not None and unit_of_work.session_factory is self.session_factory:
+            yield unit_of_work.session
+        else:
+            with self.session_factory() as session:
+                yield session
 
-    @abstractmethod
-    def _parse_entity_to_model(self, entity: EntityType) -> ModelType:
-        pass
+    def _commit(self, session: Session) -> None:
+        """Commit, or only flush when the unit of work owns the transaction."""
+        unit_of_work = SQLAlchemyUnitOfWork.current()
+        if unit_of_work is not None and unit_of_work.owns(session):
+            session.flush()
+        else:
+            session.commit()
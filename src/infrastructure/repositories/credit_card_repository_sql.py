@@ -1,21 +1,199 @@
 import logging
+from datetime import date
+from collections.abc import Sequence
+from uuid import UUID
 
-from sqlalchemy.orm import Query
+from sqlalchemy import Row, Select, select, func, and_, or_, tuple_
+from sqlalchemy.orm import Query, Session, selectinload, noload
 
 from .base_repository_sql import BaseRepositorySQL
-from src.infrastructure.database.models import CreditCardModel, AccountModel
+from .credit_card_usage_sql import parse_stored_usage
+from .data_version_sql import track_owned_data_version
+from src.infrastructure.database.models import CreditCardModel, AccountModel, ExpenseModel, ExpenseCategoryModel, PaymentModel, PeriodSummaryModel
 from src.application.ports import CreditCardRepository
 from src.domain.account import CreditCardFactory, CreditCard as CreditCardEntity
-from src.domain.shared import Amount
+from src.domain.account.enums import AccountType
+from src.domain.expense import PeriodPayment, PeriodPaymentFactory, PeriodSummary
+from src.domain.expense.enums import ExpenseType, ExpenseStatus, PaymentStatus
+from src.domain.shared import Amount, Month, Year
 
 logger = logging.getLogger(__name__)
 
 
-class CreditCardRepositorySQL(BaseRepositorySQL[CreditCardModel, CreditCardEntity], CreditCardRepository):
+class CreditCardSQLMixin:
+    """Query building and parsing shared by the sync and async credit card repositories."""
+    LOAD_OPTION_FIELDS = ['include_expenses']
+
     def _get_filter_params(self, params: dict = {}) -> dict:
         allowed = ['owner_id', 'alias']
         return {k: v for k, v in params.items() if k in allowed}
 
+    def _get_load_options(self, params: dict = {}) -> list:
+        """
+        Eager load expenses and their payments with one SELECT ... IN per relationship.
+
+        Pass `include_expenses=False` in the filter to skip them entirely; the card is
+        then returned without expenses, with the usage stored on its row.
+        """
+        if params.get('include_expenses', True):
+            return [selectinload(CreditCardModel.expenses).selectinload(ExpenseModel.payments)]
+        return [noload(CreditCardModel.expenses)]
+
+    def _get_period_payments_stmt(self, owner_id: UUID, month: int, year: int) -> Select:
+        """Build the SELECT used by get_period_payments."""
+        period_start = date(year, month, 1)
+        period_end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+
+        last_payment_date = (
+            select(func.max(PaymentModel.payment_date))
+            .where(PaymentModel.expense_id == ExpenseModel.id)
+            .correlate(ExpenseModel)
+            .scalar_subquery()
+        )
+        return (
+            select(
+                PaymentModel.id,
+                PaymentModel.amount,
+                PaymentModel.status,
+                PaymentModel.payment_date,
+                PaymentModel.no_installment,
+                PaymentModel.is_last_payment,
+                ExpenseModel.id.label('expense_id'),
+                ExpenseModel.title,
+                ExpenseModel.expense_type,
+                ExpenseModel.cc_name,
+                ExpenseModel.acquired_at,
+                ExpenseModel.installments,
+                ExpenseModel.status.label('expense_status'),
+                ExpenseModel.amount.label('expense_amount'),
+                ExpenseModel.first_payment_date,
+                ExpenseCategoryModel.name.label('category_name'),
+                AccountModel.id.label('account_id'),
+                AccountModel.alias,
+                AccountModel.is_enabled,
+                AccountModel.account_type,
+            )
+            .join(ExpenseModel, ExpenseModel.id == PaymentModel.expense_id)
+            .join(AccountModel, AccountModel.id == ExpenseModel.account_id)
+            .outerjoin(ExpenseCategoryModel, ExpenseCategoryModel.id == ExpenseModel.category_id)
+            .where(
+                AccountModel.owner_id == owner_id,
+                AccountModel.account_type == AccountType.CREDIT_CARD.value,
+                or_(
+                    and_(PaymentModel.payment_date >= period_start, PaymentModel.payment_date < period_end),
+                    and_(
+                        ExpenseModel.expense_type == ExpenseType.SUBSCRIPTION.value,
+                        ExpenseModel.status.in_([ExpenseStatus.ACTIVE.value, ExpenseStatus.PENDING.value]),
+                        PaymentModel.payment_date < period_start,
+                        PaymentModel.payment_date == last_payment_date,
+                    ),
+                ),
+            )
+            .order_by(AccountModel.id, ExpenseModel.id, PaymentModel.no_installment)
+        )
+
+    def _parse_period_rows(self, rows: Sequence[Row], month: int, year: int) -> list[PeriodPayment]:
+        """Turn the rows of the period SELECT into PeriodPayments (simulating subscriptions)."""
+        period_start = date(year, month, 1)
+        period_payments = []
+        simulated_expense_ids = set()
+        for row in rows:
+            period_payment = PeriodPayment(
+                # Payment data
+                payment_id=row.id,
+                amount=Amount(row.amount),
+                status=PaymentStatus(row.status),
+                payment_date=row.payment_date,
+                no_installment=row.no_installment,
+                is_last_payment=row.is_last_payment,
+
+                # Expense data
+                expense_id=row.expense_id,
+                expense_title=row.title,
+                expense_type=ExpenseType(row.expense_type),
+                expense_cc_name=row.cc_name,
+                expense_acquired_at=row.acquired_at,
+                expense_installments=row.installments,
+                expense_status=ExpenseStatus(row.expense_status),
+                expense_category_name=row.category_name,
+
+                # Account data
+                account_id=row.account_id,
+                account_alias=row.alias,
+                account_is_enabled=row.is_enabled,
+                account_type=AccountType(row.account_type),
+            )
+            if row.payment_date >= period_start:
+                period_payments.append(period_payment)
+            elif row.expense_id not in simulated_expense_ids:
+                # Last payment of an active subscription, used as anchor for the simulated one
+                simulated_expense_ids.add(row.expense_id)
+                period_payments.append(PeriodPaymentFactory.create_simulated(
+                    anchor=period_payment,
+                    amount=Amount(row.expense_amount),
+                    payment_day=row.first_payment_date.day,
+                    month=month,
+                    year=year,
+                ))
+        return period_payments
+
+    def _get_category_names_stmt(self, owner_id: UUID) -> Select:
+        """Build the SELECT used by get_category_names."""
+        return select(ExpenseCategoryModel.id, ExpenseCategoryModel.name).where(ExpenseCategoryModel.owner_id == owner_id)
+
+    @staticmethod
+    def _get_summary_periods(month: int, year: int, months: int) -> list[tuple[int, int]]:
+        """(year, month) of `months` consecutive periods starting at month/year."""
+        periods = []
+        for i in range(months):
+            period_year, period_month = divmod(month - 1 + i, 12)
+            periods.append((year + period_year, period_month + 1))
+        return periods
+
+    def _get_period_summaries_stmt(self, owner_id: UUID, month: int, year: int, months: int) -> Select:
+        """Build the SELECT used by get_period_summaries: a range scan of the owner's summaries."""
+        periods = self._get_summary_periods(month, year, months)
+        period = tuple_(PeriodSummaryModel.year, PeriodSummaryModel.month)
+        return (
+            select(
+                PeriodSummaryModel.year,
+                PeriodSummaryModel.month,
+                func.sum(PeriodSummaryModel.total_amount).label('total_amount'),
+                func.sum(PeriodSummaryModel.total_confirmed_amount).label('total_confirmed_amount'),
+                func.sum(PeriodSummaryModel.total_paid_amount).label('total_paid_amount'),
+                func.sum(PeriodSummaryModel.total_pending_amount).label('total_pending_amount'),
+                func.sum(PeriodSummaryModel.total_payments).label('total_payments'),
+            )
+            .join(AccountModel, AccountModel.id == PeriodSummaryModel.account_id)
+            .where(
+                PeriodSummaryModel.owner_id == owner_id,
+                AccountModel.account_type == AccountType.CREDIT_CARD.value,
+                period >= tuple_(*periods[0]),
+                period <= tuple_(*periods[-1]),
+            )
+            .group_by(PeriodSummaryModel.year, PeriodSummaryModel.month)
+        )
+
+    def _parse_period_summary_rows(self, rows: Sequence[Row], month: int, year: int, months: int) -> list[PeriodSummary]:
+        """One PeriodSummary per requested period, in order; periods without payments are empty."""
+        rows_by_period = {(row.year, row.month): row for row in rows}
+        summaries = []
+        for period_year, period_month in self._get_summary_periods(month, year, months):
+            row = rows_by_period.get((period_year, period_month))
+            if row is None:
+                summaries.append(PeriodSummary.empty(Month(period_month), Year(period_year)))
+                continue
+            summaries.append(PeriodSummary(
+                month=Month(period_month),
+                year=Year(period_year),
+                total_amount=Amount(row.total_amount),
+                total_confirmed_amount=Amount(row.total_confirmed_amount),
+                total_paid_amount=Amount(row.total_paid_amount),
+                total_pending_amount=Amount(row.total_pending_amount),
+                total_payments=int(row.total_payments),
+            ))
+        return summaries
+
     def _parse_model_to_entity(self, data: CreditCardModel) -> CreditCardEntity:
         # Load expenses from the model and convert to domain entities
         from src.domain.expense import PurchaseFactory, SubscriptionFactory, PaymentFactory
@@ -81,6 +259,9 @@ class CreditCardRepositorySQL(BaseRepositorySQL[CreditCardModel, CreditCardEntit
             next_expiring_date=data.next_expiring_date,
             financing_limit=Amount(data.financing_limit),
             expenses=expenses,
+            # Loaded without expenses: use the stored usage instead of an empty list's.
+            # With expenses the usage is computed from them, which gives the same figures.
+            usage=parse_stored_usage(data) if not data.expenses else None,
         )
 
     def _parse_entity_to_model(self, entity: CreditCardEntity):
@@ -98,6 +279,54 @@ class CreditCardRepositorySQL(BaseRepositorySQL[CreditCardModel, CreditCardEntit
             financing_limit=entity.financing_limit.value if hasattr(entity.financing_limit, 'value') else entity.financing_limit,
         )
 
+
+class CreditCardRepositorySQL(CreditCardSQLMixin, BaseRepositorySQL[CreditCardModel, CreditCardEntity], CreditCardRepository):
+    def _track_writes(self, session: Session, filter: dict):
+        return track_owned_data_version(session, CreditCardModel, filter)
+
+    def get_period_payments(self, owner_id: UUID, month: int, year: int) -> list[PeriodPayment]:
+        """
+        Get the period payments of every owner's credit card in a single query.
+
+        Selects the payments dated in the period plus, for active subscriptions, their last
+        payment when it is dated before the period. The latter are turned into simulated
+        payments, the same way Period.fill_from_account does.
+        """
+        stmt = self._get_period_payments_stmt(owner_id, month, year)
+        try:
+            with self._session() as session:
+                rows = session.execute(stmt).all()
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+        return self._parse_period_rows(rows, month, year)
+
+    def get_category_names(self, owner_id: UUID) -> dict[UUID, str]:
+        """Get the names of the owner's expense categories by id, to label the period payments."""
+        stmt = self._get_category_names_stmt(owner_id)
+        try:
+            with self._session() as session:
+                rows = session.execute(stmt).all()
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+        return {row.id: row.name for row in rows}
+
+    def get_period_summaries(self, owner_id: UUID, month: int, year: int, months: int) -> list[PeriodSummary]:
+        """
+        Get the payment totals of the owner's credit cards for `months` periods from month/year.
+
+        Read from the period_summaries table (one indexed range scan), not from the payments.
+        """
+        stmt = self._get_period_summaries_stmt(owner_id, month, year, months)
+        try:
+            with self._session() as session:
+                rows = session.execute(stmt).all()
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+        return self._parse_period_summary_rows(rows, month, year, months)
+
     def delete_by_filter(self, filter: dict) -> None:
         """
         Override delete to properly handle joined table inheritance.
@@ -105,7 +334,7 @@ class CreditCardRepositorySQL(BaseRepositorySQL[CreditCardModel, CreditCardEntit
         Deletes the Account record, which cascades to CreditCard due to FK constraint.
         """
         try:
-            with self.session_factory() as session:
+            with self._session() as session:
                 # First, get the credit card to find its account_id
                 cc_query: Query = session.query(CreditCardModel)
                 cc_query = cc_query.filter_by(**filter)
@@ -117,12 +346,13 @@ class CreditCardRepositorySQL(BaseRepositorySQL[CreditCardModel, CreditCardEntit
                 # Delete the Account record (cascades to CreditCard via FK)
                 account_query: Query = session.query(AccountModel)
                 account_query = account_query.filter_by(id=credit_card.account_id)
-                deleted_count: int = account_query.delete()
+                with self._track_writes(session, {'id': credit_card.account_id}):
+                    deleted_count: int = account_query.delete()
                 
                 if deleted_count == 0:
                     raise ValueError(f'No account found for credit card with filter {filter}')
                 
-                session.commit()
+                self._commit(session)
                 logger.info(f'Successfully deleted credit card and its account with filter {filter}')
         except Exception as ex:
             logger.error(f'Error deleting credit card: {ex.args}')
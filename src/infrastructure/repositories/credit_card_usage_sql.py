@@ -0,0 +1,160 @@
+"""
+Persisted credit card usage (used limits and expense counts on the credit_cards row).
+
+Writes to expenses and payments go through track_card_usage: it reads the usage of the
+touched expenses before and after the write, in the same session, and adds the
+difference to their cards with a single UPDATE ... SET col = col + delta per card.
+Reading a card then needs no expense or payment rows at all.
+"""
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from uuid import UUID
+
+from sqlalchemy import Select, case, func, select, update
+from sqlalchemy.orm import Session
+
+from src.domain.account import CreditCardUsage
+from src.domain.expense.enums import ExpenseType
+from src.domain.expense.enums.payment_status import FINAL_STATUSES
+from src.domain.shared import Amount
+from src.infrastructure.database.models import CreditCardModel, ExpenseModel, PaymentModel
+
+USAGE_COLUMNS = ['used_limit', 'used_financing_limit', 'expenses_count', 'purchases_count', 'subscriptions_count']
+
+
+def _get_expense_usage_stmt() -> Select:
+    """One row per expense with its pending amount, as Purchase/Subscription.pending_amount compute it."""
+    final_statuses = [status.value for status in FINAL_STATUSES]
+    final_amount = func.coalesce(
+        func.sum(case((PaymentModel.status.in_(final_statuses), PaymentModel.amount), else_=0)), 0
+    )
+    open_amount = func.coalesce(
+        func.sum(case((PaymentModel.status.not_in(final_statuses), PaymentModel.amount), else_=0)), 0
+    )
+    pending_amount = case(
+        (ExpenseModel.expense_type == ExpenseType.PURCHASE.value, ExpenseModel.amount - final_amount),
+        else_=open_amount,
+    )
+    return (
+        select(
+            ExpenseModel.account_id,
+            ExpenseModel.expense_type,
+            ExpenseModel.installments,
+            pending_amount.label('pending_amount'),
+        )
+        .outerjoin(PaymentModel, PaymentModel.expense_id == ExpenseModel.id)
+        .group_by(ExpenseModel.id, ExpenseModel.account_id, ExpenseModel.expense_type, ExpenseModel.installments, ExpenseModel.amount)
+    )
+
+
+def _sum_usage_by_card(session: Session, stmt: Select) -> dict[UUID, CreditCardUsage]:
+    usage_by_card: dict[UUID, CreditCardUsage] = {}
+    for row in session.execute(stmt):
+        pending_amount = Amount(row.pending_amount)
+        is_purchase = row.expense_type == ExpenseType.PURCHASE.value
+        usage = CreditCardUsage(
+            used_limit=pending_amount,
+            # Single payment purchases are not financed (Purchase.pending_financing_amount)
+            used_financing_limit=pending_amount if is_purchase and row.installments != 1 else Amount(0),
+            expenses_count=1,
+            purchases_count=int(is_purchase),
+            subscriptions_count=int(row.expense_type == ExpenseType.SUBSCRIPTION.value),
+        )
+        usage_by_card[row.account_id] = usage_by_card.get(row.account_id, CreditCardUsage.empty()) + usage
+    return usage_by_card
+
+
+def get_expenses_usage(session: Session, expense_ids: Iterable[UUID]) -> dict[UUID, CreditCardUsage]:
+    """Usage taken by the given expenses, grouped by account."""
+    stmt = _get_expense_usage_stmt().where(ExpenseModel.id.in_(list(expense_ids)))
+    return _sum_usage_by_card(session, stmt)
+
+
+def compute_cards_usage(session: Session, account_ids: Iterable[UUID] | None = None) -> dict[UUID, CreditCardUsage]:
+    """Usage of every credit card (or the given ones) recomputed from its expenses and payments."""
+    stmt = _get_expense_usage_stmt().join(CreditCardModel, CreditCardModel.account_id == ExpenseModel.account_id)
+    if account_ids is not None:
+        stmt = stmt.where(ExpenseModel.account_id.in_(list(account_ids)))
+    return _sum_usage_by_card(session, stmt)
+
+
+def get_stored_usage(session: Session, account_ids: Iterable[UUID] | None = None) -> dict[UUID, CreditCardUsage]:
+    """Usage currently stored on the credit_cards rows."""
+    stmt = select(CreditCardModel.account_id, *[getattr(CreditCardModel, column) for column in USAGE_COLUMNS])
+    if account_ids is not None:
+        stmt = stmt.where(CreditCardModel.account_id.in_(list(account_ids)))
+    return {row.account_id: parse_stored_usage(row) for row in session.execute(stmt)}
+
+
+def parse_stored_usage(data) -> CreditCardUsage:
+    """Build the CreditCardUsage from a credit_cards row or CreditCardModel."""
+    return CreditCardUsage(
+        used_limit=Amount(data.used_limit or 0),
+        used_financing_limit=Amount(data.used_financing_limit or 0),
+        expenses_count=data.expenses_count or 0,
+        purchases_count=data.purchases_count or 0,
+        subscriptions_count=data.subscriptions_count or 0,
+    )
+
+
+def find_usage_drift(session: Session) -> dict[UUID, tuple[CreditCardUsage, CreditCardUsage]]:
+    """Map each card whose stored usage is wrong to its (stored, expected) usage."""
+    stored = get_stored_usage(session)
+    expected = compute_cards_usage(session)
+    drift = {}
+    for account_id, stored_usage in stored.items():
+        expected_usage = expected.get(account_id, CreditCardUsage.empty())
+        if stored_usage != expected_usage:
+            drift[account_id] = (stored_usage, expected_usage)
+    return drift
+
+
+def apply_usage_delta(session: Session, account_id: UUID, delta: CreditCardUsage) -> None:
+    """Add delta to the stored usage of a card (no-op for other account types)."""
+    session.execute(
+        update(CreditCardModel)
+        .where(CreditCardModel.account_id == account_id)
+        .values(
+            used_limit=CreditCardModel.used_limit + delta.used_limit.to_decimal(),
+            used_financing_limit=CreditCardModel.used_financing_limit + delta.used_financing_limit.to_decimal(),
+            expenses_count=CreditCardModel.expenses_count + delta.expenses_count,
+            purchases_count=CreditCardModel.purchases_count + delta.purchases_count,
+            subscriptions_count=CreditCardModel.subscriptions_count + delta.subscriptions_count,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def store_usage(session: Session, account_id: UUID, usage: CreditCardUsage) -> None:
+    """Overwrite the stored usage of a card."""
+    session.execute(
+        update(CreditCardModel)
+        .where(CreditCardModel.account_id == account_id)
+        .values(
+            used_limit=usage.used_limit.to_decimal(),
+            used_financing_limit=usage.used_financing_limit.to_decimal(),
+            expenses_count=usage.expenses_count,
+            purchases_count=usage.purchases_count,
+            subscriptions_count=usage.subscriptions_count,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+@contextmanager
+def track_card_usage(session: Session, expense_ids: Iterable[UUID]) -> Iterator[None]:
+    """
+    Keep the stored card usage in step with writes to the given expenses and their payments.
+
+    Must wrap the writes themselves (the usage before them is read on entry) and run
+    before the commit, so the usage update is part of the same transaction.
+    """
+    expense_ids = list(expense_ids)
+    before = get_expenses_usage(session, expense_ids)
+    yield
+    session.flush()
+    after = get_expenses_usage(session, expense_ids)
+    for account_id in before.keys() | after.keys():
+        delta = after.get(account_id, CreditCardUsage.empty()) - before.get(account_id, CreditCardUsage.empty())
+        if not delta.is_empty:
+            apply_usage_delta(session, account_id, delta)
@@ -0,0 +1,65 @@
+"""
+Per-user data version (users.data_version), the source of the ETags of the GET routes.
+
+Writes to expenses, payments, credit cards and expense categories go through one of the
+trackers below: they collect the owners of the touched rows, before and after the
+write, and bump their version with UPDATE users SET data_version = data_version + 1
+in the same session. A client holding the ETag of a version has seen every write up to it.
+"""
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.models import AccountModel, BaseModel, ExpenseModel, UserModel
+
+
+def get_expense_owner_ids(session: Session, expense_ids: Iterable[UUID]) -> set[UUID]:
+    """Owners of the accounts of the given expenses."""
+    return set(session.scalars(
+        select(AccountModel.owner_id)
+        .join(ExpenseModel, ExpenseModel.account_id == AccountModel.id)
+        .where(ExpenseModel.id.in_(list(expense_ids)))
+        .distinct()
+    ))
+
+
+def get_owner_ids(session: Session, model: type[BaseModel], filter: dict) -> set[UUID]:
+    """Owners of the rows of an owned model (one with an owner_id column) matching the filter."""
+    return set(session.scalars(select(model.owner_id).filter_by(**filter).distinct()))  # type: ignore[attr-defined]
+
+
+def bump_data_version(session: Session, owner_ids: Iterable[UUID]) -> None:
+    owner_ids = list(owner_ids)
+    if not owner_ids:
+        return
+    session.execute(
+        update(UserModel)
+        .where(UserModel.id.in_(owner_ids))
+        .values(data_version=UserModel.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+@contextmanager
+def track_expenses_data_version(session: Session, expense_ids: Iterable[UUID]) -> Iterator[None]:
+    """
+    Bump the data version of the owners of the given expenses around writes to them or
+    their payments. Like track_card_usage, it must wrap the writes and run before the commit.
+    """
+    expense_ids = list(expense_ids)
+    owner_ids = get_expense_owner_ids(session, expense_ids)
+    yield
+    session.flush()
+    bump_data_version(session, owner_ids | get_expense_owner_ids(session, expense_ids))
+
+
+@contextmanager
+def track_owned_data_version(session: Session, model: type[BaseModel], filter: dict) -> Iterator[None]:
+    """Bump the data version of the owners of the model rows matching filter around writes to them."""
+    owner_ids = get_owner_ids(session, model, filter)
+    yield
+    session.flush()
+    bump_data_version(session, owner_ids | get_owner_ids(session, model, filter))
@@ -1,6 +1,12 @@
 import logging
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
 
 from .base_repository_sql import BaseRepositorySQL
+from .data_version_sql import track_owned_data_version
 from src.infrastructure.database.models import ExpenseCategoryModel
 from src.domain.expense import ExpenseCategoryFactory, ExpenseCategory
 from src.application.ports import ExpenseCategoryRepository
@@ -8,7 +14,14 @@ from src.application.ports import ExpenseCategoryRepository
 logger = logging.getLogger(__name__)
 
 
-class ExpenseCategoryRepositorySQL(BaseRepositorySQL[ExpenseCategoryModel, ExpenseCategory], ExpenseCategoryRepository):
+class ExpenseCategorySQLMixin:
+    """Queries and parsing shared by the sync and async expense category repositories."""
+
+    @staticmethod
+    def _get_owned_ids_stmt(owner_id: UUID, category_ids: set[UUID]) -> Select:
+        return select(ExpenseCategoryModel.id).where(
+            ExpenseCategoryModel.owner_id == owner_id, ExpenseCategoryModel.id.in_(category_ids)
+        )
 
     def _get_filter_params(self, params: dict = {}) -> dict:
         allowed = ['owner_id', 'name']
@@ -31,3 +44,22 @@ class ExpenseCategoryRepositorySQL(BaseRepositorySQL[ExpenseCategoryModel, Expen
             description=entity.description,
             is_income=entity.is_income,
         )
+
+
+class ExpenseCategoryRepositorySQL(ExpenseCategorySQLMixin, BaseRepositorySQL[ExpenseCategoryModel, ExpenseCategory], ExpenseCategoryRepository):
+    def _track_writes(self, session: Session, filter: dict):
+        # Category names are part of the expense and period payloads
+        return track_owned_data_version(session, ExpenseCategoryModel, filter)
+
+    def get_owned_ids(self, owner_id: UUID, category_ids: Iterable[UUID]) -> set[UUID]:
+        """The given category ids that exist and belong to the owner, in one SELECT."""
+        category_ids = set(category_ids)
+        if not category_ids:
+            return set()
+        stmt = self._get_owned_ids_stmt(owner_id, category_ids)
+        try:
+            with self._session() as session:
+                return set(session.scalars(stmt))
+        except Exception as ex:
+            logger.error(f'Error reading the categories of {owner_id}: {ex.args}')
+            raise ex
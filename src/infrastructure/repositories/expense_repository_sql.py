@@ -1,16 +1,25 @@
 import logging
-from datetime import date
+from collections.abc import Iterable, Iterator
+from uuid import UUID
 
-from sqlalchemy.orm import Query, joinedload
+from sqlalchemy import Row, ScalarSelect, Select, select, insert, update, delete
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from .base_repository_sql import BaseRepositorySQL
-from src.infrastructure.database.models import ExpenseModel, PaymentModel, AccountModel
+from .credit_card_usage_sql import track_card_usage
+from .period_summary_sql import track_period_summaries
+from .data_version_sql import track_expenses_data_version
+from src.infrastructure.database.models import ExpenseModel, PaymentModel, AccountModel, ExpenseCategoryModel
+from src.domain.account.enums import AccountType
 from src.domain.expense import (
     PurchaseFactory,
     SubscriptionFactory,
     PaymentFactory,
     PaymentStatus,
     ExpenseType,
+    ExpenseStatus,
+    Payment,
+    PeriodPayment,
     Expense as ExpenseEntity,
 )
 from src.application.ports import ExpenseRepository
@@ -18,174 +27,157 @@ from src.domain.shared import Amount
 
 logger = logging.getLogger(__name__)
 
+# Payment columns compared to detect changed rows on update
+PAYMENT_FIELDS = ['amount', 'no_installment', 'status', 'payment_date', 'is_last_payment']
 
-class ExpenseRepositorySQL(BaseRepositorySQL[ExpenseModel, ExpenseEntity], ExpenseRepository):
-    def create(self, entity: ExpenseEntity) -> ExpenseEntity:
-        try:
-            with self.session_factory() as session:
-                expense_model = self._parse_entity_to_model(entity)
-                session.add(expense_model)
-                session.flush()
-
-                for payment in entity.payments:
-                    payment_model = PaymentModel(
-                        id=payment.id,
-                        expense_id=expense_model.id,
-                        amount=payment.amount.value if hasattr(payment.amount, 'value') else payment.amount,
-                        no_installment=payment.no_installment,
-                        status=payment.status.value if hasattr(payment.status, 'value') else payment.status,
-                        payment_date=payment.payment_date,
-                        is_last_payment=payment.is_last_payment,
-                    )
-                    session.add(payment_model)
-
-                session.commit()
 
-                created_expense = (
-                    session.query(self.model)
-                    .options(joinedload(ExpenseModel.payments))
-                    .filter_by(id=expense_model.id)
-                    .one()
-                )
-                return self._parse_model_to_entity(created_expense)
-        except Exception as ex:
-            logger.error(f'Error creating expense: {ex.args}')
-            raise ex
+class ExpenseSQLMixin:
+    """Queries, payment diffing and parsing shared by the sync and async expense repositories."""
 
-    def update(self, entity: ExpenseEntity) -> ExpenseEntity:
+    def _apply_entity_to_expense(self, entity: ExpenseEntity, expense_model: ExpenseModel) -> None:
+        """Copy the entity's fields onto the loaded expense (payments are written by _sync_payments)."""
+        expense_model.title = entity.title
+        expense_model.cc_name = entity.cc_name
+        expense_model.acquired_at = entity.acquired_at
+        expense_model.amount = entity.amount.value if hasattr(entity.amount, 'value') else entity.amount
+        expense_model.expense_type = entity.expense_type.value if hasattr(entity.expense_type, 'value') else entity.expense_type
+        expense_model.installments = entity.installments
+        expense_model.first_payment_date = entity.first_payment_date
+        expense_model.status = entity.status.value if hasattr(entity.status, 'value') else entity.status
+        if expense_model.account_id != entity.account_id:
+            expense_model.owner_id = self._get_owner_id_expr(entity.account_id)
+        expense_model.account_id = entity.account_id
+        expense_model.category_id = entity.category_id
+
+    def _sync_payments(self, session: Session, entity: ExpenseEntity) -> None:
         """
-        Override update to also update associated payments.
-        This is crucial for rebalancing payments when one is updated.
+        Diff the entity payments against the stored rows and write only the differences.
+
+        Changed rows go in a single executemany UPDATE, new rows in a single executemany
+        INSERT and removed rows in a single DELETE ... WHERE id IN.
         """
-        try:
-            with self.session_factory() as session:
-                # Update the expense itself
-                expense_model = session.query(self.model).filter_by(id=entity.id).first()
-                if not expense_model:
-                    raise ValueError(f'Expense with id {entity.id} not found')
-                
-                # Update expense fields directly from entity attributes
-                expense_model.title = entity.title
-                expense_model.cc_name = entity.cc_name
-                expense_model.acquired_at = entity.acquired_at
-                expense_model.amount = entity.amount.value if hasattr(entity.amount, 'value') else entity.amount
-                expense_model.expense_type = entity.expense_type.value if hasattr(entity.expense_type, 'value') else entity.expense_type
-                expense_model.installments = entity.installments
-                expense_model.first_payment_date = entity.first_payment_date
-                expense_model.status = entity.status.value if hasattr(entity.status, 'value') else entity.status
-                expense_model.account_id = entity.account_id
-                expense_model.category_id = entity.category_id
-                
-                # Flush expense updates before deleting payments to avoid autoflush issues
-                session.flush()
-                
-                # Update payments - delete old ones and create new ones to ensure sync
-                session.query(PaymentModel).filter_by(expense_id=entity.id).delete()
-                
-                for payment in entity.payments:
-                    payment_model = PaymentModel(
-                        id=payment.id,
-                        expense_id=entity.id,
-                        amount=payment.amount.value if hasattr(payment.amount, 'value') else payment.amount,
-                        no_installment=payment.no_installment,
-                        status=payment.status.value if hasattr(payment.status, 'value') else payment.status,
-                        payment_date=payment.payment_date,
-                        is_last_payment=payment.is_last_payment,
-                    )
-                    session.add(payment_model)
-                
-                session.commit()
-                
-                # Reload with payments
-                updated_expense = (
-                    session.query(self.model)
-                    .options(joinedload(ExpenseModel.payments))
-                    .filter_by(id=entity.id)
-                    .one()
-                )
-                return self._parse_model_to_entity(updated_expense)
-        except Exception as ex:
-            logger.error(f'Error updating expense: {ex.args}')
-            raise ex
+        stored = {
+            row.id: row
+            for row in session.execute(
+                select(PaymentModel.id, *[getattr(PaymentModel, field) for field in PAYMENT_FIELDS])
+                .where(PaymentModel.expense_id == entity.id)
+            )
+        }
+
+        to_insert, to_update = [], []
+        for payment in entity.payments:
+            values = self._parse_payment_to_row(payment, entity.id)
+            current = stored.pop(payment.id, None)
+            if current is None:
+                to_insert.append(values)
+            elif any(getattr(current, field) != values[field] for field in PAYMENT_FIELDS):
+                to_update.append({'id': payment.id, **{field: values[field] for field in PAYMENT_FIELDS}})
+
+        if stored:
+            session.execute(
+                delete(PaymentModel).where(PaymentModel.id.in_(list(stored))),
+                execution_options={'synchronize_session': False},
+            )
+        if to_update:
+            session.execute(update(PaymentModel), to_update)
+        if to_insert:
+            session.execute(insert(PaymentModel), to_insert)
+
+    def _parse_payment_to_row(self, payment: Payment, expense_id: UUID) -> dict:
+        return {
+            'id': payment.id,
+            'expense_id': expense_id,
+            # Decimal so unchanged amounts compare equal to the stored Numeric values
+            'amount': payment.amount.to_decimal() if isinstance(payment.amount, Amount) else payment.amount,
+            'no_installment': payment.no_installment,
+            'status': payment.status.value if hasattr(payment.status, 'value') else payment.status,
+            'payment_date': payment.payment_date,
+            'is_last_payment': payment.is_last_payment,
+        }
+
+    def _parse_many_to_rows(self, entities: list[ExpenseEntity], owner_ids: dict[UUID, UUID]) -> tuple[list[dict], list[dict]]:
+        """Expense rows (with the owner_id of their account) and payment rows for create_many."""
+        expense_rows = [
+            {**self._parse_entity_to_row(entity), 'owner_id': owner_ids.get(entity.account_id)}
+            for entity in entities
+        ]
+        payment_rows = [
+            self._parse_payment_to_row(payment, entity.id)
+            for entity in entities
+            for payment in entity.payments
+        ]
+        return expense_rows, payment_rows
+
+    @staticmethod
+    def _get_account_owners_stmt(entities: list[ExpenseEntity]) -> Select:
+        return select(AccountModel.id, AccountModel.owner_id).where(
+            AccountModel.id.in_({entity.account_id for entity in entities})
+        )
+
+    @staticmethod
+    def _get_owned_account_ids_stmt(owner_id: UUID, account_ids: set[UUID]) -> Select:
+        return select(AccountModel.id).where(AccountModel.owner_id == owner_id, AccountModel.id.in_(account_ids))
 
     def _get_filter_params(self, params: dict = {}) -> dict:
         allowed = ['account_id', 'category_id', 'expense_type', 'status', 'owner_id']
         return {k: v for k, v in params.items() if k in allowed}
 
-    def get_many_by_filter(self, filter: dict, limit: int, offset: int) -> list[ExpenseEntity]:
-        """
-        Override to handle owner_id filtering which requires a JOIN with Account.
-        """
-        try:
-            with self.session_factory() as session:
-                query: Query = session.query(self.model)
-                
-                # Handle owner_id separately with JOIN
-                owner_id = filter.get('owner_id')
-                if owner_id:
-                    query = query.join(AccountModel, ExpenseModel.account_id == AccountModel.id)
-                    query = query.filter(AccountModel.owner_id == owner_id)
-                
-                # Apply other filters
-                if filter.get('order_by'):
-                    query = query.order_by(self._get_order_by_params(filter))
-                
-                search_filter = self._get_filter_params(filter)
-                # Remove owner_id from search_filter since we already handled it
-                search_filter.pop('owner_id', None)
-                
-                # When we have a JOIN, we need to use filter() with explicit model reference
-                # instead of filter_by() to avoid ambiguity
-                if search_filter:
-                    if owner_id:
-                        # Use explicit filter with ExpenseModel when we have a JOIN
-                        for key, value in search_filter.items():
-                            query = query.filter(getattr(ExpenseModel, key) == value)
-                    else:
-                        # Use filter_by when there's no JOIN
-                        query = query.filter_by(**search_filter)
-                
-                query = query.limit(limit)
-                query = query.offset(offset)
-                result_list: list[ExpenseModel] = query.all()
-                return [self._parse_model_to_entity(item) for item in result_list]
-        except Exception as ex:
-            logger.error(f'Error in get_many_by_filter: {ex.args}')
-            raise ex
+    def _get_load_options(self, params: dict = {}) -> list:
+        return [selectinload(ExpenseModel.payments)]
 
-    def count_by_filter(self, filter: dict = {}) -> int:
-        """
-        Override to handle owner_id filtering which requires a JOIN with Account.
-        """
-        try:
-            with self.session_factory() as session:
-                query: Query = session.query(self.model)
-                
-                # Handle owner_id separately with JOIN
-                owner_id = filter.get('owner_id')
-                if owner_id:
-                    query = query.join(AccountModel, ExpenseModel.account_id == AccountModel.id)
-                    query = query.filter(AccountModel.owner_id == owner_id)
-                
-                search_filter = self._get_filter_params(filter)
-                # Remove owner_id from search_filter since we already handled it
-                search_filter.pop('owner_id', None)
-                
-                # When we have a JOIN, we need to use filter() with explicit model reference
-                # instead of filter_by() to avoid ambiguity
-                if search_filter:
-                    if owner_id:
-                        # Use explicit filter with ExpenseModel when we have a JOIN
-                        for key, value in search_filter.items():
-                            query = query.filter(getattr(ExpenseModel, key) == value)
-                    else:
-                        # Use filter_by when there's no JOIN
-                        query = query.filter_by(**search_filter)
-                
-                return query.count()
-        except Exception as ex:
-            logger.error(f'Error in count_by_filter: {ex.args}')
-            raise ex
+    @staticmethod
+    def _get_payment_history_stmt(owner_id: UUID, batch_size: int) -> Select:
+        """The owner's payments joined with their expense, category and account, oldest first."""
+        return (
+            select(
+                PaymentModel.id,
+                PaymentModel.amount,
+                PaymentModel.status,
+                PaymentModel.payment_date,
+                PaymentModel.no_installment,
+                PaymentModel.is_last_payment,
+                ExpenseModel.id.label('expense_id'),
+                ExpenseModel.title,
+                ExpenseModel.expense_type,
+                ExpenseModel.cc_name,
+                ExpenseModel.acquired_at,
+                ExpenseModel.installments,
+                ExpenseModel.status.label('expense_status'),
+                ExpenseCategoryModel.name.label('category_name'),
+                AccountModel.id.label('account_id'),
+                AccountModel.alias,
+                AccountModel.is_enabled,
+                AccountModel.account_type,
+            )
+            .join(ExpenseModel, ExpenseModel.id == PaymentModel.expense_id)
+            .join(AccountModel, AccountModel.id == ExpenseModel.account_id)
+            .outerjoin(ExpenseCategoryModel, ExpenseCategoryModel.id == ExpenseModel.category_id)
+            .where(AccountModel.owner_id == owner_id)
+            .order_by(PaymentModel.payment_date, ExpenseModel.id, PaymentModel.no_installment)
+            .execution_options(yield_per=batch_size)
+        )
+
+    def _parse_payment_history_row(self, row: Row) -> PeriodPayment:
+        return PeriodPayment(
+            payment_id=row.id,
+            amount=Amount(row.amount),
+            status=PaymentStatus(row.status),
+            payment_date=row.payment_date,
+            no_installment=row.no_installment,
+            is_last_payment=row.is_last_payment,
+            expense_id=row.expense_id,
+            expense_title=row.title,
+            expense_type=ExpenseType(row.expense_type),
+            expense_cc_name=row.cc_name,
+            expense_acquired_at=row.acquired_at,
+            expense_installments=row.installments,
+            expense_status=ExpenseStatus(row.expense_status),
+            expense_category_name=row.category_name,
+            account_id=row.account_id,
+            account_alias=row.alias,
+            account_is_enabled=row.is_enabled,
+            account_type=AccountType(row.account_type),
+        )
 
     def _parse_model_to_entity(self, data: ExpenseModel):
         # choose factory by expense_type
@@ -229,27 +221,180 @@ class ExpenseRepositorySQL(BaseRepositorySQL[ExpenseModel, ExpenseEntity], Expen
             status=entity.status.value if hasattr(entity.status, 'value') else entity.status,
             spent_type=getattr(entity, 'spent_type', None),
             account_id=entity.account_id,
+            owner_id=self._get_owner_id_expr(entity.account_id),
             category_id=entity.category_id,
         )
 
+    def _parse_payments_to_models(self, entity: ExpenseEntity) -> list[PaymentModel]:
+        return [PaymentModel(**self._parse_payment_to_row(payment, entity.id)) for payment in entity.payments]
+
+    @staticmethod
+    def _get_owner_id_expr(account_id: UUID) -> ScalarSelect:
+        """owner_id of an expense on the account, filled in by the INSERT/UPDATE itself."""
+        return select(AccountModel.owner_id).where(AccountModel.id == account_id).scalar_subquery()
+
+    def _parse_entity_to_row(self, entity: ExpenseEntity) -> dict:
+        return {
+            'id': entity.id,
+            'title': entity.title,
+            'cc_name': entity.cc_name,
+            'acquired_at': entity.acquired_at,
+            'amount': entity.amount.to_decimal(),
+            'expense_type': entity.expense_type.value,
+            'installments': entity.installments,
+            'first_payment_date': entity.first_payment_date,
+            'status': entity.status.value,
+            'spent_type': getattr(entity, 'spent_type', None),
+            'account_id': entity.account_id,
+            'category_id': entity.category_id,
+        }
+
+
+class ExpenseRepositorySQL(ExpenseSQLMixin, BaseRepositorySQL[ExpenseModel, ExpenseEntity], ExpenseRepository):
+    def create(self, entity: ExpenseEntity) -> ExpenseEntity:
+        try:
+            with self._session() as session:
+                with track_card_usage(session, [entity.id]), track_period_summaries(session, [entity.id]), track_expenses_data_version(session, [entity.id]):
+                    expense_model = self._parse_entity_to_model(entity)
+                    session.add(expense_model)
+                    session.flush()
+                    session.add_all(self._parse_payments_to_models(entity))
+
+                self._commit(session)
+
+                created_expense = (
+                    session.query(self.model)
+                    .options(joinedload(ExpenseModel.payments))
+                    .filter_by(id=expense_model.id)
+                    .one()
+                )
+                return self._parse_model_to_entity(created_expense)
+        except Exception as ex:
+            logger.error(f'Error creating expense: {ex.args}')
+            raise ex
+
+    def create_many(self, entities: list[ExpenseEntity]) -> None:
+        """
+        Insert the expenses and all their payments with one executemany INSERT per table
+        (batched into multi-row VALUES by the driver), in a single transaction.
+
+        Nothing is read back: the entities already hold every stored value.
+        """
+        if not entities:
+            return
+        expense_ids = [entity.id for entity in entities]
+        try:
+            with self._session() as session:
+                owner_ids = dict(session.execute(self._get_account_owners_stmt(entities)).tuples().all())
+                expense_rows, payment_rows = self._parse_many_to_rows(entities, owner_ids)
+                with track_card_usage(session, expense_ids), track_period_summaries(session, expense_ids), track_expenses_data_version(session, expense_ids):
+                    session.execute(insert(ExpenseModel), expense_rows)
+                    if payment_rows:
+                        session.execute(insert(PaymentModel), payment_rows)
+                self._commit(session)
+        except Exception as ex:
+            logger.error(f'Error creating {len(entities)} expenses: {ex.args}')
+            raise ex
+
+    def get_owned_account_ids(self, owner_id: UUID, account_ids: Iterable[UUID]) -> set[UUID]:
+        """The given account ids that exist and belong to the owner, in one SELECT."""
+        account_ids = set(account_ids)
+        if not account_ids:
+            return set()
+        stmt = self._get_owned_account_ids_stmt(owner_id, account_ids)
+        try:
+            with self._session() as session:
+                return set(session.scalars(stmt))
+        except Exception as ex:
+            logger.error(f'Error reading the accounts of {owner_id}: {ex.args}')
+            raise ex
+
+    def update(self, entity: ExpenseEntity) -> ExpenseEntity:
+        """
+        Override update to also update associated payments.
+        This is crucial for rebalancing payments when one is updated.
+        """
+        try:
+            with self._session() as session:
+                with track_card_usage(session, [entity.id]), track_period_summaries(session, [entity.id]), track_expenses_data_version(session, [entity.id]):
+                    # Update the expense itself
+                    expense_model = session.query(self.model).filter_by(id=entity.id).first()
+                    if not expense_model:
+                        raise ValueError(f'Expense with id {entity.id} not found')
+
+                    # Update expense fields directly from entity attributes
+                    self._apply_entity_to_expense(entity, expense_model)
+
+                    # Flush expense updates before writing payments to avoid autoflush issues
+                    session.flush()
+
+                    # Update payments - only write the rows that changed
+                    self._sync_payments(session, entity)
+
+                self._commit(session)
+
+                # Reload with payments
+                updated_expense = (
+                    session.query(self.model)
+                    .options(selectinload(ExpenseModel.payments))
+                    .populate_existing()
+                    .filter_by(id=entity.id)
+                    .one()
+                )
+                return self._parse_model_to_entity(updated_expense)
+        except Exception as ex:
+            logger.error(f'Error updating expense: {ex.args}')
+            raise ex
+
+    def count_by_filter(self, filter: dict = {}) -> int:
+        """
+        Override to count only on the filter fields. owner_id is a column of expenses (copied
+        from the account), so the base listings filter on it directly, without a JOIN, and
+        cursor pages seek idx_expenses_owner_created_id.
+        """
+        try:
+            with self._session() as session:
+                return session.query(self.model).filter_by(**self._get_filter_params(filter)).count()
+        except Exception as ex:
+            logger.error(f'Error in count_by_filter: {ex.args}')
+            raise ex
+
+    def iter_payment_history(self, owner_id: UUID, batch_size: int = 1000) -> Iterator[PeriodPayment]:
+        """
+        Stream the owner's payments joined with their expense, category and account, oldest first.
+
+        Rows are fetched batch_size at a time (yield_per, a server-side cursor on PostgreSQL)
+        and no ORM entities are built, so memory stays constant whatever the history size.
+        The session stays open until the iterator is exhausted or closed.
+        """
+        stmt = self._get_payment_history_stmt(owner_id, batch_size)
+        try:
+            with self._session() as session:
+                for row in session.execute(stmt):
+                    yield self._parse_payment_history_row(row)
+        except Exception as ex:
+            logger.error(f'Error in iter_payment_history: {ex.args}')
+            raise ex
+
     def delete_by_filter(self, filter: dict) -> None:
         """
         Override delete to handle payments cascade deletion.
         First deletes all associated payments, then deletes the expense.
         """
         try:
-            with self.session_factory() as session:
+            with self._session() as session:
                 # Find the expense
                 expense = session.query(self.model).filter_by(**filter).first()
                 if not expense:
                     raise ValueError(f'No expense found matching filter {filter}')
-                
-                # Delete associated payments first
-                session.query(PaymentModel).filter_by(expense_id=expense.id).delete()
-                
-                # Now delete the expense
-                session.delete(expense)
-                session.commit()
+
+                with track_card_usage(session, [expense.id]), track_period_summaries(session, [expense.id]), track_expenses_data_version(session, [expense.id]):
+                    # Delete associated payments first
+                    session.query(PaymentModel).filter_by(expense_id=expense.id).delete()
+
+                    # Now delete the expense
+                    session.delete(expense)
+                self._commit(session)
         except Exception as ex:
             logger.error(f'Error deleting expense: {ex.args}')
             raise ex
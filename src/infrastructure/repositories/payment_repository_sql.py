@@ -1,6 +1,13 @@
 import logging
 
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query
+
 from .base_repository_sql import BaseRepositorySQL
+from .credit_card_usage_sql import track_card_usage
+from .period_summary_sql import track_period_summaries
+from .data_version_sql import track_expenses_data_version
 from src.infrastructure.database.models import PaymentModel
 from src.domain.expense import PaymentFactory, Payment as PaymentEntity
 from src.domain.expense.enums import PaymentStatus
@@ -9,7 +16,8 @@ from src.domain.shared import Amount
 logger = logging.getLogger(__name__)
 
 
-class PaymentRepositorySQL(BaseRepositorySQL[PaymentModel, PaymentEntity]):
+class PaymentSQLMixin:
+    """Parsing shared by the sync and async payment repositories."""
 
     def _get_filter_params(self, params: dict = {}) -> dict:
         allowed = ['expense_id', 'no_installment', 'status']
@@ -36,3 +44,60 @@ class PaymentRepositorySQL(BaseRepositorySQL[PaymentModel, PaymentEntity]):
             payment_date=entity.payment_date,
             is_last_payment=getattr(entity, 'is_last_payment', False),
         )
+
+
+class PaymentRepositorySQL(PaymentSQLMixin, BaseRepositorySQL[PaymentModel, PaymentEntity]):
+    """
+    Payments repository. Writes are wrapped in track_card_usage, track_period_summaries and
+    track_expenses_data_version so the usage stored on the expense's credit card, the period
+    summaries and the owner's data version change in the same transaction as the payment.
+    """
+
+    def create(self, entity: PaymentEntity) -> PaymentEntity:
+        try:
+            with self._session() as session:
+                with track_card_usage(session, [entity.expense_id]), track_period_summaries(session, [entity.expense_id]), track_expenses_data_version(session, [entity.expense_id]):
+                    new_resource = self._parse_entity_to_model(entity)
+                    session.add(new_resource)
+                self._commit(session)
+                session.refresh(new_resource)
+                return self._parse_model_to_entity(new_resource)
+        except Exception as ex:
+            logger.critical(f'{self.model} - create - {ex.args}')
+            raise ex
+
+    def update(self, entity: PaymentEntity) -> PaymentEntity:
+        try:
+            with self._session() as session:
+                existing_data: PaymentModel | None = session.query(self.model).filter_by(id=entity.id).first()
+                if not existing_data:
+                    raise ValueError(f'No record found with id {entity.id}')
+                expense_ids = {existing_data.expense_id, entity.expense_id}
+                with track_card_usage(session, expense_ids), track_period_summaries(session, expense_ids), track_expenses_data_version(session, expense_ids):
+                    self._apply_entity_to_model(entity, existing_data)
+                self._commit(session)
+                return self._parse_model_to_entity(existing_data)
+        except IntegrityError as err:
+            logger.error(err.args)
+            logger.error(f'Data with error: {str(entity.to_dict())}')
+            raise err
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
+
+    def delete_by_filter(self, filter: dict) -> None:
+        try:
+            with self._session() as session:
+                expense_ids = session.scalars(
+                    select(PaymentModel.expense_id).filter_by(**filter).distinct()
+                ).all()
+                with track_card_usage(session, expense_ids), track_period_summaries(session, expense_ids), track_expenses_data_version(session, expense_ids):
+                    query: Query = session.query(self.model)
+                    query = query.filter_by(**filter)
+                    deleted_count: int = query.delete()
+                if deleted_count == 0:
+                    raise ValueError(f'No records found matching filter {filter}')
+                self._commit(session)
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
@@ -0,0 +1,185 @@
+"""
+Materialized period summaries (payment totals per owner, account and month).
+
+Writes to expenses and payments go through track_period_summaries: it collects the
+(account, year, month) periods the touched expenses have payments in, before and after
+the write, and recomputes those summary rows in the same session. Reading the totals of
+an owner's months is then a range scan on idx_period_summaries_owner_period.
+
+The recompute runs with the rows of the touched accounts locked (SELECT ... FOR UPDATE),
+so two transactions writing to the same account take turns: the second one recomputes
+after the first has committed and sees its payments, instead of overwriting its totals
+with ones computed without them. find_period_summary_drift (and
+scripts/check_period_summaries.py) compares the stored rows with the payments.
+"""
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import date
+from uuid import UUID, uuid4
+
+from sqlalchemy import Select, and_, case, delete, extract, func, insert, or_, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.domain.expense.enums import PaymentStatus
+from src.domain.shared import Amount
+from src.infrastructure.database.models import AccountModel, ExpenseModel, PaymentModel, PeriodSummaryModel
+
+# (account_id, year, month)
+PeriodKey = tuple[UUID, int, int]
+
+TOTAL_COLUMNS = ['total_amount', 'total_confirmed_amount', 'total_paid_amount', 'total_pending_amount', 'total_payments']
+
+# Upsert on the unique (owner_id, account_id, year, month) where the dialect supports it
+UPSERT_DIALECTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+
+def _period_bounds(year: int, month: int) -> tuple[date, date]:
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+def get_period_keys(session: Session, expense_ids: Iterable[UUID]) -> set[PeriodKey]:
+    """Periods the given expenses have payments in."""
+    rows = session.execute(
+        select(ExpenseModel.account_id, PaymentModel.payment_date)
+        .join(PaymentModel, PaymentModel.expense_id == ExpenseModel.id)
+        .where(ExpenseModel.id.in_(list(expense_ids)))
+        .distinct()
+    )
+    return {(row.account_id, row.payment_date.year, row.payment_date.month) for row in rows}
+
+
+def _get_period_summaries_stmt() -> Select:
+    """Summary rows of every period with payments, grouped by owner, account and month."""
+    def total(statuses: list[PaymentStatus]):
+        values = [status.value for status in statuses]
+        return func.coalesce(func.sum(case((PaymentModel.status.in_(values), PaymentModel.amount), else_=0)), 0)
+
+    year = extract('year', PaymentModel.payment_date)
+    month = extract('month', PaymentModel.payment_date)
+    return (
+        select(
+            AccountModel.owner_id,
+            ExpenseModel.account_id,
+            year.label('year'),
+            month.label('month'),
+            func.coalesce(func.sum(PaymentModel.amount), 0).label('total_amount'),
+            total([PaymentStatus.CONFIRMED, PaymentStatus.PAID]).label('total_confirmed_amount'),
+            total([PaymentStatus.PAID]).label('total_paid_amount'),
+            total([PaymentStatus.UNCONFIRMED]).label('total_pending_amount'),
+            func.count(PaymentModel.id).label('total_payments'),
+        )
+        .join(ExpenseModel, ExpenseModel.id == PaymentModel.expense_id)
+        .join(AccountModel, AccountModel.id == ExpenseModel.account_id)
+        .group_by(AccountModel.owner_id, ExpenseModel.account_id, year, month)
+    )
+
+
+def _parse_summary_rows(rows) -> list[dict]:
+    return [{**row._asdict(), 'year': int(row.year), 'month': int(row.month)} for row in rows]
+
+
+def compute_period_summaries(session: Session, keys: Iterable[PeriodKey]) -> list[dict]:
+    """Summary rows of the given periods recomputed from their payments (periods without payments are left out)."""
+    periods = []
+    for account_id, year, month in keys:
+        start, end = _period_bounds(year, month)
+        periods.append(and_(
+            ExpenseModel.account_id == account_id,
+            PaymentModel.payment_date >= start,
+            PaymentModel.payment_date < end,
+        ))
+    if not periods:
+        return []
+    return _parse_summary_rows(session.execute(_get_period_summaries_stmt().where(or_(*periods))))
+
+
+def lock_accounts(session: Session, account_ids: Iterable[UUID]) -> None:
+    """Lock the rows of the given accounts until the transaction ends (in id order, so writers can't deadlock)."""
+    account_ids = sorted(set(account_ids))
+    if account_ids:
+        session.execute(
+            select(AccountModel.id).where(AccountModel.id.in_(account_ids)).order_by(AccountModel.id).with_for_update()
+        )
+
+
+def _get_totals(row) -> tuple:
+    'Comparable totals of a summary row (amounts as integer cents).'
+    return (*[Amount(row[column]).units for column in TOTAL_COLUMNS[:-1]], int(row['total_payments']))
+
+
+def find_period_summary_drift(session: Session) -> dict[PeriodKey, tuple[dict | None, dict | None]]:
+    """Map each period whose stored summary is wrong (or missing, or stale) to its (stored, expected) row."""
+    stored = {
+        (row['account_id'], row['year'], row['month']): dict(row)
+        for row in session.execute(select(
+            PeriodSummaryModel.owner_id, PeriodSummaryModel.account_id, PeriodSummaryModel.year, PeriodSummaryModel.month,
+            *[getattr(PeriodSummaryModel, column) for column in TOTAL_COLUMNS],
+        )).mappings()
+    }
+    expected = {
+        (row['account_id'], row['year'], row['month']): row
+        for row in _parse_summary_rows(session.execute(_get_period_summaries_stmt()))
+    }
+    drift = {}
+    for key in stored.keys() | expected.keys():
+        stored_row, expected_row = stored.get(key), expected.get(key)
+        if stored_row is None or expected_row is None or _get_totals(stored_row) != _get_totals(expected_row):
+            drift[key] = (stored_row, expected_row)
+    return drift
+
+
+def refresh_period_summaries(session: Session, keys: Iterable[PeriodKey]) -> None:
+    """Recompute the summary rows of the given periods, removing the ones left without payments."""
+    keys = set(keys)
+    if not keys:
+        return
+    summaries = compute_period_summaries(session, keys)
+
+    stale = keys - {(row['account_id'], row['year'], row['month']) for row in summaries}
+    if stale:
+        session.execute(
+            delete(PeriodSummaryModel)
+            .where(tuple_(PeriodSummaryModel.account_id, PeriodSummaryModel.year, PeriodSummaryModel.month).in_(list(stale))),
+            execution_options={'synchronize_session': False},
+        )
+    if not summaries:
+        return
+
+    upsert = UPSERT_DIALECTS.get(session.get_bind().dialect.name)
+    rows = [{'id': uuid4(), **row} for row in summaries]
+    if upsert is not None:
+        stmt = upsert(PeriodSummaryModel).values(rows)
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=['owner_id', 'account_id', 'year', 'month'],
+            set_={column: getattr(stmt.excluded, column) for column in [*TOTAL_COLUMNS, 'updated_at']},
+        ))
+    else:
+        session.execute(
+            delete(PeriodSummaryModel)
+            .where(tuple_(PeriodSummaryModel.account_id, PeriodSummaryModel.year, PeriodSummaryModel.month).in_(
+                [(row['account_id'], row['year'], row['month']) for row in summaries]
+            )),
+            execution_options={'synchronize_session': False},
+        )
+        session.execute(insert(PeriodSummaryModel), rows)
+
+
+@contextmanager
+def track_period_summaries(session: Session, expense_ids: Iterable[UUID]) -> Iterator[None]:
+    """
+    Keep the period summaries in step with writes to the given expenses and their payments.
+
+    Must wrap the writes themselves (the periods before them are read on entry) and run
+    before the commit, so the summaries change in the same transaction.
+    """
+    expense_ids = list(expense_ids)
+    before = get_period_keys(session, expense_ids)
+    yield
+    session.flush()
+    keys = before | get_period_keys(session, expense_ids)
+    # A concurrent writer to the same accounts waits here until this transaction ends
+    lock_accounts(session, {account_id for account_id, _, _ in keys})
+    refresh_period_summaries(session, keys)
@@ -3,16 +3,61 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session, sessionmaker
 
-from src.application.ports import RefreshTokenRepository
+from src.application.ports import CursorKey, RefreshTokenRepository
 from src.domain.auth import RefreshToken
 from src.infrastructure.database.models import RefreshTokenModel
 from src.infrastructure.database import db_conn
+from .base_repository_sql import get_cursor_page
 
 
-class RefreshTokenRepositorySQL(RefreshTokenRepository):
+class RefreshTokenSQLMixin:
+    """Conversions shared by the sync and async refresh token repositories"""
+
+    def _to_model(self, entity: RefreshToken) -> RefreshTokenModel:
+        """Convert domain entity to model"""
+        return RefreshTokenModel(
+            id=entity.id,
+            user_id=entity.user_id,
+            token_hash=entity.token_hash,
+            expires_at=entity.expires_at,
+            revoked=entity.revoked,
+            revoked_at=entity.revoked_at,
+            device_info=entity.device_info,
+            ip_address=entity.ip_address,
+        )
+
+    def _to_domain(self, model: RefreshTokenModel) -> RefreshToken:
+        """Convert model to domain entity"""
+        # Ensure datetimes are timezone-aware
+        expires_at = model.expires_at
+        if expires_at and expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        
+        revoked_at = model.revoked_at
+        if revoked_at and revoked_at.tzinfo is None:
+            revoked_at = revoked_at.replace(tzinfo=timezone.utc)
+        
+        created_at = model.created_at
+        if created_at and created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        
+        return RefreshToken(
+            id=model.id,
+            user_id=model.user_id,
+            token_hash=model.token_hash,
+            expires_at=expires_at,
+            revoked=model.revoked,
+            revoked_at=revoked_at,
+            device_info=model.device_info,
+            ip_address=model.ip_address,
+            created_at=created_at,
+        )
+
+
+class RefreshTokenRepositorySQL(RefreshTokenSQLMixin, RefreshTokenRepository):
     """SQL implementation of RefreshTokenRepository"""
     
     def __init__(self, session_factory: sessionmaker = db_conn.SessionLocal):
@@ -21,16 +66,7 @@ class RefreshTokenRepositorySQL(RefreshTokenRepository):
     def create(self, entity: RefreshToken) -> RefreshToken:
         """Create a new refresh token"""
         with self.session_factory() as db:
-            model = RefreshTokenModel(
-                id=entity.id,
-                user_id=entity.user_id,
-                token_hash=entity.token_hash,
-                expires_at=entity.expires_at,
-                revoked=entity.revoked,
-                revoked_at=entity.revoked_at,
-                device_info=entity.device_info,
-                ip_address=entity.ip_address,
-            )
+            model = self._to_model(entity)
             db.add(model)
             db.commit()
             db.refresh(model)
@@ -75,6 +111,24 @@ class RefreshTokenRepositorySQL(RefreshTokenRepository):
             models = db.query(RefreshTokenModel).filter_by(**filter).limit(limit).offset(offset).all()
             return [self._to_domain(model) for model in models]
     
+    def get_page_by_filter(self, filter: dict, limit: int, offset: int) -> tuple[list[RefreshToken], int]:
+        """Get a page of refresh tokens by filter and their total in one query"""
+        with self.session_factory() as db:
+            rows = (
+                db.query(RefreshTokenModel, func.count().over().label('total_count'))
+                .filter_by(**filter).limit(limit).offset(offset).all()
+            )
+            if not rows:
+                return [], self.count_by_filter(filter) if offset else 0
+            return [self._to_domain(row[0]) for row in rows], rows[0].total_count
+    
+    def get_many_by_cursor(self, filter: dict, limit: int, after: Optional[CursorKey] = None) -> tuple[list[RefreshToken], Optional[CursorKey]]:
+        """Get refresh tokens by filter in (created_at, id) order, after the given position"""
+        with self.session_factory() as db:
+            query = db.query(RefreshTokenModel).filter_by(**filter)
+            models, next_key = get_cursor_page(query, RefreshTokenModel, limit, after)
+            return [self._to_domain(model) for model in models], next_key
+    
     def get_by_filter(self, filter: dict) -> Optional[RefreshToken]:
         """Get a single refresh token by filter"""
         with self.session_factory() as db:
@@ -132,30 +186,3 @@ class RefreshTokenRepositorySQL(RefreshTokenRepository):
             
             db.commit()
             return result
-    
-    def _to_domain(self, model: RefreshTokenModel) -> RefreshToken:
-        """Convert model to domain entity"""
-        # Ensure datetimes are timezone-aware
-        expires_at = model.expires_at
-        if expires_at and expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=timezone.utc)
-        
-        revoked_at = model.revoked_at
-        if revoked_at and revoked_at.tzinfo is None:
-            revoked_at = revoked_at.replace(tzinfo=timezone.utc)
-        
-        created_at = model.created_at
-        if created_at and created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=timezone.utc)
-        
-        return RefreshToken(
-            id=model.id,
-            user_id=model.user_id,
-            token_hash=model.token_hash,
-            expires_at=expires_at,
-            revoked=model.revoked,
-            revoked_at=revoked_at,
-            device_info=model.device_info,
-            ip_address=model.ip_address,
-            created_at=created_at,
-        )
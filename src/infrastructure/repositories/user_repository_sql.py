@@ -1,4 +1,8 @@
 import logging
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from .base_repository_sql import BaseRepositorySQL
 from src.application.ports.user_repository import UserRepository
@@ -8,54 +12,47 @@ from src.domain.auth import User as UserEntity, UserFactory
 logger = logging.getLogger(__name__)
 
 
-class UserRepositorySQL(BaseRepositorySQL[UserModel, UserEntity], UserRepository):
+class UserSQLMixin:
+    """Loading and parsing shared by the sync and async user repositories."""
 
-    def update(self, entity: UserEntity) -> UserEntity:
-        try:
-            with self.session_factory() as session:
-                existing_resource: UserModel | None = session.get(self.model, entity.id)
-                if not existing_resource:
-                    raise ValueError(f'User with id {entity.id} does not exist.')
+    def _get_load_options(self, params: dict = {}) -> list:
+        # The parser reads the profile and its preferences
+        return [selectinload(UserModel.profile).selectinload(ProfileModel.preferences)]
 
-                # Update fields
-                existing_resource.username = entity.username
-                existing_resource.email = entity.email
-                existing_resource.password_hash = entity.encrypted_password
-                existing_resource.role = entity.role.value
-
-                # Update profile if exists
-                if entity.profile:
-                    if existing_resource.profile:
-                        existing_resource.profile.first_name = entity.profile.first_name
-                        existing_resource.profile.last_name = entity.profile.last_name
-                        existing_resource.profile.birthdate = entity.profile.birthdate
-
-                        # Update preferences if exists
-                        if entity.profile.preferences and existing_resource.profile.preferences:
-                            existing_resource.profile.preferences.monthly_spending_limit = entity.profile.preferences.monthly_spending_limit
-                    else:
-                        # Create new profile if it doesn't exist
-                        preferences = PreferencesModel(
-                            id=entity.profile.preferences.id,
-                            monthly_spending_limit=entity.profile.preferences.monthly_spending_limit,
-                            profile_id=entity.profile.id,
-                        )
-                        profile = ProfileModel(
-                            id=entity.profile.id,
-                            first_name=entity.profile.first_name,
-                            last_name=entity.profile.last_name,
-                            birthdate=entity.profile.birthdate,
-                            user_id=entity.id,
-                            preferences=preferences
-                        )
-                        existing_resource.profile = profile
-
-                session.commit()
-                session.refresh(existing_resource)
-                return self._parse_model_to_entity(existing_resource)
-        except Exception as ex:
-            logger.critical(f'{self.model} - update - {ex.args} - Updated resource: {entity.to_dict()}')
-            raise ex
+    def _apply_entity_to_user(self, entity: UserEntity, existing_data: UserModel) -> None:
+        """Copy the entity onto the loaded user, creating its profile if it has none."""
+        # Update fields
+        existing_data.username = entity.username
+        existing_data.email = entity.email
+        existing_data.password_hash = entity.encrypted_password
+        existing_data.role = entity.role.value
+
+        # Update profile if exists
+        if entity.profile:
+            if existing_data.profile:
+                existing_data.profile.first_name = entity.profile.first_name
+                existing_data.profile.last_name = entity.profile.last_name
+                existing_data.profile.birthdate = entity.profile.birthdate
+
+                # Update preferences if exists
+                if entity.profile.preferences and existing_data.profile.preferences:
+                    existing_data.profile.preferences.monthly_spending_limit = entity.profile.preferences.monthly_spending_limit
+            else:
+                # Create new profile if it doesn't exist
+                preferences = PreferencesModel(
+                    id=entity.profile.preferences.id,
+                    monthly_spending_limit=entity.profile.preferences.monthly_spending_limit,
+                    profile_id=entity.profile.id,
+                )
+                profile = ProfileModel(
+                    id=entity.profile.id,
+                    first_name=entity.profile.first_name,
+                    last_name=entity.profile.last_name,
+                    birthdate=entity.profile.birthdate,
+                    user_id=entity.id,
+                    preferences=preferences
+                )
+                existing_data.profile = profile
 
     def _get_filter_params(self, params: dict = {}) -> dict:
         allowed_filters = ['email', 'username']
@@ -95,3 +92,31 @@ class UserRepositorySQL(BaseRepositorySQL[UserModel, UserEntity], UserRepository
             role=entity.role.value,
             profile=profile
         )
+
+
+class UserRepositorySQL(UserSQLMixin, BaseRepositorySQL[UserModel, UserEntity], UserRepository):
+
+    def update(self, entity: UserEntity) -> UserEntity:
+        try:
+            with self._session() as session:
+                existing_resource: UserModel | None = session.get(self.model, entity.id)
+                if not existing_resource:
+                    raise ValueError(f'User with id {entity.id} does not exist.')
+
+                self._apply_entity_to_user(entity, existing_resource)
+
+                self._commit(session)
+                session.refresh(existing_resource)
+                return self._parse_model_to_entity(existing_resource)
+        except Exception as ex:
+            logger.critical(f'{self.model} - update - {ex.args} - Updated resource: {entity.to_dict()}')
+            raise ex
+
+    def get_data_version(self, user_id: UUID) -> int:
+        try:
+            with self._session() as session:
+                version = session.scalar(select(UserModel.data_version).where(UserModel.id == user_id))
+                return version or 0
+        except Exception as ex:
+            logger.critical(ex.args)
+            raise ex
@@ -0,0 +1,31 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.application.helpers.pagination import decode_cursor, encode_cursor, get_cursor_pagination
+
+
+def test_cursor_round_trip():
+    key = (datetime(2025, 6, 1, 12, 30, 15, 250), uuid4())
+    cursor = encode_cursor(key)
+    assert '=' not in cursor
+    assert decode_cursor(cursor) == key
+
+
+@pytest.mark.parametrize('cursor', ['', 'not-a-cursor', '!!!', encode_cursor((datetime(2025, 1, 1), uuid4()))[:-4]])
+def test_decode_cursor_invalid(cursor: str):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_get_cursor_pagination():
+    key = (datetime(2025, 1, 1), uuid4())
+    pagination = get_cursor_pagination(10, key)
+    assert pagination.next_cursor == encode_cursor(key)
+    assert pagination.total_items is None and pagination.total_pages is None and pagination.current_page is None
+    assert pagination.has_next_page and not pagination.has_previous_page
+
+    pagination = get_cursor_pagination(10, None, total_items=21)
+    assert pagination.next_cursor is None and not pagination.has_next_page
+    assert pagination.total_items == 21 and pagination.total_pages == 3
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.application.helpers import security
+from src.application.helpers.password_hasher import PasswordHasher
+from src.common.exceptions import PasswordHasherBusyError
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    yield hasher
+    hasher.shutdown()
+
+
+def test_password_hasher_hash_and_verify(hasher: PasswordHasher):
+    async def scenario():
+        hashed = await hasher.hash('SecurePassword123!')
+        return hashed, await hasher.verify('SecurePassword123!', hashed), await hasher.verify('wrong', hashed)
+
+    hashed, valid, invalid = asyncio.run(scenario())
+    assert security.verify_password('SecurePassword123!', hashed)
+    assert valid is True
+    assert invalid is False
+    metrics = hasher.get_metrics()
+    assert metrics['completed'] == 3
+    assert metrics['queued'] == 0 and metrics['running'] == 0
+
+
+def test_password_hasher_rejects_when_queue_is_full(hasher: PasswordHasher, monkeypatch: pytest.MonkeyPatch):
+    release = threading.Event()
+
+    def slow_hash(plain_password: str) -> str:
+        release.wait(timeout=5)
+        return plain_password
+
+    monkeypatch.setattr(security, 'hash_password', slow_hash)
+
+    async def scenario():
+        running = asyncio.ensure_future(hasher.hash('running'))
+        while hasher.get_metrics()['running'] == 0:
+            await asyncio.sleep(0.001)
+        waiting = asyncio.ensure_future(hasher.hash('waiting'))
+        await asyncio.sleep(0)
+        assert hasher.queue_depth == 1
+        with pytest.raises(PasswordHasherBusyError):
+            await hasher.hash('rejected')
+        release.set()
+        return await asyncio.gather(running, waiting)
+
+    assert asyncio.run(scenario()) == ['running', 'waiting']
+    metrics = hasher.get_metrics()
+    assert metrics['rejected'] == 1
+    assert metrics['completed'] == 2
+    assert metrics['queued'] == 0
+
+
+def test_password_hasher_cancelled_call_leaves_queue(hasher: PasswordHasher, monkeypatch: pytest.MonkeyPatch):
+    release = threading.Event()
+    monkeypatch.setattr(security, 'hash_password', lambda plain_password: release.wait(timeout=5) and plain_password)
+
+    async def scenario():
+        running = asyncio.ensure_future(hasher.hash('running'))
+        while hasher.get_metrics()['running'] == 0:
+            await asyncio.sleep(0.001)
+        waiting = asyncio.ensure_future(hasher.hash('waiting'))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.sleep(0)
+        queued = hasher.queue_depth
+        release.set()
+        await running
+        return queued
+
+    assert asyncio.run(scenario()) == 0
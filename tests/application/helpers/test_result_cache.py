@@ -0,0 +1,176 @@
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.application.helpers.result_cache import ResultCache, cached, invalidating
+from src.application.ports import AsyncCreditCardRepository, AsyncUnitOfWork, Cache, UnitOfWork
+from src.application.use_cases.period import PeriodGetOneUseCase
+from src.infrastructure.cache import InMemoryCache
+
+
+class FakeUseCase:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def execute(self, *args):
+        self.calls += 1
+        return {'args': args, 'call': self.calls}
+
+
+def test_cached_use_case_serves_repeated_calls():
+    result_cache = ResultCache(InMemoryCache(), ttl=60)
+    user_id = uuid4()
+    use_case = FakeUseCase()
+
+    first = cached(use_case, result_cache, user_id).execute({'owner_id': user_id}, 10, 0)
+    again = cached(use_case, result_cache, user_id).execute({'owner_id': user_id}, 10, 0)
+    other_page = cached(use_case, result_cache, user_id).execute({'owner_id': user_id}, 10, 10)
+
+    assert first == again
+    assert use_case.calls == 2 and other_page['call'] == 2
+    assert result_cache.get_metrics() | {'backend': None} == {
+        'backend': None, 'ttl': 60, 'hits': 1, 'misses': 2, 'hit_ratio': 1 / 3, 'invalidations': 0,
+    }
+
+
+def test_invalidating_use_case_drops_only_the_user_results():
+    result_cache = ResultCache(InMemoryCache(), ttl=60)
+    user_id, other_user_id = uuid4(), uuid4()
+    use_case = FakeUseCase()
+    cached(use_case, result_cache, user_id).execute('a')
+    cached(use_case, result_cache, other_user_id).execute('a')
+
+    assert invalidating(FakeUseCase(), result_cache, user_id).execute('write')['args'] == ('write',)
+    cached(use_case, result_cache, user_id).execute('a')
+    cached(use_case, result_cache, other_user_id).execute('a')
+
+    assert use_case.calls == 3
+    assert result_cache.get_metrics()['invalidations'] == 1
+
+
+def test_invalidating_use_case_waits_for_the_unit_of_work_commit():
+    unit_of_work = MagicMock(spec=UnitOfWork)
+    result_cache = ResultCache(InMemoryCache(), ttl=60, current_unit_of_work=lambda: unit_of_work)
+    user_id = uuid4()
+    use_case = FakeUseCase()
+    cached(use_case, result_cache, user_id).execute('a')
+
+    invalidating(FakeUseCase(), result_cache, user_id).execute('write')
+    # Not committed yet: reads still get the cached result
+    cached(use_case, result_cache, user_id).execute('a')
+    assert use_case.calls == 1
+
+    (callback,), _ = unit_of_work.after_commit.call_args
+    callback()
+    cached(use_case, result_cache, user_id).execute('a')
+    assert use_case.calls == 2
+
+
+def test_async_invalidating_use_case_waits_for_the_async_unit_of_work_commit():
+    class FakeAsyncUseCase:
+        async def execute(self, *args):
+            return args
+
+    unit_of_work = MagicMock(spec=AsyncUnitOfWork)
+    cache = InMemoryCache()
+    result_cache = ResultCache(cache, ttl=60, current_unit_of_work=lambda: unit_of_work)
+    user_id = uuid4()
+    use_case = FakeUseCase()
+    cached(use_case, result_cache, user_id).execute('a')
+
+    assert asyncio.run(invalidating(FakeAsyncUseCase(), result_cache, user_id).execute('write')) == ('write',)
+    cached(use_case, result_cache, user_id).execute('a')
+    assert use_case.calls == 1
+
+    # The callback returns the invalidation for the unit of work to await
+    (callback,), _ = unit_of_work.after_commit.call_args
+    asyncio.run(callback())
+    cached(use_case, result_cache, user_id).execute('a')
+    assert use_case.calls == 2
+    assert result_cache.get_metrics()['invalidations'] == 1
+
+
+def test_ainvalidate_uses_the_async_cache_methods():
+    cache = MagicMock(spec=Cache)
+    user_id = uuid4()
+
+    asyncio.run(ResultCache(cache, ttl=60).ainvalidate_after_commit(user_id))
+
+    cache.aset.assert_awaited_once()
+    assert cache.aset.call_args.args[0] == ResultCache.generation_key(user_id)
+    cache.ainvalidate_tag.assert_awaited_once_with(ResultCache.user_tag(user_id))
+    cache.set.assert_not_called()
+    cache.invalidate_tag.assert_not_called()
+
+
+def test_read_racing_an_invalidation_is_not_served():
+    result_cache = ResultCache(InMemoryCache(), ttl=60)
+    user_id = uuid4()
+    rows = ['before']
+
+    def compute_then_write():
+        # Read before the write commits, the invalidation lands before the result is stored
+        value = list(rows)
+        rows[:] = ['after']
+        result_cache.invalidate(user_id)
+        return value
+
+    key = ResultCache.user_key(user_id, 'rows')
+    assert result_cache.get_or_compute(user_id, key, compute_then_write) == ['before']
+    assert result_cache.get_or_compute(user_id, key, lambda: list(rows)) == ['after']
+
+    async def acompute_then_write():
+        return compute_then_write()
+
+    rows[:] = ['before']
+    result_cache.invalidate(user_id)
+    assert asyncio.run(result_cache.aget_or_compute(user_id, key, acompute_then_write)) == ['before']
+    assert result_cache.get_or_compute(user_id, key, lambda: list(rows)) == ['after']
+
+
+def test_cached_without_cache_or_user_returns_the_use_case():
+    use_case = FakeUseCase()
+    assert cached(use_case, None, uuid4()) is use_case
+    assert cached(use_case, ResultCache(InMemoryCache()), None) is use_case
+    assert invalidating(use_case, None, uuid4()) is use_case
+
+
+def test_cached_period_skips_the_repository_until_invalidated():
+    repo = MagicMock(spec=AsyncCreditCardRepository)
+    repo.get_period_payments = AsyncMock(return_value=[])
+    result_cache = ResultCache(InMemoryCache(), ttl=60)
+    user_id = uuid4()
+    today = date.today()
+
+    def load():
+        use_case = cached(PeriodGetOneUseCase(repo), result_cache, user_id)
+        return asyncio.run(use_case.execute(user_id, today.month, today.year))
+
+    first, again = load(), load()
+    assert repo.get_period_payments.await_count == 1
+    assert again is first
+
+    result_cache.invalidate(user_id)
+    load()
+    assert repo.get_period_payments.await_count == 2
+
+
+def test_async_cached_use_case_uses_the_async_cache_methods():
+    cache = MagicMock(spec=Cache)
+    cache.aget = AsyncMock(return_value=None)
+    cache.aset = AsyncMock()
+    repo = MagicMock(spec=AsyncCreditCardRepository)
+    repo.get_period_payments = AsyncMock(return_value=[])
+    user_id = uuid4()
+    today = date.today()
+
+    use_case = cached(PeriodGetOneUseCase(repo), ResultCache(cache, ttl=60), user_id)
+    asyncio.run(use_case.execute(user_id, today.month, today.year))
+
+    # The entry, then the user's generation before and after computing
+    assert cache.aget.await_count == 3
+    cache.aset.assert_awaited_once()
+    # No blocking cache call on the event loop
+    cache.get.assert_not_called()
+    cache.set.assert_not_called()
@@ -1,9 +1,18 @@
 from datetime import timedelta
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
-from src.application.helpers.security import hash_password, verify_password, encode_jwt, decode_jwt, create_access_token
+from src.application.helpers import security
+from src.application.helpers.security import (
+    hash_password,
+    verify_password,
+    encode_jwt,
+    decode_jwt,
+    decode_jwt_cached,
+    create_access_token,
+)
 from src.common.exceptions import JWTExpiredError, JWTInvalidError, JWTInvalidSignatureError
 from src.domain.auth import User, UserFactory
 
@@ -90,3 +99,37 @@ def test_create_access_token(user: User):
     assert decoded['role'] == user.role.value
     assert decoded['email'] == user.email
     assert 'exp' in decoded  # Ensure the token has an expiration claim
+
+
+def test_decode_jwt_cached_verifies_once():
+    security.jwt_cache.clear()
+    token = encode_jwt({'sub': '123'}, 'supersecretkey', 'HS256', timedelta(minutes=5))
+    with patch.object(security.jwt, 'decode', wraps=security.jwt.decode) as jwt_decode:
+        first = decode_jwt_cached(token, 'supersecretkey', 'HS256')
+        second = decode_jwt_cached(token, 'supersecretkey', 'HS256')
+    assert jwt_decode.call_count == 1
+    assert first == second and first['sub'] == '123'
+
+
+def test_decode_jwt_cached_returns_copies():
+    security.jwt_cache.clear()
+    token = encode_jwt({'sub': '123'}, 'supersecretkey', 'HS256', timedelta(minutes=5))
+    payload = decode_jwt_cached(token, 'supersecretkey', 'HS256')
+    del payload['exp']
+    assert 'exp' in decode_jwt_cached(token, 'supersecretkey', 'HS256')
+
+
+def test_decode_jwt_cached_is_keyed_by_secret():
+    security.jwt_cache.clear()
+    token = encode_jwt({'sub': '123'}, 'supersecretkey', 'HS256', timedelta(minutes=5))
+    decode_jwt_cached(token, 'supersecretkey', 'HS256')
+    with pytest.raises(JWTInvalidSignatureError):
+        decode_jwt_cached(token, 'wrongsecret', 'HS256')
+
+
+def test_decode_jwt_cached_does_not_cache_invalid_tokens():
+    security.jwt_cache.clear()
+    token = encode_jwt({'sub': '123'}, 'supersecretkey', 'HS256', timedelta(seconds=-1))
+    with pytest.raises(JWTExpiredError):
+        decode_jwt_cached(token, 'supersecretkey', 'HS256')
+    assert len(security.jwt_cache) == 0
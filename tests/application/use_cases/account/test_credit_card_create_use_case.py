@@ -1,9 +1,10 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.application.use_cases.account import CreditCardCreateUseCase
-from src.application.ports import CreditCardRepository
+from src.application.ports import AsyncCreditCardRepository
 from src.application.dtos import CreateCreditCardDTO, CreditCardResponseDTO
 from src.domain.account import CreditCard
 from tests.fixtures.account_fixtures import main_credit_card_dto, main_credit_card, user  # noqa: F401
@@ -14,22 +15,22 @@ def create_fake_credit_card(credit_card_data: CreditCard) -> CreditCard:
 
 
 @pytest.fixture
-def repo() -> CreditCardRepository:
-    repo: CreditCardRepository = MagicMock(spec=CreditCardRepository)
+def repo() -> AsyncCreditCardRepository:
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
     repo.create.side_effect = create_fake_credit_card
     return repo
 
 
 @pytest.fixture
-def repo_fail() -> CreditCardRepository:
-    repo: CreditCardRepository = MagicMock(spec=CreditCardRepository)
+def repo_fail() -> AsyncCreditCardRepository:
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
     repo.create.side_effect = Exception('Database error')
     return repo
 
 
-def test_credit_card_create_use_case_success(main_credit_card_dto: CreateCreditCardDTO, repo: CreditCardRepository):
+def test_credit_card_create_use_case_success(main_credit_card_dto: CreateCreditCardDTO, repo: AsyncCreditCardRepository):
     use_case = CreditCardCreateUseCase(credit_card_repository=repo)
-    result = use_case.execute(main_credit_card_dto)
+    result = asyncio.run(use_case.execute(main_credit_card_dto))
     assert isinstance(
         result, CreditCardResponseDTO), f'Expected CreditCardResponseDTO, got {type(result)}'
     assert result.id is not None, 'Expected non-null credit card ID'
@@ -49,7 +50,7 @@ def test_credit_card_create_use_case_success(main_credit_card_dto: CreateCreditC
     assert result.used_financing_limit == 0.0, f'Expected used_financing_limit 0.0, got {result.used_financing_limit}'
     assert result.available_financing_limit == main_credit_card_dto.financing_limit, f'Expected available_financing_limit {main_credit_card_dto.financing_limit}, got {result.available_financing_limit}'
 
-def test_credit_card_create_use_case_fail(main_credit_card_dto: CreateCreditCardDTO, repo_fail: CreditCardRepository):
+def test_credit_card_create_use_case_fail(main_credit_card_dto: CreateCreditCardDTO, repo_fail: AsyncCreditCardRepository):
     use_case = CreditCardCreateUseCase(credit_card_repository=repo_fail)
     with pytest.raises(Exception):
-        use_case.execute(main_credit_card_dto)
\ No newline at end of file
+        asyncio.run(use_case.execute(main_credit_card_dto))
\ No newline at end of file
@@ -1,35 +1,36 @@
+import asyncio
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 
 from src.application.use_cases.account import CreditCardDeleteUseCase
-from src.application.ports import CreditCardRepository
+from src.application.ports import AsyncCreditCardRepository
 
 
 @pytest.fixture
-def repo() -> CreditCardRepository:
-    repo: CreditCardRepository = MagicMock(spec=CreditCardRepository)
+def repo() -> AsyncCreditCardRepository:
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
     repo.delete_by_filter.return_value = None
     return repo
 
 
 @pytest.fixture
-def repo_fail() -> CreditCardRepository:
-    repo: CreditCardRepository = MagicMock(spec=CreditCardRepository)
+def repo_fail() -> AsyncCreditCardRepository:
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
     repo.delete_by_filter.side_effect = Exception('Database error')
     return repo
 
 
-def test_credit_card_delete_use_case_success(repo: CreditCardRepository):
+def test_credit_card_delete_use_case_success(repo: AsyncCreditCardRepository):
     credit_card_id = uuid4()
     use_case = CreditCardDeleteUseCase(credit_card_repository=repo)
-    none_response = use_case.execute(credit_card_id)
+    none_response = asyncio.run(use_case.execute(credit_card_id))
     assert none_response is None, f'Expected None, got {type(none_response)}'
 
 
-def test_credit_card_delete_use_case_fail(repo_fail: CreditCardRepository):
+def test_credit_card_delete_use_case_fail(repo_fail: AsyncCreditCardRepository):
     credit_card_id = uuid4()
     use_case = CreditCardDeleteUseCase(credit_card_repository=repo_fail)
     with pytest.raises(Exception):
-        use_case.execute(credit_card_id)
+        asyncio.run(use_case.execute(credit_card_id))
@@ -1,10 +1,11 @@
+import asyncio
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 
 from src.application.use_cases.account import CreditCardGetOneUseCase
-from src.application.ports import CreditCardRepository
+from src.application.ports import AsyncCreditCardRepository
 from src.application.dtos import CreditCardResponseDTO
 from src.domain.account import CreditCard
 from src.common.exceptions import RepoNotFoundError
@@ -12,40 +13,43 @@ from tests.fixtures.account_fixtures import main_credit_card, user  # noqa: F401
 
 
 @pytest.fixture
-def repo(main_credit_card: CreditCard) -> CreditCardRepository:
-    repo: CreditCardRepository = MagicMock(spec=CreditCardRepository)
+def repo(main_credit_card: CreditCard) -> AsyncCreditCardRepository:
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
     repo.get_by_filter.return_value = main_credit_card
     return repo
 
 
 @pytest.fixture
-def repo_fail() -> CreditCardRepository:
-    repo: CreditCardRepository = MagicMock(spec=CreditCardRepository)
+def repo_fail() -> AsyncCreditCardRepository:
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
     repo.get_by_filter.side_effect = Exception('Database error')
     return repo
 
 
 @pytest.fixture
-def repo_none() -> CreditCardRepository:
-    repo: CreditCardRepository = MagicMock(spec=CreditCardRepository)
+def repo_none() -> AsyncCreditCardRepository:
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
     repo.get_by_filter.return_value = None
     return repo
 
 
-def test_credit_card_get_one_use_case_success(repo: CreditCardRepository):
+def test_credit_card_get_one_use_case_success(repo: AsyncCreditCardRepository):
     use_case = CreditCardGetOneUseCase(credit_card_repository=repo)
-    result = use_case.execute(credit_card_id=uuid4())
+    credit_card_id = uuid4()
+    result = asyncio.run(use_case.execute(credit_card_id=credit_card_id))
     assert isinstance(
         result, CreditCardResponseDTO), f'Expected CreditCardResponseDTO, got {type(result)}'
+    # Usage figures come from the stored aggregates, expenses are not loaded
+    repo.get_by_filter.assert_called_once_with({'id': credit_card_id, 'include_expenses': False})
 
 
-def test_credit_card_get_one_use_case_not_found(repo_none: CreditCardRepository):
+def test_credit_card_get_one_use_case_not_found(repo_none: AsyncCreditCardRepository):
     use_case = CreditCardGetOneUseCase(credit_card_repository=repo_none)
     with pytest.raises(RepoNotFoundError):
-        use_case.execute(credit_card_id=uuid4())
+        asyncio.run(use_case.execute(credit_card_id=uuid4()))
 
 
-def test_credit_card_get_one_use_case_fail(repo_fail: CreditCardRepository):
+def test_credit_card_get_one_use_case_fail(repo_fail: AsyncCreditCardRepository):
     use_case = CreditCardGetOneUseCase(credit_card_repository=repo_fail)
     with pytest.raises(Exception):
-        use_case.execute(credit_card_id=uuid4())
+        asyncio.run(use_case.execute(credit_card_id=uuid4()))
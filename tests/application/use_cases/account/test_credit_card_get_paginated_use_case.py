@@ -1,22 +1,52 @@
+import asyncio
+from datetime import datetime
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 
 from src.application.use_cases.account import CreditCardGetPaginatedUseCase
-from src.application.ports import CreditCardRepository
+from src.application.ports import AsyncCreditCardRepository
 from src.application.dtos import PaginatedResponse
+from src.application.helpers.pagination import encode_cursor
 
 
 @pytest.fixture
-def repo() -> CreditCardRepository:
-    repo: CreditCardRepository = MagicMock(spec=CreditCardRepository)
-    repo.get_many_by_filter.return_value = []
+def repo() -> AsyncCreditCardRepository:
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
+    repo.get_page_by_filter.return_value = ([], 0)
     return repo
 
 
-def test_credit_card_get_paginated_use_case_success(repo: CreditCardRepository):
+def test_credit_card_get_paginated_use_case_success(repo: AsyncCreditCardRepository):
     use_case = CreditCardGetPaginatedUseCase(credit_card_repository=repo)
-    result = use_case.execute(filter={'owner_id': uuid4()}, limit=10, offset=0)
+    result = asyncio.run(use_case.execute(filter={'owner_id': uuid4()}, limit=10, offset=0))
     assert isinstance(
         result, PaginatedResponse), f'Expected PaginatedResponse, got {type(result)}'
+
+
+def test_credit_card_get_paginated_use_case_by_cursor(repo: AsyncCreditCardRepository):
+    next_key = (datetime(2025, 1, 2, 3, 4, 5), uuid4())
+    repo.get_many_by_cursor.return_value = ([], next_key)
+    use_case = CreditCardGetPaginatedUseCase(credit_card_repository=repo)
+
+    first = asyncio.run(use_case.execute_by_cursor(filter={'owner_id': uuid4()}, limit=10))
+    assert first.pagination.next_cursor == encode_cursor(next_key)
+    assert first.pagination.has_next_page
+    assert first.pagination.total_items is None
+    repo.count_by_filter.assert_not_called()
+
+    repo.get_many_by_cursor.return_value = ([], None)
+    repo.count_by_filter.return_value = 12
+    last = asyncio.run(use_case.execute_by_cursor(filter={}, limit=10, cursor=first.pagination.next_cursor, include_total=True))
+    assert repo.get_many_by_cursor.call_args.args[2] == next_key
+    assert last.pagination.next_cursor is None
+    assert not last.pagination.has_next_page
+    assert last.pagination.total_items == 12
+    assert last.pagination.total_pages == 2
+
+
+def test_credit_card_get_paginated_use_case_invalid_cursor(repo: AsyncCreditCardRepository):
+    use_case = CreditCardGetPaginatedUseCase(credit_card_repository=repo)
+    with pytest.raises(ValueError):
+        asyncio.run(use_case.execute_by_cursor(filter={}, limit=10, cursor='not-a-cursor'))
@@ -1,9 +1,10 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.application.use_cases.account import CreditCardUpdateUseCase
-from src.application.ports import CreditCardRepository
+from src.application.ports import AsyncCreditCardRepository
 from src.application.dtos import CreditCardResponseDTO, UpdateCreditCardDTO
 from src.domain.account import CreditCard
 from tests.fixtures.account_fixtures import main_credit_card, updated_credit_card_dto  # noqa: F401
@@ -16,16 +17,16 @@ def fake_update(credit_card: CreditCard) -> CreditCard:
 
 
 @pytest.fixture
-def repo(main_credit_card: CreditCardResponseDTO) -> CreditCardRepository:
-    repo: CreditCardRepository = MagicMock(spec=CreditCardRepository)
+def repo(main_credit_card: CreditCardResponseDTO) -> AsyncCreditCardRepository:
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
     repo.get_by_filter.return_value = main_credit_card
     repo.update.side_effect = fake_update
     return repo
 
 
-def test_credit_card_update_use_case_success(repo: CreditCardRepository, main_credit_card: CreditCard, updated_credit_card_dto: UpdateCreditCardDTO):
+def test_credit_card_update_use_case_success(repo: AsyncCreditCardRepository, main_credit_card: CreditCard, updated_credit_card_dto: UpdateCreditCardDTO):
     use_case = CreditCardUpdateUseCase(repo)
-    updated_card = use_case.execute(main_credit_card.id, updated_credit_card_dto)
+    updated_card = asyncio.run(use_case.execute(main_credit_card.id, updated_credit_card_dto))
 
     assert updated_card.alias == updated_credit_card_dto.alias, \
         f'Expected alias {updated_credit_card_dto.alias}, got {updated_card.alias}'
@@ -33,14 +34,15 @@ def test_credit_card_update_use_case_success(repo: CreditCardRepository, main_cr
         f'Expected limit {updated_credit_card_dto.limit}, got {updated_card.limit}'
     assert updated_card.financing_limit == updated_credit_card_dto.financing_limit, \
         f'Expected financing limit {updated_credit_card_dto.financing_limit}, got {updated_card.financing_limit}'
+    repo.get_by_filter.assert_called_once_with({'id': main_credit_card.id, 'include_expenses': False})
 
 
 def test_credit_card_update_use_case_not_found(main_credit_card: CreditCard, updated_credit_card_dto: UpdateCreditCardDTO):
     """Test credit card update when card is not found."""
-    repo: CreditCardRepository = MagicMock(spec=CreditCardRepository)
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
     repo.get_by_filter.return_value = None
     
     use_case = CreditCardUpdateUseCase(repo)
     
     with pytest.raises(ValueError, match='Credit card not found'):
-        use_case.execute(main_credit_card.id, updated_credit_card_dto)
+        asyncio.run(use_case.execute(main_credit_card.id, updated_credit_card_dto))
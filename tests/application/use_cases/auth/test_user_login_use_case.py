@@ -1,9 +1,10 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.application.use_cases.auth import UserLoginUseCase
-from src.application.ports import UserRepository, RefreshTokenRepository
+from src.application.ports import AsyncUserRepository, AsyncRefreshTokenRepository
 from src.application.dtos import LoginUserDTO, LoggedInUserDTO
 from src.application.helpers import security
 from src.domain.auth import Role, User
@@ -19,24 +20,24 @@ def login_dto(user_fixture: User) -> LoginUserDTO:
 
 
 @pytest.fixture
-def repo(user_fixture: User) -> UserRepository:
-    repo: UserRepository = MagicMock(spec=UserRepository)
+def repo(user_fixture: User) -> AsyncUserRepository:
+    repo: AsyncUserRepository = MagicMock(spec=AsyncUserRepository)
     user_fixture.encrypted_password = security.hash_password('secure_password')
     repo.get_by_filter.return_value = user_fixture
     return repo
 
 
 @pytest.fixture
-def refresh_token_repo() -> RefreshTokenRepository:
-    repo: RefreshTokenRepository = MagicMock(spec=RefreshTokenRepository)
+def refresh_token_repo() -> AsyncRefreshTokenRepository:
+    repo: AsyncRefreshTokenRepository = MagicMock(spec=AsyncRefreshTokenRepository)
     # Mock the create method to return the entity that was passed
     repo.create.side_effect = lambda entity: entity
     return repo
 
 
-def test_user_login_use_case_success(login_dto: LoginUserDTO, repo: UserRepository, refresh_token_repo: RefreshTokenRepository):
+def test_user_login_use_case_success(login_dto: LoginUserDTO, repo: AsyncUserRepository, refresh_token_repo: AsyncRefreshTokenRepository):
     use_case = UserLoginUseCase(user_repository=repo, refresh_token_repository=refresh_token_repo)
-    result = use_case.execute(login_dto)
+    result = asyncio.run(use_case.execute(login_dto))
     assert isinstance(result, LoggedInUserDTO), f'Expected LoggedInUserDTO, got {type(result)}'
     assert result.id is not None, 'Expected non-null user ID'
     assert result.username == login_dto.username, f'Expected username "{login_dto.username}", got {result.username}'
@@ -48,20 +49,20 @@ def test_user_login_use_case_success(login_dto: LoginUserDTO, repo: UserReposito
     assert result.refresh_token != '', 'Expected non-empty refresh token'
 
 
-def test_user_login_use_case_invalid_username(login_dto: LoginUserDTO, refresh_token_repo: RefreshTokenRepository):
-    repo: UserRepository = MagicMock(spec=UserRepository)
+def test_user_login_use_case_invalid_username(login_dto: LoginUserDTO, refresh_token_repo: AsyncRefreshTokenRepository):
+    repo: AsyncUserRepository = MagicMock(spec=AsyncUserRepository)
     repo.get_by_filter.return_value = None  # Simulate user not found
     use_case = UserLoginUseCase(user_repository=repo, refresh_token_repository=refresh_token_repo)
     with pytest.raises(ValueError) as exc_info:
-        use_case.execute(login_dto)
+        asyncio.run(use_case.execute(login_dto))
     assert str(
         exc_info.value) == "Invalid username or password", f'Expected ValueError with message "Invalid username or password", got "{str(exc_info.value)}"'
 
 
-def test_user_login_use_case_invalid_password(login_dto: LoginUserDTO, repo: UserRepository, refresh_token_repo: RefreshTokenRepository):
+def test_user_login_use_case_invalid_password(login_dto: LoginUserDTO, repo: AsyncUserRepository, refresh_token_repo: AsyncRefreshTokenRepository):
     login_dto.password = 'wrong_password'  # Simulate wrong password
     use_case = UserLoginUseCase(user_repository=repo, refresh_token_repository=refresh_token_repo)
     with pytest.raises(ValueError) as exc_info:
-        use_case.execute(login_dto)
+        asyncio.run(use_case.execute(login_dto))
     assert str(
         exc_info.value) == "Invalid username or password", f'Expected ValueError with message "Invalid username or password", got "{str(exc_info.value)}"'
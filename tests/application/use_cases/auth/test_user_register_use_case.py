@@ -1,9 +1,10 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.application.use_cases.auth import UserRegisterUseCase
-from src.application.ports import UserRepository
+from src.application.ports import AsyncUserRepository
 from src.application.dtos import RegisterUserDTO, LoggedInUserDTO
 from src.application.helpers import security
 from src.domain.auth import Role, User
@@ -21,15 +22,15 @@ def register_dto(user_fixture: User) -> RegisterUserDTO:
     )
 
 @pytest.fixture
-def repo(user_fixture: User) -> UserRepository:
-    repo: UserRepository = MagicMock(spec=UserRepository)
+def repo(user_fixture: User) -> AsyncUserRepository:
+    repo: AsyncUserRepository = MagicMock(spec=AsyncUserRepository)
     user_fixture.encrypted_password = security.hash_password('secure_password')
     repo.create.return_value = user_fixture
     return repo
 
-def test_user_register_use_case_success(register_dto: RegisterUserDTO, repo: UserRepository):
+def test_user_register_use_case_success(register_dto: RegisterUserDTO, repo: AsyncUserRepository):
     use_case = UserRegisterUseCase(user_repository=repo)
-    result = use_case.execute(register_dto)
+    result = asyncio.run(use_case.execute(register_dto))
     assert isinstance(result, LoggedInUserDTO), f'Expected LoggedInUserDTO, got {type(result)}'
     assert result.id is not None, 'Expected non-null user ID'
     assert result.username == register_dto.username, f'Expected username "{register_dto.username}", got {result.username}'
@@ -1,9 +1,10 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.application.use_cases.auth import UserRenewTokenUseCase
-from src.application.ports import UserRepository
+from src.application.ports import AsyncUserRepository
 from src.application.dtos import LoggedInUserDTO
 from src.application.helpers import security
 from src.domain.auth import Role, User
@@ -22,15 +23,15 @@ def logged_in_dto(user_fixture: User) -> LoggedInUserDTO:
 
 
 @pytest.fixture
-def repo(user_fixture: User) -> UserRepository:
-    repo: UserRepository = MagicMock(spec=UserRepository)
+def repo(user_fixture: User) -> AsyncUserRepository:
+    repo: AsyncUserRepository = MagicMock(spec=AsyncUserRepository)
     repo.get_by_filter.return_value = user_fixture
     return repo
 
 
-def test_user_renew_token_use_case_success(logged_in_dto: LoggedInUserDTO, repo: UserRepository):
+def test_user_renew_token_use_case_success(logged_in_dto: LoggedInUserDTO, repo: AsyncUserRepository):
     use_case = UserRenewTokenUseCase(user_repository=repo)
-    result = use_case.execute(logged_in_dto)
+    result = asyncio.run(use_case.execute(logged_in_dto))
     assert isinstance(
         result, LoggedInUserDTO), f'Expected LoggedInUserDTO, got {type(result)}'
     assert result.id == logged_in_dto.id, 'Expected user ID to match'
@@ -41,8 +42,8 @@ def test_user_renew_token_use_case_success(logged_in_dto: LoggedInUserDTO, repo:
 
 
 def test_user_renew_token_use_case_user_not_found(logged_in_dto: LoggedInUserDTO):
-    repo: UserRepository = MagicMock(spec=UserRepository)
+    repo: AsyncUserRepository = MagicMock(spec=AsyncUserRepository)
     repo.get_by_filter.return_value = None
     use_case = UserRenewTokenUseCase(user_repository=repo)
     with pytest.raises(ValueError, match='User not found'):
-        use_case.execute(logged_in_dto)
+        asyncio.run(use_case.execute(logged_in_dto))
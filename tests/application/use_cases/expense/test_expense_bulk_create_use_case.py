@@ -0,0 +1,104 @@
+import asyncio
+from datetime import date
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from src.application.dtos import BulkCreateExpensesDTO, CreatePurchaseDTO, CreateSubscriptionDTO
+from src.application.dtos.expense_dtos import MAX_BULK_ROWS
+from src.application.ports import AsyncExpenseCategoryRepository, AsyncExpenseRepository
+from src.application.use_cases.expense import ExpenseBulkCreateUseCase
+from src.domain.expense import Purchase, Subscription
+from src.domain.expense.enums import ExpenseType
+
+
+def build_purchase_dto(installments: int = 3, title: str = 'Laptop') -> CreatePurchaseDTO:
+    return CreatePurchaseDTO(
+        account_id=uuid4(),
+        title=title,
+        cc_name='LAPTOP',
+        acquired_at=date(2025, 1, 5),
+        amount=300,
+        installments=installments,
+        first_payment_date=date(2025, 2, 10),
+        category_id=uuid4(),
+    )
+
+
+def build_subscription_dto() -> CreateSubscriptionDTO:
+    return CreateSubscriptionDTO(
+        account_id=uuid4(),
+        title='Streaming',
+        cc_name='STREAM',
+        acquired_at=date(2025, 1, 1),
+        amount=15.5,
+        installments=1,
+        first_payment_date=date(2025, 1, 30),
+        status='active',
+        category_id=uuid4(),
+    )
+
+
+def build_repositories(data: BulkCreateExpensesDTO) -> tuple[MagicMock, MagicMock]:
+    """Repositories where every account and category of the rows belongs to the owner."""
+    rows = [*data.purchases, *data.subscriptions]
+    repo = MagicMock(spec=AsyncExpenseRepository)
+    repo.get_owned_account_ids.return_value = {row.account_id for row in rows}
+    category_repo = MagicMock(spec=AsyncExpenseCategoryRepository)
+    category_repo.get_owned_ids.return_value = {row.category_id for row in rows}
+    return repo, category_repo
+
+
+def test_expense_bulk_create_use_case_success():
+    data = BulkCreateExpensesDTO(
+        purchases=[build_purchase_dto(), build_purchase_dto(installments=0), build_purchase_dto(installments=12)],
+        subscriptions=[build_subscription_dto()],
+    )
+    repo, category_repo = build_repositories(data)
+
+    result = asyncio.run(ExpenseBulkCreateUseCase(repo, category_repo).execute(data, uuid4()))
+
+    repo.create_many.assert_called_once()
+    created = repo.create_many.call_args.args[0]
+    assert [type(expense) for expense in created] == [Purchase, Purchase, Subscription]
+    # Installments computed in memory, before the write
+    assert [len(expense.payments) for expense in created[:2]] == [3, 12]
+    assert result.created_count == 3
+    assert result.created_ids == [expense.id for expense in created]
+    assert len(result.errors) == 1
+    assert result.errors[0].expense_type == ExpenseType.PURCHASE
+    assert result.errors[0].index == 1
+    assert 'installments' in result.errors[0].description
+
+
+def test_expense_bulk_create_use_case_rejects_large_batches():
+    with pytest.raises(ValidationError):
+        BulkCreateExpensesDTO(purchases=[build_purchase_dto()] * (MAX_BULK_ROWS + 1))
+
+
+def test_expense_bulk_create_use_case_rejects_unknown_accounts_and_categories():
+    data = BulkCreateExpensesDTO(
+        purchases=[build_purchase_dto(), build_purchase_dto(), build_purchase_dto()],
+        subscriptions=[build_subscription_dto()],
+    )
+    repo, category_repo = build_repositories(data)
+    owner_id = uuid4()
+    # Another owner's (or a missing) account and category
+    repo.get_owned_account_ids.return_value -= {data.purchases[1].account_id}
+    category_repo.get_owned_ids.return_value -= {data.subscriptions[0].category_id}
+
+    result = asyncio.run(ExpenseBulkCreateUseCase(repo, category_repo).execute(data, owner_id))
+
+    # One query each for the referenced accounts and categories, scoped to the owner
+    repo.get_owned_account_ids.assert_called_once_with(owner_id, {row.account_id for row in [*data.purchases, *data.subscriptions]})
+    category_repo.get_owned_ids.assert_called_once()
+    assert category_repo.get_owned_ids.call_args.args[0] == owner_id
+    created = repo.create_many.call_args.args[0]
+    assert [expense.title for expense in created] == ['Laptop', 'Laptop']
+    assert [(error.expense_type, error.index) for error in result.errors] == [
+        (ExpenseType.PURCHASE, 1), (ExpenseType.SUBSCRIPTION, 0),
+    ]
+    assert result.errors[0].description == f'Account with ID {data.purchases[1].account_id} not found'
+    assert result.errors[1].description == f'Category with ID {data.subscriptions[0].category_id} not found'
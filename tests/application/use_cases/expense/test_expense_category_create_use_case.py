@@ -1,10 +1,11 @@
+import asyncio
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 
 from src.application.use_cases.expense import ExpenseCategoryCreateUseCase
-from src.application.ports import ExpenseCategoryRepository
+from src.application.ports import AsyncExpenseCategoryRepository
 from src.domain.expense import ExpenseCategoryFactory
 from src.application.dtos import ExpenseCategoryResponseDTO, CreateExpenseCategoryDTO
 from tests.fixtures.auth_fixtures import user
@@ -12,8 +13,8 @@ from src.domain.auth import User
 
 
 @pytest.fixture
-def repo(user: User) -> ExpenseCategoryRepository:
-    repo: ExpenseCategoryRepository = MagicMock(spec=ExpenseCategoryRepository)
+def repo(user: User) -> AsyncExpenseCategoryRepository:
+    repo: AsyncExpenseCategoryRepository = MagicMock(spec=AsyncExpenseCategoryRepository)
     repo.create.return_value = ExpenseCategoryFactory.create(
         id=uuid4(),
         owner_id=user.id,
@@ -24,7 +25,7 @@ def repo(user: User) -> ExpenseCategoryRepository:
     return repo
 
 
-def test_expense_category_create_use_case_success(repo: ExpenseCategoryRepository, user: User):
+def test_expense_category_create_use_case_success(repo: AsyncExpenseCategoryRepository, user: User):
     use_case = ExpenseCategoryCreateUseCase(repo)
     create_dto = CreateExpenseCategoryDTO(
         owner_id=user.id,
@@ -32,7 +33,7 @@ def test_expense_category_create_use_case_success(repo: ExpenseCategoryRepositor
         description='Expenses for food and groceries',
         is_income=False,
     )
-    new_category = use_case.execute(create_dto)
+    new_category = asyncio.run(use_case.execute(create_dto))
 
     assert new_category.name == create_dto.name, \
         f'Expected name {create_dto.name}, got {new_category.name}'
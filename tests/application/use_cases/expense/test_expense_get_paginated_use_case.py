@@ -1,10 +1,11 @@
+import asyncio
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 
 from src.application.use_cases.expense import ExpenseGetPaginatedUseCase
-from src.application.ports import ExpenseRepository
+from src.application.ports import AsyncExpenseRepository
 from src.application.dtos import ExpenseResponseDTO
 from tests.fixtures.expense_fixtures import purchase, subscription  # noqa: F401
 from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
@@ -12,24 +13,23 @@ from tests.fixtures.auth_fixtures import user  # noqa: F401
 
 
 @pytest.fixture
-def repo(purchase, subscription) -> ExpenseRepository:
-    repo = MagicMock(spec=ExpenseRepository)
-    repo.count_by_filter.return_value = 2
-    repo.get_many_by_filter.return_value = [
+def repo(purchase, subscription) -> AsyncExpenseRepository:
+    repo = MagicMock(spec=AsyncExpenseRepository)
+    repo.get_page_by_filter.return_value = ([
         purchase,
         subscription
-    ]
+    ], 2)
 
     return repo
 
 
-def test_expense_get_paginated_use_case_success(repo: ExpenseRepository):
+def test_expense_get_paginated_use_case_success(repo: AsyncExpenseRepository):
     use_case = ExpenseGetPaginatedUseCase(repo)
     filter = {'account_id': uuid4()}
     limit = 10
     offset = 0
 
-    paginated_response = use_case.execute(filter, limit, offset)
+    paginated_response = asyncio.run(use_case.execute(filter, limit, offset))
 
     assert paginated_response.pagination.total_items == 2, \
         f'Expected total_items 2, got {paginated_response.pagination.total_items}'
@@ -37,3 +37,18 @@ def test_expense_get_paginated_use_case_success(repo: ExpenseRepository):
         f'Expected 2 items, got {len(paginated_response.items)}'
     assert all(isinstance(item, ExpenseResponseDTO) for item in paginated_response.items), \
         'All items should be instances of ExpenseResponseDTO'
+
+
+def test_expense_get_paginated_use_case_single_query(repo: AsyncExpenseRepository, purchase, subscription):
+    repo.get_page_by_filter.return_value = ([purchase, subscription], 22)
+    use_case = ExpenseGetPaginatedUseCase(repo)
+
+    paginated_response = asyncio.run(use_case.execute({}, limit=10, offset=20))
+
+    repo.get_page_by_filter.assert_called_once_with({}, 10, 20)
+    repo.count_by_filter.assert_not_called()
+    repo.get_many_by_filter.assert_not_called()
+    assert paginated_response.pagination.current_page == 3
+    assert paginated_response.pagination.total_pages == 3
+    assert paginated_response.pagination.total_items == 22
+    assert not paginated_response.pagination.has_next_page
@@ -1,3 +1,4 @@
+import asyncio
 from uuid import uuid4
 from datetime import date
 from unittest.mock import MagicMock
@@ -5,6 +6,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.application.use_cases.expense import PaymentCreateUseCase
+from src.application.ports import AsyncExpenseRepository, AsyncPaymentRepository
 from src.application.dtos import CreatePaymentDTO
 from src.domain.expense import Subscription, Purchase, Payment, PaymentStatus, PaymentFactory
 from src.domain.shared import Amount
@@ -12,12 +14,12 @@ from src.domain.shared import Amount
 
 @pytest.fixture
 def payment_repository():
-    return MagicMock()
+    return MagicMock(spec=AsyncPaymentRepository)
 
 
 @pytest.fixture
 def expense_repository():
-    return MagicMock()
+    return MagicMock(spec=AsyncExpenseRepository)
 
 
 @pytest.fixture
@@ -61,8 +63,8 @@ def test_payment_create_use_case_raises_when_expense_repository_not_provided(pay
         payment_date=date(2025, 2, 15),
     )
     
-    with pytest.raises(ValueError, match='ExpenseRepository is required'):
-        use_case.execute(payment_data)
+    with pytest.raises(ValueError, match='AsyncExpenseRepository is required'):
+        asyncio.run(use_case.execute(payment_data))
 
 
 def test_payment_create_use_case_raises_when_expense_not_found(payment_repository, expense_repository):
@@ -76,7 +78,7 @@ def test_payment_create_use_case_raises_when_expense_not_found(payment_repositor
     )
     
     with pytest.raises(ValueError, match='Expense with ID .* not found'):
-        use_case.execute(payment_data)
+        asyncio.run(use_case.execute(payment_data))
 
 
 def test_payment_create_use_case_creates_payment_for_subscription(payment_repository, expense_repository, subscription):
@@ -91,7 +93,7 @@ def test_payment_create_use_case_creates_payment_for_subscription(payment_reposi
     )
     
     # Execute
-    result = use_case.execute(payment_data)
+    result = asyncio.run(use_case.execute(payment_data))
     
     # Verify
     assert result is not None
@@ -121,7 +123,7 @@ def test_payment_create_use_case_updates_subscription_installments(payment_repos
     )
     
     # Execute
-    use_case.execute(payment_data)
+    asyncio.run(use_case.execute(payment_data))
     
     # Verify installments was updated
     assert subscription.installments == initial_installments + 1
@@ -140,7 +142,7 @@ def test_payment_create_use_case_orders_subscription_payments_by_date(payment_re
     )
     
     # Execute
-    use_case.execute(payment_data)
+    asyncio.run(use_case.execute(payment_data))
     
     # Verify payments are ordered by date
     assert len(subscription.payments) == 2
@@ -165,7 +167,7 @@ def test_payment_create_use_case_updates_subscription_amount_when_last_payment(p
     )
     
     # Execute
-    use_case.execute(payment_data)
+    asyncio.run(use_case.execute(payment_data))
     
     # Verify subscription amount was updated to match last payment
     assert subscription.amount.value == 30.0
@@ -183,7 +185,7 @@ def test_payment_create_use_case_creates_payment_for_purchase(payment_repository
     )
     
     # Execute
-    result = use_case.execute(payment_data)
+    result = asyncio.run(use_case.execute(payment_data))
     
     # Verify
     assert result is not None
@@ -212,7 +214,7 @@ def test_payment_create_use_case_returns_correct_dto_structure(payment_repositor
     )
     
     # Execute
-    result = use_case.execute(payment_data)
+    result = asyncio.run(use_case.execute(payment_data))
     
     # Verify DTO structure
     assert hasattr(result, 'id')
@@ -238,7 +240,7 @@ def test_payment_create_use_case_creates_payment_with_unconfirmed_status(payment
     )
     
     # Execute
-    result = use_case.execute(payment_data)
+    result = asyncio.run(use_case.execute(payment_data))
     
     # Verify status is UNCONFIRMED
     assert result.status == PaymentStatus.UNCONFIRMED
@@ -1,3 +1,4 @@
+import asyncio
 from uuid import uuid4
 from datetime import date
 from unittest.mock import MagicMock
@@ -5,18 +6,19 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.application.use_cases.expense import PaymentDeleteUseCase
+from src.application.ports import AsyncExpenseRepository, AsyncPaymentRepository
 from src.domain.expense import Subscription, Payment, PaymentStatus, PaymentFactory
 from src.domain.shared import Amount
 
 
 @pytest.fixture
 def payment_repository():
-    return MagicMock()
+    return MagicMock(spec=AsyncPaymentRepository)
 
 
 @pytest.fixture
 def expense_repository():
-    return MagicMock()
+    return MagicMock(spec=AsyncExpenseRepository)
 
 
 @pytest.fixture
@@ -61,7 +63,7 @@ def test_payment_delete_use_case_raises_when_payment_not_found(payment_repositor
     use_case = PaymentDeleteUseCase(payment_repository, expense_repository)
     
     with pytest.raises(ValueError, match='Payment with ID .* not found'):
-        use_case.execute(uuid4())
+        asyncio.run(use_case.execute(uuid4()))
 
 
 def test_payment_delete_use_case_raises_when_expense_not_found(payment_repository, expense_repository):
@@ -76,7 +78,7 @@ def test_payment_delete_use_case_raises_when_expense_not_found(payment_repositor
     use_case = PaymentDeleteUseCase(payment_repository, expense_repository)
     
     with pytest.raises(ValueError, match='Expense with ID .* not found'):
-        use_case.execute(payment_id)
+        asyncio.run(use_case.execute(payment_id))
 
 
 def test_payment_delete_use_case_updates_subscription_installments(payment_repository, expense_repository, subscription):
@@ -93,7 +95,7 @@ def test_payment_delete_use_case_updates_subscription_installments(payment_repos
     
     # Execute use case
     use_case = PaymentDeleteUseCase(payment_repository, expense_repository)
-    use_case.execute(payment_to_delete.id)
+    asyncio.run(use_case.execute(payment_to_delete.id))
     
     # Verify subscription was updated
     assert subscription.installments == 2, f'Expected 2 installments after delete, got {subscription.installments}'
@@ -116,7 +118,7 @@ def test_payment_delete_use_case_updates_subscription_amount_when_deleting_last_
     
     # Execute use case
     use_case = PaymentDeleteUseCase(payment_repository, expense_repository)
-    use_case.execute(last_payment.id)
+    asyncio.run(use_case.execute(last_payment.id))
     
     # After deleting the last payment, subscription amount should be from the new last payment (20)
     assert subscription.amount.value == 20, f'Expected amount 20 after deleting last payment, got {subscription.amount.value}'
@@ -136,7 +138,7 @@ def test_payment_delete_use_case_reorders_no_installment_after_delete(payment_re
     
     # Execute use case
     use_case = PaymentDeleteUseCase(payment_repository, expense_repository)
-    use_case.execute(first_payment.id)
+    asyncio.run(use_case.execute(first_payment.id))
     
     # Verify remaining payments have correct no_installment (should be 1 and 2)
     assert len(subscription.payments) == 2, f'Expected 2 payments, got {len(subscription.payments)}'
@@ -175,7 +177,7 @@ def test_payment_delete_use_case_deletes_purchase_payment_directly(payment_repos
     expense_repository.get_by_filter.return_value = purchase
     
     use_case = PaymentDeleteUseCase(payment_repository, expense_repository)
-    use_case.execute(payment_id)
+    asyncio.run(use_case.execute(payment_id))
     
     # Verify payment was deleted directly (not through domain method)
     payment_repository.delete_by_filter.assert_called_once_with({'id': payment_id})
@@ -0,0 +1,94 @@
+import asyncio
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterable
+from datetime import date
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dtos import ExportFormat
+from src.application.ports import AsyncExpenseRepository
+from src.application.use_cases.expense import PaymentExportUseCase
+from src.application.use_cases.expense.payment_export_use_case import EXPORT_COLUMNS
+from src.domain.account.enums import AccountType
+from src.domain.expense import PeriodPayment
+from src.domain.expense.enums import ExpenseStatus, ExpenseType, PaymentStatus
+from src.domain.shared import Amount
+
+
+def build_payment(no_installment: int) -> PeriodPayment:
+    return PeriodPayment(
+        payment_id=uuid4(),
+        amount=Amount(10.5),
+        status=PaymentStatus.PAID,
+        payment_date=date(2025, no_installment, 10),
+        no_installment=no_installment,
+        is_last_payment=no_installment == 5,
+        expense_id=uuid4(),
+        expense_title='Laptop, 15"',
+        expense_type=ExpenseType.PURCHASE,
+        expense_cc_name='LAPTOP',
+        expense_acquired_at=date(2024, 12, 20),
+        expense_installments=5,
+        expense_status=ExpenseStatus.ACTIVE,
+        expense_category_name='Home',
+        account_id=uuid4(),
+        account_alias='Card',
+        account_is_enabled=True,
+        account_type=AccountType.CREDIT_CARD,
+    )
+
+
+async def async_iter(payments: Iterable[PeriodPayment]) -> AsyncIterator[PeriodPayment]:
+    for payment in payments:
+        yield payment
+
+
+async def collect(chunks: AsyncIterator[str]) -> list[str]:
+    return [chunk async for chunk in chunks]
+
+
+@pytest.fixture
+def repo() -> AsyncExpenseRepository:
+    repo = MagicMock(spec=AsyncExpenseRepository)
+    repo.iter_payment_history.side_effect = lambda owner_id, batch_size: async_iter(build_payment(i) for i in range(1, 6))
+    return repo
+
+
+def test_payment_export_use_case_ndjson(repo: AsyncExpenseRepository):
+    chunks = asyncio.run(collect(PaymentExportUseCase(repo, chunk_size=2).execute(uuid4(), ExportFormat.NDJSON)))
+
+    assert len(chunks) == 3
+    rows = [json.loads(line) for line in ''.join(chunks).splitlines()]
+    assert [row['no_installment'] for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[0]['amount'] == 10.5
+    assert rows[0]['expense_category_name'] == 'Home'
+    assert rows[0]['payment_date'] == '2025-01-10'
+
+
+def test_payment_export_use_case_csv(repo: AsyncExpenseRepository):
+    chunks = asyncio.run(collect(PaymentExportUseCase(repo, chunk_size=2).execute(uuid4(), ExportFormat.CSV)))
+
+    assert len(chunks) == 3
+    rows = list(csv.DictReader(io.StringIO(''.join(chunks))))
+    assert list(rows[0]) == EXPORT_COLUMNS
+    assert [row['no_installment'] for row in rows] == ['1', '2', '3', '4', '5']
+    assert rows[0]['expense_title'] == 'Laptop, 15"'
+
+
+def test_payment_export_use_case_csv_without_payments():
+    repo = MagicMock(spec=AsyncExpenseRepository)
+    repo.iter_payment_history.return_value = async_iter([])
+
+    chunks = asyncio.run(collect(PaymentExportUseCase(repo).execute(uuid4(), ExportFormat.CSV)))
+
+    assert chunks == [','.join(EXPORT_COLUMNS) + '\n']
+
+
+def test_payment_export_use_case_invalid_format(repo: AsyncExpenseRepository):
+    with pytest.raises(ValueError):
+        PaymentExportUseCase(repo).execute(uuid4(), 'xml')
+    repo.iter_payment_history.assert_not_called()
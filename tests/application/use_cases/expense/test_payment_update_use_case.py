@@ -1,3 +1,4 @@
+import asyncio
 from uuid import uuid4
 from datetime import date
 from unittest.mock import MagicMock
@@ -6,6 +7,7 @@ import copy
 import pytest
 
 from src.application.use_cases.expense import PaymentUpdateUseCase
+from src.application.ports import AsyncExpenseRepository, AsyncPaymentRepository
 from src.application.dtos import UpdatePaymentDTO
 from src.domain.expense import Subscription, Purchase, Payment, PaymentStatus, PaymentFactory
 from src.domain.shared import Amount
@@ -13,12 +15,12 @@ from src.domain.shared import Amount
 
 @pytest.fixture
 def payment_repository():
-    return MagicMock()
+    return MagicMock(spec=AsyncPaymentRepository)
 
 
 @pytest.fixture
 def expense_repository():
-    return MagicMock()
+    return MagicMock(spec=AsyncExpenseRepository)
 
 
 @pytest.fixture
@@ -77,7 +79,7 @@ def test_payment_update_use_case_raises_when_payment_not_found(payment_repositor
     )
     
     with pytest.raises(ValueError, match='Payment with ID .* not found'):
-        use_case.execute(uuid4(), payment_data)
+        asyncio.run(use_case.execute(uuid4(), payment_data))
 
 
 def test_payment_update_use_case_raises_when_expense_not_found(payment_repository, expense_repository):
@@ -102,7 +104,7 @@ def test_payment_update_use_case_raises_when_expense_not_found(payment_repositor
     )
     
     with pytest.raises(ValueError, match='Expense with ID .* not found'):
-        use_case.execute(payment.id, payment_data)
+        asyncio.run(use_case.execute(payment.id, payment_data))
 
 
 def test_payment_update_use_case_updates_subscription_payment(payment_repository, expense_repository, subscription_with_payments):
@@ -120,7 +122,7 @@ def test_payment_update_use_case_updates_subscription_payment(payment_repository
     )
     
     # Execute
-    result = use_case.execute(payment_to_update.id, payment_data)
+    result = asyncio.run(use_case.execute(payment_to_update.id, payment_data))
     
     # Verify
     assert result is not None
@@ -149,7 +151,7 @@ def test_payment_update_use_case_updates_subscription_amount_when_updating_last_
     )
     
     # Execute
-    use_case.execute(last_payment.id, payment_data)
+    asyncio.run(use_case.execute(last_payment.id, payment_data))
     
     # Verify subscription amount was updated
     assert subscription_with_payments.amount.value == 50.0
@@ -173,7 +175,7 @@ def test_payment_update_use_case_reorders_subscription_payments_when_date_change
     )
     
     # Execute
-    use_case.execute(payment_to_update.id, payment_data)
+    asyncio.run(use_case.execute(payment_to_update.id, payment_data))
     
     # Verify payments were reordered
     assert subscription_with_payments.payments[0].id == payment_to_update.id
@@ -196,7 +198,7 @@ def test_payment_update_use_case_rebalances_purchase_payments(payment_repository
     )
     
     # Execute
-    use_case.execute(first_payment.id, payment_data)
+    asyncio.run(use_case.execute(first_payment.id, payment_data))
     
     # Verify first payment has new amount
     assert purchase_with_payments.payments[0].amount.value == 500.0
@@ -228,7 +230,7 @@ def test_payment_update_use_case_does_not_rebalance_when_payment_becomes_paid(pa
     )
     
     # Execute
-    use_case.execute(first_payment.id, payment_data)
+    asyncio.run(use_case.execute(first_payment.id, payment_data))
     
     # Verify payment status changed
     assert purchase_with_payments.payments[0].status == PaymentStatus.PAID
@@ -252,7 +254,7 @@ def test_payment_update_use_case_returns_updated_payment(payment_repository, exp
     )
     
     # Execute
-    result = use_case.execute(payment_to_update.id, payment_data)
+    result = asyncio.run(use_case.execute(payment_to_update.id, payment_data))
     
     # Verify returned DTO has updated values
     assert result.id == payment_to_update.id
@@ -277,7 +279,7 @@ def test_payment_update_use_case_handles_status_change(payment_repository, expen
     )
     
     # Execute
-    result = use_case.execute(payment_to_update.id, payment_data)
+    result = asyncio.run(use_case.execute(payment_to_update.id, payment_data))
     
     # Verify status was updated
     assert result.status == PaymentStatus.CONFIRMED
@@ -302,7 +304,7 @@ def test_payment_update_use_case_handles_payment_date_change(payment_repository,
     )
     
     # Execute
-    result = use_case.execute(payment_to_update.id, payment_data)
+    result = asyncio.run(use_case.execute(payment_to_update.id, payment_data))
     
     # Verify date was updated
     assert result.payment_date == new_date
@@ -339,7 +341,7 @@ def test_payment_update_use_case_updates_other_expense_types_directly(payment_re
     )
     
     # Execute
-    result = use_case.execute(payment.id, payment_data)
+    result = asyncio.run(use_case.execute(payment.id, payment_data))
     
     # Verify payment was updated directly (not through expense)
     payment_repository.update.assert_called_once_with(payment)
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock
 from uuid import uuid4
 from datetime import date
@@ -5,7 +6,7 @@ from datetime import date
 import pytest
 
 from src.application.use_cases.expense import PurchaseCreateUseCase
-from src.application.ports import ExpenseRepository
+from src.application.ports import AsyncExpenseRepository
 from src.application.dtos import ExpenseResponseDTO, CreatePurchaseDTO
 from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
 from tests.fixtures.auth_fixtures import user  # noqa: F401
@@ -13,13 +14,13 @@ from src.domain.account import CreditCard
 
 
 @pytest.fixture
-def repo() -> ExpenseRepository:
-    repo = MagicMock(spec=ExpenseRepository)
+def repo() -> AsyncExpenseRepository:
+    repo = MagicMock(spec=AsyncExpenseRepository)
     repo.create.side_effect = lambda expense: expense
     return repo
 
 
-def test_purchase_create_use_case_success(repo: ExpenseRepository, main_credit_card: CreditCard):
+def test_purchase_create_use_case_success(repo: AsyncExpenseRepository, main_credit_card: CreditCard):
     use_case = PurchaseCreateUseCase(repo)
     purchase_data = CreatePurchaseDTO(
         account_id=main_credit_card.id,
@@ -32,7 +33,7 @@ def test_purchase_create_use_case_success(repo: ExpenseRepository, main_credit_c
         category_id=uuid4(),
     )
 
-    expense_response = use_case.execute(purchase_data)
+    expense_response = asyncio.run(use_case.execute(purchase_data))
 
     assert isinstance(expense_response, ExpenseResponseDTO), \
         f'Expected instance of ExpenseResponseDTO, got {type(expense_response)}'
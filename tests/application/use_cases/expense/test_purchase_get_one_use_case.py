@@ -1,10 +1,11 @@
+import asyncio
 from unittest.mock import MagicMock
 from uuid import uuid4, UUID
 
 import pytest
 
 from src.application.use_cases.expense import PurchaseGetOneUseCase
-from src.application.ports import ExpenseRepository
+from src.application.ports import AsyncExpenseRepository
 from src.application.dtos import ExpenseResponseDTO
 from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
 from tests.fixtures.auth_fixtures import user  # noqa: F401
@@ -18,17 +19,17 @@ def get_fake_purchase(id: UUID, purchase: Purchase) -> Purchase:
 
 
 @pytest.fixture
-def repo(purchase: Purchase) -> ExpenseRepository:
-    repo = MagicMock(spec=ExpenseRepository)
+def repo(purchase: Purchase) -> AsyncExpenseRepository:
+    repo = MagicMock(spec=AsyncExpenseRepository)
     repo.get_by_filter.side_effect = lambda filter: get_fake_purchase(filter['id'], purchase)
     return repo
 
 
-def test_purchase_get_one_use_case_success(repo: ExpenseRepository, purchase: Purchase):
+def test_purchase_get_one_use_case_success(repo: AsyncExpenseRepository, purchase: Purchase):
     use_case = PurchaseGetOneUseCase(repo)
     purchase_id = uuid4()
 
-    expense_response = use_case.execute(purchase_id)
+    expense_response = asyncio.run(use_case.execute(purchase_id))
 
     assert isinstance(expense_response, ExpenseResponseDTO), \
         f'Expected instance of ExpenseResponseDTO, got {type(expense_response)}'
@@ -39,9 +40,9 @@ def test_purchase_get_one_use_case_success(repo: ExpenseRepository, purchase: Pu
 
 
 def test_purchase_get_one_use_case_not_found():
-    repo = MagicMock(spec=ExpenseRepository)
+    repo = MagicMock(spec=AsyncExpenseRepository)
     repo.get_by_filter.return_value = None
     use_case = PurchaseGetOneUseCase(repo)
     purchase_id = uuid4()
     with pytest.raises(ValueError, match='Purchase not found'):
-        use_case.execute(purchase_id)
+        asyncio.run(use_case.execute(purchase_id))
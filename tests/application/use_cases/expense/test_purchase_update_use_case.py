@@ -1,10 +1,11 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 from uuid import uuid4
 
 from src.application.use_cases.expense import PurchaseUpdateUseCase
-from src.application.ports import ExpenseRepository
+from src.application.ports import AsyncExpenseRepository
 from src.application.dtos import UpdatePurchaseDTO
 from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
 from tests.fixtures.auth_fixtures import user  # noqa: F401
@@ -19,21 +20,21 @@ def get_fake_purchase(filter: dict, purchase: Purchase) -> Purchase:
 
 
 @pytest.fixture
-def repo(purchase: Purchase) -> ExpenseRepository:
-    repo: ExpenseRepository = MagicMock(spec=ExpenseRepository)
+def repo(purchase: Purchase) -> AsyncExpenseRepository:
+    repo: AsyncExpenseRepository = MagicMock(spec=AsyncExpenseRepository)
     repo.get_by_filter.side_effect = lambda filter: get_fake_purchase(filter, purchase)
     repo.update.side_effect = lambda purchase: purchase
     return repo
 
 
-def test_purchase_update_use_case_success(repo: ExpenseRepository, purchase: Purchase):
+def test_purchase_update_use_case_success(repo: AsyncExpenseRepository, purchase: Purchase):
     use_case = PurchaseUpdateUseCase(repo)
     purchase_id = purchase.id
     update_data = UpdatePurchaseDTO(
         cc_name='updated*ccname',
         title='Updated Purchase Title',
     )
-    updated_purchase = use_case.execute(purchase_id, update_data)
+    updated_purchase = asyncio.run(use_case.execute(purchase_id, update_data))
     assert updated_purchase.id == purchase_id
     assert updated_purchase.cc_name == update_data.cc_name
     assert updated_purchase.title == update_data.title
@@ -41,10 +42,10 @@ def test_purchase_update_use_case_success(repo: ExpenseRepository, purchase: Pur
 
 
 def test_purchase_update_use_case_not_found():
-    repo: ExpenseRepository = MagicMock(spec=ExpenseRepository)
+    repo: AsyncExpenseRepository = MagicMock(spec=AsyncExpenseRepository)
     repo.get_by_filter.return_value = None
     use_case = PurchaseUpdateUseCase(repo)
     purchase_id = uuid4()
     update_data = UpdatePurchaseDTO(title='Updated Title')
     with pytest.raises(ValueError, match='Purchase not found'):
-        use_case.execute(purchase_id, update_data)
+        asyncio.run(use_case.execute(purchase_id, update_data))
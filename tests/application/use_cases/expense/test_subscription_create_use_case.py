@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock
 from uuid import uuid4
 from datetime import date
@@ -5,7 +6,7 @@ from datetime import date
 import pytest
 
 from src.application.use_cases.expense import SubscriptionCreateUseCase
-from src.application.ports import ExpenseRepository
+from src.application.ports import AsyncExpenseRepository
 from src.application.dtos import ExpenseResponseDTO, CreateSubscriptionDTO
 from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
 from tests.fixtures.auth_fixtures import user  # noqa: F401
@@ -14,13 +15,13 @@ from src.domain.expense import ExpenseStatus
 
 
 @pytest.fixture
-def repo() -> ExpenseRepository:
-    repo = MagicMock(spec=ExpenseRepository)
+def repo() -> AsyncExpenseRepository:
+    repo = MagicMock(spec=AsyncExpenseRepository)
     repo.create.side_effect = lambda expense: expense
     return repo
 
 
-def test_subscription_create_use_case_success(repo: ExpenseRepository, main_credit_card: CreditCard):
+def test_subscription_create_use_case_success(repo: AsyncExpenseRepository, main_credit_card: CreditCard):
     use_case = SubscriptionCreateUseCase(repo)
     subscription_data = CreateSubscriptionDTO(
         account_id=main_credit_card.id,
@@ -34,7 +35,7 @@ def test_subscription_create_use_case_success(repo: ExpenseRepository, main_cred
         status=ExpenseStatus.ACTIVE,
     )
 
-    expense_response = use_case.execute(subscription_data)
+    expense_response = asyncio.run(use_case.execute(subscription_data))
 
     assert isinstance(expense_response, ExpenseResponseDTO), \
         f'Expected instance of ExpenseResponseDTO, got {type(expense_response)}'
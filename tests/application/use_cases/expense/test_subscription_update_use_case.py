@@ -1,10 +1,11 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 from uuid import uuid4
 
 from src.application.use_cases.expense import SubscriptionUpdateUseCase
-from src.application.ports import ExpenseRepository
+from src.application.ports import AsyncExpenseRepository
 from src.application.dtos import UpdateSubscriptionDTO
 from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
 from tests.fixtures.auth_fixtures import user  # noqa: F401
@@ -18,21 +19,21 @@ def get_fake_subscription(filter: dict, subscription: Subscription) -> Subscript
 
 
 @pytest.fixture
-def repo(subscription: Subscription) -> ExpenseRepository:
-    repo: ExpenseRepository = MagicMock(spec=ExpenseRepository)
+def repo(subscription: Subscription) -> AsyncExpenseRepository:
+    repo: AsyncExpenseRepository = MagicMock(spec=AsyncExpenseRepository)
     repo.get_by_filter.side_effect = lambda filter: get_fake_subscription(filter, subscription)
     repo.update.side_effect = lambda subscription: subscription
     return repo
 
 
-def test_subscription_update_use_case_success(repo: ExpenseRepository, subscription: Subscription):
+def test_subscription_update_use_case_success(repo: AsyncExpenseRepository, subscription: Subscription):
     use_case = SubscriptionUpdateUseCase(repo)
     subscription_id = subscription.id
     update_data = UpdateSubscriptionDTO(
         cc_name='updated*ccname',
         title='Updated Subscription Title',
     )
-    updated_subscription = use_case.execute(subscription_id, update_data)
+    updated_subscription = asyncio.run(use_case.execute(subscription_id, update_data))
     assert updated_subscription.id == subscription_id
     assert updated_subscription.cc_name == update_data.cc_name
     assert updated_subscription.title == update_data.title
@@ -40,10 +41,10 @@ def test_subscription_update_use_case_success(repo: ExpenseRepository, subscript
 
 
 def test_subscription_update_use_case_not_found():
-    repo: ExpenseRepository = MagicMock(spec=ExpenseRepository)
+    repo: AsyncExpenseRepository = MagicMock(spec=AsyncExpenseRepository)
     repo.get_by_filter.return_value = None
     use_case = SubscriptionUpdateUseCase(repo)
     subscription_id = uuid4()
     update_data = UpdateSubscriptionDTO(title='Updated Title')
     with pytest.raises(ValueError, match='Subscription not found'):
-        use_case.execute(subscription_id, update_data)
+        asyncio.run(use_case.execute(subscription_id, update_data))
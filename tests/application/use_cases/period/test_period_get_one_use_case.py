@@ -0,0 +1,65 @@
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+from datetime import date
+
+import pytest
+
+from src.application.use_cases.period import PeriodGetOneUseCase
+from src.application.ports import AsyncCreditCardRepository
+from src.application.dtos import PeriodResponseDTO
+from src.domain.account.enums import AccountType
+from src.domain.expense import PeriodPayment
+from src.domain.expense.enums import PaymentStatus, ExpenseStatus, ExpenseType
+from src.domain.shared import Amount
+
+
+@pytest.fixture
+def period_payment() -> PeriodPayment:
+    return PeriodPayment(
+        payment_id=uuid4(),
+        amount=Amount(100.0),
+        status=PaymentStatus.UNCONFIRMED,
+        payment_date=date(2026, 1, 10),
+        no_installment=1,
+        is_last_payment=True,
+        expense_id=uuid4(),
+        expense_title='Some Purchase',
+        expense_cc_name='SOME',
+        expense_acquired_at=date(2025, 12, 20),
+        expense_installments=1,
+        expense_status=ExpenseStatus.ACTIVE,
+        expense_category_name=None,
+        expense_type=ExpenseType.PURCHASE,
+        account_id=uuid4(),
+        account_alias='Personal Card',
+        account_is_enabled=True,
+        account_type=AccountType.CREDIT_CARD,
+    )
+
+
+@pytest.fixture
+def repo(period_payment: PeriodPayment) -> AsyncCreditCardRepository:
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
+    repo.get_period_payments.return_value = [period_payment]
+    return repo
+
+
+def test_period_get_one_use_case_success(repo: AsyncCreditCardRepository, period_payment: PeriodPayment):
+    user_id = uuid4()
+    use_case = PeriodGetOneUseCase(credit_card_repository=repo)
+    result = asyncio.run(use_case.execute(user_id=user_id, month=1, year=2026))
+    assert isinstance(result, PeriodResponseDTO), f'Expected PeriodResponseDTO, got {type(result)}'
+    assert result.month == 1 and result.year == 2026
+    assert result.total_payments == 1
+    assert result.payments[0].payment_id == period_payment.payment_id
+    repo.get_period_payments.assert_awaited_once_with(owner_id=user_id, month=1, year=2026)
+    repo.get_many_by_filter.assert_not_called()
+
+
+def test_period_get_one_use_case_fail():
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
+    repo.get_period_payments.side_effect = Exception('Database error')
+    use_case = PeriodGetOneUseCase(credit_card_repository=repo)
+    with pytest.raises(Exception):
+        asyncio.run(use_case.execute(user_id=uuid4(), month=1, year=2026))
@@ -0,0 +1,40 @@
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.period import PeriodGetSummariesUseCase
+from src.application.ports import AsyncCreditCardRepository
+from src.application.dtos import PeriodSummaryDTO
+from src.domain.expense import PeriodSummary
+from src.domain.shared import Amount, Month, Year
+
+
+def test_period_get_summaries_use_case_success():
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
+    repo.get_period_summaries.return_value = [
+        PeriodSummary(Month(12), Year(2025), Amount(150.5), Amount(100), Amount(50), Amount(50.5), 3),
+        PeriodSummary.empty(Month(1), Year(2026)),
+    ]
+    user_id = uuid4()
+    use_case = PeriodGetSummariesUseCase(credit_card_repository=repo)
+    result = asyncio.run(use_case.execute(user_id=user_id, month=12, year=2025, months=2))
+
+    assert all(isinstance(summary, PeriodSummaryDTO) for summary in result)
+    assert [summary.period_str for summary in result] == ['12/2025', '01/2026']
+    assert result[0].total_amount == 150.5
+    assert result[0].total_confirmed_amount == 100
+    assert result[0].total_paid_amount == 50
+    assert result[0].total_payments == 3
+    assert result[1].total_amount == 0 and result[1].total_payments == 0
+    repo.get_period_summaries.assert_awaited_once_with(owner_id=user_id, month=12, year=2025, months=2)
+    repo.get_period_payments.assert_not_called()
+
+
+def test_period_get_summaries_use_case_fail():
+    repo: AsyncCreditCardRepository = MagicMock(spec=AsyncCreditCardRepository)
+    repo.get_period_summaries.side_effect = Exception('Database error')
+    use_case = PeriodGetSummariesUseCase(credit_card_repository=repo)
+    with pytest.raises(Exception):
+        asyncio.run(use_case.execute(user_id=uuid4(), month=1, year=2026))
@@ -1,16 +1,18 @@
+import asyncio
 import pytest
 from uuid import uuid4
 from datetime import date
 from unittest.mock import MagicMock
 
 from src.application.use_cases.user import UserGetOneUseCase
+from src.application.ports import AsyncUserRepository
 from src.application.dtos import UserResponseDTO
 from src.domain.auth import User, Profile, Preferences, Role
 
 
 @pytest.fixture
 def user_repository() -> MagicMock:
-    return MagicMock()
+    return MagicMock(spec=AsyncUserRepository)
 
 
 @pytest.fixture
@@ -46,7 +48,7 @@ def test_user_get_one_use_case_success(
     use_case = UserGetOneUseCase(user_repository)
 
     # Act
-    result = use_case.execute(sample_user.id)
+    result = asyncio.run(use_case.execute(sample_user.id))
 
     # Assert
     assert isinstance(result, UserResponseDTO)
@@ -74,7 +76,7 @@ def test_user_get_one_use_case_user_not_found(
 
     # Act & Assert
     with pytest.raises(ValueError, match=f'User with id {user_id} not found'):
-        use_case.execute(user_id)
+        asyncio.run(use_case.execute(user_id))
 
 
 def test_user_get_one_use_case_without_birthdate(
@@ -102,7 +104,7 @@ def test_user_get_one_use_case_without_birthdate(
     use_case = UserGetOneUseCase(user_repository)
 
     # Act
-    result = use_case.execute(user.id)
+    result = asyncio.run(use_case.execute(user.id))
 
     # Assert
     assert result.profile.birthdate is None
@@ -1,16 +1,19 @@
+import asyncio
 import pytest
 from uuid import uuid4
 from datetime import date
 from unittest.mock import MagicMock
 
 from src.application.use_cases.user import UserUpdateUseCase
+from src.application.helpers.password_hasher import PasswordHasher
+from src.application.ports import AsyncUserRepository
 from src.application.dtos import UpdateUserDTO, UpdateProfileDTO, UpdatePreferencesDTO, UserResponseDTO
 from src.domain.auth import User, Profile, Preferences, Role
 
 
 @pytest.fixture
 def user_repository() -> MagicMock:
-    return MagicMock()
+    return MagicMock(spec=AsyncUserRepository)
 
 
 @pytest.fixture
@@ -48,7 +51,7 @@ def test_user_update_use_case_update_username(
     update_data = UpdateUserDTO(username='newusername')
 
     # Act
-    result = use_case.execute(sample_user.id, update_data)
+    result = asyncio.run(use_case.execute(sample_user.id, update_data))
 
     # Assert
     assert isinstance(result, UserResponseDTO)
@@ -68,7 +71,7 @@ def test_user_update_use_case_update_email(
     update_data = UpdateUserDTO(email='newemail@example.com')
 
     # Act
-    result = use_case.execute(sample_user.id, update_data)
+    result = asyncio.run(use_case.execute(sample_user.id, update_data))
 
     # Assert
     assert sample_user.email == 'newemail@example.com'
@@ -78,26 +81,24 @@ def test_user_update_use_case_update_email(
 def test_user_update_use_case_update_password(
     user_repository: MagicMock,
     sample_user: User,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test updating the password."""
     # Arrange
     user_repository.get_by_filter.return_value = sample_user
     user_repository.update.return_value = sample_user
     
-    # Mock hash_password
-    mock_hash = MagicMock(return_value='new_hashed_password')
-    monkeypatch.setattr('src.application.use_cases.user.user_update_use_case.hash_password', mock_hash)
+    password_hasher = MagicMock(spec=PasswordHasher)
+    password_hasher.hash.return_value = 'new_hashed_password'
     
-    use_case = UserUpdateUseCase(user_repository)
+    use_case = UserUpdateUseCase(user_repository, password_hasher)
     update_data = UpdateUserDTO(password='newpassword123')
 
     # Act
-    result = use_case.execute(sample_user.id, update_data)
+    result = asyncio.run(use_case.execute(sample_user.id, update_data))
 
     # Assert
     assert sample_user.encrypted_password == 'new_hashed_password'
-    mock_hash.assert_called_once_with('newpassword123')
+    password_hasher.hash.assert_awaited_once_with('newpassword123')
     user_repository.update.assert_called_once()
 
 
@@ -118,7 +119,7 @@ def test_user_update_use_case_update_profile_name(
     )
 
     # Act
-    result = use_case.execute(sample_user.id, update_data)
+    result = asyncio.run(use_case.execute(sample_user.id, update_data))
 
     # Assert
     assert sample_user.profile.first_name == 'Jane'
@@ -140,7 +141,7 @@ def test_user_update_use_case_update_birthdate(
     )
 
     # Act
-    result = use_case.execute(sample_user.id, update_data)
+    result = asyncio.run(use_case.execute(sample_user.id, update_data))
 
     # Assert
     assert sample_user.profile.birthdate == date(1995, 5, 15)
@@ -161,7 +162,7 @@ def test_user_update_use_case_invalid_birthdate_format(
 
     # Act & Assert
     with pytest.raises(ValueError, match='Invalid birthdate format'):
-        use_case.execute(sample_user.id, update_data)
+        asyncio.run(use_case.execute(sample_user.id, update_data))
 
 
 def test_user_update_use_case_update_preferences(
@@ -180,7 +181,7 @@ def test_user_update_use_case_update_preferences(
     )
 
     # Act
-    result = use_case.execute(sample_user.id, update_data)
+    result = asyncio.run(use_case.execute(sample_user.id, update_data))
 
     # Assert
     assert sample_user.profile.preferences.monthly_spending_limit == 2000.0
@@ -199,23 +200,22 @@ def test_user_update_use_case_user_not_found(
 
     # Act & Assert
     with pytest.raises(ValueError, match=f'User with id {user_id} not found'):
-        use_case.execute(user_id, update_data)
+        asyncio.run(use_case.execute(user_id, update_data))
 
 
 def test_user_update_use_case_update_multiple_fields(
     user_repository: MagicMock,
     sample_user: User,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test updating multiple fields at once."""
     # Arrange
     user_repository.get_by_filter.return_value = sample_user
     user_repository.update.return_value = sample_user
     
-    mock_hash = MagicMock(return_value='new_hashed')
-    monkeypatch.setattr('src.application.use_cases.user.user_update_use_case.hash_password', mock_hash)
+    password_hasher = MagicMock(spec=PasswordHasher)
+    password_hasher.hash.return_value = 'new_hashed'
     
-    use_case = UserUpdateUseCase(user_repository)
+    use_case = UserUpdateUseCase(user_repository, password_hasher)
     update_data = UpdateUserDTO(
         username='newusername',
         email='newemail@test.com',
@@ -229,7 +229,7 @@ def test_user_update_use_case_update_multiple_fields(
     )
 
     # Act
-    result = use_case.execute(sample_user.id, update_data)
+    result = asyncio.run(use_case.execute(sample_user.id, update_data))
 
     # Assert
     assert sample_user.username == 'newusername'
@@ -0,0 +1,74 @@
+import pytest
+
+from src.common.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_get_and_set():
+    cache = TTLCache(max_size=2, clock=FakeClock())
+    cache.set('a', 1, expires_at=2000)
+    assert cache.get('a') == 1
+    assert cache.get('missing', 'default') == 'default'
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache(max_size=2, clock=clock)
+    cache.set('a', 1, expires_at=1010)
+    clock.now = 1010
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_ignores_already_expired_entries():
+    cache = TTLCache(max_size=2, clock=FakeClock())
+    cache.set('a', 1, expires_at=999)
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, clock=FakeClock())
+    cache.set('a', 1, expires_at=2000)
+    cache.set('b', 2, expires_at=2000)
+    cache.get('a')  # 'b' is now the least recently used
+    cache.set('c', 3, expires_at=2000)
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_ttl_cache_pop_and_clear():
+    cache = TTLCache(max_size=2, clock=FakeClock())
+    cache.set('a', 1, expires_at=2000)
+    cache.set('b', 2, expires_at=2000)
+    assert cache.pop('a') == 1
+    assert cache.pop('a', 'gone') == 'gone'
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl_cache_invalid_size():
+    with pytest.raises(ValueError):
+        TTLCache(max_size=0)
+
+
+def test_ttl_cache_reports_expired_and_evicted_keys():
+    clock = FakeClock()
+    evicted = []
+    cache = TTLCache(max_size=2, clock=clock, on_evict=evicted.append)
+    cache.set('a', 1, expires_at=clock.now + 10)
+    cache.set('b', 2, expires_at=clock.now + 60)
+    cache.set('c', 3, expires_at=clock.now + 60)
+    assert evicted == ['a']
+
+    clock.now += 60
+    assert cache.get('b') is None
+    cache.pop('c')
+    assert evicted == ['a', 'b']
@@ -2,8 +2,9 @@ import pytest
 from uuid import uuid4
 from datetime import date
 
-from src.domain.account import CreditCard
-from src.domain.expense import Purchase
+from src.domain.account import CreditCard, CreditCardUsage
+from src.domain.expense import Purchase, Subscription
+from src.domain.expense.enums import PaymentStatus
 from src.domain.shared import Amount, Month, Year
 
 
@@ -117,3 +118,61 @@ def test_credit_card_get_payments_with_only_year_raises_error():
     
     with pytest.raises(ValueError, match='Both month and year must be provided together'):
         cc.get_payments(None, Year(2025))
+
+
+def test_credit_card_usage_from_expenses(credit_card_with_expenses: CreditCard):
+    purchase = credit_card_with_expenses.expenses[0]
+    purchase.payments[0].status = PaymentStatus.PAID
+    credit_card_with_expenses.expenses.append(Subscription(
+        id=uuid4(),
+        account_id=credit_card_with_expenses.id,
+        title='Streaming',
+        cc_name='STREAM',
+        acquired_at=date(2025, 11, 1),
+        amount=Amount(15),
+        first_payment_date=date(2025, 11, 30),
+        category_id=uuid4(),
+        payments=[],
+    ))
+
+    usage = credit_card_with_expenses.usage
+    assert usage == CreditCardUsage(
+        used_limit=Amount(215),
+        used_financing_limit=Amount(200),
+        expenses_count=2,
+        purchases_count=1,
+        subscriptions_count=1,
+    )
+    assert credit_card_with_expenses.available_limit == Amount(4785)
+    assert credit_card_with_expenses.available_financing_limit == Amount(1800)
+
+
+def test_credit_card_uses_stored_usage():
+    stored_usage = CreditCardUsage(Amount(120.5), Amount(100), expenses_count=4, purchases_count=3, subscriptions_count=1)
+    cc = CreditCard(
+        id=uuid4(),
+        owner_id=uuid4(),
+        alias='Test Card',
+        limit=Amount(5000),
+        is_enabled=True,
+        main_credit_card_id=None,
+        next_closing_date=date(2025, 12, 1),
+        next_expiring_date=date(2025, 12, 15),
+        financing_limit=Amount(2000),
+        expenses=[],
+        usage=stored_usage,
+    )
+    assert cc.total_expenses_count == 4
+    assert cc.total_purchases_count == 3
+    assert cc.total_subscriptions_count == 1
+    assert cc.used_limit == Amount(120.5)
+    assert cc.available_limit == Amount(4879.5)
+    assert cc.available_financing_limit == Amount(1900)
+
+
+def test_credit_card_usage_arithmetic():
+    usage = CreditCardUsage(Amount(100), Amount(50), expenses_count=2, purchases_count=1, subscriptions_count=1)
+    other = CreditCardUsage(Amount(30.25), Amount(0), expenses_count=1, purchases_count=0, subscriptions_count=1)
+    assert (usage + other) - other == usage
+    assert (usage - usage).is_empty
+    assert not usage.is_empty
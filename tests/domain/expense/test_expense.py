@@ -1,8 +1,9 @@
 import pytest
+from copy import copy
 from uuid import uuid4
 from datetime import date
 
-from src.domain.expense import Expense, ExpenseCategory, Purchase
+from src.domain.expense import Expense, ExpenseCategory, Purchase, Subscription
 from src.domain.expense.enums import ExpenseType, ExpenseStatus, PaymentStatus
 from src.domain.expense.exceptions import ExpenseNotImplementedOperation
 from src.domain.shared import Amount
@@ -103,6 +104,41 @@ def test_expense_get_payments_with_month_year_filter(base_expense: Expense) -> N
         assert payment.payment_date.year == Year(2025)
 
 
+def test_expense_get_payments_follows_payment_changes(base_expense: Expense) -> None:
+    """Test the month lookup sees payments added, replaced or removed after a first lookup."""
+    assert [p.no_installment for p in base_expense.get_payments(Month(3), Year(2025))] == [2]
+
+    base_expense.payments = base_expense.payments[:1]
+    assert base_expense.get_payments(Month(3), Year(2025)) == []
+
+    base_expense.payments.append(base_expense.payments[0])
+    assert len(base_expense.get_payments(Month(2), Year(2025))) == 2
+
+
+def test_subscription_get_payments_follows_update_payment() -> None:
+    """Test moving a subscription payment to another month moves it in the month lookup."""
+    subscription = Subscription(
+        id=uuid4(),
+        account_id=uuid4(),
+        title='Streaming',
+        cc_name='STREAM',
+        acquired_at=date(2025, 1, 1),
+        amount=Amount(15),
+        first_payment_date=date(2025, 1, 10),
+        category_id=uuid4(),
+        payments=[],
+    )
+    payment = subscription.payments[0]
+    assert subscription.get_payments(Month(1), Year(2025)) == [payment]
+
+    moved = copy(payment)
+    moved.payment_date = date(2025, 2, 10)
+    subscription.update_payment(payment.id, moved)
+
+    assert subscription.get_payments(Month(1), Year(2025)) == []
+    assert subscription.get_payments(Month(2), Year(2025)) == [moved]
+
+
 def test_expense_abstract_methods_raise_not_implemented():
     """Test that abstract methods raise ExpenseNotImplementedOperation when called from base Expense."""
     # Create a minimal concrete subclass that doesn't override abstract methods
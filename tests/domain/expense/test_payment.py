@@ -45,3 +45,9 @@ def test_to_dict(payment: Payment):
     assert isinstance(payment_dict['amount'], float)
     assert isinstance(payment_dict['no_installment'], int)
     assert payment_dict['status'] in {status.value for status in PaymentStatus}
+
+
+def test_payment_has_no_instance_dict(payment: Payment):
+    assert not hasattr(payment, '__dict__')
+    with pytest.raises(AttributeError):
+        payment.unknown_field = 1
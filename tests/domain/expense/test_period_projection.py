@@ -0,0 +1,112 @@
+import pytest
+from uuid import uuid4
+from datetime import date
+
+from src.domain.account import CreditCard, CreditCardFactory
+from src.domain.expense import PeriodFactory, PeriodProjection, PurchaseFactory, SubscriptionFactory
+from src.domain.expense.enums import PaymentStatus
+from src.domain.shared import Amount, Month, Year
+
+
+MONTHS = [(Month(11), Year(2025)), (Month(12), Year(2025)), (Month(1), Year(2026)), (Month(2), Year(2026))]
+
+
+@pytest.fixture
+def credit_card() -> CreditCard:
+    """Create a credit card with a purchase in installments and a subscription."""
+    cc = CreditCardFactory.create(
+        id=uuid4(),
+        owner_id=uuid4(),
+        alias='Test Card',
+        limit=Amount(5000),
+        is_enabled=True,
+        main_credit_card_id=None,
+        next_closing_date=date(2025, 12, 1),
+        next_expiring_date=date(2025, 12, 10),
+        financing_limit=Amount(5000),
+        expenses=[],
+    )
+    cc.expenses.append(PurchaseFactory.create(
+        id=uuid4(),
+        account_id=cc.id,
+        title='Laptop',
+        cc_name='LAPTOP',
+        acquired_at=date(2025, 10, 20),
+        amount=Amount(300),
+        installments=3,
+        first_payment_date=date(2025, 11, 10),
+        category_id=uuid4(),
+        payments=[],
+    ))
+    cc.expenses.append(SubscriptionFactory.create(
+        id=uuid4(),
+        account_id=cc.id,
+        title='Streaming',
+        cc_name='STREAM',
+        acquired_at=date(2025, 11, 1),
+        amount=Amount(15),
+        first_payment_date=date(2025, 11, 30),
+        category_id=uuid4(),
+        payments=[],
+    ))
+    return cc
+
+
+def test_period_projection_matches_fill_from_account(credit_card: CreditCard) -> None:
+    """Test projected periods hold the same payments as filling each period on its own."""
+    projection = PeriodProjection(MONTHS)
+    projection.add_account(credit_card)
+    periods = projection.get_periods()
+
+    assert [(p.month, p.year) for p in periods] == MONTHS
+    for projected, (month, year) in zip(periods, MONTHS):
+        expected = PeriodFactory.create(id=uuid4(), month=month, year=year, payments=[])
+        expected.fill_from_account(credit_card)
+
+        assert projected.total_payments == expected.total_payments
+        assert projected.total_amount == expected.total_amount
+        assert [(pp.expense_id, pp.payment_date, pp.no_installment, pp.status) for pp in projected.payments] == \
+            [(pp.expense_id, pp.payment_date, pp.no_installment, pp.status) for pp in expected.payments]
+
+
+def test_period_projection_simulates_subscription_after_last_payment(credit_card: CreditCard) -> None:
+    """Test subscriptions only get simulated payments after their last real one."""
+    projection = PeriodProjection(MONTHS)
+    projection.add_account(credit_card)
+    periods = projection.get_periods()
+
+    simulated = [
+        [pp for pp in period.payments if pp.status == PaymentStatus.SIMULATED]
+        for period in periods
+    ]
+    assert [len(s) for s in simulated] == [0, 1, 1, 1]
+    # Payment day is clamped to the last day of February
+    assert simulated[3][0].payment_date == date(2026, 2, 28)
+    assert simulated[3][0].no_installment == 4
+
+
+def test_period_projection_category_names(credit_card: CreditCard) -> None:
+    """Test payments, real and simulated, are labeled with their expense's category name."""
+    purchase, subscription = credit_card.expenses
+    category_names = {purchase.category_id: 'Tech', subscription.category_id: 'Entertainment'}
+    expenses_by_id = {purchase.id: purchase, subscription.id: subscription}
+    projection = PeriodProjection(MONTHS)
+    projection.add_account(credit_card, category_names=category_names)
+
+    for projected, (month, year) in zip(projection.get_periods(), MONTHS):
+        expected = PeriodFactory.create(id=uuid4(), month=month, year=year, payments=[])
+        expected.fill_from_account(credit_card, category_names=category_names)
+
+        assert [pp.expense_category_name for pp in projected.payments] == \
+            [category_names[expenses_by_id[pp.expense_id].category_id] for pp in projected.payments]
+        assert [pp.expense_category_name for pp in projected.payments] == [pp.expense_category_name for pp in expected.payments]
+
+
+def test_period_projection_empty_account() -> None:
+    """Test periods are returned even when no account was added."""
+    projection = PeriodProjection(MONTHS)
+
+    periods = projection.get_periods()
+
+    assert len(periods) == len(MONTHS)
+    assert all(period.total_payments == 0 for period in periods)
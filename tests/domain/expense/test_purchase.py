@@ -205,6 +205,27 @@ def test_calculate_payments(purchase: Purchase):
     assert total_amount == pytest.approx(purchase.amount.value)
 
 
+def test_calculate_payments_splits_exact_cents(purchase: Purchase):
+    purchase.amount = Amount(100)
+    purchase.installments = 3
+    purchase.payments = []
+    purchase.calculate_payments()
+    assert [payment.amount.units for payment in purchase.payments] == [3333, 3334, 3333]
+    assert Amount.sum(payment.amount for payment in purchase.payments) == purchase.amount
+
+
+def test_calculate_payments_clamps_month_end_dates(purchase: Purchase):
+    purchase.installments = 3
+    purchase.first_payment_date = date(2025, 1, 31)
+    purchase.payments = []
+    purchase.calculate_payments()
+    assert [payment.payment_date for payment in purchase.payments] == [
+        date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31),
+    ]
+    assert [payment.no_installment for payment in purchase.payments] == [1, 2, 3]
+    assert [payment.is_last_payment for payment in purchase.payments] == [False, False, True]
+
+
 def test_to_dict(purchase: Purchase):
     purchase_dict = purchase.to_dict()
     assert purchase_dict['id'] == str(purchase.id)
@@ -6,7 +6,7 @@ from datetime import date
 
 import pytest
 
-from src.domain.expense import Subscription, Payment, PaymentStatus, PaymentFactory
+from src.domain.expense import Subscription, Payment, PaymentStatus, PaymentFactory, ExpenseStatus
 from src.domain.shared import Amount
 
 
@@ -583,3 +583,74 @@ def test_get_next_payment_raises_when_factor_is_zero():
 
 
 
+
+
+@pytest.fixture
+def month_end_subscription() -> Subscription:
+    """Subscription charged on the 31st, last recorded payment on 2025-03-31 (installment 3)."""
+    subscription = Subscription(
+        id=uuid4(),
+        account_id=uuid4(),
+        title='Gym',
+        cc_name='GYM',
+        acquired_at=date(2025, 1, 1),
+        amount=Amount(40),
+        first_payment_date=date(2025, 1, 31),
+        category_id=uuid4(),
+        payments=[],
+    )
+    subscription.payments = [
+        PaymentFactory.create(
+            id=uuid4(),
+            expense_id=subscription.id,
+            amount=Amount(40),
+            no_installment=no,
+            status=PaymentStatus.PAID,
+            payment_date=payment_date,
+        )
+        for no, payment_date in enumerate([date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31)], start=1)
+    ]
+    return subscription
+
+
+def test_last_payment_follows_payment_changes(month_end_subscription: Subscription):
+    subscription = month_end_subscription
+    assert subscription.last_payment is subscription.payments[-1]
+
+    later_payment = subscription.get_next_payment()
+    subscription.add_new_payment(later_payment)
+    assert subscription.last_payment is later_payment
+
+    subscription.remove_payment(later_payment.id)
+    assert subscription.last_payment is subscription.payments[-1]
+
+    subscription.payments = []
+    assert subscription.last_payment is None
+
+
+def test_iter_simulated_occurrences(month_end_subscription: Subscription):
+    occurrences = list(month_end_subscription.iter_simulated_occurrences(1, 2025, 6, 2025))
+
+    # Only the months after the last payment, charged on the first payment's day (clamped)
+    assert [(o.payment_date, o.no_installment) for o in occurrences] == [
+        (date(2025, 4, 30), 4),
+        (date(2025, 5, 31), 5),
+        (date(2025, 6, 30), 6),
+    ]
+    assert all(o.amount == Amount(40) for o in occurrences)
+
+
+def test_iter_simulated_occurrences_is_lazy(month_end_subscription: Subscription):
+    # A range of a million years only computes the months that are read
+    occurrences = month_end_subscription.iter_simulated_occurrences(1, 2026, 12, 1_002_025)
+    assert next(occurrences).payment_date == date(2026, 1, 31)
+    assert next(occurrences).no_installment == 14
+
+
+def test_iter_simulated_occurrences_skips_cancelled_or_unstarted(month_end_subscription: Subscription):
+    month_end_subscription.status = ExpenseStatus.CANCELLED
+    assert list(month_end_subscription.iter_simulated_occurrences(1, 2025, 12, 2025)) == []
+
+    month_end_subscription.status = ExpenseStatus.ACTIVE
+    month_end_subscription.payments = []
+    assert list(month_end_subscription.iter_simulated_occurrences(1, 2025, 12, 2025)) == []
@@ -1,6 +1,6 @@
 from datetime import date, timedelta
 
-from src.domain.shared.helpers.dates import add_months_to_date, calc_days_until, is_leap_year
+from src.domain.shared.helpers.dates import add_months_to_date, calc_days_until, clamp_to_month, is_leap_year, iter_monthly_dates
 
 
 def test_calc_days_until_future_date():
@@ -20,7 +20,7 @@ def test_calc_days_until_past_date():
 def test_add_months_to_date():
     start_date = date(2023, 1, 31)
     new_date = add_months_to_date(start_date, 1)
-    assert new_date == date(2023, 3, 2), f'Expected 2023-03-01, got {new_date}'
+    assert new_date == date(2023, 2, 28), f'Expected 2023-02-28, got {new_date}'
 
     new_date = add_months_to_date(start_date, 12)
     assert new_date == date(
@@ -28,7 +28,7 @@ def test_add_months_to_date():
 
     start_date = date(2023, 1, 30)
     new_date = add_months_to_date(start_date, 1)
-    assert new_date == date(2023, 3, 1), f'Expected 2023-03-01, got {new_date}'
+    assert new_date == date(2023, 2, 28), f'Expected 2023-02-28, got {new_date}'
 
     start_date = date(2023, 1, 29)
     new_date = add_months_to_date(start_date, 1)
@@ -40,6 +40,23 @@ def test_add_months_to_date():
     assert new_date == date(
         2023, 9, 15), f'Expected 2023-09-15, got {new_date}'
 
+    start_date = date(2023, 12, 31)
+    new_date = add_months_to_date(start_date, 2)
+    assert new_date == date(2024, 2, 29), f'Expected 2024-02-29, got {new_date}'
+
+
+def test_clamp_to_month():
+    assert clamp_to_month(2023, 2, 31) == date(2023, 2, 28)
+    assert clamp_to_month(2024, 2, 30) == date(2024, 2, 29)
+    assert clamp_to_month(2023, 4, 31) == date(2023, 4, 30)
+    assert clamp_to_month(2023, 5, 15) == date(2023, 5, 15)
+
+
+def test_iter_monthly_dates_keeps_the_start_day_after_short_months():
+    dates = list(iter_monthly_dates(date(2023, 11, 30), 5))
+    assert dates == [date(2023, 11, 30), date(2023, 12, 30), date(2024, 1, 30), date(2024, 2, 29), date(2024, 3, 30)]
+    assert list(iter_monthly_dates(date(2023, 1, 31), 0)) == []
+
 
 def test_is_leap_year():
     assert is_leap_year(2020) is True, '2020 should be a leap year'
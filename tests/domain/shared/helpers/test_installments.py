@@ -0,0 +1,65 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from src.domain.shared.helpers.dates import add_months_to_date
+from src.domain.shared.helpers.installments import installment_schedule, split_units
+
+
+def reference_split(total_units: int, parts: int) -> list[int]:
+    # Former Purchase.calculate_payments split (float division, rounded half-even)
+    installments = []
+    remaining_units, remaining_parts = total_units, parts
+    for _ in range(parts):
+        units = round(remaining_units / remaining_parts)
+        installments.append(units)
+        remaining_units -= units
+        remaining_parts -= 1
+    return installments
+
+
+def test_split_units():
+    assert split_units(10000, 3) == [3333, 3334, 3333]
+    assert split_units(10000, 1) == [10000]
+    assert split_units(1, 4) == [0, 0, 0, 1]
+    assert split_units(0, 2) == [0, 0]
+
+
+def test_split_units_rejects_no_parts():
+    with pytest.raises(ValueError, match='parts must be at least 1'):
+        split_units(10000, 0)
+
+
+def test_installment_schedule_clamps_month_ends():
+    schedule = installment_schedule(10000, 4, date(2024, 1, 31))
+    assert schedule == [
+        (2500, date(2024, 1, 31)),
+        (2500, date(2024, 2, 29)),
+        (2500, date(2024, 3, 31)),
+        (2500, date(2024, 4, 30)),
+    ]
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_installment_schedule_properties(seed: int):
+    rng = random.Random(seed)
+    for _ in range(50):
+        total_units = rng.randint(-10**6, 10**9)
+        installments = rng.randint(1, 60)
+        first_date = date(2000, 1, 1) + timedelta(days=rng.randint(0, 365 * 40))
+
+        schedule = installment_schedule(total_units, installments, first_date)
+
+        units = [units for units, _ in schedule]
+        dates = [due_date for _, due_date in schedule]
+        assert len(schedule) == installments
+        # Exact: nothing lost or created by the split, installments at most one unit apart
+        assert sum(units) == total_units
+        assert max(units) - min(units) <= 1
+        assert units == reference_split(total_units, installments)
+        # One due date per consecutive month, on the first day or the month's last one
+        assert dates[0] == first_date
+        for no, due_date in enumerate(dates):
+            assert due_date == add_months_to_date(first_date, no)
+            assert due_date.day == first_date.day or (due_date + timedelta(days=1)).day == 1
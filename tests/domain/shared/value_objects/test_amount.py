@@ -1,4 +1,5 @@
 import pytest
+from decimal import Decimal
 
 from src.domain.shared.value_objects.amount import Amount
 
@@ -98,3 +99,56 @@ def test_amount_eq_with_invalid_type():
     amount = Amount(10)
     result = amount.__eq__('invalid')
     assert result is NotImplemented
+
+
+def test_amount_has_no_instance_dict():
+    """Test Amount is slotted (no per-instance __dict__)."""
+    amount = Amount(10)
+    assert not hasattr(amount, '__dict__')
+    with pytest.raises(AttributeError):
+        amount.currency = 'ARS'
+
+
+def test_amount_arithmetic_keeps_rounding_and_precision():
+    """Test add/sub results are rounded to the highest precision of both operands."""
+    result = Amount(0.1) + Amount(0.2, precision=3)
+    assert isinstance(result, Amount)
+    assert result.value == 0.3
+    assert result.precision == 3
+    assert (Amount(10.555, precision=3) - Amount(0.5)).value == 10.055
+
+
+def test_amount_is_backed_by_integer_units():
+    """Test Amount keeps an integer number of cents (10**-precision units)."""
+    assert Amount(10.5).units == 1050
+    assert Amount(3).units == 300
+    assert Amount(Decimal('19.995'), precision=2).units == 2000
+    assert Amount(1.2345, precision=3).units == 1234
+
+
+def test_amount_from_units_and_to_decimal():
+    """Test from_units/to_decimal round-trip without float conversions."""
+    amount = Amount.from_units(1999)
+    assert amount.value == 19.99
+    assert amount.to_decimal() == Decimal('19.99')
+
+
+def test_amount_sum_is_exact():
+    """Test Amount.sum adds integer units (no float drift over many payments)."""
+    amounts = [Amount(0.1) for _ in range(1000)]
+    total = Amount.sum(amounts)
+    assert total.units == 10000
+    assert total == Amount(100)
+    assert sum(amounts) == Amount(100)  # builtin sum starts from 0 via __radd__
+
+
+def test_amount_sum_mixed_precision():
+    """Test Amount.sum rescales to the highest precision."""
+    total = Amount.sum([Amount(1.5), Amount(0.125, precision=3)])
+    assert total.precision == 3
+    assert total.units == 1625
+
+
+def test_amount_sum_empty():
+    """Test Amount.sum of nothing is zero."""
+    assert Amount.sum([]) == Amount(0)
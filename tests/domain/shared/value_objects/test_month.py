@@ -33,3 +33,8 @@ def test_month_str_representation() -> None:
     assert str(Month(9)) == '09'
     assert str(Month(10)) == '10'
     assert str(Month(12)) == '12'
+
+
+def test_month_has_no_instance_dict():
+    """Test Month adds no per-instance __dict__ to int."""
+    assert not hasattr(Month(1), '__dict__')
@@ -26,3 +26,8 @@ def test_year_str_representation() -> None:
     """Test that year string representation works correctly."""
     assert str(Year(2025)) == '2025'
     assert str(Year(2000)) == '2000'
+
+
+def test_year_has_no_instance_dict():
+    """Test Year adds no per-instance __dict__ to int."""
+    assert not hasattr(Year(2025), '__dict__')
@@ -1,6 +1,7 @@
+import asyncio
 import pytest
 from uuid import uuid4, UUID
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from datetime import date
 
 from src.entrypoints.controllers import AccountController
@@ -11,15 +12,17 @@ from src.application.dtos import (
     PaginatedResponse,
     Pagination,
 )
-from src.application.ports import CreditCardRepository
+from src.application.helpers.result_cache import ResultCache
+from src.application.ports import AsyncCreditCardRepository
 from src.entrypoints.exceptions.client_exceptions import BadRequest, NotFound
 from src.entrypoints.exceptions.server_exceptions import InternalServerError
 from src.common.exceptions import RepoNotFoundError
+from src.infrastructure.cache import InMemoryCache
 
 
 @pytest.fixture
 def credit_card_repository_mock() -> MagicMock:
-    return MagicMock(spec=CreditCardRepository)
+    return MagicMock(spec=AsyncCreditCardRepository)
 
 
 @pytest.fixture
@@ -79,6 +82,7 @@ def credit_card_response_dto() -> CreditCardResponseDTO:
 @pytest.fixture
 def create_credit_card_use_case_ok(monkeypatch: pytest.MonkeyPatch, credit_card_response_dto: CreditCardResponseDTO) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = credit_card_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardCreateUseCase', uc_class)
@@ -88,6 +92,7 @@ def create_credit_card_use_case_ok(monkeypatch: pytest.MonkeyPatch, credit_card_
 @pytest.fixture
 def create_credit_card_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Invalid credit card data')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardCreateUseCase', uc_class)
@@ -97,6 +102,7 @@ def create_credit_card_use_case_value_error(monkeypatch: pytest.MonkeyPatch) ->
 @pytest.fixture
 def create_credit_card_use_case_exception(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Unexpected error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardCreateUseCase', uc_class)
@@ -108,7 +114,7 @@ def test_create_credit_card_success(
     create_credit_card_dto: CreateCreditCardDTO,
     create_credit_card_use_case_ok: MagicMock,
 ) -> None:
-    result = controller.create_credit_card(create_credit_card_dto)
+    result = asyncio.run(controller.create_credit_card(create_credit_card_dto))
     assert isinstance(result, CreditCardResponseDTO)
     assert result.alias == 'Test Card'
 
@@ -119,7 +125,7 @@ def test_create_credit_card_bad_request(
     create_credit_card_use_case_value_error: MagicMock,
 ) -> None:
     with pytest.raises(BadRequest) as exc:
-        controller.create_credit_card(create_credit_card_dto)
+        asyncio.run(controller.create_credit_card(create_credit_card_dto))
     assert exc.value.status_code == 400
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail['code'] == 'CREATE_CREDIT_CARD_BAD_REQUEST'
@@ -131,7 +137,7 @@ def test_create_credit_card_unexpected_error(
     create_credit_card_use_case_exception: MagicMock,
 ) -> None:
     with pytest.raises(InternalServerError) as exc:
-        controller.create_credit_card(create_credit_card_dto)
+        asyncio.run(controller.create_credit_card(create_credit_card_dto))
     assert exc.value.status_code == 500
 
 
@@ -140,6 +146,7 @@ def test_create_credit_card_unexpected_error(
 @pytest.fixture
 def get_credit_card_use_case_ok(monkeypatch: pytest.MonkeyPatch, credit_card_response_dto: CreditCardResponseDTO) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = credit_card_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardGetOneUseCase', uc_class)
@@ -149,6 +156,7 @@ def get_credit_card_use_case_ok(monkeypatch: pytest.MonkeyPatch, credit_card_res
 @pytest.fixture
 def get_credit_card_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = RepoNotFoundError('Credit card not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardGetOneUseCase', uc_class)
@@ -160,7 +168,7 @@ def test_get_credit_card_success(
     get_credit_card_use_case_ok: MagicMock,
 ) -> None:
     credit_card_id = uuid4()
-    result = controller.get_credit_card(credit_card_id)
+    result = asyncio.run(controller.get_credit_card(credit_card_id))
     assert isinstance(result, CreditCardResponseDTO)
 
 
@@ -170,7 +178,7 @@ def test_get_credit_card_not_found(
 ) -> None:
     credit_card_id = uuid4()
     with pytest.raises(NotFound) as exc:
-        controller.get_credit_card(credit_card_id)
+        asyncio.run(controller.get_credit_card(credit_card_id))
     assert exc.value.status_code == 404
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail['code'] == 'CREDIT_CARD_NOT_FOUND'
@@ -181,6 +189,7 @@ def test_get_credit_card_not_found(
 @pytest.fixture
 def update_credit_card_use_case_ok(monkeypatch: pytest.MonkeyPatch, credit_card_response_dto: CreditCardResponseDTO) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = credit_card_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardUpdateUseCase', uc_class)
@@ -190,6 +199,7 @@ def update_credit_card_use_case_ok(monkeypatch: pytest.MonkeyPatch, credit_card_
 @pytest.fixture
 def update_credit_card_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Invalid update data')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardUpdateUseCase', uc_class)
@@ -202,7 +212,7 @@ def test_update_credit_card_success(
     update_credit_card_use_case_ok: MagicMock,
 ) -> None:
     credit_card_id = uuid4()
-    result = controller.update_credit_card(credit_card_id, update_credit_card_dto)
+    result = asyncio.run(controller.update_credit_card(credit_card_id, update_credit_card_dto))
     assert isinstance(result, CreditCardResponseDTO)
 
 
@@ -213,7 +223,7 @@ def test_update_credit_card_bad_request(
 ) -> None:
     credit_card_id = uuid4()
     with pytest.raises(BadRequest) as exc:
-        controller.update_credit_card(credit_card_id, update_credit_card_dto)
+        asyncio.run(controller.update_credit_card(credit_card_id, update_credit_card_dto))
     assert exc.value.status_code == 400
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail['code'] == 'UPDATE_CREDIT_CARD_BAD_REQUEST'
@@ -224,6 +234,7 @@ def test_update_credit_card_bad_request(
 @pytest.fixture
 def delete_credit_card_use_case_ok(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = None
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardDeleteUseCase', uc_class)
@@ -233,6 +244,7 @@ def delete_credit_card_use_case_ok(monkeypatch: pytest.MonkeyPatch) -> MagicMock
 @pytest.fixture
 def delete_credit_card_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Credit card not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardDeleteUseCase', uc_class)
@@ -244,7 +256,7 @@ def test_delete_credit_card_success(
     delete_credit_card_use_case_ok: MagicMock,
 ) -> None:
     credit_card_id = uuid4()
-    controller.delete_credit_card(credit_card_id)
+    asyncio.run(controller.delete_credit_card(credit_card_id))
     delete_credit_card_use_case_ok.execute.assert_called_once_with(credit_card_id)
 
 
@@ -254,7 +266,7 @@ def test_delete_credit_card_not_found(
 ) -> None:
     credit_card_id = uuid4()
     with pytest.raises(NotFound) as exc:
-        controller.delete_credit_card(credit_card_id)
+        asyncio.run(controller.delete_credit_card(credit_card_id))
     assert exc.value.status_code == 404
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail['code'] == 'CREDIT_CARD_NOT_FOUND'
@@ -265,6 +277,7 @@ def test_delete_credit_card_not_found(
 @pytest.fixture
 def get_paginated_credit_cards_use_case_ok(monkeypatch: pytest.MonkeyPatch, credit_card_response_dto: CreditCardResponseDTO) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = PaginatedResponse(
         items=[credit_card_response_dto],
         pagination=Pagination(current_page=1, total_pages=1, total_items=1, per_page=10),
@@ -277,6 +290,7 @@ def get_paginated_credit_cards_use_case_ok(monkeypatch: pytest.MonkeyPatch, cred
 @pytest.fixture
 def get_paginated_credit_cards_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Invalid pagination parameters')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardGetPaginatedUseCase', uc_class)
@@ -287,7 +301,7 @@ def test_get_paginated_credit_cards_success(
     controller: AccountController,
     get_paginated_credit_cards_use_case_ok: MagicMock,
 ) -> None:
-    result = controller.get_paginated_credit_cards(filter={}, limit=10, offset=0)
+    result = asyncio.run(controller.get_paginated_credit_cards(filter={}, limit=10, offset=0))
     assert isinstance(result, PaginatedResponse)
     assert len(result.items) == 1
 
@@ -297,7 +311,7 @@ def test_get_paginated_credit_cards_bad_request(
     get_paginated_credit_cards_use_case_value_error: MagicMock,
 ) -> None:
     with pytest.raises(BadRequest) as exc:
-        controller.get_paginated_credit_cards(filter={}, limit=10, offset=0)
+        asyncio.run(controller.get_paginated_credit_cards(filter={}, limit=10, offset=0))
     assert exc.value.status_code == 400
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail['code'] == 'PAGINATION_BAD_REQUEST'
@@ -309,12 +323,13 @@ def test_get_credit_card_internal_error(
 ) -> None:
     """Test internal error when getting credit card."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardGetOneUseCase', uc_class)
     
     with pytest.raises(InternalServerError):
-        controller.get_credit_card(uuid4())
+        asyncio.run(controller.get_credit_card(uuid4()))
 
 
 def test_update_credit_card_internal_error(
@@ -323,13 +338,14 @@ def test_update_credit_card_internal_error(
 ) -> None:
     """Test internal error when updating credit card."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardUpdateUseCase', uc_class)
     
     update_dto = UpdateCreditCardDTO(alias='Test')
     with pytest.raises(InternalServerError):
-        controller.update_credit_card(uuid4(), update_dto)
+        asyncio.run(controller.update_credit_card(uuid4(), update_dto))
 
 
 def test_delete_credit_card_internal_error(
@@ -338,12 +354,13 @@ def test_delete_credit_card_internal_error(
 ) -> None:
     """Test internal error when deleting credit card."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardDeleteUseCase', uc_class)
     
     with pytest.raises(InternalServerError):
-        controller.delete_credit_card(uuid4())
+        asyncio.run(controller.delete_credit_card(uuid4()))
 
 
 def test_get_paginated_credit_cards_internal_error(
@@ -352,10 +369,29 @@ def test_get_paginated_credit_cards_internal_error(
 ) -> None:
     """Test internal error when getting paginated credit cards."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.account_controller.CreditCardGetPaginatedUseCase', uc_class)
     
     with pytest.raises(InternalServerError):
-        controller.get_paginated_credit_cards(filter={}, limit=10, offset=0)
+        asyncio.run(controller.get_paginated_credit_cards(filter={}, limit=10, offset=0))
 
+
+
+def test_get_paginated_credit_cards_cached_until_write(
+    credit_card_repository_mock: MagicMock,
+    get_paginated_credit_cards_use_case_ok: MagicMock,
+    delete_credit_card_use_case_ok: MagicMock,
+) -> None:
+    controller = AccountController(credit_card_repository_mock, result_cache=ResultCache(InMemoryCache()))
+    owner_id = uuid4()
+    filter = {'owner_id': owner_id, 'include_expenses': False}
+
+    asyncio.run(controller.get_paginated_credit_cards(filter=filter, limit=10, offset=0))
+    asyncio.run(controller.get_paginated_credit_cards(filter=filter, limit=10, offset=0))
+    assert get_paginated_credit_cards_use_case_ok.execute.call_count == 1
+
+    asyncio.run(controller.delete_credit_card(uuid4(), user_id=owner_id))
+    asyncio.run(controller.get_paginated_credit_cards(filter=filter, limit=10, offset=0))
+    assert get_paginated_credit_cards_use_case_ok.execute.call_count == 2
@@ -1,23 +1,25 @@
+import asyncio
 import pytest
 from uuid import uuid4
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from src.entrypoints.controllers import AuthController
-from src.application.ports import UserRepository, RefreshTokenRepository
+from src.application.ports import AsyncUserRepository, AsyncRefreshTokenRepository
 from src.application.dtos import LoginUserDTO, RegisterUserDTO, LoggedInUserDTO
 from src.domain.auth.enums.role import Role
 from src.entrypoints.exceptions.client_exceptions import Unauthorized, BadRequest, NotFound
-from src.entrypoints.exceptions.server_exceptions import InternalServerError
+from src.entrypoints.exceptions.server_exceptions import InternalServerError, ServiceUnavailable
+from src.common.exceptions import PasswordHasherBusyError
 
 # TODO: manejar fixtures para que devuelvan ok, o errores segun se necesite para el test
 @pytest.fixture
 def user_repository_mock() -> MagicMock:
-    return MagicMock(spec=UserRepository)
+    return MagicMock(spec=AsyncUserRepository)
 
 
 @pytest.fixture
 def refresh_token_repository_mock() -> MagicMock:
-    repo = MagicMock(spec=RefreshTokenRepository)
+    repo = MagicMock(spec=AsyncRefreshTokenRepository)
     repo.create.side_effect = lambda entity: entity
     return repo
 
@@ -63,6 +65,7 @@ def logged_in_dto() -> LoggedInUserDTO:
 @pytest.fixture
 def login_use_case_ok(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = lambda creds: LoggedInUserDTO(
         id=uuid4(), username=creds.username, email='test@example.com', role=Role.FREE_USER, access_token='ok')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
@@ -73,6 +76,7 @@ def login_use_case_ok(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
 @pytest.fixture
 def login_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Invalid email or password')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.auth_controller.UserLoginUseCase', uc_class)
@@ -82,6 +86,7 @@ def login_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
 @pytest.fixture
 def login_use_case_exception(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('boom')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.auth_controller.UserLoginUseCase', uc_class)
@@ -91,6 +96,7 @@ def login_use_case_exception(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
 @pytest.fixture
 def register_use_case_ok(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = lambda dto: LoggedInUserDTO(
         id=uuid4(), username=dto.username, email=dto.email, role=dto.role, access_token='ok')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
@@ -101,6 +107,7 @@ def register_use_case_ok(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
 @pytest.fixture
 def register_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('invalid data')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.auth_controller.UserRegisterUseCase', uc_class)
@@ -110,6 +117,7 @@ def register_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
 @pytest.fixture
 def renew_use_case_ok(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = lambda dto: LoggedInUserDTO(
         id=dto.id, username=dto.username, email=dto.email, role=dto.role, access_token='new')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
@@ -120,6 +128,7 @@ def renew_use_case_ok(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
 @pytest.fixture
 def renew_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('User not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.auth_controller.UserRenewTokenUseCase', uc_class)
@@ -127,7 +136,7 @@ def renew_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
 
 
 def test_login_success(controller: AuthController, login_dto: LoginUserDTO, login_use_case_ok: MagicMock) -> None:
-    result = controller.login(login_dto)
+    result = asyncio.run(controller.login(login_dto))
     assert isinstance(result, LoggedInUserDTO)
     assert result.username == login_dto.username
     assert result.access_token != ''
@@ -135,7 +144,7 @@ def test_login_success(controller: AuthController, login_dto: LoginUserDTO, logi
 
 def test_login_invalid_credentials(controller: AuthController, login_dto: LoginUserDTO, login_use_case_value_error: MagicMock) -> None:
     with pytest.raises(Unauthorized) as exc:
-        controller.login(login_dto)
+        asyncio.run(controller.login(login_dto))
     assert exc.value.status_code == 401
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail.get('code') == 'LOGIN_INVALID_CREDENTIALS'
@@ -143,33 +152,43 @@ def test_login_invalid_credentials(controller: AuthController, login_dto: LoginU
 
 def test_login_unexpected_error(controller: AuthController, login_dto: LoginUserDTO, login_use_case_exception: MagicMock) -> None:
     with pytest.raises(InternalServerError) as exc:
-        controller.login(login_dto)
+        asyncio.run(controller.login(login_dto))
     assert exc.value.status_code == 500
 
 
+def test_login_password_hasher_busy(controller: AuthController, login_dto: LoginUserDTO, monkeypatch: pytest.MonkeyPatch) -> None:
+    uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock(side_effect=PasswordHasherBusyError())
+    monkeypatch.setattr('src.entrypoints.controllers.auth_controller.UserLoginUseCase', MagicMock(return_value=uc_instance))
+    with pytest.raises(ServiceUnavailable) as exc:
+        asyncio.run(controller.login(login_dto))
+    assert exc.value.status_code == 503
+    assert exc.value.detail.get('code') == 'PASSWORD_HASHER_BUSY'
+
+
 def test_register_success(controller: AuthController, register_dto: RegisterUserDTO, register_use_case_ok: MagicMock) -> None:
-    result = controller.register(register_dto)
+    result = asyncio.run(controller.register(register_dto))
     assert isinstance(result, LoggedInUserDTO)
     assert result.username == register_dto.username
 
 
 def test_register_bad_request(controller: AuthController, register_dto: RegisterUserDTO, register_use_case_value_error: MagicMock) -> None:
     with pytest.raises(BadRequest) as exc:
-        controller.register(register_dto)
+        asyncio.run(controller.register(register_dto))
     assert exc.value.status_code == 400
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail.get('code') == 'REGISTER_BAD_REQUEST'
 
 
 def test_renew_token_success(controller: AuthController, logged_in_dto: LoggedInUserDTO, renew_use_case_ok: MagicMock) -> None:
-    result = controller.renew_token(logged_in_dto)
+    result = asyncio.run(controller.renew_token(logged_in_dto))
     assert isinstance(result, LoggedInUserDTO)
     assert result.access_token == 'new'
 
 
 def test_renew_token_not_found(controller: AuthController, logged_in_dto: LoggedInUserDTO, renew_use_case_value_error: MagicMock) -> None:
     with pytest.raises(NotFound) as exc:
-        controller.renew_token(logged_in_dto)
+        asyncio.run(controller.renew_token(logged_in_dto))
     assert exc.value.status_code == 404
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail.get('code') == 'USER_NOT_FOUND'
@@ -1,6 +1,7 @@
+import asyncio
 import pytest
 from uuid import uuid4
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from datetime import date
 
 from src.entrypoints.controllers import ExpenseController
@@ -19,7 +20,7 @@ from src.application.dtos import (
     UpdatePaymentDTO,
     PaymentResponseDTO,
 )
-from src.application.ports import ExpenseCategoryRepository, ExpenseRepository, PaymentRepository
+from src.application.ports import AsyncExpenseCategoryRepository, AsyncExpenseRepository, AsyncPaymentRepository
 from src.entrypoints.exceptions.client_exceptions import BadRequest, NotFound
 from src.entrypoints.exceptions.server_exceptions import InternalServerError
 from src.domain.expense.enums import ExpenseType, ExpenseStatus
@@ -27,17 +28,17 @@ from src.domain.expense.enums import ExpenseType, ExpenseStatus
 
 @pytest.fixture
 def expense_category_repository_mock() -> MagicMock:
-    return MagicMock(spec=ExpenseCategoryRepository)
+    return MagicMock(spec=AsyncExpenseCategoryRepository)
 
 
 @pytest.fixture
 def expense_repository_mock() -> MagicMock:
-    return MagicMock(spec=ExpenseRepository)
+    return MagicMock(spec=AsyncExpenseRepository)
 
 
 @pytest.fixture
 def payment_repository_mock() -> MagicMock:
-    return MagicMock(spec=PaymentRepository)
+    return MagicMock(spec=AsyncPaymentRepository)
 
 
 @pytest.fixture
@@ -117,6 +118,7 @@ def expense_response_dto() -> ExpenseResponseDTO:
 @pytest.fixture
 def create_category_use_case_ok(monkeypatch: pytest.MonkeyPatch, category_response_dto: ExpenseCategoryResponseDTO) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = category_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryCreateUseCase', uc_class)
@@ -126,6 +128,7 @@ def create_category_use_case_ok(monkeypatch: pytest.MonkeyPatch, category_respon
 @pytest.fixture
 def create_category_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Invalid category data')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryCreateUseCase', uc_class)
@@ -137,7 +140,7 @@ def test_create_expense_category_success(
     create_category_dto: CreateExpenseCategoryDTO,
     create_category_use_case_ok: MagicMock,
 ) -> None:
-    result = controller.create_expense_category(create_category_dto)
+    result = asyncio.run(controller.create_expense_category(create_category_dto))
     assert isinstance(result, ExpenseCategoryResponseDTO)
     assert result.name == 'Food'
 
@@ -148,7 +151,7 @@ def test_create_expense_category_bad_request(
     create_category_use_case_value_error: MagicMock,
 ) -> None:
     with pytest.raises(BadRequest) as exc:
-        controller.create_expense_category(create_category_dto)
+        asyncio.run(controller.create_expense_category(create_category_dto))
     assert exc.value.status_code == 400
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail['code'] == 'CREATE_CATEGORY_BAD_REQUEST'
@@ -159,6 +162,7 @@ def test_create_expense_category_bad_request(
 @pytest.fixture
 def create_purchase_use_case_ok(monkeypatch: pytest.MonkeyPatch, expense_response_dto: ExpenseResponseDTO) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = expense_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseCreateUseCase', uc_class)
@@ -168,6 +172,7 @@ def create_purchase_use_case_ok(monkeypatch: pytest.MonkeyPatch, expense_respons
 @pytest.fixture
 def create_purchase_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Invalid purchase data')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseCreateUseCase', uc_class)
@@ -179,7 +184,7 @@ def test_create_purchase_success(
     create_purchase_dto: CreatePurchaseDTO,
     create_purchase_use_case_ok: MagicMock,
 ) -> None:
-    result = controller.create_purchase(create_purchase_dto)
+    result = asyncio.run(controller.create_purchase(create_purchase_dto))
     assert isinstance(result, ExpenseResponseDTO)
     assert result.title == 'Laptop'
 
@@ -190,7 +195,7 @@ def test_create_purchase_bad_request(
     create_purchase_use_case_value_error: MagicMock,
 ) -> None:
     with pytest.raises(BadRequest) as exc:
-        controller.create_purchase(create_purchase_dto)
+        asyncio.run(controller.create_purchase(create_purchase_dto))
     assert exc.value.status_code == 400
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail['code'] == 'CREATE_PURCHASE_BAD_REQUEST'
@@ -199,6 +204,7 @@ def test_create_purchase_bad_request(
 @pytest.fixture
 def get_purchase_use_case_ok(monkeypatch: pytest.MonkeyPatch, expense_response_dto: ExpenseResponseDTO) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = expense_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseGetOneUseCase', uc_class)
@@ -208,6 +214,7 @@ def get_purchase_use_case_ok(monkeypatch: pytest.MonkeyPatch, expense_response_d
 @pytest.fixture
 def get_purchase_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Purchase not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseGetOneUseCase', uc_class)
@@ -219,7 +226,7 @@ def test_get_purchase_success(
     get_purchase_use_case_ok: MagicMock,
 ) -> None:
     purchase_id = uuid4()
-    result = controller.get_purchase(purchase_id)
+    result = asyncio.run(controller.get_purchase(purchase_id))
     assert isinstance(result, ExpenseResponseDTO)
 
 
@@ -229,7 +236,7 @@ def test_get_purchase_not_found(
 ) -> None:
     purchase_id = uuid4()
     with pytest.raises(NotFound) as exc:
-        controller.get_purchase(purchase_id)
+        asyncio.run(controller.get_purchase(purchase_id))
     assert exc.value.status_code == 404
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail['code'] == 'PURCHASE_NOT_FOUND'
@@ -238,6 +245,7 @@ def test_get_purchase_not_found(
 @pytest.fixture
 def delete_purchase_use_case_ok(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = None
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseDeleteUseCase', uc_class)
@@ -247,6 +255,7 @@ def delete_purchase_use_case_ok(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
 @pytest.fixture
 def delete_purchase_use_case_value_error(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Purchase not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseDeleteUseCase', uc_class)
@@ -258,7 +267,7 @@ def test_delete_purchase_success(
     delete_purchase_use_case_ok: MagicMock,
 ) -> None:
     purchase_id = uuid4()
-    controller.delete_purchase(purchase_id)
+    asyncio.run(controller.delete_purchase(purchase_id))
     delete_purchase_use_case_ok.execute.assert_called_once_with(purchase_id)
 
 
@@ -268,7 +277,7 @@ def test_delete_purchase_not_found(
 ) -> None:
     purchase_id = uuid4()
     with pytest.raises(NotFound) as exc:
-        controller.delete_purchase(purchase_id)
+        asyncio.run(controller.delete_purchase(purchase_id))
     assert exc.value.status_code == 404
     assert isinstance(exc.value.detail, dict)
     assert exc.value.detail['code'] == 'PURCHASE_NOT_FOUND'
@@ -294,6 +303,7 @@ def create_subscription_dto() -> CreateSubscriptionDTO:
 @pytest.fixture
 def create_subscription_use_case_ok(monkeypatch: pytest.MonkeyPatch, expense_response_dto: ExpenseResponseDTO) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = expense_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionCreateUseCase', uc_class)
@@ -305,7 +315,7 @@ def test_create_subscription_success(
     create_subscription_dto: CreateSubscriptionDTO,
     create_subscription_use_case_ok: MagicMock,
 ) -> None:
-    result = controller.create_subscription(create_subscription_dto)
+    result = asyncio.run(controller.create_subscription(create_subscription_dto))
     assert isinstance(result, ExpenseResponseDTO)
 
 
@@ -314,6 +324,7 @@ def test_create_subscription_success(
 @pytest.fixture
 def get_paginated_expenses_use_case_ok(monkeypatch: pytest.MonkeyPatch, expense_response_dto: ExpenseResponseDTO) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = PaginatedResponse(
         items=[expense_response_dto],
         pagination=Pagination(current_page=1, total_pages=1, total_items=1, per_page=10),
@@ -327,7 +338,7 @@ def test_get_paginated_expenses_success(
     controller: ExpenseController,
     get_paginated_expenses_use_case_ok: MagicMock,
 ) -> None:
-    result = controller.get_paginated_expenses(filter={}, limit=10, offset=0)
+    result = asyncio.run(controller.get_paginated_expenses(filter={}, limit=10, offset=0))
     assert isinstance(result, PaginatedResponse)
     assert len(result.items) == 1
 
@@ -370,6 +381,7 @@ def payment_response_dto() -> PaymentResponseDTO:
 @pytest.fixture
 def create_payment_use_case_ok(monkeypatch: pytest.MonkeyPatch, payment_response_dto: PaymentResponseDTO) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = payment_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PaymentCreateUseCase', uc_class)
@@ -379,6 +391,7 @@ def create_payment_use_case_ok(monkeypatch: pytest.MonkeyPatch, payment_response
 @pytest.fixture
 def update_payment_use_case_ok(monkeypatch: pytest.MonkeyPatch, payment_response_dto: PaymentResponseDTO) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = payment_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PaymentUpdateUseCase', uc_class)
@@ -388,6 +401,7 @@ def update_payment_use_case_ok(monkeypatch: pytest.MonkeyPatch, payment_response
 @pytest.fixture
 def delete_payment_use_case_ok(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = None
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PaymentDeleteUseCase', uc_class)
@@ -399,7 +413,7 @@ def test_create_payment_success(
     create_payment_dto: CreatePaymentDTO,
     create_payment_use_case_ok: MagicMock,
 ) -> None:
-    result = controller.create_payment(create_payment_dto)
+    result = asyncio.run(controller.create_payment(create_payment_dto))
     assert isinstance(result, PaymentResponseDTO)
     create_payment_use_case_ok.execute.assert_called_once_with(create_payment_dto)
 
@@ -411,12 +425,13 @@ def test_create_payment_bad_request(
 ) -> None:
     # Mock use case to raise ValueError
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Invalid payment data')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PaymentCreateUseCase', uc_class)
     
     with pytest.raises(BadRequest) as exc_info:
-        controller.create_payment(create_payment_dto)
+        asyncio.run(controller.create_payment(create_payment_dto))
     
     assert 'Invalid payment data' in str(exc_info.value)
 
@@ -428,12 +443,13 @@ def test_create_payment_internal_error(
 ) -> None:
     # Mock use case to raise generic exception
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PaymentCreateUseCase', uc_class)
     
     with pytest.raises(InternalServerError):
-        controller.create_payment(create_payment_dto)
+        asyncio.run(controller.create_payment(create_payment_dto))
 
 
 def test_update_payment_success(
@@ -442,7 +458,7 @@ def test_update_payment_success(
     update_payment_use_case_ok: MagicMock,
 ) -> None:
     payment_id = uuid4()
-    result = controller.update_payment(payment_id, update_payment_dto)
+    result = asyncio.run(controller.update_payment(payment_id, update_payment_dto))
     assert isinstance(result, PaymentResponseDTO)
     update_payment_use_case_ok.execute.assert_called_once_with(payment_id, update_payment_dto)
 
@@ -454,13 +470,14 @@ def test_update_payment_bad_request(
 ) -> None:
     # Mock use case to raise ValueError
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Payment not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PaymentUpdateUseCase', uc_class)
     
     payment_id = uuid4()
     with pytest.raises(BadRequest) as exc_info:
-        controller.update_payment(payment_id, update_payment_dto)
+        asyncio.run(controller.update_payment(payment_id, update_payment_dto))
     
     assert 'Payment not found' in str(exc_info.value)
 
@@ -472,13 +489,14 @@ def test_update_payment_internal_error(
 ) -> None:
     # Mock use case to raise generic exception
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PaymentUpdateUseCase', uc_class)
     
     payment_id = uuid4()
     with pytest.raises(InternalServerError):
-        controller.update_payment(payment_id, update_payment_dto)
+        asyncio.run(controller.update_payment(payment_id, update_payment_dto))
 
 
 def test_delete_payment_success(
@@ -486,7 +504,7 @@ def test_delete_payment_success(
     delete_payment_use_case_ok: MagicMock,
 ) -> None:
     payment_id = uuid4()
-    result = controller.delete_payment(payment_id)
+    result = asyncio.run(controller.delete_payment(payment_id))
     assert result is None
     delete_payment_use_case_ok.execute.assert_called_once_with(payment_id)
 
@@ -497,13 +515,14 @@ def test_delete_payment_not_found(
 ) -> None:
     # Mock use case to raise ValueError
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Payment not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PaymentDeleteUseCase', uc_class)
     
     payment_id = uuid4()
     with pytest.raises(NotFound) as exc_info:
-        controller.delete_payment(payment_id)
+        asyncio.run(controller.delete_payment(payment_id))
     
     assert 'Payment not found' in str(exc_info.value)
 
@@ -514,13 +533,14 @@ def test_delete_payment_internal_error(
 ) -> None:
     # Mock use case to raise generic exception
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PaymentDeleteUseCase', uc_class)
     
     payment_id = uuid4()
     with pytest.raises(InternalServerError):
-        controller.delete_payment(payment_id)
+        asyncio.run(controller.delete_payment(payment_id))
 
 
 # ExpenseCategory update tests
@@ -532,13 +552,14 @@ def test_update_expense_category_success(
 ) -> None:
     # Mock use case
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = category_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryUpdateUseCase', uc_class)
     
     update_dto = UpdateExpenseCategoryDTO(name='Updated Category')
     category_id = uuid4()
-    result = controller.update_expense_category(category_id, update_dto)
+    result = asyncio.run(controller.update_expense_category(category_id, update_dto))
     
     assert isinstance(result, ExpenseCategoryResponseDTO)
     uc_instance.execute.assert_called_once_with(category_id, update_dto)
@@ -550,6 +571,7 @@ def test_update_expense_category_not_found(
 ) -> None:
     # Mock use case to raise ValueError
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Category not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryUpdateUseCase', uc_class)
@@ -558,7 +580,7 @@ def test_update_expense_category_not_found(
     category_id = uuid4()
     
     with pytest.raises(BadRequest) as exc_info:
-        controller.update_expense_category(category_id, update_dto)
+        asyncio.run(controller.update_expense_category(category_id, update_dto))
     
     assert 'Category not found' in str(exc_info.value)
 
@@ -571,12 +593,13 @@ def test_delete_expense_category_success(
 ) -> None:
     # Mock use case
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = None
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryDeleteUseCase', uc_class)
     
     category_id = uuid4()
-    result = controller.delete_expense_category(category_id)
+    result = asyncio.run(controller.delete_expense_category(category_id))
     
     assert result is None
     uc_instance.execute.assert_called_once_with(category_id)
@@ -588,6 +611,7 @@ def test_delete_expense_category_not_found(
 ) -> None:
     # Mock use case to raise ValueError
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Category not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryDeleteUseCase', uc_class)
@@ -595,7 +619,7 @@ def test_delete_expense_category_not_found(
     category_id = uuid4()
     
     with pytest.raises(NotFound) as exc_info:
-        controller.delete_expense_category(category_id)
+        asyncio.run(controller.delete_expense_category(category_id))
     
     assert 'Category not found' in str(exc_info.value)
 
@@ -609,13 +633,14 @@ def test_update_purchase_success(
 ) -> None:
     # Mock use case
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = expense_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseUpdateUseCase', uc_class)
     
     update_dto = UpdatePurchaseDTO(title='Updated Purchase', amount=200.0)
     purchase_id = uuid4()
-    result = controller.update_purchase(purchase_id, update_dto)
+    result = asyncio.run(controller.update_purchase(purchase_id, update_dto))
     
     assert isinstance(result, ExpenseResponseDTO)
     uc_instance.execute.assert_called_once_with(purchase_id, update_dto)
@@ -627,6 +652,7 @@ def test_update_purchase_not_found(
 ) -> None:
     # Mock use case to raise ValueError
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Purchase not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseUpdateUseCase', uc_class)
@@ -635,7 +661,7 @@ def test_update_purchase_not_found(
     purchase_id = uuid4()
     
     with pytest.raises(BadRequest) as exc_info:
-        controller.update_purchase(purchase_id, update_dto)
+        asyncio.run(controller.update_purchase(purchase_id, update_dto))
     
     assert 'Purchase not found' in str(exc_info.value)
 
@@ -649,12 +675,13 @@ def test_get_subscription_success(
 ) -> None:
     # Mock use case
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = expense_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionGetOneUseCase', uc_class)
     
     subscription_id = uuid4()
-    result = controller.get_subscription(subscription_id)
+    result = asyncio.run(controller.get_subscription(subscription_id))
     
     assert isinstance(result, ExpenseResponseDTO)
     uc_instance.execute.assert_called_once_with(subscription_id)
@@ -666,6 +693,7 @@ def test_get_subscription_not_found(
 ) -> None:
     # Mock use case to raise ValueError
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Subscription not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionGetOneUseCase', uc_class)
@@ -673,7 +701,7 @@ def test_get_subscription_not_found(
     subscription_id = uuid4()
     
     with pytest.raises(NotFound) as exc_info:
-        controller.get_subscription(subscription_id)
+        asyncio.run(controller.get_subscription(subscription_id))
     
     assert 'Subscription not found' in str(exc_info.value)
 
@@ -685,13 +713,14 @@ def test_update_subscription_success(
 ) -> None:
     # Mock use case
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = expense_response_dto
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionUpdateUseCase', uc_class)
     
     update_dto = UpdateSubscriptionDTO(title='Updated Subscription', amount=20.0)
     subscription_id = uuid4()
-    result = controller.update_subscription(subscription_id, update_dto)
+    result = asyncio.run(controller.update_subscription(subscription_id, update_dto))
     
     assert isinstance(result, ExpenseResponseDTO)
     uc_instance.execute.assert_called_once_with(subscription_id, update_dto)
@@ -703,6 +732,7 @@ def test_update_subscription_not_found(
 ) -> None:
     # Mock use case to raise ValueError
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Subscription not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionUpdateUseCase', uc_class)
@@ -711,7 +741,7 @@ def test_update_subscription_not_found(
     subscription_id = uuid4()
     
     with pytest.raises(BadRequest) as exc_info:
-        controller.update_subscription(subscription_id, update_dto)
+        asyncio.run(controller.update_subscription(subscription_id, update_dto))
     
     assert 'Subscription not found' in str(exc_info.value)
 
@@ -722,12 +752,13 @@ def test_delete_subscription_success(
 ) -> None:
     # Mock use case
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = None
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionDeleteUseCase', uc_class)
     
     subscription_id = uuid4()
-    result = controller.delete_subscription(subscription_id)
+    result = asyncio.run(controller.delete_subscription(subscription_id))
     
     assert result is None
     uc_instance.execute.assert_called_once_with(subscription_id)
@@ -739,6 +770,7 @@ def test_delete_subscription_not_found(
 ) -> None:
     # Mock use case to raise ValueError
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Subscription not found')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionDeleteUseCase', uc_class)
@@ -746,7 +778,7 @@ def test_delete_subscription_not_found(
     subscription_id = uuid4()
     
     with pytest.raises(NotFound) as exc_info:
-        controller.delete_subscription(subscription_id)
+        asyncio.run(controller.delete_subscription(subscription_id))
     
     assert 'Subscription not found' in str(exc_info.value)
 
@@ -759,6 +791,7 @@ def test_create_expense_category_internal_error(
 ) -> None:
     """Test internal error when creating expense category."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryCreateUseCase', uc_class)
@@ -770,7 +803,7 @@ def test_create_expense_category_internal_error(
         is_income=False,
     )
     with pytest.raises(InternalServerError):
-        controller.create_expense_category(create_dto)
+        asyncio.run(controller.create_expense_category(create_dto))
 
 
 def test_update_expense_category_internal_error(
@@ -779,13 +812,14 @@ def test_update_expense_category_internal_error(
 ) -> None:
     """Test internal error when updating expense category."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryUpdateUseCase', uc_class)
     
     update_dto = UpdateExpenseCategoryDTO(name='Test')
     with pytest.raises(InternalServerError):
-        controller.update_expense_category(uuid4(), update_dto)
+        asyncio.run(controller.update_expense_category(uuid4(), update_dto))
 
 
 def test_delete_expense_category_internal_error(
@@ -794,12 +828,13 @@ def test_delete_expense_category_internal_error(
 ) -> None:
     """Test internal error when deleting expense category."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryDeleteUseCase', uc_class)
     
     with pytest.raises(InternalServerError):
-        controller.delete_expense_category(uuid4())
+        asyncio.run(controller.delete_expense_category(uuid4()))
 
 
 def test_get_paginated_expense_categories_success(
@@ -809,6 +844,7 @@ def test_get_paginated_expense_categories_success(
 ) -> None:
     """Test successful retrieval of paginated expense categories."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.return_value = PaginatedResponse(
         items=[category_response_dto],
         pagination=Pagination(current_page=1, total_pages=1, total_items=1, per_page=10),
@@ -816,7 +852,7 @@ def test_get_paginated_expense_categories_success(
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryGetPaginatedUseCase', uc_class)
     
-    result = controller.get_paginated_expense_categories(filter={}, limit=10, offset=0)
+    result = asyncio.run(controller.get_paginated_expense_categories(filter={}, limit=10, offset=0))
     assert isinstance(result, PaginatedResponse)
     assert len(result.items) == 1
 
@@ -827,12 +863,13 @@ def test_get_paginated_expense_categories_bad_request(
 ) -> None:
     """Test ValueError handling when getting paginated expense categories."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Invalid pagination parameters')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryGetPaginatedUseCase', uc_class)
     
     with pytest.raises(BadRequest) as exc:
-        controller.get_paginated_expense_categories(filter={}, limit=10, offset=0)
+        asyncio.run(controller.get_paginated_expense_categories(filter={}, limit=10, offset=0))
     assert exc.value.detail['code'] == 'PAGINATION_BAD_REQUEST'
 
 
@@ -842,12 +879,13 @@ def test_get_paginated_expense_categories_internal_error(
 ) -> None:
     """Test internal error when getting paginated expense categories."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseCategoryGetPaginatedUseCase', uc_class)
     
     with pytest.raises(InternalServerError):
-        controller.get_paginated_expense_categories(filter={}, limit=10, offset=0)
+        asyncio.run(controller.get_paginated_expense_categories(filter={}, limit=10, offset=0))
 
 
 def test_create_purchase_internal_error(
@@ -856,6 +894,7 @@ def test_create_purchase_internal_error(
 ) -> None:
     """Test internal error when creating purchase."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseCreateUseCase', uc_class)
@@ -871,7 +910,7 @@ def test_create_purchase_internal_error(
         category_id=uuid4(),
     )
     with pytest.raises(InternalServerError):
-        controller.create_purchase(create_dto)
+        asyncio.run(controller.create_purchase(create_dto))
 
 
 def test_get_purchase_internal_error(
@@ -880,12 +919,13 @@ def test_get_purchase_internal_error(
 ) -> None:
     """Test internal error when getting purchase."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseGetOneUseCase', uc_class)
     
     with pytest.raises(InternalServerError):
-        controller.get_purchase(uuid4())
+        asyncio.run(controller.get_purchase(uuid4()))
 
 
 def test_update_purchase_internal_error(
@@ -894,13 +934,14 @@ def test_update_purchase_internal_error(
 ) -> None:
     """Test internal error when updating purchase."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseUpdateUseCase', uc_class)
     
     update_dto = UpdatePurchaseDTO(title='Test')
     with pytest.raises(InternalServerError):
-        controller.update_purchase(uuid4(), update_dto)
+        asyncio.run(controller.update_purchase(uuid4(), update_dto))
 
 
 def test_delete_purchase_internal_error(
@@ -909,12 +950,13 @@ def test_delete_purchase_internal_error(
 ) -> None:
     """Test internal error when deleting purchase."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.PurchaseDeleteUseCase', uc_class)
     
     with pytest.raises(InternalServerError):
-        controller.delete_purchase(uuid4())
+        asyncio.run(controller.delete_purchase(uuid4()))
 
 
 def test_create_subscription_bad_request(
@@ -924,6 +966,7 @@ def test_create_subscription_bad_request(
     """Test ValueError handling when creating subscription."""
     from src.domain.expense.enums import ExpenseStatus
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Invalid subscription data')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionCreateUseCase', uc_class)
@@ -940,7 +983,7 @@ def test_create_subscription_bad_request(
         status=ExpenseStatus.ACTIVE,
     )
     with pytest.raises(BadRequest) as exc:
-        controller.create_subscription(create_dto)
+        asyncio.run(controller.create_subscription(create_dto))
     assert exc.value.detail['code'] == 'CREATE_SUBSCRIPTION_BAD_REQUEST'
 
 
@@ -951,6 +994,7 @@ def test_create_subscription_internal_error(
     """Test internal error when creating subscription."""
     from src.domain.expense.enums import ExpenseStatus
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionCreateUseCase', uc_class)
@@ -967,7 +1011,7 @@ def test_create_subscription_internal_error(
         status=ExpenseStatus.ACTIVE,
     )
     with pytest.raises(InternalServerError):
-        controller.create_subscription(create_dto)
+        asyncio.run(controller.create_subscription(create_dto))
 
 
 def test_get_subscription_internal_error(
@@ -976,12 +1020,13 @@ def test_get_subscription_internal_error(
 ) -> None:
     """Test internal error when getting subscription."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionGetOneUseCase', uc_class)
     
     with pytest.raises(InternalServerError):
-        controller.get_subscription(uuid4())
+        asyncio.run(controller.get_subscription(uuid4()))
 
 
 def test_update_subscription_internal_error(
@@ -990,13 +1035,14 @@ def test_update_subscription_internal_error(
 ) -> None:
     """Test internal error when updating subscription."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionUpdateUseCase', uc_class)
     
     update_dto = UpdateSubscriptionDTO(title='Test')
     with pytest.raises(InternalServerError):
-        controller.update_subscription(uuid4(), update_dto)
+        asyncio.run(controller.update_subscription(uuid4(), update_dto))
 
 
 def test_delete_subscription_internal_error(
@@ -1005,12 +1051,13 @@ def test_delete_subscription_internal_error(
 ) -> None:
     """Test internal error when deleting subscription."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.SubscriptionDeleteUseCase', uc_class)
     
     with pytest.raises(InternalServerError):
-        controller.delete_subscription(uuid4())
+        asyncio.run(controller.delete_subscription(uuid4()))
 
 
 def test_get_paginated_expenses_bad_request(
@@ -1019,12 +1066,13 @@ def test_get_paginated_expenses_bad_request(
 ) -> None:
     """Test ValueError handling when getting paginated expenses."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = ValueError('Invalid pagination parameters')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseGetPaginatedUseCase', uc_class)
     
     with pytest.raises(BadRequest) as exc:
-        controller.get_paginated_expenses(filter={}, limit=10, offset=0)
+        asyncio.run(controller.get_paginated_expenses(filter={}, limit=10, offset=0))
     assert exc.value.detail['code'] == 'PAGINATION_BAD_REQUEST'
 
 
@@ -1034,12 +1082,13 @@ def test_get_paginated_expenses_internal_error(
 ) -> None:
     """Test internal error when getting paginated expenses."""
     uc_instance: MagicMock = MagicMock()
+    uc_instance.execute = AsyncMock()
     uc_instance.execute.side_effect = Exception('Database error')
     uc_class: MagicMock = MagicMock(return_value=uc_instance)
     monkeypatch.setattr('src.entrypoints.controllers.expense_controller.ExpenseGetPaginatedUseCase', uc_class)
     
     with pytest.raises(InternalServerError):
-        controller.get_paginated_expenses(filter={}, limit=10, offset=0)
+        asyncio.run(controller.get_paginated_expenses(filter={}, limit=10, offset=0))
 
 
 
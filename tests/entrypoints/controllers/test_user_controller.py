@@ -1,8 +1,10 @@
+import asyncio
 import pytest
 from uuid import uuid4
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from src.entrypoints.controllers import UserController
+from src.application.ports import AsyncUserRepository
 from src.application.dtos import UpdateUserDTO, UserResponseDTO, ProfileResponseDTO, PreferencesResponseDTO, UpdateProfileDTO
 from src.entrypoints.exceptions.client_exceptions import NotFound, BadRequest
 from src.entrypoints.exceptions.server_exceptions import InternalServerError
@@ -11,7 +13,7 @@ from src.domain.auth import Role
 
 @pytest.fixture
 def user_repository() -> MagicMock:
-    return MagicMock()
+    return MagicMock(spec=AsyncUserRepository)
 
 
 @pytest.fixture
@@ -49,12 +51,13 @@ def test_get_user_success(
     """Test successfully getting a user."""
     # Arrange
     use_case_instance = MagicMock()
+    use_case_instance.execute = AsyncMock()
     use_case_instance.execute.return_value = user_response_dto
     use_case_class = MagicMock(return_value=use_case_instance)
     monkeypatch.setattr('src.entrypoints.controllers.user_controller.UserGetOneUseCase', use_case_class)
 
     # Act
-    result = controller.get_user(user_response_dto.id)
+    result = asyncio.run(controller.get_user(user_response_dto.id))
 
     # Assert
     assert isinstance(result, UserResponseDTO)
@@ -70,6 +73,7 @@ def test_get_user_not_found(
     """Test error when user is not found."""
     # Arrange
     use_case_instance = MagicMock()
+    use_case_instance.execute = AsyncMock()
     use_case_instance.execute.side_effect = ValueError('User not found')
     use_case_class = MagicMock(return_value=use_case_instance)
     monkeypatch.setattr('src.entrypoints.controllers.user_controller.UserGetOneUseCase', use_case_class)
@@ -78,7 +82,7 @@ def test_get_user_not_found(
 
     # Act & Assert
     with pytest.raises(NotFound, match='User not found'):
-        controller.get_user(user_id)
+        asyncio.run(controller.get_user(user_id))
 
 
 def test_get_user_internal_error(
@@ -88,6 +92,7 @@ def test_get_user_internal_error(
     """Test internal server error."""
     # Arrange
     use_case_instance = MagicMock()
+    use_case_instance.execute = AsyncMock()
     use_case_instance.execute.side_effect = Exception('Database error')
     use_case_class = MagicMock(return_value=use_case_instance)
     monkeypatch.setattr('src.entrypoints.controllers.user_controller.UserGetOneUseCase', use_case_class)
@@ -96,7 +101,7 @@ def test_get_user_internal_error(
 
     # Act & Assert
     with pytest.raises(InternalServerError):
-        controller.get_user(user_id)
+        asyncio.run(controller.get_user(user_id))
 
 
 def test_update_user_success(
@@ -107,6 +112,7 @@ def test_update_user_success(
     """Test successfully updating a user."""
     # Arrange
     use_case_instance = MagicMock()
+    use_case_instance.execute = AsyncMock()
     use_case_instance.execute.return_value = user_response_dto
     use_case_class = MagicMock(return_value=use_case_instance)
     monkeypatch.setattr('src.entrypoints.controllers.user_controller.UserUpdateUseCase', use_case_class)
@@ -114,7 +120,7 @@ def test_update_user_success(
     update_data = UpdateUserDTO(username='newusername')
 
     # Act
-    result = controller.update_user(user_response_dto.id, update_data)
+    result = asyncio.run(controller.update_user(user_response_dto.id, update_data))
 
     # Assert
     assert isinstance(result, UserResponseDTO)
@@ -128,6 +134,7 @@ def test_update_user_not_found(
     """Test error when user to update is not found."""
     # Arrange
     use_case_instance = MagicMock()
+    use_case_instance.execute = AsyncMock()
     use_case_instance.execute.side_effect = ValueError('User with id xyz not found')
     use_case_class = MagicMock(return_value=use_case_instance)
     monkeypatch.setattr('src.entrypoints.controllers.user_controller.UserUpdateUseCase', use_case_class)
@@ -137,7 +144,7 @@ def test_update_user_not_found(
 
     # Act & Assert
     with pytest.raises(NotFound):
-        controller.update_user(user_id, update_data)
+        asyncio.run(controller.update_user(user_id, update_data))
 
 
 def test_update_user_bad_request(
@@ -147,6 +154,7 @@ def test_update_user_bad_request(
     """Test bad request error."""
     # Arrange
     use_case_instance = MagicMock()
+    use_case_instance.execute = AsyncMock()
     use_case_instance.execute.side_effect = ValueError('Invalid birthdate format')
     use_case_class = MagicMock(return_value=use_case_instance)
     monkeypatch.setattr('src.entrypoints.controllers.user_controller.UserUpdateUseCase', use_case_class)
@@ -156,7 +164,7 @@ def test_update_user_bad_request(
 
     # Act & Assert
     with pytest.raises(BadRequest):
-        controller.update_user(user_id, update_data)
+        asyncio.run(controller.update_user(user_id, update_data))
 
 
 def test_update_user_internal_error(
@@ -166,6 +174,7 @@ def test_update_user_internal_error(
     """Test internal server error during update."""
     # Arrange
     use_case_instance = MagicMock()
+    use_case_instance.execute = AsyncMock()
     use_case_instance.execute.side_effect = Exception('Database error')
     use_case_class = MagicMock(return_value=use_case_instance)
     monkeypatch.setattr('src.entrypoints.controllers.user_controller.UserUpdateUseCase', use_case_class)
@@ -175,7 +184,7 @@ def test_update_user_internal_error(
 
     # Act & Assert
     with pytest.raises(InternalServerError):
-        controller.update_user(user_id, update_data)
+        asyncio.run(controller.update_user(user_id, update_data))
 
 
 def test_update_user_profile_only(
@@ -186,6 +195,7 @@ def test_update_user_profile_only(
     """Test updating only profile information."""
     # Arrange
     use_case_instance = MagicMock()
+    use_case_instance.execute = AsyncMock()
     use_case_instance.execute.return_value = user_response_dto
     use_case_class = MagicMock(return_value=use_case_instance)
     monkeypatch.setattr('src.entrypoints.controllers.user_controller.UserUpdateUseCase', use_case_class)
@@ -198,7 +208,7 @@ def test_update_user_profile_only(
     )
 
     # Act
-    result = controller.update_user(user_response_dto.id, update_data)
+    result = asyncio.run(controller.update_user(user_response_dto.id, update_data))
 
     # Assert
     assert isinstance(result, UserResponseDTO)
@@ -0,0 +1,75 @@
+from datetime import timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+from fastapi import FastAPI, Depends
+from fastapi.middleware import Middleware
+from fastapi.testclient import TestClient
+
+from src.application.dtos import DecodedJWT
+from src.application.helpers import security
+from src.config import settings
+from src.domain.auth.enums.role import ALL_ROLES, ADMIN_ROLES
+from src.entrypoints.dependencies.auth_dependencies import has_permission
+from src.entrypoints.middlewares.jwt_middleware import JWTMiddleware
+
+
+def build_client(with_middleware: bool = True) -> TestClient:
+    app = FastAPI(middleware=[Middleware(JWTMiddleware)] if with_middleware else [])
+
+    @app.get('/me')
+    async def me(token: DecodedJWT = Depends(has_permission(ALL_ROLES))) -> dict:
+        return {'user_id': str(token.user_id)}
+
+    @app.get('/admin')
+    async def admin(token: DecodedJWT = Depends(has_permission(ADMIN_ROLES))) -> dict:
+        return {'ok': True}
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def build_token(role: str = 'free_user') -> tuple[str, str]:
+    user_id = str(uuid4())
+    payload = {'sub': user_id, 'role': role, 'email': 'user@example.com'}
+    token = security.encode_jwt(payload, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM, timedelta(minutes=60))
+    return user_id, token
+
+
+def test_has_permission_reuses_token_verified_by_middleware():
+    security.jwt_cache.clear()
+    user_id, token = build_token()
+    client = build_client()
+
+    with patch.object(security.jwt, 'decode', wraps=security.jwt.decode) as jwt_decode:
+        for _ in range(3):
+            response = client.get('/me', headers={'Authorization': f'Bearer {token}'})
+            assert response.status_code == 200
+            assert response.json() == {'user_id': user_id}
+
+    # One signature check for the three requests (middleware + dependency + cache)
+    assert jwt_decode.call_count == 1
+
+
+def test_has_permission_without_middleware_decodes_token():
+    security.jwt_cache.clear()
+    user_id, token = build_token()
+
+    response = build_client(with_middleware=False).get('/me', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == 200
+    assert response.json() == {'user_id': user_id}
+
+
+def test_has_permission_forbidden_role():
+    security.jwt_cache.clear()
+    _, token = build_token()
+
+    response = build_client().get('/admin', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == 403
+
+
+def test_has_permission_invalid_token():
+    response = build_client(with_middleware=False).get('/me', headers={'Authorization': 'Bearer invalid'})
+
+    assert response.status_code == 401
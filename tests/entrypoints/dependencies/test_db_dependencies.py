@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+from fastapi import FastAPI, Depends
+from fastapi.testclient import TestClient
+
+from src.entrypoints.dependencies.db_dependencies import unit_of_work
+from src.infrastructure.database import AsyncSQLAlchemyUnitOfWork
+
+
+def build_client() -> TestClient:
+    app = FastAPI(dependencies=[Depends(unit_of_work, scope='function')])
+
+    @app.get('/ok')
+    async def ok() -> dict:
+        # Async repositories look the unit of work up from the path operation's context
+        return {'bound': AsyncSQLAlchemyUnitOfWork.current() is not None}
+
+    @app.get('/fail')
+    async def fail() -> dict:
+        raise ValueError('boom')
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_unit_of_work_dependency_commits_on_success():
+    with patch.object(AsyncSQLAlchemyUnitOfWork, 'commit') as commit, patch.object(AsyncSQLAlchemyUnitOfWork, 'rollback') as rollback:
+        response = build_client().get('/ok')
+
+    assert response.status_code == 200
+    assert response.json() == {'bound': True}
+    commit.assert_awaited_once()
+    rollback.assert_not_called()
+    assert AsyncSQLAlchemyUnitOfWork.current() is None
+
+
+def test_unit_of_work_dependency_rolls_back_on_error():
+    with patch.object(AsyncSQLAlchemyUnitOfWork, 'commit') as commit, patch.object(AsyncSQLAlchemyUnitOfWork, 'rollback') as rollback:
+        response = build_client().get('/fail')
+
+    assert response.status_code == 500
+    commit.assert_not_called()
+    rollback.assert_awaited_once()
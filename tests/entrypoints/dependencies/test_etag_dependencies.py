@@ -0,0 +1,74 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from fastapi import FastAPI, Depends, Request, Response
+from fastapi.testclient import TestClient
+
+from src.application.helpers import security
+from src.application.ports import AsyncUserRepository
+from src.config import settings
+from src.entrypoints.dependencies.etag_dependencies import conditional_get, etag_matches
+from src.entrypoints.exceptions import NotModified
+
+
+def build_client(user_repository: AsyncUserRepository, calls: list) -> TestClient:
+    app = FastAPI()
+
+    @app.exception_handler(NotModified)
+    async def not_modified_handler(request: Request, exc: NotModified):
+        return Response(status_code=exc.status_code, headers=exc.headers)
+
+    @app.get('/items', dependencies=[Depends(conditional_get(user_repository))])
+    def items() -> dict:
+        calls.append(1)
+        return {'items': []}
+
+    return TestClient(app)
+
+
+def build_headers() -> dict:
+    payload = {'sub': str(uuid4()), 'role': 'free_user', 'email': 'user@example.com'}
+    token = security.encode_jwt(payload, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM, timedelta(minutes=60))
+    return {'Authorization': f'Bearer {token}'}
+
+
+def test_conditional_get_answers_304_until_data_version_changes():
+    repo = MagicMock(spec=AsyncUserRepository)
+    repo.get_data_version.return_value = 1
+    calls: list = []
+    client = build_client(repo, calls)
+    headers = build_headers()
+
+    response = client.get('/items', headers=headers)
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert etag.startswith('W/"')
+    assert response.headers['Cache-Control'] == 'private, no-cache'
+
+    # Same version: 304 without running the path operation
+    response = client.get('/items', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+    assert response.content == b''
+    assert len(calls) == 1
+
+    # Query strings are other resources
+    assert client.get('/items?limit=5', headers={**headers, 'If-None-Match': etag}).status_code == 200
+
+    # A write bumped the version
+    repo.get_data_version.return_value = 2
+    response = client.get('/items', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert len(calls) == 3
+    assert repo.get_data_version.await_count == 4
+
+
+def test_etag_matches():
+    assert etag_matches('W/"abc"', 'W/"abc"')
+    assert etag_matches('"abc"', 'W/"abc"')
+    assert etag_matches('"xyz", W/"abc"', 'W/"abc"')
+    assert etag_matches('*', 'W/"abc"')
+    assert not etag_matches('W/"xyz"', 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
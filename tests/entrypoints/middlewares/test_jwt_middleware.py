@@ -0,0 +1,101 @@
+from datetime import timedelta
+from uuid import uuid4
+
+from fastapi import FastAPI, Request
+from fastapi.middleware import Middleware
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.application.helpers.security import encode_jwt, decode_jwt
+from src.common.error_codes import JWT_EXPIRED, JWT_INVALID
+from src.common.exceptions import JWTExpiredError, JWTInvalidError
+from src.config import settings
+from src.entrypoints.middlewares.jwt_middleware import JWTMiddleware
+
+
+def build_client() -> TestClient:
+    app = FastAPI(middleware=[Middleware(JWTMiddleware)])
+
+    @app.get('/hello')
+    async def hello(request: Request) -> dict:
+        decoded = getattr(request.state, 'decoded_jwt', None)
+        return {'sub': decoded.sub if decoded else None}
+
+    @app.get('/api/v3/auth/login')
+    async def login() -> dict:
+        return {'ok': True}
+
+    @app.get('/stream')
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for i in range(3):
+                yield f'{i}\n'
+        return StreamingResponse(chunks(), media_type='text/plain')
+
+    return TestClient(app)
+
+
+def build_token(minutes_left: float, renewal_count: int = 0) -> tuple[str, str]:
+    user_id = str(uuid4())
+    payload = {'sub': user_id, 'role': 'free_user', 'email': 'user@example.com', 'renewal_count': renewal_count}
+    token = encode_jwt(payload, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM, timedelta(minutes=minutes_left))
+    return user_id, token
+
+
+def test_jwt_middleware_without_token():
+    response = build_client().get('/hello')
+    assert response.status_code == 200
+    assert response.json() == {'sub': None}
+
+
+def test_jwt_middleware_excluded_path_ignores_invalid_token():
+    response = build_client().get('/api/v3/auth/login', headers={'Authorization': 'Bearer invalid'})
+    assert response.status_code == 200
+
+
+def test_jwt_middleware_invalid_token():
+    response = build_client().get('/hello', headers={'Authorization': 'Bearer invalid'})
+    assert response.status_code == 401
+    assert response.headers['content-type'] == 'application/json'
+    assert response.json() == {'detail': {'description': str(JWTInvalidError()), 'code': JWT_INVALID}}
+
+
+def test_jwt_middleware_expired_token():
+    _, token = build_token(minutes_left=-1)
+    response = build_client().get('/hello', headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 401
+    assert response.json() == {'detail': {'description': str(JWTExpiredError()), 'code': JWT_EXPIRED}}
+
+
+def test_jwt_middleware_fresh_token_is_not_renewed():
+    user_id, token = build_token(minutes_left=settings.JWT_EXPIRATION_TIME_MINUTES)
+    response = build_client().get('/hello', headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 200
+    assert response.json() == {'sub': user_id}
+    assert 'renewed-token' not in response.headers
+    assert 'X-Require-Refresh' not in response.headers
+
+
+def test_jwt_middleware_renews_token():
+    user_id, token = build_token(minutes_left=5, renewal_count=1)
+    response = build_client().get('/hello', headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 200
+    renewed = decode_jwt(response.headers['renewed-token'], settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+    assert renewed['sub'] == user_id
+    assert renewed['renewal_count'] == 2
+
+
+def test_jwt_middleware_requires_refresh_after_max_renewals():
+    _, token = build_token(minutes_left=5, renewal_count=settings.JWT_MAX_RENEWALS)
+    response = build_client().get('/hello', headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 200
+    assert response.headers['X-Require-Refresh'] == 'true'
+    assert 'renewed-token' not in response.headers
+
+
+def test_jwt_middleware_streaming_response_with_renewal():
+    _, token = build_token(minutes_left=5)
+    response = build_client().get('/stream', headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 200
+    assert response.text == '0\n1\n2\n'
+    assert 'renewed-token' in response.headers
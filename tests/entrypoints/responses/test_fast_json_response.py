@@ -0,0 +1,84 @@
+from datetime import date
+from uuid import uuid4
+
+from fastapi import FastAPI, Depends, Response
+from fastapi.testclient import TestClient
+
+from src.application.dtos import PeriodResponseDTO
+from src.application.use_cases.period.helpers import parse_period
+from src.domain.account.enums import AccountType
+from src.domain.expense import Period, PeriodPayment
+from src.domain.expense.enums import ExpenseStatus, ExpenseType, PaymentStatus
+from src.domain.shared import Amount, Month, Year
+from src.entrypoints.responses import FastJSONResponse, fast_json
+
+
+def build_periods(months: int, payments_per_month: int) -> list[PeriodResponseDTO]:
+    expense_id, account_id = uuid4(), uuid4()
+    periods = []
+    for month in range(1, months + 1):
+        payments = [
+            PeriodPayment(
+                payment_id=uuid4(),
+                amount=Amount(100.15 + i),
+                status=PaymentStatus.PAID if i % 2 else PaymentStatus.UNCONFIRMED,
+                payment_date=date(2025, month, 10),
+                no_installment=i + 1,
+                is_last_payment=False,
+                expense_id=expense_id,
+                expense_title='Laptop',
+                expense_type=ExpenseType.PURCHASE,
+                expense_cc_name='LAPTOP',
+                expense_acquired_at=date(2024, 12, 20),
+                expense_installments=12,
+                expense_status=ExpenseStatus.ACTIVE,
+                expense_category_name=None,
+                account_id=account_id,
+                account_alias='Card',
+                account_is_enabled=True,
+                account_type=AccountType.CREDIT_CARD,
+            )
+            for i in range(payments_per_month)
+        ]
+        period = Period(id=uuid4(), month=Month(month), year=Year(2025), payments=payments)
+        periods.append(parse_period(period))
+    return periods
+
+
+def set_header(response: Response) -> None:
+    response.headers['ETag'] = 'W/"v1"'
+
+
+def build_client(periods: list[PeriodResponseDTO]) -> TestClient:
+    app = FastAPI()
+
+    @app.get('/default', response_model=list[PeriodResponseDTO], dependencies=[Depends(set_header)])
+    def default() -> list[PeriodResponseDTO]:
+        return periods
+
+    @app.get('/fast', response_model=list[PeriodResponseDTO], response_class=FastJSONResponse, dependencies=[Depends(set_header)])
+    def fast(response: Response) -> FastJSONResponse:
+        return fast_json(periods, response)
+
+    return TestClient(app)
+
+
+def test_fast_json_matches_default_response():
+    client = build_client(build_periods(months=3, payments_per_month=4))
+
+    default = client.get('/default')
+    fast = client.get('/fast')
+
+    assert fast.status_code == default.status_code == 200
+    assert fast.headers['content-type'] == 'application/json'
+    assert fast.json() == default.json()
+    assert len(fast.json()[0]['payments']) == 4
+    # Headers set by dependencies are kept
+    assert fast.headers['ETag'] == default.headers['ETag'] == 'W/"v1"'
+
+
+def test_fast_json_keeps_response_model_schema():
+    client = build_client([])
+    schema = client.get('/openapi.json').json()
+    content = schema['paths']['/fast']['get']['responses']['200']['content']['application/json']
+    assert content['schema']['items']['$ref'].endswith('/PeriodResponseDTO')
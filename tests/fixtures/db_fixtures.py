@@ -1,6 +1,10 @@
+import asyncio
+
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 
 from src.infrastructure.database.models import BaseModel
 
@@ -13,3 +17,16 @@ def sqlite_session():
     # Create all tables before use
     BaseModel.metadata.create_all(bind=engine)
     return TestingSessionLocal
+
+
+def run_async_db(coro_fn, url: str = 'sqlite+aiosqlite://'):
+    """Run coro_fn(session_factory) against an aiosqlite database (a fresh in-memory one by default)."""
+    async def runner():
+        engine = create_async_engine(url, poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(BaseModel.metadata.create_all)
+        try:
+            return await coro_fn(async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False))
+        finally:
+            await engine.dispose()
+    return asyncio.run(runner())
@@ -0,0 +1,71 @@
+from src.infrastructure.cache import InMemoryCache, is_cache_enabled
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_memory_cache_get_and_set():
+    cache = InMemoryCache(max_size=2, clock=FakeClock())
+    cache.set('a', {'value': 1}, ttl=60)
+    assert cache.get('a') == {'value': 1}
+    assert cache.get('missing') is None
+
+
+def test_memory_cache_expires_entries():
+    clock = FakeClock()
+    cache = InMemoryCache(max_size=2, clock=clock)
+    cache.set('a', 1, ttl=10)
+    clock.now += 10
+    assert cache.get('a') is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = InMemoryCache(max_size=2, clock=FakeClock())
+    cache.set('a', 1, ttl=60)
+    cache.set('b', 2, ttl=60)
+    cache.get('a')
+    cache.set('c', 3, ttl=60)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+
+
+def test_memory_cache_invalidate_tag():
+    cache = InMemoryCache(clock=FakeClock())
+    cache.set('user:1:a', 1, ttl=60, tags=['user:1'])
+    cache.set('user:1:b', 2, ttl=60, tags=['user:1'])
+    cache.set('user:2:a', 3, ttl=60, tags=['user:2'])
+
+    cache.invalidate_tag('user:1')
+    assert cache.get('user:1:a') is None and cache.get('user:1:b') is None
+    assert cache.get('user:2:a') == 3
+    # Unknown tags are a no-op
+    cache.invalidate_tag('user:3')
+    assert len(cache) == 1
+
+
+def test_memory_cache_untags_expired_and_evicted_entries():
+    clock = FakeClock()
+    cache = InMemoryCache(max_size=2, clock=clock)
+    cache.set('user:1:a', 1, ttl=10, tags=['user:1'])
+    cache.set('user:2:a', 2, ttl=60, tags=['user:2'])
+    cache.set('user:3:a', 3, ttl=60, tags=['user:3'])  # Evicts user:1:a
+    assert 'user:1' not in cache._tags
+
+    clock.now += 60
+    assert cache.get('user:2:a') is None
+    assert cache._tags == {'user:3': {'user:3:a'}}
+    cache.invalidate_tag('user:3')
+    assert cache._tags == {} and cache._key_tags == {}
+
+
+def test_is_cache_enabled():
+    # Unset: only with a cache shared by the workers
+    assert is_cache_enabled(None, None) is False
+    assert is_cache_enabled(None, 'redis://localhost') is True
+    assert is_cache_enabled(True, None) is True
+    assert is_cache_enabled(False, 'redis://localhost') is False
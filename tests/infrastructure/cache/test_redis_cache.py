@@ -0,0 +1,80 @@
+import asyncio
+import pickle
+from unittest.mock import AsyncMock, MagicMock
+
+from src.infrastructure.cache import RedisCache
+
+
+def test_redis_cache_get_unpickles_values():
+    client = MagicMock()
+    client.get.return_value = pickle.dumps({'value': 1})
+    cache = RedisCache('redis://localhost', client=client)
+
+    assert cache.get('a') == {'value': 1}
+    client.get.assert_called_once_with('smw:a')
+    client.get.return_value = None
+    assert cache.get('b') is None
+
+
+def test_redis_cache_set_lists_key_under_tags():
+    client = MagicMock()
+    pipe = client.pipeline.return_value
+    cache = RedisCache('redis://localhost', client=client)
+
+    cache.set('a', [1, 2], ttl=60, tags=['user:1'])
+    pipe.set.assert_called_once_with('smw:a', pickle.dumps([1, 2]), ex=60)
+    pipe.sadd.assert_called_once_with('smw:tag:user:1', 'smw:a')
+    pipe.execute.assert_called_once()
+
+
+def test_redis_cache_invalidate_tag_deletes_listed_keys():
+    client = MagicMock()
+    client.smembers.return_value = {b'smw:a'}
+    cache = RedisCache('redis://localhost', client=client)
+
+    cache.invalidate_tag('user:1')
+    client.delete.assert_called_once_with(b'smw:a', 'smw:tag:user:1')
+
+
+def test_redis_cache_errors_are_misses():
+    client = MagicMock()
+    client.get.side_effect = ConnectionError('down')
+    client.pipeline.side_effect = ConnectionError('down')
+    client.smembers.side_effect = ConnectionError('down')
+    cache = RedisCache('redis://localhost', client=client)
+
+    assert cache.get('a') is None
+    cache.set('a', 1, ttl=60)
+    cache.invalidate_tag('user:1')
+
+
+def test_redis_cache_async_methods_use_the_async_client():
+    client = MagicMock()
+    async_client = MagicMock()
+    async_client.get = AsyncMock(return_value=pickle.dumps('cached'))
+    async_client.smembers = AsyncMock(return_value={b'smw:a'})
+    async_client.delete = AsyncMock()
+    pipe = async_client.pipeline.return_value
+    pipe.execute = AsyncMock()
+    cache = RedisCache('redis://localhost', client=client, async_client=async_client)
+
+    assert asyncio.run(cache.aget('a')) == 'cached'
+    asyncio.run(cache.aset('a', [1], ttl=60, tags=['user:1']))
+    asyncio.run(cache.ainvalidate_tag('user:1'))
+
+    async_client.get.assert_awaited_once_with('smw:a')
+    pipe.sadd.assert_called_once_with('smw:tag:user:1', 'smw:a')
+    pipe.execute.assert_awaited_once()
+    async_client.delete.assert_awaited_once_with(b'smw:a', 'smw:tag:user:1')
+    # The sync client is not used by the async methods
+    client.get.assert_not_called()
+    client.pipeline.assert_not_called()
+
+
+def test_redis_cache_async_methods_without_async_client_run_in_a_thread():
+    client = MagicMock()
+    client.get.return_value = pickle.dumps('cached')
+    cache = RedisCache('redis://localhost', client=client)
+
+    assert asyncio.run(cache.aget('a')) == 'cached'
+    client.get.assert_called_once_with('smw:a')
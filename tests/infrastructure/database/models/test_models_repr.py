@@ -148,32 +148,3 @@ def test_expense_model_str():
     assert 'Expense:' in str_repr
     assert 'Monthly Subscription' in str_repr
 
-
-def test_expense_model_owner_id_property(db_session):
-    """Test ExpenseModel owner_id hybrid property with mock account."""
-    from src.infrastructure.database.models.account_model import AccountModel
-    from unittest.mock import MagicMock
-    
-    # Create a mock account with owner_id
-    owner_id = uuid4()
-    mock_account = MagicMock()
-    mock_account.owner_id = owner_id
-    
-    # Create an expense and manually set the account relationship
-    expense = ExpenseModel(
-        id=uuid4(),
-        account_id=uuid4(),
-        title='Test Expense',
-        cc_name='Test Card',
-        acquired_at=datetime.now().date(),
-        amount=100.0,
-        installments=1,
-        first_payment_date=datetime.now().date(),
-        status='active',
-        expense_type='purchase',
-        category_id=uuid4()
-    )
-    expense.account = mock_account
-    
-    # Test the hybrid property
-    assert expense.owner_id == owner_id
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.infrastructure.database.pool_metrics import PoolMetrics, InstrumentedQueuePool, attach_pool_metrics
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f'sqlite:///{tmp_path / "pool.db"}',
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    attach_pool_metrics(engine.pool, engine.pool.metrics)
+    yield engine
+    engine.dispose()
+
+
+def test_pool_metrics_record_checkout():
+    metrics = PoolMetrics()
+    metrics.record_checkout(0.002)
+    metrics.record_checkout(0.004)
+    assert metrics.checkouts == 2
+    assert metrics.checkout_wait_total == pytest.approx(0.006)
+    assert metrics.checkout_wait_max == 0.004
+
+
+def test_instrumented_pool_tracks_in_use_and_overflow(engine):
+    pool: InstrumentedQueuePool = engine.pool
+    with engine.connect() as first, engine.connect() as second:
+        first.execute(text('SELECT 1'))
+        second.execute(text('SELECT 1'))
+        status = pool.metrics.snapshot(pool)
+        assert status['checked_out'] == 2
+        assert status['overflow'] == 1
+        assert status['pool_size'] == 1
+
+    status = pool.metrics.snapshot(pool)
+    assert status['checkouts'] == 2
+    assert status['checked_out'] == 0
+    assert status['connections_opened'] == 2
+    assert status['checkout_wait_avg_ms'] >= 0
+
+
+def test_instrumented_pool_counts_timeouts(engine):
+    pool: InstrumentedQueuePool = engine.pool
+    with engine.connect(), engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    assert pool.metrics.checkout_timeouts == 1
+    assert pool.metrics.checkouts == 2
+
+
+def test_instrumented_pool_keeps_metrics_after_dispose(engine):
+    metrics = engine.pool.metrics
+    with engine.connect():
+        pass
+    engine.dispose()
+    with engine.connect():
+        pass
+
+    assert engine.pool.metrics is metrics
+    assert metrics.checkouts == 2
+    assert metrics.connections_opened == 2
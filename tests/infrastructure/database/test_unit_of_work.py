@@ -0,0 +1,150 @@
+import copy
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.infrastructure.database import SQLAlchemyUnitOfWork, AsyncSQLAlchemyUnitOfWork
+from src.infrastructure.database.models import CreditCardModel
+from src.infrastructure.repositories import AsyncCreditCardRepositorySQL, CreditCardRepositorySQL
+from src.domain.account import CreditCard as CreditCardEntity
+from tests.fixtures.db_fixtures import run_async_db, sqlite_session  # noqa: F401
+from tests.fixtures.auth_fixtures import user  # noqa: F401
+from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
+
+
+@pytest.fixture
+def credit_card_repo(sqlite_session) -> CreditCardRepositorySQL:
+    return CreditCardRepositorySQL(model=CreditCardModel, session_factory=sqlite_session)
+
+
+def test_unit_of_work_shares_session_and_commits_once(sqlite_session, credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity):
+    commits = []
+
+    def count_commits(session):
+        commits.append(session)
+
+    event.listen(sqlite_session, 'after_commit', count_commits)
+
+    with SQLAlchemyUnitOfWork(session_factory=sqlite_session) as uow:
+        assert SQLAlchemyUnitOfWork.current() is uow
+        created = credit_card_repo.create(main_credit_card)
+        created.alias = 'Updated Alias'
+        credit_card_repo.update(created)
+        assert commits == []
+
+    event.remove(sqlite_session, 'after_commit', count_commits)
+    assert len(commits) == 1
+    assert SQLAlchemyUnitOfWork.current() is None
+    fetched = credit_card_repo.get_by_filter({'id': main_credit_card.id})
+    assert fetched is not None and fetched.alias == 'Updated Alias'
+
+
+def test_unit_of_work_rolls_back_on_error(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    with pytest.raises(RuntimeError):
+        with SQLAlchemyUnitOfWork(session_factory=sqlite_session):
+            credit_card_repo.create(main_credit_card)
+            raise RuntimeError('boom')
+
+    assert SQLAlchemyUnitOfWork.current() is None
+    assert credit_card_repo.count_by_filter({'id': main_credit_card.id}) == 0
+
+
+def test_unit_of_work_ignored_by_other_session_factories(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    other_factory = copy.copy(sqlite_session)
+    with pytest.raises(RuntimeError):
+        with SQLAlchemyUnitOfWork(session_factory=other_factory):
+            credit_card_repo.create(main_credit_card)
+            raise RuntimeError('boom')
+
+    # The repository did not use the unit of work session, so its write was committed
+    assert credit_card_repo.count_by_filter({'id': main_credit_card.id}) == 1
+
+
+def test_unit_of_work_without_queries_opens_no_session(sqlite_session):
+    with SQLAlchemyUnitOfWork(session_factory=sqlite_session) as uow:
+        pass
+    assert uow._session is None
+
+
+def test_unit_of_work_runs_after_commit_callbacks_only_on_commit(sqlite_session):
+    calls = []
+
+    with SQLAlchemyUnitOfWork(session_factory=sqlite_session) as uow:
+        uow.after_commit(lambda: calls.append('first'))
+        uow.after_commit(lambda: 1 / 0)  # Logged, doesn't stop the others
+        uow.after_commit(lambda: calls.append('second'))
+        assert calls == []
+    assert calls == ['first', 'second']
+
+    with pytest.raises(RuntimeError):
+        with SQLAlchemyUnitOfWork(session_factory=sqlite_session) as uow:
+            uow.after_commit(lambda: calls.append('rolled back'))
+            raise RuntimeError('boom')
+    assert calls == ['first', 'second']
+
+
+def async_credit_card_repo(session_factory) -> AsyncCreditCardRepositorySQL:
+    return AsyncCreditCardRepositorySQL(model=CreditCardModel, session_factory=session_factory)
+
+
+def test_async_unit_of_work_shares_session_and_commits_once(main_credit_card: CreditCardEntity):
+    commits = []
+
+    async def scenario(session_factory):
+        repo = async_credit_card_repo(session_factory)
+        engine = session_factory.kw['bind'].sync_engine
+        count_commits = commits.append
+        event.listen(engine, 'commit', count_commits)
+        try:
+            async with AsyncSQLAlchemyUnitOfWork(session_factory=session_factory) as uow:
+                assert AsyncSQLAlchemyUnitOfWork.current() is uow
+                created = await repo.create(main_credit_card)
+                created.alias = 'Updated Alias'
+                await repo.update(created)
+                assert commits == []
+        finally:
+            event.remove(engine, 'commit', count_commits)
+        assert AsyncSQLAlchemyUnitOfWork.current() is None
+        return await repo.get_by_filter({'id': main_credit_card.id})
+
+    fetched = run_async_db(scenario)
+    assert len(commits) == 1
+    assert fetched is not None and fetched.alias == 'Updated Alias'
+
+
+def test_async_unit_of_work_rolls_back_on_error(main_credit_card: CreditCardEntity):
+    async def scenario(session_factory):
+        repo = async_credit_card_repo(session_factory)
+        with pytest.raises(RuntimeError):
+            async with AsyncSQLAlchemyUnitOfWork(session_factory=session_factory):
+                await repo.create(main_credit_card)
+                raise RuntimeError('boom')
+        assert AsyncSQLAlchemyUnitOfWork.current() is None
+        return await repo.count_by_filter({'id': main_credit_card.id})
+
+    assert run_async_db(scenario) == 0
+
+
+def test_async_unit_of_work_awaits_after_commit_callbacks_only_on_commit():
+    calls = []
+
+    async def record(name):
+        calls.append(name)
+
+    async def scenario(session_factory):
+        async with AsyncSQLAlchemyUnitOfWork(session_factory=session_factory) as uow:
+            uow.after_commit(lambda: record('async'))
+            uow.after_commit(lambda: 1 / 0)  # Logged, doesn't stop the others
+            uow.after_commit(lambda: calls.append('sync'))
+            assert calls == []
+        assert uow._session is None
+        assert calls == ['async', 'sync']
+
+        with pytest.raises(RuntimeError):
+            async with AsyncSQLAlchemyUnitOfWork(session_factory=session_factory) as uow:
+                uow.after_commit(lambda: record('rolled back'))
+                raise RuntimeError('boom')
+
+    run_async_db(scenario)
+    assert calls == ['async', 'sync']
@@ -0,0 +1,195 @@
+import asyncio
+import copy
+import pytest
+from uuid import uuid4
+from datetime import date
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.repositories import (
+    AsyncCreditCardRepositorySQL,
+    CreditCardRepositorySQL,
+    ExpenseRepositorySQL,
+)
+from src.infrastructure.database.models import BaseModel, CreditCardModel, ExpenseModel, UserModel
+from src.domain.account import CreditCard as CreditCardEntity
+from src.domain.expense import PurchaseFactory, SubscriptionFactory
+from src.domain.shared import Amount
+from tests.fixtures.auth_fixtures import user  # noqa: F401
+from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
+
+
+def run_with_repo(coro_fn, url: str = 'sqlite+aiosqlite://'):
+    """Run coro_fn(repo) against an aiosqlite database (a fresh in-memory one by default)."""
+    async def runner():
+        engine = create_async_engine(url, poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(BaseModel.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        try:
+            return await coro_fn(AsyncCreditCardRepositorySQL(model=CreditCardModel, session_factory=session_factory))
+        finally:
+            await engine.dispose()
+    return asyncio.run(runner())
+
+
+def test_async_credit_card_repository_create_and_get(main_credit_card: CreditCardEntity):
+    async def scenario(repo: AsyncCreditCardRepositorySQL):
+        created = await repo.create(main_credit_card)
+        fetched = await repo.get_by_filter({'id': created.id})
+        count = await repo.count_by_filter({'id': created.id})
+        many = await repo.get_many_by_filter({'owner_id': created.owner_id}, limit=10, offset=0)
+        return created, fetched, count, many
+
+    created, fetched, count, many = run_with_repo(scenario)
+    assert isinstance(created, CreditCardEntity)
+    assert fetched is not None and fetched.id == main_credit_card.id
+    assert fetched.expenses == []
+    assert count == 1
+    assert [card.id for card in many] == [main_credit_card.id]
+
+
+def test_async_credit_card_repository_update(main_credit_card: CreditCardEntity):
+    async def scenario(repo: AsyncCreditCardRepositorySQL):
+        created = await repo.create(main_credit_card)
+        created.alias = 'Updated Alias'
+        await repo.update(created)
+        return await repo.get_by_filter({'id': created.id})
+
+    updated = run_with_repo(scenario)
+    assert updated is not None and updated.alias == 'Updated Alias'
+
+
+def test_async_credit_card_repository_delete_by_filter(main_credit_card: CreditCardEntity):
+    async def scenario(repo: AsyncCreditCardRepositorySQL):
+        created = await repo.create(main_credit_card)
+        await repo.delete_by_filter({'id': created.id})
+        return await repo.count_by_filter({'id': created.id})
+
+    assert run_with_repo(scenario) == 0
+
+
+def test_async_credit_card_repository_delete_by_filter_not_found():
+    async def scenario(repo: AsyncCreditCardRepositorySQL):
+        await repo.delete_by_filter({'id': uuid4()})
+
+    with pytest.raises(ValueError, match='No credit card found matching filter'):
+        run_with_repo(scenario)
+
+
+def test_async_credit_card_repository_pages(main_credit_card: CreditCardEntity):
+    async def scenario(repo: AsyncCreditCardRepositorySQL):
+        for alias in ['First', 'Second', 'Third']:
+            card = copy.deepcopy(main_credit_card)
+            card.id, card.alias = uuid4(), alias
+            await repo.create(card)
+        filter = {'owner_id': main_credit_card.owner_id, 'include_expenses': False}
+        page, total = await repo.get_page_by_filter(filter, limit=2, offset=0)
+        past_end = await repo.get_page_by_filter(filter, limit=2, offset=4)
+        first, after = await repo.get_many_by_cursor(filter, limit=2)
+        last, end = await repo.get_many_by_cursor(filter, limit=2, after=after)
+        return page, total, past_end, first + last, end
+
+    page, total, past_end, by_cursor, end = run_with_repo(scenario)
+    assert len(page) == 2 and total == 3
+    assert past_end == ([], 3)
+    assert sorted(card.alias for card in by_cursor) == ['First', 'Second', 'Third'] and end is None
+
+
+def test_async_credit_card_repository_writes_bump_the_owner_data_version(main_credit_card: CreditCardEntity):
+    async def data_version(repo: AsyncCreditCardRepositorySQL) -> int:
+        async with repo.session_factory() as session:
+            return await session.scalar(select(UserModel.data_version).where(UserModel.id == main_credit_card.owner_id))
+
+    async def scenario(repo: AsyncCreditCardRepositorySQL):
+        async with repo.session_factory() as session:
+            session.add(UserModel(id=main_credit_card.owner_id, email='owner@example.com', username='owner', password_hash='x', role='free_user'))
+            await session.commit()
+        versions = [await data_version(repo)]
+        created = await repo.create(main_credit_card)
+        versions.append(await data_version(repo))
+        created.alias = 'Updated Alias'
+        await repo.update(created)
+        versions.append(await data_version(repo))
+        await repo.delete_by_filter({'id': created.id})
+        versions.append(await data_version(repo))
+        return versions
+
+    assert run_with_repo(scenario) == [0, 1, 2, 3]
+
+
+def seed_file_db(main_credit_card: CreditCardEntity, db_file) -> CreditCardRepositorySQL:
+    """Seed a file database through the sync repositories; returns the sync credit card repository."""
+    engine = create_engine(f'sqlite:///{db_file}')
+    BaseModel.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+    credit_card_repo = CreditCardRepositorySQL(model=CreditCardModel, session_factory=session_factory)
+    expense_repo = ExpenseRepositorySQL(model=ExpenseModel, session_factory=session_factory)
+    credit_card_repo.create(main_credit_card)
+    for expense in [
+        PurchaseFactory.create(
+            id=uuid4(),
+            account_id=main_credit_card.id,
+            title='Laptop',
+            cc_name='LAPTOP',
+            acquired_at=date(2025, 10, 20),
+            amount=Amount(300),
+            installments=3,
+            first_payment_date=date(2025, 11, 10),
+            category_id=uuid4(),
+            payments=[],
+        ),
+        SubscriptionFactory.create(
+            id=uuid4(),
+            account_id=main_credit_card.id,
+            title='Streaming',
+            cc_name='STREAM',
+            acquired_at=date(2025, 11, 1),
+            amount=Amount(15),
+            first_payment_date=date(2025, 11, 30),
+            category_id=uuid4(),
+            payments=[],
+        ),
+    ]:
+        expense_repo.create(expense)
+    return credit_card_repo
+
+
+def test_async_credit_card_repository_get_period_payments_matches_sync(main_credit_card: CreditCardEntity, tmp_path):
+    # Seed a file database through the sync repositories and read it back with both implementations
+    db_file = tmp_path / 'periods.db'
+    credit_card_repo = seed_file_db(main_credit_card, db_file)
+    expected = credit_card_repo.get_period_payments(owner_id=main_credit_card.owner_id, month=1, year=2026)
+    credit_card_repo.session_factory.kw['bind'].dispose()
+
+    async def scenario(repo: AsyncCreditCardRepositorySQL):
+        return await repo.get_period_payments(owner_id=main_credit_card.owner_id, month=1, year=2026)
+
+    result = run_with_repo(scenario, url=f'sqlite+aiosqlite:///{db_file}')
+
+    def key(pp):
+        return (pp.expense_id, pp.payment_date, pp.no_installment, pp.status, pp.amount.value)
+
+    assert len(result) == len(expected) > 0
+    assert sorted(map(key, result)) == sorted(map(key, expected))
+
+
+def test_async_credit_card_repository_get_period_summaries_matches_sync(main_credit_card: CreditCardEntity, tmp_path):
+    db_file = tmp_path / 'summaries.db'
+    credit_card_repo = seed_file_db(main_credit_card, db_file)
+    expected = credit_card_repo.get_period_summaries(owner_id=main_credit_card.owner_id, month=10, year=2025, months=6)
+    credit_card_repo.session_factory.kw['bind'].dispose()
+
+    async def scenario(repo: AsyncCreditCardRepositorySQL):
+        return await repo.get_period_summaries(owner_id=main_credit_card.owner_id, month=10, year=2025, months=6)
+
+    result = run_with_repo(scenario, url=f'sqlite+aiosqlite:///{db_file}')
+
+    def key(summary):
+        return (summary.period_str, summary.total_amount.value, summary.total_paid_amount.value, summary.total_payments)
+
+    assert [key(summary) for summary in result] == [key(summary) for summary in expected]
+    assert [summary.total_payments for summary in result] == [0, 2, 1, 1, 0, 0]
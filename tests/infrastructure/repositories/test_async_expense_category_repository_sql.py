@@ -0,0 +1,64 @@
+import pytest
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from src.infrastructure.repositories import AsyncExpenseCategoryRepositorySQL
+from src.infrastructure.database.models import ExpenseCategoryModel, UserModel
+from src.domain.expense import ExpenseCategory, ExpenseCategoryFactory
+from tests.fixtures.db_fixtures import run_async_db
+
+
+@pytest.fixture
+def category() -> ExpenseCategory:
+    return ExpenseCategoryFactory.create(
+        id=uuid4(),
+        owner_id=uuid4(),
+        name='Groceries',
+        description='Food and household',
+        is_income=False,
+    )
+
+
+def run_with_repo(coro_fn):
+    async def runner(session_factory):
+        return await coro_fn(AsyncExpenseCategoryRepositorySQL(model=ExpenseCategoryModel, session_factory=session_factory))
+    return run_async_db(runner)
+
+
+def test_async_expense_category_repository_crud(category: ExpenseCategory):
+    async def scenario(repo: AsyncExpenseCategoryRepositorySQL):
+        created = await repo.create(category)
+        created.name = 'Food'
+        updated = await repo.update(created)
+        owned = await repo.get_owned_ids(category.owner_id, [category.id, uuid4()])
+        not_owned = await repo.get_owned_ids(uuid4(), [category.id])
+        await repo.delete_by_filter({'id': category.id})
+        return updated, owned, not_owned, await repo.count_by_filter({'owner_id': category.owner_id})
+
+    updated, owned, not_owned, count = run_with_repo(scenario)
+    assert updated.name == 'Food'
+    assert owned == {category.id} and not_owned == set()
+    assert count == 0
+
+
+def test_async_expense_category_repository_writes_bump_the_owner_data_version(category: ExpenseCategory):
+    async def data_version(repo: AsyncExpenseCategoryRepositorySQL) -> int:
+        async with repo.session_factory() as session:
+            return await session.scalar(select(UserModel.data_version).where(UserModel.id == category.owner_id))
+
+    async def scenario(repo: AsyncExpenseCategoryRepositorySQL):
+        async with repo.session_factory() as session:
+            session.add(UserModel(id=category.owner_id, email='owner@example.com', username='owner', password_hash='x', role='free_user'))
+            await session.commit()
+        versions = [await data_version(repo)]
+        created = await repo.create(category)
+        versions.append(await data_version(repo))
+        created.name = 'Food'
+        await repo.update(created)
+        versions.append(await data_version(repo))
+        await repo.delete_by_filter({'id': created.id})
+        versions.append(await data_version(repo))
+        return versions
+
+    assert run_with_repo(scenario) == [0, 1, 2, 3]
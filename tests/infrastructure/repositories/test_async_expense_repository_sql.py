@@ -0,0 +1,145 @@
+import copy
+import pytest
+from uuid import uuid4
+
+from sqlalchemy import select, func
+
+from src.infrastructure.repositories import AsyncCreditCardRepositorySQL, AsyncExpenseRepositorySQL
+from src.infrastructure.database.models import CreditCardModel, ExpenseModel, PaymentModel
+from src.domain.expense import Purchase as PurchaseEntity, PaymentFactory, PaymentStatus
+from src.domain.shared import Amount
+from tests.fixtures.db_fixtures import run_async_db
+from tests.fixtures.expense_fixtures import purchase  # noqa: F401
+from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
+from tests.fixtures.auth_fixtures import user  # noqa: F401
+
+
+def run_with_repos(main_credit_card, coro_fn):
+    """Run coro_fn(expense_repo, card_repo) with the expense fixtures' account already stored."""
+    async def runner(session_factory):
+        card_repo = AsyncCreditCardRepositorySQL(model=CreditCardModel, session_factory=session_factory)
+        await card_repo.create(main_credit_card)
+        return await coro_fn(AsyncExpenseRepositorySQL(model=ExpenseModel, session_factory=session_factory), card_repo)
+    return run_async_db(runner)
+
+
+def with_installments(purchase: PurchaseEntity, installments: int) -> PurchaseEntity:
+    expense = copy.deepcopy(purchase)
+    expense.id = uuid4()
+    expense.installments = installments
+    expense.payments = []
+    expense.calculate_payments()
+    return expense
+
+
+def test_async_expense_repository_create_and_get(main_credit_card, purchase: PurchaseEntity):
+    expense = with_installments(purchase, 3)
+
+    async def scenario(repo: AsyncExpenseRepositorySQL, card_repo):
+        created = await repo.create(expense)
+        fetched = await repo.get_by_filter({'id': expense.id})
+        page, total = await repo.get_page_by_filter({'owner_id': main_credit_card.owner_id}, limit=10, offset=0)
+        card = await card_repo.get_by_filter({'id': main_credit_card.id, 'include_expenses': False})
+        return created, fetched, page, total, card
+
+    created, fetched, page, total, card = run_with_repos(main_credit_card, scenario)
+    assert isinstance(created, PurchaseEntity) and len(created.payments) == 3
+    assert fetched is not None and [p.id for p in fetched.payments] == [p.id for p in created.payments]
+    assert [e.id for e in page] == [expense.id] and total == 1
+    assert card.usage.expenses_count == 1
+
+
+def test_async_expense_repository_create_many(main_credit_card, purchase: PurchaseEntity):
+    expenses = [with_installments(purchase, 3) for _ in range(5)]
+
+    async def scenario(repo: AsyncExpenseRepositorySQL, card_repo):
+        await repo.create_many(expenses)
+        await repo.create_many([])
+        count = await repo.count_by_filter({'owner_id': main_credit_card.owner_id})
+        stored = await repo.get_by_filter({'id': expenses[0].id})
+        owned = await repo.get_owned_account_ids(main_credit_card.owner_id, [main_credit_card.id, uuid4()])
+        card = await card_repo.get_by_filter({'id': main_credit_card.id, 'include_expenses': False})
+        return count, stored, owned, card
+
+    count, stored, owned, card = run_with_repos(main_credit_card, scenario)
+    assert count == 5
+    assert stored is not None and len(stored.payments) == 3
+    assert owned == {main_credit_card.id}
+    assert card.usage.expenses_count == 5
+    assert card.usage.used_limit.units == 5 * purchase.amount.units
+
+
+def test_async_expense_repository_update_syncs_payments(main_credit_card, purchase: PurchaseEntity):
+    expense = with_installments(purchase, 3)
+
+    async def scenario(repo: AsyncExpenseRepositorySQL, card_repo):
+        created = await repo.create(expense)
+        created.title = 'Updated Title'
+        created.payments[1].status = PaymentStatus.PAID
+        new_payment = PaymentFactory.create(
+            id=uuid4(),
+            expense_id=created.id,
+            amount=Amount(10),
+            no_installment=4,
+            status=PaymentStatus.UNCONFIRMED,
+            payment_date=created.first_payment_date,
+            is_last_payment=True,
+        )
+        removed_id = created.payments[0].id
+        created.payments = created.payments[1:] + [new_payment]
+        updated = await repo.update(created)
+        async with repo.session_factory() as session:
+            removed = await session.scalar(select(func.count()).select_from(PaymentModel).filter_by(id=removed_id))
+        return updated, new_payment, removed
+
+    updated, new_payment, removed = run_with_repos(main_credit_card, scenario)
+    assert updated.title == 'Updated Title'
+    assert len(updated.payments) == 3 and new_payment.id in [p.id for p in updated.payments]
+    assert [p.status for p in updated.payments].count(PaymentStatus.PAID) == 1
+    assert removed == 0
+
+
+def test_async_expense_repository_update_not_found(main_credit_card, purchase: PurchaseEntity):
+    async def scenario(repo: AsyncExpenseRepositorySQL, card_repo):
+        await repo.update(purchase)
+
+    with pytest.raises(ValueError, match='not found'):
+        run_with_repos(main_credit_card, scenario)
+
+
+def test_async_expense_repository_iter_payment_history(main_credit_card, purchase: PurchaseEntity):
+    expense = with_installments(purchase, 3)
+
+    async def scenario(repo: AsyncExpenseRepositorySQL, card_repo):
+        await repo.create(expense)
+        payments = [payment async for payment in repo.iter_payment_history(main_credit_card.owner_id, batch_size=2)]
+        none = [payment async for payment in repo.iter_payment_history(uuid4())]
+        return payments, none
+
+    payments, none = run_with_repos(main_credit_card, scenario)
+    assert [payment.no_installment for payment in payments] == [1, 2, 3]
+    assert all(payment.account_alias == main_credit_card.alias for payment in payments)
+    assert sum(payment.amount.units for payment in payments) == expense.amount.units
+    assert none == []
+
+
+def test_async_expense_repository_delete_by_filter(main_credit_card, purchase: PurchaseEntity):
+    async def scenario(repo: AsyncExpenseRepositorySQL, card_repo):
+        created = await repo.create(purchase)
+        await repo.delete_by_filter({'id': created.id})
+        async with repo.session_factory() as session:
+            payments = await session.scalar(select(func.count()).select_from(PaymentModel).filter_by(expense_id=created.id))
+        card = await card_repo.get_by_filter({'id': main_credit_card.id, 'include_expenses': False})
+        return await repo.count_by_filter({'id': created.id}), payments, card
+
+    count, payments, card = run_with_repos(main_credit_card, scenario)
+    assert count == 0 and payments == 0
+    assert card.usage.expenses_count == 0
+
+
+def test_async_expense_repository_delete_by_filter_not_found(main_credit_card):
+    async def scenario(repo: AsyncExpenseRepositorySQL, card_repo):
+        await repo.delete_by_filter({'id': uuid4()})
+
+    with pytest.raises(ValueError, match='No expense found matching filter'):
+        run_with_repos(main_credit_card, scenario)
@@ -0,0 +1,67 @@
+import pytest
+from uuid import uuid4
+
+from src.infrastructure.repositories import AsyncCreditCardRepositorySQL, AsyncExpenseRepositorySQL, AsyncPaymentRepositorySQL
+from sqlalchemy import select
+
+from src.infrastructure.database.models import CreditCardModel, ExpenseModel, PaymentModel, UserModel
+from src.domain.expense import Purchase as PurchaseEntity, PaymentFactory, PaymentStatus
+from src.domain.shared import Amount
+from tests.fixtures.db_fixtures import run_async_db
+from tests.fixtures.expense_fixtures import purchase  # noqa: F401
+from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
+from tests.fixtures.auth_fixtures import user  # noqa: F401
+
+
+def run_with_repos(main_credit_card, purchase: PurchaseEntity, coro_fn):
+    """Run coro_fn(payment_repo, card_repo) with the purchase and its account already stored."""
+    async def runner(session_factory):
+        async with session_factory() as session:
+            session.add(UserModel(id=main_credit_card.owner_id, email='owner@example.com', username='owner', password_hash='x', role='free_user'))
+            await session.commit()
+        card_repo = AsyncCreditCardRepositorySQL(model=CreditCardModel, session_factory=session_factory)
+        await card_repo.create(main_credit_card)
+        await AsyncExpenseRepositorySQL(model=ExpenseModel, session_factory=session_factory).create(purchase)
+        return await coro_fn(AsyncPaymentRepositorySQL(model=PaymentModel, session_factory=session_factory), card_repo)
+    return run_async_db(runner)
+
+
+def test_async_payment_repository_writes_bump_the_owner_data_version(main_credit_card, purchase: PurchaseEntity):
+    payment = PaymentFactory.create(
+        id=uuid4(),
+        expense_id=purchase.id,
+        amount=Amount(100),
+        no_installment=2,
+        status=PaymentStatus.UNCONFIRMED,
+        payment_date=purchase.first_payment_date,
+        is_last_payment=True,
+    )
+
+    async def data_version(repo: AsyncPaymentRepositorySQL) -> int:
+        async with repo.session_factory() as session:
+            return await session.scalar(select(UserModel.data_version).where(UserModel.id == main_credit_card.owner_id))
+
+    async def scenario(repo: AsyncPaymentRepositorySQL, card_repo):
+        versions = [await data_version(repo)]
+        created = await repo.create(payment)
+        versions.append(await data_version(repo))
+        created.status = PaymentStatus.PAID
+        updated = await repo.update(created)
+        versions.append(await data_version(repo))
+        await repo.delete_by_filter({'id': payment.id})
+        versions.append(await data_version(repo))
+        return created, updated, versions, await repo.count_by_filter({'expense_id': purchase.id})
+
+    created, updated, versions, count = run_with_repos(main_credit_card, purchase, scenario)
+    assert created.no_installment == 2
+    assert updated.status == PaymentStatus.PAID
+    assert versions == [versions[0], versions[0] + 1, versions[0] + 2, versions[0] + 3]
+    assert count == len(purchase.payments)
+
+
+def test_async_payment_repository_delete_by_filter_not_found(main_credit_card, purchase: PurchaseEntity):
+    async def scenario(repo: AsyncPaymentRepositorySQL, card_repo):
+        await repo.delete_by_filter({'id': uuid4()})
+
+    with pytest.raises(ValueError, match='No records found matching filter'):
+        run_with_repos(main_credit_card, purchase, scenario)
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from src.infrastructure.repositories.async_refresh_token_repository_sql import AsyncRefreshTokenRepositorySQL
+from src.domain.auth import RefreshToken
+from tests.fixtures.db_fixtures import run_async_db
+
+
+def make_token(user_id, expires_in: timedelta = timedelta(days=7)) -> RefreshToken:
+    return RefreshToken(
+        id=uuid4(),
+        user_id=user_id,
+        token_hash=uuid4().hex,
+        expires_at=datetime.now(timezone.utc) + expires_in,
+    )
+
+
+def run_with_repo(coro_fn):
+    async def runner(session_factory):
+        return await coro_fn(AsyncRefreshTokenRepositorySQL(session_factory=session_factory))
+    return run_async_db(runner)
+
+
+def test_async_refresh_token_repository_lifecycle():
+    user_id = uuid4()
+    active, other, expired = make_token(user_id), make_token(user_id), make_token(user_id, timedelta(days=-1))
+
+    async def scenario(repo: AsyncRefreshTokenRepositorySQL):
+        for token in (active, other, expired):
+            await repo.create(token)
+        found = await repo.find_by_token_hash(active.token_hash)
+        found.revoke()
+        await repo.update(found)
+        still_active = await repo.find_active_by_user(user_id)
+        revoked = await repo.revoke_all_by_user(user_id)
+        deleted = await repo.delete_expired()
+        remaining = await repo.count_by_filter({'user_id': user_id})
+        return found, still_active, revoked, deleted, remaining
+
+    found, still_active, revoked, deleted, remaining = run_with_repo(scenario)
+    assert found.id == active.id and found.created_at is not None
+    assert [token.id for token in still_active] == [other.id]
+    assert revoked == 2
+    assert deleted == 1
+    assert remaining == 2
+
+
+def test_async_refresh_token_repository_pages():
+    user_id = uuid4()
+    tokens = [make_token(user_id) for _ in range(3)]
+
+    async def scenario(repo: AsyncRefreshTokenRepositorySQL):
+        for token in tokens:
+            await repo.create(token)
+        page, total = await repo.get_page_by_filter({'user_id': user_id}, limit=2, offset=0)
+        first, after = await repo.get_many_by_cursor({'user_id': user_id}, limit=2)
+        last, end = await repo.get_many_by_cursor({'user_id': user_id}, limit=2, after=after)
+        await repo.delete_by_filter({'user_id': user_id})
+        return page, total, first + last, end, await repo.get_by_filter({'id': tokens[0].id})
+
+    page, total, by_cursor, end, deleted = run_with_repo(scenario)
+    assert len(page) == 2 and total == 3
+    assert sorted(token.id for token in by_cursor) == sorted(token.id for token in tokens) and end is None
+    assert deleted is None
@@ -0,0 +1,83 @@
+import copy
+import pytest
+from uuid import uuid4
+
+from sqlalchemy import delete
+
+from src.infrastructure.repositories import AsyncUserRepositorySQL
+from src.infrastructure.database.models import UserModel, ProfileModel
+from src.domain.auth import User as UserEntity, Profile, Preferences
+from tests.fixtures.db_fixtures import run_async_db
+from tests.fixtures.auth_fixtures import user as user_entity  # noqa: F401
+
+
+def run_with_repo(coro_fn):
+    async def runner(session_factory):
+        return await coro_fn(AsyncUserRepositorySQL(model=UserModel, session_factory=session_factory))
+    return run_async_db(runner)
+
+
+def test_async_user_repository_create_and_get(user_entity: UserEntity):
+    async def scenario(repo: AsyncUserRepositorySQL):
+        created = await repo.create(user_entity)
+        by_email = await repo.get_by_filter({'email': user_entity.email})
+        many = await repo.get_many_by_filter({'username': user_entity.username}, limit=10, offset=0)
+        return created, by_email, many
+
+    created, by_email, many = run_with_repo(scenario)
+    assert created.profile.id == user_entity.profile.id
+    assert created.profile.preferences.id == user_entity.profile.preferences.id
+    assert by_email is not None and by_email.profile.first_name == user_entity.profile.first_name
+    assert [user.id for user in many] == [user_entity.id]
+
+
+def test_async_user_repository_update(user_entity: UserEntity):
+    async def scenario(repo: AsyncUserRepositorySQL):
+        created = await repo.create(user_entity)
+        user_copy = copy.deepcopy(created)
+        user_copy.email = 'updated@example.com'
+        user_copy.profile.first_name = 'Jane'
+        user_copy.profile.preferences.monthly_spending_limit = 500
+        return await repo.update(user_copy)
+
+    updated = run_with_repo(scenario)
+    assert updated.email == 'updated@example.com'
+    assert updated.profile.first_name == 'Jane'
+    assert updated.profile.preferences.monthly_spending_limit == 500
+
+
+def test_async_user_repository_update_creates_profile_if_not_exists(user_entity: UserEntity):
+    async def scenario(repo: AsyncUserRepositorySQL):
+        created = await repo.create(user_entity)
+        async with repo.session_factory() as session:
+            await session.execute(delete(ProfileModel).filter_by(user_id=created.id))
+            await session.commit()
+        user_copy = copy.deepcopy(created)
+        user_copy.profile = Profile(
+            id=uuid4(),
+            first_name='NewFirst',
+            last_name='NewLast',
+            birthdate=None,
+            preferences=Preferences(id=uuid4(), monthly_spending_limit=500.0),
+        )
+        return await repo.update(user_copy)
+
+    updated = run_with_repo(scenario)
+    assert updated.profile is not None and updated.profile.first_name == 'NewFirst'
+    assert updated.profile.preferences.monthly_spending_limit == 500.0
+
+
+def test_async_user_repository_update_non_existent_user(user_entity: UserEntity):
+    async def scenario(repo: AsyncUserRepositorySQL):
+        await repo.update(user_entity)
+
+    with pytest.raises(ValueError, match=f'User with id {user_entity.id} does not exist'):
+        run_with_repo(scenario)
+
+
+def test_async_user_repository_get_data_version(user_entity: UserEntity):
+    async def scenario(repo: AsyncUserRepositorySQL):
+        await repo.create(user_entity)
+        return await repo.get_data_version(user_entity.id), await repo.get_data_version(uuid4())
+
+    assert run_with_repo(scenario) == (0, 0)
@@ -1,11 +1,20 @@
 import pytest
 import copy
 from uuid import uuid4
+from datetime import date
 from collections.abc import Callable
 
-from src.infrastructure.repositories import CreditCardRepositorySQL
-from src.infrastructure.database.models import CreditCardModel
-from src.domain.account import CreditCard as CreditCardEntity
+from sqlalchemy import event
+
+from src.infrastructure.repositories import CreditCardRepositorySQL, ExpenseCategoryRepositorySQL, ExpenseRepositorySQL, PaymentRepositorySQL, UserRepositorySQL
+from src.infrastructure.repositories.credit_card_usage_sql import find_usage_drift, store_usage
+from src.infrastructure.repositories.period_summary_sql import find_period_summary_drift, lock_accounts, refresh_period_summaries
+from src.infrastructure.database.models import CreditCardModel, ExpenseCategoryModel, ExpenseModel, PaymentModel, PeriodSummaryModel, UserModel
+from src.domain.account import CreditCard as CreditCardEntity, CreditCardUsage
+from src.domain.auth import User
+from src.domain.expense import ExpenseCategoryFactory, PeriodFactory, PurchaseFactory, SubscriptionFactory
+from src.domain.expense.enums import PaymentStatus
+from src.domain.shared import Amount, Month, Year
 from tests.fixtures.db_fixtures import sqlite_session  # noqa: F401
 from tests.fixtures.auth_fixtures import user  # noqa: F401
 from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
@@ -55,6 +64,49 @@ def test_credit_card_repository_get_many_by_filter(credit_card_repo: CreditCardR
     assert total == 3
 
 
+def test_credit_card_repository_get_page_by_filter(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    for i in range(3):
+        card = copy.deepcopy(main_credit_card)
+        card.id = uuid4()
+        card.alias = f'Card{i}'
+        credit_card_repo.create(card)
+    filter = {'owner_id': main_credit_card.owner_id, 'include_expenses': False}
+
+    statements = []
+
+    def count_statements(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = sqlite_session.kw['bind']
+    event.listen(engine, 'before_cursor_execute', count_statements)
+    cards, total = credit_card_repo.get_page_by_filter(filter, limit=2, offset=2)
+    event.remove(engine, 'before_cursor_execute', count_statements)
+
+    # Page and total in a single statement
+    assert len(statements) == 1
+    assert [card.id for card in cards] == [card.id for card in credit_card_repo.get_many_by_filter(filter, limit=2, offset=2)]
+    assert total == credit_card_repo.count_by_filter(filter) == 3
+    # Past the last page the total still comes back
+    assert credit_card_repo.get_page_by_filter(filter, limit=2, offset=10) == ([], 3)
+    assert credit_card_repo.get_page_by_filter({'owner_id': uuid4()}, limit=2, offset=0) == ([], 0)
+
+
+def test_credit_card_repository_get_many_by_cursor(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity):
+    ids = []
+    for i in range(3):
+        card = copy.deepcopy(main_credit_card)
+        card.id = uuid4()
+        card.alias = f'Card{i}'
+        ids.append(credit_card_repo.create(card).id)
+
+    filter = {'owner_id': main_credit_card.owner_id, 'include_expenses': False}
+    first, after = credit_card_repo.get_many_by_cursor(filter, limit=2)
+    assert len(first) == 2 and after is not None
+    last, after = credit_card_repo.get_many_by_cursor(filter, limit=2, after=after)
+    assert len(last) == 1 and after is None
+    assert sorted(card.id for card in first + last) == sorted(ids)
+
+
 def test_credit_card_repository_get_by_filter(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity):
     created = credit_card_repo.create(main_credit_card)
     fetched = credit_card_repo.get_by_filter({'id': created.id})
@@ -124,6 +176,442 @@ def test_credit_card_repository_delete_by_filter_account_not_found(credit_card_r
         credit_card_repo.delete_by_filter({'id': created.id})
 
 
+def test_credit_card_repository_get_period_payments(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    expense_repo = ExpenseRepositorySQL(model=ExpenseModel, session_factory=sqlite_session)
+    category_repo = ExpenseCategoryRepositorySQL(model=ExpenseCategoryModel, session_factory=sqlite_session)
+    created = credit_card_repo.create(main_credit_card)
+    category = category_repo.create(ExpenseCategoryFactory.create(
+        id=uuid4(), owner_id=created.owner_id, name='Tech', description='', is_income=False,
+    ))
+    purchase = expense_repo.create(PurchaseFactory.create(
+        id=uuid4(),
+        account_id=created.id,
+        title='Laptop',
+        cc_name='LAPTOP',
+        acquired_at=date(2025, 10, 20),
+        amount=Amount(300),
+        installments=3,
+        first_payment_date=date(2025, 11, 10),
+        category_id=category.id,
+        payments=[],
+    ))
+    subscription = expense_repo.create(SubscriptionFactory.create(
+        id=uuid4(),
+        account_id=created.id,
+        title='Streaming',
+        cc_name='STREAM',
+        acquired_at=date(2025, 11, 1),
+        amount=Amount(15),
+        first_payment_date=date(2025, 11, 30),
+        category_id=uuid4(),
+        payments=[],
+    ))
+    card = credit_card_repo.get_by_filter({'id': created.id})
+    assert card is not None
+
+    statements = []
+
+    def count_statements(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = sqlite_session.kw['bind']
+    event.listen(engine, 'before_cursor_execute', count_statements)
+    period_payments = credit_card_repo.get_period_payments(owner_id=created.owner_id, month=2, year=2026)
+    event.remove(engine, 'before_cursor_execute', count_statements)
+
+    assert len(statements) == 1
+    expected = PeriodFactory.create(id=uuid4(), month=Month(2), year=Year(2026), payments=[])
+    category_names = credit_card_repo.get_category_names(created.owner_id)
+    assert category_names == {category.id: 'Tech'}
+    expected.fill_from_account(card, category_names=category_names)
+    assert sorted((pp.expense_id, pp.payment_date, pp.no_installment, pp.status, pp.expense_category_name) for pp in period_payments) == \
+        sorted((pp.expense_id, pp.payment_date, pp.no_installment, pp.status, pp.expense_category_name) for pp in expected.payments)
+    simulated = [pp for pp in period_payments if pp.status == PaymentStatus.SIMULATED]
+    assert len(simulated) == 1
+    assert simulated[0].expense_id == subscription.id
+    assert simulated[0].payment_date == date(2026, 2, 28)
+    # The subscription's category does not exist: left unnamed
+    assert simulated[0].expense_category_name is None
+    last_installment = credit_card_repo.get_period_payments(owner_id=created.owner_id, month=1, year=2026)
+    assert {pp.expense_category_name for pp in last_installment if pp.expense_id == purchase.id} == {'Tech'}
+
+
+def test_credit_card_repository_get_period_payments_other_owner(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity):
+    credit_card_repo.create(main_credit_card)
+    assert credit_card_repo.get_period_payments(owner_id=uuid4(), month=1, year=2026) == []
+
+
+def test_credit_card_repository_get_many_by_filter_eager_loads_expenses(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    expense_repo = ExpenseRepositorySQL(model=ExpenseModel, session_factory=sqlite_session)
+    for i in range(3):
+        card = copy.deepcopy(main_credit_card)
+        card.id = uuid4()
+        credit_card_repo.create(card)
+        for _ in range(2):
+            expense_repo.create(PurchaseFactory.create(
+                id=uuid4(),
+                account_id=card.id,
+                title='Purchase',
+                cc_name='PURCHASE',
+                acquired_at=date(2025, 10, 20),
+                amount=Amount(300),
+                installments=3,
+                first_payment_date=date(2025, 11, 10),
+                category_id=uuid4(),
+                payments=[],
+            ))
+
+    statements = []
+
+    def count_statements(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = sqlite_session.kw['bind']
+    event.listen(engine, 'before_cursor_execute', count_statements)
+    cards = credit_card_repo.get_many_by_filter({'owner_id': main_credit_card.owner_id}, limit=10, offset=0)
+    event.remove(engine, 'before_cursor_execute', count_statements)
+
+    assert len(cards) == 3
+    assert all(len(card.expenses) == 2 for card in cards)
+    assert all(len(expense.payments) == 3 for card in cards for expense in card.expenses)
+    # cards + expenses + payments, regardless of the number of rows
+    assert len(statements) == 3
+
+
+def test_credit_card_repository_get_by_filter_without_expenses(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    expense_repo = ExpenseRepositorySQL(model=ExpenseModel, session_factory=sqlite_session)
+    created = credit_card_repo.create(main_credit_card)
+    expense_repo.create(PurchaseFactory.create(
+        id=uuid4(),
+        account_id=created.id,
+        title='Purchase',
+        cc_name='PURCHASE',
+        acquired_at=date(2025, 10, 20),
+        amount=Amount(300),
+        installments=3,
+        first_payment_date=date(2025, 11, 10),
+        category_id=uuid4(),
+        payments=[],
+    ))
+
+    fetched = credit_card_repo.get_by_filter({'id': created.id, 'include_expenses': False})
+    assert fetched is not None
+    assert fetched.expenses == []
+    assert credit_card_repo.count_by_filter({'id': created.id, 'include_expenses': False}) == 1
+    full = credit_card_repo.get_by_filter({'id': created.id})
+    assert full is not None and len(full.expenses) == 1
+
+
+
+def test_credit_card_repository_stored_usage_follows_writes(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    expense_repo = ExpenseRepositorySQL(model=ExpenseModel, session_factory=sqlite_session)
+    payment_repo = PaymentRepositorySQL(model=PaymentModel, session_factory=sqlite_session)
+    created = credit_card_repo.create(main_credit_card)
+
+    def assert_stored_usage(expected: CreditCardUsage) -> None:
+        stored = credit_card_repo.get_by_filter({'id': created.id, 'include_expenses': False})
+        computed = credit_card_repo.get_by_filter({'id': created.id})
+        assert stored is not None and computed is not None
+        assert stored.usage == expected
+        assert computed.usage == expected
+        with sqlite_session() as session:
+            assert find_usage_drift(session) == {}
+
+    assert_stored_usage(CreditCardUsage.empty())
+
+    purchase = expense_repo.create(PurchaseFactory.create(
+        id=uuid4(),
+        account_id=created.id,
+        title='Laptop',
+        cc_name='LAPTOP',
+        acquired_at=date(2025, 10, 20),
+        amount=Amount(300),
+        installments=3,
+        first_payment_date=date(2025, 11, 10),
+        category_id=uuid4(),
+        payments=[],
+    ))
+    subscription = expense_repo.create(SubscriptionFactory.create(
+        id=uuid4(),
+        account_id=created.id,
+        title='Streaming',
+        cc_name='STREAM',
+        acquired_at=date(2025, 11, 1),
+        amount=Amount(15.5),
+        first_payment_date=date(2025, 11, 30),
+        category_id=uuid4(),
+        payments=[],
+    ))
+    assert_stored_usage(CreditCardUsage(Amount(315.5), Amount(300), 2, 1, 1))
+
+    # Through the expense (rebalancing path)
+    purchase.payments[0].status = PaymentStatus.PAID
+    expense_repo.update(purchase)
+    assert_stored_usage(CreditCardUsage(Amount(215.5), Amount(200), 2, 1, 1))
+
+    # Through the payment repository
+    subscription_payment = subscription.payments[0]
+    subscription_payment.status = PaymentStatus.PAID
+    payment_repo.update(subscription_payment)
+    assert_stored_usage(CreditCardUsage(Amount(200), Amount(200), 2, 1, 1))
+
+    payment_repo.delete_by_filter({'id': purchase.payments[1].id})
+    assert_stored_usage(CreditCardUsage(Amount(200), Amount(200), 2, 1, 1))
+
+    expense_repo.delete_by_filter({'id': purchase.id})
+    assert_stored_usage(CreditCardUsage(Amount(0), Amount(0), 1, 0, 1))
+
+
+def test_credit_card_repository_data_version_follows_writes(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, user: User, sqlite_session):
+    user_repo = UserRepositorySQL(model=UserModel, session_factory=sqlite_session)
+    expense_repo = ExpenseRepositorySQL(model=ExpenseModel, session_factory=sqlite_session)
+    payment_repo = PaymentRepositorySQL(model=PaymentModel, session_factory=sqlite_session)
+    category_repo = ExpenseCategoryRepositorySQL(model=ExpenseCategoryModel, session_factory=sqlite_session)
+    user_repo.create(user)
+    versions = [user_repo.get_data_version(user.id)]
+
+    def assert_bumped() -> None:
+        versions.append(user_repo.get_data_version(user.id))
+        assert versions[-1] > versions[-2]
+
+    created = credit_card_repo.create(main_credit_card)
+    assert_bumped()
+    created.alias = 'Renamed'
+    credit_card_repo.update(created)
+    assert_bumped()
+    category = category_repo.create(ExpenseCategoryFactory.create(
+        id=uuid4(), owner_id=user.id, name='Home', description='', is_income=False,
+    ))
+    assert_bumped()
+    purchase = expense_repo.create(PurchaseFactory.create(
+        id=uuid4(),
+        account_id=created.id,
+        title='Laptop',
+        cc_name='LAPTOP',
+        acquired_at=date(2025, 10, 20),
+        amount=Amount(300),
+        installments=3,
+        first_payment_date=date(2025, 11, 10),
+        category_id=category.id,
+        payments=[],
+    ))
+    assert_bumped()
+    payment = purchase.payments[0]
+    payment.status = PaymentStatus.PAID
+    payment_repo.update(payment)
+    assert_bumped()
+    payment_repo.delete_by_filter({'id': purchase.payments[1].id})
+    assert_bumped()
+    expense_repo.delete_by_filter({'id': purchase.id})
+    assert_bumped()
+    category_repo.delete_by_filter({'id': category.id})
+    assert_bumped()
+    credit_card_repo.delete_by_filter({'id': created.id})
+    assert_bumped()
+    # Other users' versions are left alone
+    assert user_repo.get_data_version(uuid4()) == 0
+
+
+def test_credit_card_repository_usage_drift(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    expense_repo = ExpenseRepositorySQL(model=ExpenseModel, session_factory=sqlite_session)
+    created = credit_card_repo.create(main_credit_card)
+    expense_repo.create(PurchaseFactory.create(
+        id=uuid4(),
+        account_id=created.id,
+        title='Laptop',
+        cc_name='LAPTOP',
+        acquired_at=date(2025, 10, 20),
+        amount=Amount(300),
+        installments=3,
+        first_payment_date=date(2025, 11, 10),
+        category_id=uuid4(),
+        payments=[],
+    ))
+    expected = CreditCardUsage(Amount(300), Amount(300), 1, 1, 0)
+
+    with sqlite_session() as session:
+        session.query(CreditCardModel).filter_by(account_id=created.id).update({'used_limit': 0, 'expenses_count': 7})
+        session.commit()
+        drift = find_usage_drift(session)
+        assert list(drift) == [created.id]
+        assert drift[created.id][1] == expected
+
+        store_usage(session, created.id, expected)
+        session.commit()
+        assert find_usage_drift(session) == {}
+
+
+def test_credit_card_repository_get_many_by_filter_without_expenses(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    expense_repo = ExpenseRepositorySQL(model=ExpenseModel, session_factory=sqlite_session)
+    created = credit_card_repo.create(main_credit_card)
+    for _ in range(3):
+        expense_repo.create(PurchaseFactory.create(
+            id=uuid4(),
+            account_id=created.id,
+            title='Purchase',
+            cc_name='PURCHASE',
+            acquired_at=date(2025, 10, 20),
+            amount=Amount(100),
+            installments=1,
+            first_payment_date=date(2025, 11, 10),
+            category_id=uuid4(),
+            payments=[],
+        ))
+
+    statements = []
+
+    def count_statements(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = sqlite_session.kw['bind']
+    event.listen(engine, 'before_cursor_execute', count_statements)
+    cards = credit_card_repo.get_many_by_filter({'owner_id': main_credit_card.owner_id, 'include_expenses': False}, limit=10, offset=0)
+    event.remove(engine, 'before_cursor_execute', count_statements)
+
+    # Only the cards query: no expense or payment rows are read
+    assert len(statements) == 1
+    assert cards[0].used_limit == Amount(300)
+    assert cards[0].used_financing_limit == Amount(0)
+    assert cards[0].total_purchases_count == 3
+
+
+def test_credit_card_repository_period_summaries_follow_writes(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    expense_repo = ExpenseRepositorySQL(model=ExpenseModel, session_factory=sqlite_session)
+    payment_repo = PaymentRepositorySQL(model=PaymentModel, session_factory=sqlite_session)
+    created = credit_card_repo.create(main_credit_card)
+    owner_id = main_credit_card.owner_id
+
+    def summaries() -> list[tuple]:
+        return [
+            (s.period_str, s.total_amount.value, s.total_confirmed_amount.value, s.total_paid_amount.value,
+             s.total_pending_amount.value, s.total_payments)
+            for s in credit_card_repo.get_period_summaries(owner_id=owner_id, month=11, year=2025, months=4)
+        ]
+
+    purchase = expense_repo.create(PurchaseFactory.create(
+        id=uuid4(),
+        account_id=created.id,
+        title='Laptop',
+        cc_name='LAPTOP',
+        acquired_at=date(2025, 10, 20),
+        amount=Amount(300),
+        installments=3,
+        first_payment_date=date(2025, 11, 10),
+        category_id=uuid4(),
+        payments=[],
+    ))
+    subscription = expense_repo.create(SubscriptionFactory.create(
+        id=uuid4(),
+        account_id=created.id,
+        title='Streaming',
+        cc_name='STREAM',
+        acquired_at=date(2025, 11, 1),
+        amount=Amount(15.5),
+        first_payment_date=date(2025, 11, 30),
+        category_id=uuid4(),
+        payments=[],
+    ))
+    assert summaries() == [
+        ('11/2025', 115.5, 0, 0, 115.5, 2),
+        ('12/2025', 100, 0, 0, 100, 1),
+        ('01/2026', 100, 0, 0, 100, 1),
+        ('02/2026', 0, 0, 0, 0, 0),
+    ]
+
+    # Same totals as the period computed from the payments (no simulated payment in November)
+    expected = PeriodFactory.create(id=uuid4(), month=Month(11), year=Year(2025), payments=[])
+    expected.payments.extend(credit_card_repo.get_period_payments(owner_id=owner_id, month=11, year=2025))
+    assert summaries()[0][1] == expected.total_amount.value
+
+    subscription_payment = subscription.payments[0]
+    subscription_payment.status = PaymentStatus.PAID
+    payment_repo.update(subscription_payment)
+    purchase.payments[0].status = PaymentStatus.CONFIRMED
+    expense_repo.update(purchase)
+    assert summaries()[0] == ('11/2025', 115.5, 115.5, 15.5, 0, 2)
+
+    # Moving a payment to another month updates both periods
+    subscription_payment.payment_date = date(2026, 2, 28)
+    payment_repo.update(subscription_payment)
+    assert summaries()[0] == ('11/2025', 100, 100, 0, 0, 1)
+    assert summaries()[3] == ('02/2026', 15.5, 15.5, 15.5, 0, 1)
+
+    expense_repo.delete_by_filter({'id': purchase.id})
+    assert [summary[-1] for summary in summaries()] == [0, 0, 0, 1]
+    with sqlite_session() as session:
+        # Periods left without payments have no row
+        assert session.query(PeriodSummaryModel).count() == 1
+
+
+def test_credit_card_repository_period_summary_drift(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    expense_repo = ExpenseRepositorySQL(model=ExpenseModel, session_factory=sqlite_session)
+    created = credit_card_repo.create(main_credit_card)
+    expense_repo.create(PurchaseFactory.create(
+        id=uuid4(),
+        account_id=created.id,
+        title='Laptop',
+        cc_name='LAPTOP',
+        acquired_at=date(2025, 10, 20),
+        amount=Amount(300),
+        installments=3,
+        first_payment_date=date(2025, 11, 10),
+        category_id=uuid4(),
+        payments=[],
+    ))
+
+    with sqlite_session() as session:
+        assert find_period_summary_drift(session) == {}
+
+        # A lost update in November, a missing December and a stale row in a month without payments
+        session.query(PeriodSummaryModel).filter_by(month=11).update({'total_amount': 50, 'total_pending_amount': 50})
+        session.query(PeriodSummaryModel).filter_by(month=12).delete()
+        session.add(PeriodSummaryModel(
+            id=uuid4(), owner_id=main_credit_card.owner_id, account_id=created.id, year=2026, month=6,
+            total_amount=10, total_confirmed_amount=0, total_paid_amount=0, total_pending_amount=10, total_payments=1,
+        ))
+        session.commit()
+        drift = find_period_summary_drift(session)
+        assert sorted(drift) == sorted([(created.id, 2025, 11), (created.id, 2025, 12), (created.id, 2026, 6)])
+        assert drift[(created.id, 2025, 12)][0] is None
+        assert drift[(created.id, 2026, 6)][1] is None
+
+        refresh_period_summaries(session, drift.keys())
+        session.commit()
+        assert find_period_summary_drift(session) == {}
+
+
+def test_lock_accounts_selects_for_update_in_id_order():
+    from unittest.mock import MagicMock
+    from sqlalchemy.dialects import postgresql
+
+    session = MagicMock()
+    account_ids = [uuid4(), uuid4()]
+    lock_accounts(session, account_ids * 2)
+
+    stmt = session.execute.call_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.endswith('ORDER BY accounts.id FOR UPDATE')
+    lock_accounts(session, [])
+    session.execute.assert_called_once()
+
+
+def test_credit_card_repository_get_period_summaries_single_statement(credit_card_repo: CreditCardRepositorySQL, main_credit_card: CreditCardEntity, sqlite_session):
+    credit_card_repo.create(main_credit_card)
+    statements = []
+
+    def count_statements(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = sqlite_session.kw['bind']
+    event.listen(engine, 'before_cursor_execute', count_statements)
+    summaries = credit_card_repo.get_period_summaries(owner_id=main_credit_card.owner_id, month=1, year=2025, months=24)
+    event.remove(engine, 'before_cursor_execute', count_statements)
+
+    assert len(statements) == 1
+    assert 'FROM period_summaries' in statements[0] and 'JOIN payments' not in statements[0]
+    assert [summary.period_str for summary in summaries][::12] == ['01/2025', '01/2026']
+    assert all(summary.total_payments == 0 for summary in summaries)
+
 def __check_session(sqlite_session: Callable):
     session = sqlite_session()
     if session.get_bind().dialect.name == 'sqlite':
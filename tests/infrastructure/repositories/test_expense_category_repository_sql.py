@@ -88,3 +88,37 @@ def test_expense_category_repo_interface():
     repo = ExpenseCategoryRepositorySQL(ExpenseCategoryModel)
     assert hasattr(repo, 'create')
     assert hasattr(repo, 'get_by_filter')
+
+
+def test_expense_category_repository_get_many_by_cursor(expense_category_repo: ExpenseCategoryRepositorySQL, expense_category: ExpenseCategoryEntity):
+    # Created within the same second: the id breaks created_at ties
+    for i in range(5):
+        category = copy.deepcopy(expense_category)
+        category.id = uuid4()
+        category.name = f'Category {i}'
+        expense_category_repo.create(category)
+    other_owner = copy.deepcopy(expense_category)
+    other_owner.id, other_owner.owner_id = uuid4(), uuid4()
+    expense_category_repo.create(other_owner)
+
+    filter = {'owner_id': expense_category.owner_id}
+    seen, after, pages = [], None, 0
+    while True:
+        items, after = expense_category_repo.get_many_by_cursor(filter, limit=2, after=after)
+        seen.extend(item.id for item in items)
+        pages += 1
+        if after is None:
+            break
+
+    assert pages == 3
+    assert len(seen) == len(set(seen)) == 5
+    assert other_owner.id not in seen
+
+
+def test_expense_category_repository_get_owned_ids(expense_category_repo: ExpenseCategoryRepositorySQL, expense_category: ExpenseCategoryEntity):
+    created = expense_category_repo.create(expense_category)
+    unknown_id = uuid4()
+
+    assert expense_category_repo.get_owned_ids(created.owner_id, [created.id, unknown_id]) == {created.id}
+    assert expense_category_repo.get_owned_ids(uuid4(), [created.id]) == set()
+    assert expense_category_repo.get_owned_ids(created.owner_id, []) == set()
@@ -2,9 +2,12 @@ import pytest
 import copy
 from uuid import uuid4
 
-from src.infrastructure.repositories import ExpenseRepositorySQL
-from src.infrastructure.database.models import ExpenseModel, PaymentModel
-from src.domain.expense import Purchase as PurchaseEntity
+from sqlalchemy import event
+
+from src.infrastructure.repositories import CreditCardRepositorySQL, ExpenseRepositorySQL
+from src.infrastructure.database.models import CreditCardModel, ExpenseModel, PaymentModel
+from src.domain.expense import Purchase as PurchaseEntity, PaymentFactory, PaymentStatus
+from src.domain.shared import Amount
 from tests.fixtures.db_fixtures import sqlite_session  # noqa: F401
 from tests.fixtures.expense_fixtures import purchase  # noqa: F401
 from tests.fixtures.account_fixtures import main_credit_card  # noqa: F401
@@ -12,7 +15,9 @@ from tests.fixtures.auth_fixtures import user  # noqa: F401
 
 
 @pytest.fixture
-def expense_repo(sqlite_session) -> ExpenseRepositorySQL:
+def expense_repo(sqlite_session, main_credit_card) -> ExpenseRepositorySQL:
+    # The account of the expense fixtures, the expenses copy its owner_id
+    CreditCardRepositorySQL(model=CreditCardModel, session_factory=sqlite_session).create(main_credit_card)
     return ExpenseRepositorySQL(model=ExpenseModel, session_factory=sqlite_session)
 
 
@@ -61,6 +66,46 @@ def test_expense_repository_create_persists_payments(
         assert len(stored_payments) == purchase.installments
 
 
+def test_expense_repository_create_many(expense_repo: ExpenseRepositorySQL, purchase: PurchaseEntity, main_credit_card, sqlite_session):
+    card_repo = CreditCardRepositorySQL(model=CreditCardModel, session_factory=sqlite_session)
+    expenses = []
+    for i in range(20):
+        exp = copy.deepcopy(purchase)
+        exp.id = uuid4()
+        exp.installments = 3
+        exp.payments = []
+        exp.calculate_payments()
+        expenses.append(exp)
+
+    statements = []
+    engine = sqlite_session.kw['bind']
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, 'before_cursor_execute', listener)
+    try:
+        expense_repo.create_many(expenses)
+    finally:
+        event.remove(engine, 'before_cursor_execute', listener)
+
+    # One INSERT for the expenses and one for all their payments
+    inserts = [statement.split(' (')[0] for statement in statements if statement.startswith('INSERT INTO expenses') or statement.startswith('INSERT INTO payments')]
+    assert inserts == ['INSERT INTO expenses', 'INSERT INTO payments']
+    assert expense_repo.count_by_filter({'owner_id': main_credit_card.owner_id}) == 20
+    stored = expense_repo.get_by_filter({'id': expenses[0].id})
+    assert stored is not None and len(stored.payments) == 3
+    card = card_repo.get_by_filter({'id': main_credit_card.id, 'include_expenses': False})
+    assert card.usage.expenses_count == 20
+    assert card.usage.used_limit.units == 20 * purchase.amount.units
+    expense_repo.create_many([])
+
+
+def test_expense_repository_get_owned_account_ids(expense_repo: ExpenseRepositorySQL, main_credit_card, sqlite_session):
+    unknown_id = uuid4()
+
+    assert expense_repo.get_owned_account_ids(main_credit_card.owner_id, [main_credit_card.id, unknown_id]) == {main_credit_card.id}
+    assert expense_repo.get_owned_account_ids(uuid4(), [main_credit_card.id]) == set()
+    assert expense_repo.get_owned_account_ids(main_credit_card.owner_id, []) == set()
+
+
 def test_expense_repository_get_many_by_filter(expense_repo: ExpenseRepositorySQL, purchase: PurchaseEntity):
     for i in range(3):
         exp = copy.deepcopy(purchase)
@@ -73,6 +118,63 @@ def test_expense_repository_get_many_by_filter(expense_repo: ExpenseRepositorySQ
     assert total == 3
 
 
+def test_expense_repository_get_page_by_filter(expense_repo: ExpenseRepositorySQL, purchase: PurchaseEntity, main_credit_card, sqlite_session):
+    for i in range(3):
+        exp = copy.deepcopy(purchase)
+        exp.id = uuid4()
+        exp.title = f'Expense{i}'
+        exp.payments = []
+        exp.calculate_payments()
+        expense_repo.create(exp)
+
+    filter = {'owner_id': main_credit_card.owner_id}
+    expenses, total = expense_repo.get_page_by_filter(filter, limit=2, offset=0)
+    assert total == expense_repo.count_by_filter(filter) == 3
+    assert len(expenses) == 2
+    assert all(len(expense.payments) == purchase.installments for expense in expenses)
+    assert expense_repo.get_page_by_filter({'owner_id': uuid4()}, limit=2, offset=0) == ([], 0)
+
+
+def test_expense_repository_get_many_by_cursor(expense_repo: ExpenseRepositorySQL, purchase: PurchaseEntity, main_credit_card, sqlite_session):
+    for i in range(3):
+        exp = copy.deepcopy(purchase)
+        exp.id = uuid4()
+        exp.title = f'Expense{i}'
+        exp.payments = []
+        exp.calculate_payments()
+        expense_repo.create(exp)
+
+    filter = {'owner_id': main_credit_card.owner_id}
+    first, after = expense_repo.get_many_by_cursor(filter, limit=2)
+    last, after = expense_repo.get_many_by_cursor(filter, limit=2, after=after)
+    assert len(first) == 2 and len(last) == 1 and after is None
+    assert len({expense.id for expense in first + last}) == 3
+    assert all(len(expense.payments) == purchase.installments for expense in first + last)
+    assert expense_repo.get_many_by_cursor({'owner_id': uuid4()}, limit=2) == ([], None)
+    # Served by the (account_id, created_at, id) index
+    by_account, _ = expense_repo.get_many_by_cursor({**filter, 'account_id': main_credit_card.id}, limit=5)
+    assert [expense.id for expense in by_account] == [expense.id for expense in first + last]
+    assert expense_repo.get_many_by_cursor({**filter, 'account_id': uuid4()}, limit=2) == ([], None)
+
+
+def test_expense_repository_iter_payment_history(expense_repo: ExpenseRepositorySQL, purchase: PurchaseEntity, main_credit_card, sqlite_session):
+    purchase.installments = 3
+    purchase.payments = []
+    purchase.calculate_payments()
+    expense_repo.create(purchase)
+
+    history = expense_repo.iter_payment_history(main_credit_card.owner_id, batch_size=2)
+    assert not isinstance(history, list)
+    payments = list(history)
+
+    assert [payment.no_installment for payment in payments] == [1, 2, 3]
+    assert [payment.payment_date for payment in payments] == sorted(payment.payment_date for payment in payments)
+    assert all(payment.expense_id == purchase.id for payment in payments)
+    assert all(payment.account_alias == main_credit_card.alias for payment in payments)
+    assert sum(payment.amount.units for payment in payments) == purchase.amount.units
+    assert list(expense_repo.iter_payment_history(uuid4())) == []
+
+
 def test_expense_repository_get_by_filter(expense_repo: ExpenseRepositorySQL, purchase: PurchaseEntity):
     created = expense_repo.create(purchase)
     fetched = expense_repo.get_by_filter({'id': created.id})
@@ -88,6 +190,112 @@ def test_expense_repository_update(expense_repo: ExpenseRepositorySQL, purchase:
     assert updated.title == 'Updated Expense Title'
 
 
+def test_expense_repository_stores_owner_id(
+    expense_repo: ExpenseRepositorySQL,
+    sqlite_session,
+    purchase: PurchaseEntity,
+    main_credit_card,
+):
+    other_card = copy.deepcopy(main_credit_card)
+    other_card.id = uuid4()
+    other_card.owner_id = uuid4()
+    CreditCardRepositorySQL(model=CreditCardModel, session_factory=sqlite_session).create(other_card)
+    bulk = copy.deepcopy(purchase)
+    bulk.id = uuid4()
+    bulk.account_id = other_card.id
+    bulk.payments = []
+    bulk.calculate_payments()
+
+    created = expense_repo.create(purchase)
+    expense_repo.create_many([bulk])
+    assert expense_repo.count_by_filter({'owner_id': main_credit_card.owner_id}) == 1
+    assert expense_repo.count_by_filter({'owner_id': other_card.owner_id}) == 1
+
+    # Moving the expense to another account moves it to that account's owner
+    created.account_id = other_card.id
+    expense_repo.update(created)
+    with sqlite_session() as session:
+        assert session.get(ExpenseModel, created.id).owner_id == other_card.owner_id
+    assert expense_repo.count_by_filter({'owner_id': main_credit_card.owner_id}) == 0
+
+
+def test_expense_repository_owner_cursor_page_skips_accounts(
+    expense_repo: ExpenseRepositorySQL,
+    sqlite_session,
+    purchase: PurchaseEntity,
+    main_credit_card,
+):
+    expense_repo.create(purchase)
+
+    statements = []
+    engine = sqlite_session.kw['bind']
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, 'before_cursor_execute', listener)
+    try:
+        expenses, _ = expense_repo.get_many_by_cursor({'owner_id': main_credit_card.owner_id}, limit=5)
+    finally:
+        event.remove(engine, 'before_cursor_execute', listener)
+
+    assert [expense.id for expense in expenses] == [purchase.id]
+    expense_selects = [statement for statement in statements if 'FROM expenses' in statement]
+    assert len(expense_selects) == 1
+    assert 'accounts' not in expense_selects[0]
+
+
+def test_expense_repository_update_only_writes_changed_payments(
+    expense_repo: ExpenseRepositorySQL,
+    sqlite_session,
+    purchase: PurchaseEntity,
+):
+    purchase.installments = 12
+    purchase.payments = []
+    purchase.calculate_payments()
+    created = expense_repo.create(purchase)
+    created.payments[3].status = PaymentStatus.PAID
+
+    statements = []
+
+    def count_statements(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = sqlite_session.kw['bind']
+    event.listen(engine, 'before_cursor_execute', count_statements)
+    updated = expense_repo.update(created)
+    event.remove(engine, 'before_cursor_execute', count_statements)
+
+    payment_writes = [st for st in statements if st.startswith(('UPDATE payments', 'INSERT INTO payments', 'DELETE FROM payments'))]
+    assert len(payment_writes) == 1
+    assert payment_writes[0].startswith('UPDATE payments')
+    assert [p.status for p in updated.payments].count(PaymentStatus.PAID) == 1
+    assert len(updated.payments) == 12
+
+
+def test_expense_repository_update_inserts_and_deletes_payments(
+    expense_repo: ExpenseRepositorySQL,
+    sqlite_session,
+    purchase: PurchaseEntity,
+):
+    created = expense_repo.create(purchase)
+    removed_id = created.payments[0].id
+    new_payment = PaymentFactory.create(
+        id=uuid4(),
+        expense_id=created.id,
+        amount=Amount(10),
+        no_installment=1,
+        status=PaymentStatus.UNCONFIRMED,
+        payment_date=created.first_payment_date,
+        is_last_payment=True,
+    )
+    created.payments = [new_payment]
+
+    updated = expense_repo.update(created)
+
+    assert [p.id for p in updated.payments] == [new_payment.id]
+    with sqlite_session() as session:
+        assert session.query(PaymentModel).filter_by(id=removed_id).count() == 0
+        assert session.query(PaymentModel).filter_by(expense_id=created.id).count() == 1
+
+
 def test_expense_repository_delete_by_filter(expense_repo: ExpenseRepositorySQL, purchase: PurchaseEntity):
     created = expense_repo.create(purchase)
     cnt = expense_repo.count_by_filter(filter={'id': created.id})
@@ -157,25 +365,26 @@ def test_update_exception(mock_expense_repo, mock_session_factory, purchase: Pur
         mock_expense_repo.update(purchase)
 
 
-def test_get_many_by_filter_with_owner_id_join(mock_expense_repo, mock_session_factory):
-    """Test get_many_by_filter with owner_id performs JOIN."""
+def test_get_many_by_filter_with_owner_id_filters_expenses_column(mock_expense_repo, mock_session_factory):
+    """Test get_many_by_filter with owner_id filters the expenses column, without a JOIN."""
     _, mock_session = mock_session_factory
     mock_query = MagicMock()
     mock_session.query.return_value = mock_query
     
     # Setup chain
-    mock_query.join.return_value = mock_query
-    mock_query.filter.return_value = mock_query
+    mock_query.options.return_value = mock_query
+    mock_query.filter_by.return_value = mock_query
     mock_query.limit.return_value = mock_query
     mock_query.offset.return_value = mock_query
     mock_query.all.return_value = [MagicMock()]
     
-    with patch.object(mock_expense_repo, '_get_filter_params', return_value={'owner_id': uuid4()}):
-        with patch.object(mock_expense_repo, '_parse_model_to_entity', return_value=MagicMock()):
-            result = mock_expense_repo.get_many_by_filter({'owner_id': uuid4()}, limit=10, offset=0)
-            
-            assert len(result) == 1
-            mock_query.join.assert_called_once()
+    owner_id = uuid4()
+    with patch.object(mock_expense_repo, '_parse_model_to_entity', return_value=MagicMock()):
+        result = mock_expense_repo.get_many_by_filter({'owner_id': owner_id}, limit=10, offset=0)
+        
+        assert len(result) == 1
+        mock_query.filter_by.assert_called_once_with(owner_id=owner_id)
+        mock_query.join.assert_not_called()
 
 
 def test_get_many_by_filter_with_owner_id_and_ordering(mock_expense_repo, mock_session_factory):
@@ -185,19 +394,18 @@ def test_get_many_by_filter_with_owner_id_and_ordering(mock_expense_repo, mock_s
     mock_session.query.return_value = mock_query
     
     # Setup chain
-    mock_query.join.return_value = mock_query
-    mock_query.filter.return_value = mock_query
+    mock_query.options.return_value = mock_query
+    mock_query.filter_by.return_value = mock_query
     mock_query.order_by.return_value = mock_query
     mock_query.limit.return_value = mock_query
     mock_query.offset.return_value = mock_query
     mock_query.all.return_value = [MagicMock()]
     
-    with patch.object(mock_expense_repo, '_get_filter_params', return_value={'owner_id': uuid4()}):
-        with patch.object(mock_expense_repo, '_parse_model_to_entity', return_value=MagicMock()):
-            result = mock_expense_repo.get_many_by_filter({'owner_id': uuid4(), 'order_by': 'id'}, limit=10, offset=0)
-            
-            assert len(result) == 1
-            mock_query.order_by.assert_called_once()
+    with patch.object(mock_expense_repo, '_parse_model_to_entity', return_value=MagicMock()):
+        result = mock_expense_repo.get_many_by_filter({'owner_id': uuid4(), 'order_by': 'id'}, limit=10, offset=0)
+        
+        assert len(result) == 1
+        mock_query.order_by.assert_called_once()
 
 
 def test_get_many_by_filter_with_owner_id_and_filters(mock_expense_repo, mock_session_factory):
@@ -207,21 +415,20 @@ def test_get_many_by_filter_with_owner_id_and_filters(mock_expense_repo, mock_se
     mock_session.query.return_value = mock_query
     
     # Setup chain
-    mock_query.join.return_value = mock_query
-    mock_query.filter.return_value = mock_query
+    mock_query.options.return_value = mock_query
+    mock_query.filter_by.return_value = mock_query
     mock_query.limit.return_value = mock_query
     mock_query.offset.return_value = mock_query
     mock_query.all.return_value = [MagicMock()]
     
     owner_id = uuid4()
     account_id = uuid4()
-    with patch.object(mock_expense_repo, '_get_filter_params', return_value={'owner_id': owner_id, 'account_id': account_id}):
-        with patch.object(mock_expense_repo, '_parse_model_to_entity', return_value=MagicMock()):
-            result = mock_expense_repo.get_many_by_filter({'owner_id': owner_id, 'account_id': account_id}, limit=10, offset=0)
-            
-            assert len(result) == 1
-            # Should call filter multiple times
-            assert mock_query.filter.call_count >= 2
+    with patch.object(mock_expense_repo, '_parse_model_to_entity', return_value=MagicMock()):
+        result = mock_expense_repo.get_many_by_filter({'owner_id': owner_id, 'account_id': account_id}, limit=10, offset=0)
+        
+        assert len(result) == 1
+        mock_query.filter_by.assert_called_once_with(owner_id=owner_id, account_id=account_id)
+        mock_query.join.assert_not_called()
 
 
 def test_get_many_by_filter_without_owner_id_uses_filter_by(mock_expense_repo, mock_session_factory):
@@ -231,6 +438,7 @@ def test_get_many_by_filter_without_owner_id_uses_filter_by(mock_expense_repo, m
     mock_session.query.return_value = mock_query
     
     # Setup chain
+    mock_query.options.return_value = mock_query
     mock_query.filter_by.return_value = mock_query
     mock_query.limit.return_value = mock_query
     mock_query.offset.return_value = mock_query
@@ -254,22 +462,22 @@ def test_get_many_by_filter_exception(mock_expense_repo, mock_session_factory):
         mock_expense_repo.get_many_by_filter({}, limit=10, offset=0)
 
 
-def test_count_by_filter_with_owner_id_join(mock_expense_repo, mock_session_factory):
-    """Test count_by_filter with owner_id performs JOIN."""
+def test_count_by_filter_with_owner_id_filters_expenses_column(mock_expense_repo, mock_session_factory):
+    """Test count_by_filter with owner_id filters the expenses column, without a JOIN."""
     _, mock_session = mock_session_factory
     mock_query = MagicMock()
     mock_session.query.return_value = mock_query
     
     # Setup chain
-    mock_query.join.return_value = mock_query
-    mock_query.filter.return_value = mock_query
+    mock_query.filter_by.return_value = mock_query
     mock_query.count.return_value = 5
     
-    with patch.object(mock_expense_repo, '_get_filter_params', return_value={'owner_id': uuid4()}):
-        result = mock_expense_repo.count_by_filter({'owner_id': uuid4()})
-        
-        assert result == 5
-        mock_query.join.assert_called_once()
+    owner_id = uuid4()
+    result = mock_expense_repo.count_by_filter({'owner_id': owner_id})
+    
+    assert result == 5
+    mock_query.filter_by.assert_called_once_with(owner_id=owner_id)
+    mock_query.join.assert_not_called()
 
 
 def test_count_by_filter_with_owner_id_and_filters(mock_expense_repo, mock_session_factory):
@@ -279,18 +487,15 @@ def test_count_by_filter_with_owner_id_and_filters(mock_expense_repo, mock_sessi
     mock_session.query.return_value = mock_query
     
     # Setup chain
-    mock_query.join.return_value = mock_query
-    mock_query.filter.return_value = mock_query
+    mock_query.filter_by.return_value = mock_query
     mock_query.count.return_value = 3
     
     owner_id = uuid4()
     account_id = uuid4()
-    with patch.object(mock_expense_repo, '_get_filter_params', return_value={'owner_id': owner_id, 'account_id': account_id}):
-        result = mock_expense_repo.count_by_filter({'owner_id': owner_id, 'account_id': account_id})
-        
-        assert result == 3
-        # Should call filter multiple times
-        assert mock_query.filter.call_count >= 2
+    result = mock_expense_repo.count_by_filter({'owner_id': owner_id, 'account_id': account_id})
+    
+    assert result == 3
+    mock_query.filter_by.assert_called_once_with(owner_id=owner_id, account_id=account_id)
 
 
 def test_count_by_filter_without_owner_id_uses_filter_by(mock_expense_repo, mock_session_factory):